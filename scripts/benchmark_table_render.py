@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark how long UniversalOutputFormatter takes to render large lists as tables.
+
+Renders synthetic machine-type rows (shaped like `cudo-compute vm-machine-type list`)
+for a colour terminal, discards the output and reports the time and peak memory per
+list size.
+
+    python3 ./scripts/benchmark_table_render.py
+    python3 ./scripts/benchmark_table_render.py --rows 1000 10000 --baseline
+"""
+
+import argparse
+import io
+import time
+import tracemalloc
+
+from rich.console import Console
+
+from vantage_cli.render import UniversalOutputFormatter
+
+
+def make_rows(count):
+    """Build ``count`` machine-type-like rows"""
+    return [
+        {
+            "id": f"{i:08x}-6f1c-4b7e-9d2a-{i:012x}",
+            "name": f"epyc-rome-rtx-a{4000 + i % 3 * 1000}-{i}",
+            "status": "available",
+            "data_center_id": ["gb-bournemouth-1", "se-smedjebacken-1", "no-luster-1"][i % 3],
+            "gpu_model": ["RTX A4000", "RTX A5000", "A100 80GB PCIe"][i % 3],
+            "vcpus": 4 + i % 60,
+            "memory_gib": 16 + i % 480,
+            "gpus": i % 9,
+            "price_hr": f"{0.25 + (i % 40) / 10:.2f}",
+            "description": "High-frequency CPU with NVMe scratch" if i % 5 == 0 else "",
+        }
+        for i in range(count)
+    ]
+
+
+class Discard(io.TextIOBase):
+    """Text sink that drops everything written, so only rendering is measured"""
+
+    def write(self, text):
+        return len(text)
+
+
+def new_console(width):
+    """Console that renders like a colour terminal but discards its output"""
+    return Console(file=Discard(), width=width, force_terminal=True, color_system="truecolor")
+
+
+def render_streaming(rows, width):
+    """Render through the formatter's streaming table renderer"""
+    formatter = UniversalOutputFormatter(new_console(width))
+    formatter._get_terminal_width = lambda: width
+    formatter.output(rows, title="VM Machine Types")
+
+
+def render_single_table(rows, width):
+    """Render all rows as one Rich table, as the formatter did before streaming"""
+    console = new_console(width)
+    formatter = UniversalOutputFormatter(console)
+    keys = formatter._sort_table_keys(rows)
+    widths = formatter._calculate_proportional_widths(rows, keys, width)
+    columns = [(key, widths.get(key, 20)) for key in keys]
+    table = formatter._new_list_table(columns, "VM Machine Types", width)
+    for row in rows:
+        table.add_row(*formatter._format_table_row(row, columns))
+    console.print(table)
+
+
+def measure(render, rows, width):
+    """Return (seconds, peak MiB) for one render; memory is traced in a separate run"""
+    started = time.perf_counter()
+    render(rows, width)
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    render(rows, width)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / (1024 * 1024)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--width", type=int, default=160, help="Terminal width to render at")
+    parser.add_argument(
+        "--baseline", action="store_true", help="Also time rendering one Rich table of all rows"
+    )
+    args = parser.parse_args()
+
+    renderers = [("streaming", render_streaming)]
+    if args.baseline:
+        renderers.append(("single table", render_single_table))
+
+    print(f"{'renderer':<14} {'rows':>8} {'seconds':>9} {'ms/1k rows':>11} {'peak MiB':>9}")
+    for count in args.rows:
+        rows = make_rows(count)
+        for name, render in renderers:
+            elapsed, peak = measure(render, rows, args.width)
+            per_thousand = elapsed * 1000 / (count / 1000)
+            print(f"{name:<14} {count:>8} {elapsed:>9.2f} {per_thousand:>11.1f} {peak:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
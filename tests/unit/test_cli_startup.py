@@ -0,0 +1,131 @@
+"""Unit tests for lazy subcommand loading and CLI cold-start time."""
+
+import json
+import re
+import sys
+from subprocess import PIPE, Popen
+
+import typer
+from typer.testing import CliRunner
+
+from vantage_cli import LazySubcommand, LazyTyperGroup
+
+# Cumulative import time budget for ``import vantage_cli.main`` in a fresh interpreter
+STARTUP_IMPORT_BUDGET_SECONDS = 1.0
+
+# Modules that only specific subcommands need and must not load at startup
+HEAVY_MODULES = ["aiohttp", "gql", "juju", "kubernetes", "textual", "vantage_cli.commands"]
+
+_IMPORTTIME_LINE = re.compile(r"import time:\s+\d+\s+\|\s+(\d+)\s+\|\s*(\S+)")
+
+
+def _run_python(*args: str) -> str:
+    """Run a fresh interpreter and return its output, failing on a non-zero exit.
+
+    ``Popen`` is bound at import time so the autouse subprocess mock does not apply.
+    """
+    with Popen([sys.executable, *args], stdout=PIPE, stderr=PIPE, text=True) as process:
+        stdout, stderr = process.communicate(timeout=120)
+    assert process.returncode == 0, stderr
+    return stdout + stderr
+
+
+def _cumulative_import_seconds(module: str) -> float:
+    """Return the cumulative ``-X importtime`` figure for a top-level import."""
+    output = _run_python("-X", "importtime", "-c", f"import {module}")
+    for match in _IMPORTTIME_LINE.finditer(output):
+        if match.group(2) == module:
+            return int(match.group(1)) / 1_000_000
+    raise AssertionError(f"No importtime entry for {module}")
+
+
+def test_main_import_stays_within_budget():
+    # Best of three runs keeps the check stable on a loaded machine
+    elapsed = min(_cumulative_import_seconds("vantage_cli.main") for _ in range(3))
+
+    assert elapsed < STARTUP_IMPORT_BUDGET_SECONDS, (
+        f"import vantage_cli.main took {elapsed:.3f}s "
+        f"(budget {STARTUP_IMPORT_BUDGET_SECONDS:.1f}s); check for new eager imports"
+    )
+
+
+def test_help_does_not_import_subcommands():
+    script = (
+        "import json, sys, typer\n"
+        "from vantage_cli.main import app\n"
+        "typer.main.get_command(app)(['--help'], standalone_mode=False)\n"
+        f"heavy = {HEAVY_MODULES!r}\n"
+        "loaded = [m for m in heavy if any(k == m or k.startswith(m + '.') for k in sys.modules)]\n"
+        "print(json.dumps(loaded))\n"
+    )
+    output = _run_python("-c", script)
+
+    assert "cluster" in output
+    assert json.loads(output.strip().splitlines()[-1]) == []
+
+
+def _lazy_app() -> typer.Typer:
+    class Group(LazyTyperGroup):
+        lazy_subcommands = {
+            "prof": LazySubcommand(
+                import_path="vantage_cli.commands.profile:profile_app", help="Lazy profiles"
+            ),
+            "secret": LazySubcommand(
+                import_path="vantage_cli.commands.alias.profiles:profiles_command", hidden=True
+            ),
+        }
+
+    app = typer.Typer(cls=Group)
+
+    @app.callback()
+    def main() -> None:
+        """Test application."""
+
+    return app
+
+
+def test_lazy_group_lists_registered_help_text():
+    result = CliRunner().invoke(_lazy_app(), ["--help"])
+
+    assert result.exit_code == 0
+    assert "Lazy profiles" in result.output
+    assert "secret" not in result.output
+
+
+def test_lazy_group_resolves_typer_app_on_invocation():
+    group = typer.main.get_command(_lazy_app())
+    ctx = typer.Context(group)
+
+    command = group.get_command(ctx, "prof")
+
+    assert isinstance(command, typer.core.TyperGroup)
+    assert command.name == "prof"
+    assert "list" in command.list_commands(ctx)
+    # The resolved command is cached on the group
+    assert group.get_command(ctx, "prof") is command
+
+
+def test_lazy_group_resolves_command_function():
+    group = typer.main.get_command(_lazy_app())
+    ctx = typer.Context(group)
+
+    command = group.get_command(ctx, "secret")
+
+    assert command is not None
+    assert command.name == "secret"
+    assert command.hidden is True
+    assert group.get_command(ctx, "missing") is None
+
+
+def test_lazy_subcommand_help_comes_from_the_registration():
+    group = typer.main.get_command(_lazy_app())
+    ctx = typer.Context(group)
+
+    prof = group.get_command(ctx, "prof")
+    secret = group.get_command(ctx, "secret")
+
+    assert prof is not None and prof.help == "Lazy profiles"
+    assert secret is not None
+    assert not {"--install-completion", "--show-completion"} & {
+        opt for param in secret.params for opt in param.opts
+    }
@@ -0,0 +1,74 @@
+"""Unit tests for the async command runner."""
+
+import asyncio
+import subprocess
+import sys
+import time
+
+import pytest
+
+from vantage_cli.clouds import command_runner
+from vantage_cli.clouds.command_runner import run_command
+
+
+@pytest.fixture
+def mock_subprocess():
+    """Run real (python) subprocesses in this module."""
+    yield {}
+
+
+def _python(code: str) -> list:
+    return [sys.executable, "-c", code]
+
+
+@pytest.mark.asyncio
+async def test_output_is_streamed_line_by_line_and_captured():
+    lines: list = []
+    result = await run_command(
+        _python("import sys; print(sys.stdin.read().upper()); print('done', file=sys.stderr)"),
+        input="hello\nworld",
+        on_stdout=lines.append,
+    )
+
+    assert result.returncode == 0
+    assert result.stdout == "HELLO\nWORLD\n"
+    assert result.stderr == "done\n"
+    assert lines == ["HELLO", "WORLD"]
+
+
+@pytest.mark.asyncio
+async def test_check_raises_and_timeout_kills():
+    with pytest.raises(subprocess.CalledProcessError) as exc_info:
+        await run_command(_python("import sys; sys.exit(3)"), check=True)
+    assert exc_info.value.returncode == 3
+
+    started = time.monotonic()
+    with pytest.raises(subprocess.TimeoutExpired):
+        await run_command(_python("import time; time.sleep(30)"), timeout=0.2)
+    assert time.monotonic() - started < 10
+
+    with pytest.raises(FileNotFoundError):
+        await run_command(["definitely-not-a-vantage-binary"])
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limit_and_event_loop_stays_responsive(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(command_runner, "MAX_CONCURRENT_COMMANDS", 2)
+    monkeypatch.setattr(command_runner, "_semaphores", command_runner.weakref.WeakKeyDictionary())
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    tick_task = asyncio.create_task(ticker())
+    started = time.monotonic()
+    await asyncio.gather(*(run_command(_python("import time; time.sleep(0.3)")) for _ in range(4)))
+    elapsed = time.monotonic() - started
+    tick_task.cancel()
+
+    # Four 0.3s commands, two at a time
+    assert elapsed >= 0.6
+    assert ticks > 10
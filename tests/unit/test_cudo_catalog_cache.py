@@ -0,0 +1,130 @@
+"""Unit tests for the Cudo Compute catalog cache."""
+
+import json
+from pathlib import Path
+from typing import Optional
+
+import pytest
+from pydantic import BaseModel
+
+from vantage_cli.clouds.cudo_compute import catalog_cache
+from vantage_cli.clouds.cudo_compute.catalog_cache import (
+    CacheMode,
+    CatalogCacheStats,
+    CudoCatalog,
+    cache_mode,
+)
+
+
+class MachineType(BaseModel):
+    machine_type: str
+    data_center_id: str
+    max_vcpu_free: Optional[int] = None
+
+
+class FakeSDK:
+    api_key = "key"
+
+    def __init__(self):
+        self.calls = 0
+
+    async def list_vm_machine_types(self, project_id=None):
+        self.calls += 1
+        return [
+            MachineType(machine_type="epyc", data_center_id="gb-1", max_vcpu_free=32),
+            MachineType(machine_type="xeon", data_center_id="se-1"),
+            MachineType(machine_type="genoa", data_center_id="gb-1"),
+        ]
+
+    async def get_data_center(self, data_center_id):
+        self.calls += 1
+        return None
+
+
+@pytest.fixture(autouse=True)
+def fresh_memo(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(catalog_cache, "_loaded", {})
+
+
+def _catalog(tmp_path: Path, sdk: FakeSDK, mode: CacheMode = CacheMode.USE) -> CudoCatalog:
+    return CudoCatalog(sdk, mode=mode, cache_dir=tmp_path, stats=CatalogCacheStats())
+
+
+@pytest.mark.asyncio
+async def test_second_lookup_is_served_from_disk(tmp_path: Path):
+    sdk = FakeSDK()
+    first = _catalog(tmp_path, sdk)
+    await first.list_vm_machine_types()
+
+    # A new process only has the file on disk
+    catalog_cache._loaded.clear()
+    second = _catalog(tmp_path, sdk)
+    machine_types = await second.list_vm_machine_types()
+
+    assert sdk.calls == 1
+    assert [mt.machine_type for mt in machine_types] == ["epyc", "xeon", "genoa"]
+    assert isinstance(machine_types[0], MachineType)
+    assert machine_types[0].max_vcpu_free == 32
+    assert first.stats.misses == 1
+    assert second.stats.hits == 1
+    assert second.stats.hit_ratio == 1.0
+
+
+@pytest.mark.asyncio
+async def test_data_center_lookups_use_the_index(tmp_path: Path):
+    sdk = FakeSDK()
+    catalog = _catalog(tmp_path, sdk)
+
+    gb = await catalog.list_vm_machine_types(data_center_id="gb-1")
+    se = await catalog.list_vm_machine_types(data_center_id="se-1")
+    missing = await catalog.list_vm_machine_types(data_center_id="us-1")
+
+    assert [mt.machine_type for mt in gb] == ["epyc", "genoa"]
+    assert [mt.machine_type for mt in se] == ["xeon"]
+    assert missing == []
+    assert sdk.calls == 1
+    entry = json.loads(next(tmp_path.glob("vm_machine_types-*.json")).read_text())
+    assert entry["by_data_center"] == {"gb-1": [0, 2], "se-1": [1]}
+
+
+@pytest.mark.asyncio
+async def test_refresh_and_no_cache_modes(tmp_path: Path):
+    sdk = FakeSDK()
+    await _catalog(tmp_path, sdk).list_vm_machine_types()
+
+    await _catalog(tmp_path, sdk, cache_mode(refresh=True)).list_vm_machine_types()
+    assert sdk.calls == 2
+
+    bypass = _catalog(tmp_path, sdk, cache_mode(no_cache=True, refresh=True))
+    await bypass.list_vm_machine_types()
+    assert sdk.calls == 3
+    assert bypass.stats.bypassed == 1
+
+
+@pytest.mark.asyncio
+async def test_expired_entries_are_refetched(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    sdk = FakeSDK()
+    catalog = _catalog(tmp_path, sdk)
+    await catalog.list_vm_machine_types()
+
+    monkeypatch.setattr(catalog_cache, "CUDO_MACHINE_TYPE_CACHE_TTL_SECONDS", -1)
+    await catalog.list_vm_machine_types()
+
+    assert sdk.calls == 2
+    assert catalog.stats.expired == 1
+
+
+@pytest.mark.asyncio
+async def test_entries_are_scoped_to_api_key_and_misses_are_not_stored(tmp_path: Path):
+    sdk = FakeSDK()
+    await _catalog(tmp_path, sdk).list_vm_machine_types()
+
+    other = FakeSDK()
+    other.api_key = "other-key"
+    await _catalog(tmp_path, other).list_vm_machine_types()
+    assert other.calls == 1
+
+    catalog = _catalog(tmp_path, sdk)
+    assert await catalog.get_data_center("nowhere") is None
+    assert await catalog.get_data_center("nowhere") is None
+    assert sdk.calls == 3
@@ -0,0 +1,168 @@
+"""Unit tests for the Cudo Compute project teardown planner."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+import typer
+
+from vantage_cli.clouds.cudo_compute.cmds.project import delete as project_delete
+from vantage_cli.clouds.cudo_compute.main import project_app
+
+
+class FakeCudoSDK:
+    """In-memory project whose VMs disappear a couple of listings after termination."""
+
+    def __init__(self, vms: int = 0, disks: int = 0, networks: int = 0):
+        self.resources = {
+            "vms": {f"vm-{i}" for i in range(vms)},
+            "disks": {f"disk-{i}" for i in range(disks)},
+            "volumes": set(),
+            "security_groups": {"sg-0"},
+            "networks": {f"net-{i}" for i in range(networks)},
+        }
+        self.terminating: dict[str, int] = {}
+        self.events: list[tuple[str, str]] = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    def _lister(self, kind: str):
+        async def list_resources(project_id: str):
+            if kind == "vms":
+                for vm_id, polls in list(self.terminating.items()):
+                    if polls <= 1:
+                        self.resources["vms"].discard(vm_id)
+                        del self.terminating[vm_id]
+                    else:
+                        self.terminating[vm_id] = polls - 1
+            return [SimpleNamespace(id=r) for r in sorted(self.resources[kind])]
+
+        return list_resources
+
+    def __getattr__(self, name: str):
+        """Serve ``list_<kind>`` methods from the in-memory resources."""
+        if name.startswith("list_"):
+            return self._lister(name.removeprefix("list_"))
+        raise AttributeError(name)
+
+    async def _delete(self, kind: str, resource_id: str) -> None:
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        self.events.append((kind, resource_id))
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        if kind == "vms":
+            self.terminating[resource_id] = 2
+        else:
+            self.resources[kind].discard(resource_id)
+
+    async def terminate_vm(self, project_id: str, vm_id: str):
+        await self._delete("vms", vm_id)
+
+    async def delete_disk(self, project_id: str, disk_id: str):
+        await self._delete("disks", disk_id)
+
+    async def delete_volume(self, project_id: str, volume_id: str):
+        await self._delete("volumes", volume_id)
+
+    async def delete_security_group(self, project_id: str, security_group_id: str):
+        await self._delete("security_groups", security_group_id)
+
+    async def delete_network(self, project_id: str, network_id: str):
+        if network_id == "net-1":
+            raise RuntimeError("network busy")
+        await self._delete("networks", network_id)
+
+
+@pytest.fixture(autouse=True)
+def fast_polling(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(project_delete, "TEARDOWN_POLL_INITIAL_DELAY", 0.001)
+    monkeypatch.setattr(project_delete, "TEARDOWN_POLL_MAX_DELAY", 0.004)
+
+
+@pytest.mark.asyncio
+async def test_teardown_deletes_in_dependency_order_with_bounded_concurrency():
+    sdk = FakeCudoSDK(vms=6, disks=4, networks=2)
+    ctx = SimpleNamespace(obj=SimpleNamespace(cudo_sdk=sdk))
+
+    results = await project_delete._delete_all_project_resources(ctx, "proj", parallel=3)
+
+    kinds = [kind for kind, _ in sdk.events]
+    last_vm = max(i for i, kind in enumerate(kinds) if kind == "vms")
+    first_disk = kinds.index("disks")
+    last_sg = kinds.index("security_groups")
+    first_network = kinds.index("networks")
+
+    assert sdk.peak_in_flight == 3
+    assert last_vm < first_disk
+    assert last_sg < first_network
+    assert not sdk.resources["vms"]
+    assert [r.kind for r in results][:6] == ["VM"] * 6
+
+
+@pytest.mark.asyncio
+async def test_teardown_reports_per_resource_timing_and_failures():
+    sdk = FakeCudoSDK(vms=1, networks=2)
+    ctx = SimpleNamespace(obj=SimpleNamespace(cudo_sdk=sdk))
+
+    results = {
+        r.resource_id: r for r in await project_delete._delete_all_project_resources(ctx, "proj")
+    }
+
+    assert results["vm-0"].status == "deleted"
+    assert results["vm-0"].gone_seconds >= results["vm-0"].delete_seconds
+    assert results["net-0"].status == "deleted"
+    assert results["net-1"].status == "failed"
+    assert results["net-1"].gone_seconds is None
+    assert results["net-1"].error == "network busy"
+
+
+@pytest.mark.asyncio
+async def test_teardown_stops_waiting_after_timeout(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(project_delete, "TEARDOWN_WAIT_TIMEOUT", 0.02)
+    sdk = FakeCudoSDK(vms=1)
+    ctx = SimpleNamespace(obj=SimpleNamespace(cudo_sdk=sdk))
+
+    async def never_gone(project_id: str, vm_id: str):
+        sdk.events.append(("vms", vm_id))
+
+    sdk.terminate_vm = never_gone  # type: ignore[method-assign]
+
+    results = await project_delete._delete_all_project_resources(ctx, "proj")
+
+    assert [(r.resource_id, r.status) for r in results][0] == ("vm-0", "still present")
+    assert ("security_groups", "sg-0") in sdk.events
+
+
+@pytest.mark.asyncio
+async def test_failing_kind_does_not_cancel_the_other_kinds():
+    sdk = FakeCudoSDK(vms=1, disks=2, networks=1)
+    ctx = SimpleNamespace(obj=SimpleNamespace(cudo_sdk=sdk))
+    list_security_groups = sdk._lister("security_groups")
+
+    async def failing_list(project_id: str):
+        await list_security_groups(project_id)
+        raise RuntimeError("list failed")
+
+    sdk.list_security_groups = failing_list  # type: ignore[attr-defined]
+
+    results = await project_delete._delete_all_project_resources(ctx, "proj")
+
+    by_kind = {(r.kind, r.resource_id): r for r in results}
+    assert by_kind[("security group", "*")].status == "failed"
+    assert by_kind[("security group", "*")].error == "list failed"
+    # Independent disks and the dependent networks are still torn down
+    assert by_kind[("disk", "disk-1")].status == "deleted"
+    assert by_kind[("network", "net-0")].status == "deleted"
+    assert not sdk.resources["disks"] and not sdk.resources["networks"]
+
+
+def test_parallel_option_does_not_shadow_profile_short_flag():
+    group = typer.main.get_command(project_app)
+    command = group.get_command(None, "delete")  # type: ignore[arg-type]
+    params = command.make_context(
+        "delete", ["proj", "-p", "4", "--parallel", "2", "--force"]
+    ).params
+
+    assert params["parallel"] == 2
+    assert params["profile"] == "4"
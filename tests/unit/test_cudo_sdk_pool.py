@@ -0,0 +1,75 @@
+"""Unit tests for the shared CudoComputeSDK registry."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from vantage_cli.clouds.cudo_compute import sdk_pool
+from vantage_cli.clouds.cudo_compute.sdk_pool import CudoSDKPool
+
+
+class FakeSDK:
+    def __init__(self, api_key):
+        self.api_key = api_key
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+def _credential(api_key="key", credential_id="cred-1"):
+    return SimpleNamespace(id=credential_id, name="cudo", credentials_data={"api_key": api_key})
+
+
+@pytest.fixture(autouse=True)
+def fake_sdk(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(sdk_pool, "CudoComputeSDK", FakeSDK)
+
+
+@pytest.mark.asyncio
+async def test_same_credential_shares_one_client():
+    pool = CudoSDKPool()
+
+    first = pool.get(_credential())
+    second = pool.get(_credential())
+    other = pool.get(_credential(credential_id="cred-2"))
+
+    assert first is second
+    assert other is not first
+
+
+@pytest.mark.asyncio
+async def test_rotated_api_key_replaces_client_and_close_releases_all():
+    pool = CudoSDKPool()
+    old = pool.get(_credential("old-key"))
+    new = pool.get(_credential("new-key"))
+
+    assert new is not old
+    assert new.api_key == "new-key"
+
+    await pool.close()
+    assert old.closed and new.closed
+    assert pool.get(_credential("new-key")) is not new
+
+
+@pytest.mark.asyncio
+async def test_get_default_caches_the_credential_until_close(monkeypatch: pytest.MonkeyPatch):
+    lookups = []
+    credentials = [None, _credential("key-1"), _credential("key-2")]
+
+    def get_default(cloud_name):
+        lookups.append(cloud_name)
+        return credentials[len(lookups) - 1]
+
+    monkeypatch.setattr(sdk_pool.cloud_credential_sdk, "get_default", get_default)
+    pool = CudoSDKPool()
+
+    # A missing default is looked up again on the next call
+    assert pool.get_default() is None
+    first = pool.get_default()
+    assert first is not None and first is pool.get_default()
+    assert lookups == ["cudo-compute"] * 2
+
+    await pool.close()
+    assert pool.get_default().api_key == "key-2"
+    assert lookups == ["cudo-compute"] * 3
@@ -0,0 +1,149 @@
+"""Unit tests for adaptive dashboard refresh and in-place table patching."""
+
+import asyncio
+
+import pytest
+from textual.app import App, ComposeResult
+from textual.widgets import DataTable
+
+from vantage_cli.dashboard import DashboardApp, DashboardConfig
+from vantage_cli.dashboard.refresh import AdaptiveRefresh, TableModel, patch_table_rows
+
+
+def test_interval_backs_off_while_unchanged_and_resets_on_change():
+    policy = AdaptiveRefresh(base_interval=10, max_interval=120)
+    now = policy.last_activity
+
+    assert policy.next_interval(now) == 10
+    for _ in range(2):
+        policy.record_result(changed=False)
+    assert policy.next_interval(now) == 40
+    for _ in range(5):
+        policy.record_result(changed=False)
+    assert policy.next_interval(now) == 120
+
+    policy.record_result(changed=True)
+    assert policy.next_interval(now) == 10
+
+
+def test_interval_stretches_while_unfocused_or_idle():
+    policy = AdaptiveRefresh(base_interval=10, idle_after=60, inactive_factor=4)
+    now = policy.last_activity
+
+    policy.set_focused(False)
+    assert policy.next_interval(now) == 40
+    policy.set_focused(True)
+    now = policy.last_activity
+    assert policy.next_interval(now + 59) == 10
+    assert policy.is_idle(now + 60)
+    assert policy.next_interval(now + 60) == 40
+
+
+class _TableApp(App):
+    def compose(self) -> ComposeResult:
+        yield DataTable()
+
+    def on_mount(self) -> None:
+        table = self.query_one(DataTable)
+        table.add_columns("Name", "Status")
+        table.add_row("alpha", "READY", key="a")
+        table.add_row("beta", "PENDING", key="b")
+        table.add_row("gamma", "READY", key="c")
+
+
+@pytest.mark.asyncio
+async def test_patch_table_rows_touches_only_changed_rows():
+    app = _TableApp()
+    async with app.run_test():
+        table = app.query_one(DataTable)
+
+        patch = patch_table_rows(
+            table,
+            {"a": ["alpha", "READY"], "c": ["gamma", "FAILED"], "d": ["delta", "READY"]},
+        )
+
+        assert patch == (1, 1, 1, False)
+        assert [row.value for row in table.rows] == ["a", "c", "d"]
+        assert table.get_row("c") == ["gamma", "FAILED"]
+        assert not patch_table_rows(
+            table, {"a": ["alpha", "READY"], "c": ["gamma", "FAILED"], "d": ["delta", "READY"]}
+        ).changed
+
+
+@pytest.mark.asyncio
+async def test_table_model_keeps_cursor_on_the_same_item():
+    model = TableModel(
+        key=lambda item: item["id"], render=lambda item: (item["name"], item["state"])
+    )
+    items = [{"id": f"id-{i}", "name": f"item-{i}", "state": "READY"} for i in range(5)]
+    app = _TableApp()
+    async with app.run_test() as pilot:
+        table = app.query_one(DataTable)
+        table.clear()
+        model.sync(table, items)
+        table.move_cursor(row=3)
+        await pilot.pause()
+
+        # Rows above the cursor go away; the cursor follows its row
+        patch = model.sync(table, items[2:])
+        assert (patch.removed, patch.reordered) == (2, False)
+        assert table.cursor_row == 1
+        assert model.get(table.coordinate_to_cell_key(table.cursor_coordinate).row_key) is items[3]
+
+        # A new first row forces a rebuild in the new order; the cursor still follows
+        first = {"id": "id-new", "name": "new", "state": "PENDING"}
+        patch = model.sync(table, [first, *items[2:]])
+        assert patch.reordered
+        assert [row.key.value for row in table.ordered_rows][:2] == ["id-new", "id-2"]
+        assert table.cursor_row == 2
+
+        assert model.get("id-new") is first
+        assert "id-0" not in model
+        assert len(model) == 4
+
+        model.sync(table, [], placeholder=("empty", ("(none)", "")))
+        assert table.row_count == 1
+        assert model.get("empty") is None
+
+
+class _FakeTimer:
+    def __init__(self) -> None:
+        self.stopped = False
+
+    def stop(self) -> None:
+        self.stopped = True
+
+
+@pytest.mark.asyncio
+async def test_resume_during_a_refresh_keeps_a_single_timer_chain(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    app = DashboardApp(config=DashboardConfig(enable_logs=False))
+    timers: list = []
+    syncs: list = []
+    release = asyncio.Event()
+
+    def set_timer(delay, callback):
+        timers.append(_FakeTimer())
+        return timers[-1]
+
+    async def sync() -> bool:
+        syncs.append(len(syncs))
+        if len(syncs) == 1:
+            await release.wait()
+        return False
+
+    monkeypatch.setattr(app, "set_timer", set_timer)
+    monkeypatch.setattr(app, "_sync_refreshable_tables", sync)
+    monkeypatch.setattr(app, "call_later", lambda callback: asyncio.create_task(callback()))
+    app.refresh_policy.unchanged_streak = 3
+
+    refresh = asyncio.create_task(app.auto_refresh_data())
+    await asyncio.sleep(0)
+    app._resume_auto_refresh()
+    await app.auto_refresh_data()  # a timer that fires meanwhile is folded in too
+    release.set()
+    await refresh
+
+    assert len(syncs) == 2
+    assert [timer.stopped for timer in timers] == [False]
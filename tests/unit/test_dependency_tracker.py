@@ -0,0 +1,168 @@
+"""Unit tests for the concurrent dependency tracker."""
+
+import asyncio
+import time
+
+import pytest
+
+from vantage_cli.dependency_tracker import DependencyTracker, Worker, WorkerState
+
+
+def _sleeper(log: list, delay: float = 0.05, fail: bool = False):
+    async def run(worker_id: str):
+        log.append(("start", worker_id))
+        await asyncio.sleep(delay)
+        log.append(("end", worker_id))
+        if fail:
+            raise RuntimeError(f"{worker_id} broke")
+        return worker_id.upper()
+
+    return run
+
+
+@pytest.mark.asyncio
+async def test_independent_workers_run_concurrently_within_the_limit():
+    log: list = []
+    running = peak = 0
+
+    async def run(worker_id: str):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.05)
+        running -= 1
+        log.append(worker_id)
+
+    workers = [Worker(f"w{i}", run) for i in range(6)]
+    workers.append(Worker("last", run, depends_on=[f"w{i}" for i in range(6)]))
+    tracker = DependencyTracker(workers, max_concurrency=3)
+
+    started = time.monotonic()
+    assert await tracker.execute()
+
+    assert peak == 3
+    assert time.monotonic() - started < 0.25
+    assert log[-1] == "last"
+    assert tracker.progress() == 1.0
+
+
+@pytest.mark.asyncio
+async def test_failure_skips_dependents_but_not_independent_branches():
+    log: list = []
+    tracker = DependencyTracker(
+        [
+            Worker("broken", _sleeper(log, fail=True)),
+            Worker("child", _sleeper(log), depends_on=["broken"]),
+            Worker("grandchild", _sleeper(log), depends_on=["child"]),
+            Worker("other", _sleeper(log, delay=0.1)),
+            Worker("other-child", _sleeper(log), depends_on=["other"]),
+        ]
+    )
+
+    assert not await tracker.execute()
+
+    states = {w.id: w.state for w in tracker.workers.values()}
+    assert states == {
+        "broken": WorkerState.FAILED,
+        "child": WorkerState.SKIPPED,
+        "grandchild": WorkerState.SKIPPED,
+        "other": WorkerState.COMPLETE,
+        "other-child": WorkerState.COMPLETE,
+    }
+    assert {w.id for w in tracker.get_blocked_workers()} == {"child", "grandchild"}
+    assert tracker.results == {"other": "OTHER", "other-child": "OTHER-CHILD"}
+    with pytest.raises(RuntimeError, match="broken broke"):
+        tracker.raise_first_failure()
+
+
+@pytest.mark.asyncio
+async def test_fail_fast_cancels_running_workers():
+    log: list = []
+    tracker = DependencyTracker(
+        [
+            Worker("broken", _sleeper(log, delay=0.01, fail=True)),
+            Worker("slow", _sleeper(log, delay=5)),
+            Worker("after", _sleeper(log), depends_on=["slow"]),
+        ]
+    )
+
+    assert not await tracker.execute(fail_fast=True)
+
+    assert tracker.workers["slow"].state == WorkerState.CANCELLED
+    assert tracker.workers["after"].state == WorkerState.CANCELLED
+    assert ("end", "slow") not in log
+
+
+@pytest.mark.asyncio
+async def test_retries_with_backoff_then_succeeds():
+    attempts = []
+
+    def flaky(worker_id: str):
+        attempts.append(time.monotonic())
+        if len(attempts) < 3:
+            raise ConnectionError("try again")
+        return "ok"
+
+    tracker = DependencyTracker([Worker("flaky", flaky, retries=2, retry_delay=0.02)])
+
+    assert await tracker.execute()
+    assert tracker.workers["flaky"].result == "ok"
+    assert tracker.workers["flaky"].attempts == 3
+    assert attempts[2] - attempts[1] >= attempts[1] - attempts[0]
+
+
+@pytest.mark.asyncio
+async def test_cancel_then_retry_failed_runs_only_unfinished_workers():
+    log: list = []
+    tracker = DependencyTracker(
+        [
+            Worker("fast", _sleeper(log, delay=0.01)),
+            Worker("slow", _sleeper(log, delay=5)),
+            Worker("after", _sleeper(log, delay=0.01), depends_on=["slow"]),
+        ]
+    )
+
+    execution = asyncio.create_task(tracker.execute())
+    await asyncio.sleep(0.1)
+    tracker.cancel()
+    assert not await execution
+    assert tracker.get_status_summary()["cancelled"] == 2
+
+    tracker.workers["slow"].worker_func = _sleeper(log, delay=0.01)
+    assert sorted(tracker.retry_failed()) == ["after", "slow"]
+    log.clear()
+    assert await tracker.execute()
+    assert [entry for entry in log if entry[0] == "start"] == [
+        ("start", "slow"),
+        ("start", "after"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_progress_updates_are_reported():
+    updates = []
+    overall = []
+
+    async def work(worker_id: str):
+        tracker.report_progress(worker_id, 0.5, "halfway")
+        overall.append(tracker.progress())
+
+    tracker = DependencyTracker(
+        [Worker("a", work), Worker("b", work, depends_on=["a"])],
+        on_update=lambda w: updates.append((w.id, w.state, w.progress, w.message)),
+    )
+
+    assert await tracker.execute()
+    assert overall == [0.25, 0.75]
+    assert updates[:3] == [
+        ("a", WorkerState.IN_PROGRESS, 0.0, None),
+        ("a", WorkerState.IN_PROGRESS, 0.5, "halfway"),
+        ("a", WorkerState.COMPLETE, 1.0, "halfway"),
+    ]
+
+
+def test_cycles_are_rejected():
+    with pytest.raises(ValueError, match="Circular dependency"):
+        DependencyTracker(
+            [Worker("a", print, depends_on=["b"]), Worker("b", print, depends_on=["a"])]
+        )
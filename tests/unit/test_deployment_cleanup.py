@@ -0,0 +1,71 @@
+"""Unit tests for concurrent orphaned deployment cleanup."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+import typer
+
+from vantage_cli.commands.app.deployment import deployment_app
+from vantage_cli.commands.app.deployment.cleanup import _cleanup_deployments
+
+
+def _deployment(index: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=f"dep-{index}",
+        name=f"deployment-{index}",
+        app_name="slow-app",
+        cluster=SimpleNamespace(name=f"cluster-{index}"),
+    )
+
+
+def _ctx() -> SimpleNamespace:
+    return SimpleNamespace(obj=SimpleNamespace(json_output=True))
+
+
+@pytest.mark.asyncio
+async def test_cleanup_runs_at_most_parallel_removals():
+    running = 0
+    peak = 0
+
+    async def remove(ctx, deployment):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    apps = {"slow-app": SimpleNamespace(module=SimpleNamespace(remove=remove))}
+    orphaned = [_deployment(i) for i in range(6)]
+
+    results = await _cleanup_deployments(_ctx(), orphaned, apps, parallel=2, timeout=None)
+
+    assert peak == 2
+    assert [r["deployment_id"] for r in results] == [d.id for d in orphaned]
+    assert all(r["status"] == "cleaned" for r in results)
+
+
+@pytest.mark.asyncio
+async def test_cleanup_reports_timeouts_without_stopping_others():
+    async def remove(ctx, deployment):
+        if deployment.id == "dep-0":
+            await asyncio.sleep(10)
+
+    apps = {"slow-app": SimpleNamespace(module=SimpleNamespace(remove=remove))}
+
+    results = await _cleanup_deployments(
+        _ctx(), [_deployment(0), _deployment(1)], apps, parallel=2, timeout=0.05
+    )
+
+    assert results[0]["status"] == "timed out"
+    assert results[0]["success"] is False
+    assert results[1]["status"] == "cleaned"
+
+
+def test_parallel_option_does_not_shadow_profile_short_flag():
+    group = typer.main.get_command(deployment_app)
+    command = group.get_command(None, "cleanup-orphans")  # type: ignore[arg-type]
+    params = command.make_context("cleanup-orphans", ["--parallel", "3", "-p", "work"]).params
+
+    assert params["parallel"] == 3
+    assert params["profile"] == "work"
@@ -0,0 +1,245 @@
+"""Unit tests for the indexed deployment store."""
+
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+import yaml
+
+from vantage_cli.sdk.cloud.schema import Cloud
+from vantage_cli.sdk.cluster.schema import Cluster, VantageClusterContext
+from vantage_cli.sdk.deployment.crud import DeploymentSDK
+from vantage_cli.sdk.deployment.schema import Deployment
+from vantage_cli.sdk.deployment.store import DeploymentStore
+
+
+def _record(cluster: str, app: str = "slurm-lxd", cloud: str = "localhost", status="active"):
+    return {
+        "app_name": app,
+        "status": status,
+        "substrate": "lxd",
+        "created_at": datetime(2025, 1, 1, 12, 0),
+        "cluster": {
+            "name": cluster,
+            "status": "READY",
+            "client_id": f"{cluster}-id",
+            "description": "",
+            "owner_email": "user@example.com",
+            "provider": "on_prem",
+        },
+        "vantage_cluster_ctx": {
+            "cluster_name": cluster,
+            "client_id": f"{cluster}-id",
+            "client_secret": "secret",
+            "oidc_domain": "auth.example.com",
+            "oidc_base_url": "https://auth.example.com",
+            "base_api_url": "https://apis.example.com",
+            "tunnel_api_url": "https://tunnel.example.com",
+            "ldap_url": "ldap://ldap.example.com",
+            "sssd_binder_password": "password",
+            "org_id": "org",
+            "jupyterhub_token": "token",
+        },
+        "cloud": {"id": cloud, "vantage_provider_label": "on_prem", "substrates": ["lxd"]},
+    }
+
+
+def _write_deployment(status: str = "init") -> Deployment:
+    record = _record("alpha")
+    deployment = Deployment(
+        app_name="slurm-lxd",
+        cluster=Cluster(**record["cluster"]),
+        vantage_cluster_ctx=VantageClusterContext(**record["vantage_cluster_ctx"]),
+        cloud=Cloud(**record["cloud"]),
+        substrate="lxd",
+        status=status,
+        additional_metadata={"nodes": 2},
+    )
+    deployment.write()
+    return deployment
+
+
+@pytest.fixture
+def store(tmp_path: Path):
+    store = DeploymentStore(tmp_path / "deployments.db", tmp_path / "deployments.yaml")
+    yield store
+    store.close()
+
+
+def test_put_get_and_versioning(store: DeploymentStore):
+    store.put("dep-1", _record("alpha"))
+    assert store.get("dep-1").version == 1
+
+    store.put("dep-1", _record("alpha", status="error"))
+    stored = store.get("dep-1")
+
+    assert stored.version == 2
+    assert stored.record["status"] == "error"
+    assert stored.record["created_at"] == "2025-01-01T12:00:00"
+    assert store.get("missing") is None
+
+
+def test_list_uses_secondary_indexes(store: DeploymentStore):
+    store.put("dep-1", _record("alpha", app="slurm-lxd"))
+    store.put("dep-2", _record("alpha", app="jupyterhub", status="error"))
+    store.put("dep-3", _record("beta", cloud="Cudo-Compute"))
+
+    assert [s.id for s in store.list(cluster_name="alpha")] == ["dep-1", "dep-2"]
+    assert [s.id for s in store.list(app_name="jupyterhub")] == ["dep-2"]
+    assert [s.id for s in store.list(cloud="cudo-compute")] == ["dep-3"]
+    assert [s.id for s in store.list(cluster_name="alpha", status="active")] == ["dep-1"]
+    assert len(store.list()) == 3
+
+
+def test_update_status_and_delete(store: DeploymentStore):
+    store.put("dep-1", _record("alpha"))
+
+    assert store.update_status("dep-1", "deleting") is True
+    assert store.get("dep-1").record["status"] == "deleting"
+    assert [s.id for s in store.list(status="deleting")] == ["dep-1"]
+    assert store.update_status("missing", "deleting") is False
+
+    assert store.delete("dep-1") is True
+    assert store.delete("dep-1") is False
+
+
+def test_generation_changes_on_every_write(store: DeploymentStore, tmp_path: Path):
+    other = DeploymentStore(tmp_path / "deployments.db", tmp_path / "deployments.yaml")
+    seen = [store.generation()]
+
+    store.put("dep-1", _record("alpha"))
+    seen.append(other.generation())
+    store.update_status("dep-1", "deleting")
+    seen.append(other.generation())
+    store.delete("dep-1")
+    seen.append(other.generation())
+    store.delete("dep-1")
+    seen.append(other.generation())
+    other.close()
+
+    assert seen[:4] == sorted(set(seen[:4]))
+    assert seen[4] == seen[3]
+
+
+def test_migrates_legacy_yaml_once(tmp_path: Path):
+    legacy = tmp_path / "deployments.yaml"
+    legacy.write_text(yaml.dump({"deployments": {"dep-1": _record("alpha")}}))
+
+    store = DeploymentStore(tmp_path / "deployments.db", legacy)
+    assert [s.id for s in store.list(cluster_name="alpha")] == ["dep-1"]
+    store.close()
+
+    assert not legacy.exists()
+    assert (tmp_path / "deployments.yaml.migrated").exists()
+
+    # A YAML file written later by an older CLI is not imported again
+    legacy.write_text(yaml.dump({"deployments": {"dep-2": _record("beta")}}))
+    reopened = DeploymentStore(tmp_path / "deployments.db", legacy)
+    assert [s.id for s in reopened.list()] == ["dep-1"]
+    reopened.close()
+
+
+@pytest.mark.asyncio
+async def test_sdk_round_trips_deployments(store: DeploymentStore, monkeypatch):
+    monkeypatch.setattr("vantage_cli.sdk.deployment.schema.deployment_store", store)
+    sdk = DeploymentSDK(store=store)
+    ctx = SimpleNamespace(obj=None)
+    deployment = _write_deployment()
+
+    assert await sdk.update_deployment_status(ctx, deployment.id, "active")  # type: ignore[arg-type]
+    loaded = await sdk.get_deployment(ctx, deployment.id)  # type: ignore[arg-type]
+    by_cluster = await sdk.get_deployments_by_cluster(ctx, "alpha")  # type: ignore[arg-type]
+
+    assert loaded is not None
+    assert loaded.status == "active"
+    assert loaded.cluster.name == "alpha"
+    assert [d.id for d in by_cluster] == [deployment.id]
+    assert await sdk.list(ctx, cloud="LOCALHOST") != []  # type: ignore[arg-type]
+    assert await sdk.delete(deployment.id)
+    assert await sdk.get_deployment(ctx, deployment.id) is None  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+async def test_hydration_is_cached_per_record_version(store: DeploymentStore, monkeypatch):
+    monkeypatch.setattr("vantage_cli.sdk.deployment.schema.deployment_store", store)
+    sdk = DeploymentSDK(store=store)
+    ctx = SimpleNamespace(obj=None)
+    deployment = _write_deployment()
+    constructed = []
+    original = sdk._construct_deployment
+
+    def counting_construct(deployment_id, deployment_data):
+        constructed.append(deployment_id)
+        return original(deployment_id, deployment_data)
+
+    monkeypatch.setattr(sdk, "_construct_deployment", counting_construct)
+
+    first = await sdk.list(ctx)  # type: ignore[arg-type]
+    second = await sdk.list(ctx)  # type: ignore[arg-type]
+
+    assert constructed == [deployment.id]
+    assert first[0] is not second[0]
+    assert first[0].model_dump() == second[0].model_dump()
+    assert first[0].additional_metadata == {"nodes": 2}
+
+    # Callers mutating a returned object do not affect the cache
+    first[0].status = "mutated"
+    first[0].cluster.name = "mutated"
+    first[0].additional_metadata["nodes"] = 99
+    cached = await sdk.get_deployment(ctx, deployment.id)  # type: ignore[arg-type]
+    assert cached.status == "init"
+    assert cached.cluster.name == deployment.cluster.name
+    assert cached.additional_metadata == {"nodes": 2}
+
+    # A new store version is hydrated again
+    await sdk.update_deployment_status(ctx, deployment.id, "active")  # type: ignore[arg-type]
+    refreshed = await sdk.get_deployment(ctx, deployment.id)  # type: ignore[arg-type]
+
+    assert refreshed.status == "active"
+    assert constructed == [deployment.id, deployment.id]
+
+
+def test_cli_written_records_match_validated_hydration(store: DeploymentStore, monkeypatch):
+    monkeypatch.setattr("vantage_cli.sdk.deployment.schema.deployment_store", store)
+    sdk = DeploymentSDK(store=store)
+    deployment = _write_deployment()
+    record = store.get(deployment.id).record
+
+    fast = sdk._construct_deployment(deployment.id, record)
+    validated = sdk._validate_deployment(deployment.id, record)
+
+    assert fast is not None and validated is not None
+    assert fast.model_dump() == validated.model_dump()
+
+
+def test_legacy_yaml_is_kept_when_the_migration_does_not_commit(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    legacy = tmp_path / "deployments.yaml"
+    legacy.write_text(yaml.dump({"deployments": {"dep-1": _record("alpha")}}))
+
+    class FailingConnection(sqlite3.Connection):
+        def execute(self, sql, *args):
+            if sql.startswith("PRAGMA user_version ="):
+                raise sqlite3.OperationalError("disk I/O error")
+            return super().execute(sql, *args)
+
+    connect = sqlite3.connect
+    monkeypatch.setattr(
+        sqlite3,
+        "connect",
+        lambda *args, **kwargs: connect(*args, factory=FailingConnection, **kwargs),
+    )
+    with pytest.raises(sqlite3.OperationalError):
+        DeploymentStore(tmp_path / "deployments.db", legacy).list()
+    monkeypatch.undo()
+
+    assert legacy.exists()
+    assert not (tmp_path / "deployments.yaml.migrated").exists()
+
+    store = DeploymentStore(tmp_path / "deployments.db", legacy)
+    assert [s.id for s in store.list()] == ["dep-1"]
+    store.close()
+    assert not legacy.exists()
@@ -0,0 +1,74 @@
+"""Unit tests for the shared GraphQL client pool."""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+import vantage_cli.gql_client as gql_client
+from vantage_cli.config import Settings
+from vantage_cli.gql_client import GraphQLClientPool
+
+
+def _fake_client(url: str) -> Mock:
+    client = Mock()
+    client.config = Mock(url=url)
+    client.persona = Mock()
+    client.close = AsyncMock()
+    return client
+
+
+@pytest.fixture
+def created_clients(monkeypatch: pytest.MonkeyPatch):
+    created = []
+
+    def fake_create(self, keep_alive: bool = False):
+        assert keep_alive is True
+        client = _fake_client(f"{self.settings.get_apis_url()}{self.base_path}")
+        created.append(client)
+        return client
+
+    monkeypatch.setattr(gql_client.VantageGQLClient, "create", fake_create)
+    monkeypatch.setattr(gql_client, "is_token_expired", lambda token: False)
+    return created
+
+
+def test_pool_reuses_client_per_profile_and_base_path(created_clients):
+    pool = GraphQLClientPool()
+    settings = Settings()
+
+    first = pool.get(settings, "default", "/cluster/graphql")
+    second = pool.get(settings, "default", "/cluster/graphql")
+    sos = pool.get(settings, "default", "/sos/graphql")
+    other_profile = pool.get(settings, "staging", "/cluster/graphql")
+
+    assert first is second
+    assert sos is not first
+    assert other_profile is not first
+    assert len(created_clients) == 3
+
+
+def test_pool_replaces_client_when_url_changes(created_clients):
+    pool = GraphQLClientPool()
+
+    first = pool.get(Settings(), "default")
+    second = pool.get(Settings(vantage_url="https://app.example.com"), "default")
+
+    assert first is not second
+    assert second.config.url == "https://apis.example.com/cluster/graphql"
+
+
+@pytest.mark.asyncio
+async def test_pool_close_closes_all_sessions(created_clients):
+    pool = GraphQLClientPool()
+    settings = Settings()
+
+    pool.get(settings, "default", "/cluster/graphql")
+    pool.get(settings, "default", "/sos/graphql")
+    await pool.close()
+
+    for client in created_clients:
+        client.close.assert_awaited_once()
+
+    # A fresh client is created after shutdown
+    pool.get(settings, "default", "/cluster/graphql")
+    assert len(created_clients) == 3
@@ -0,0 +1,79 @@
+"""Unit tests for batched GraphQL lookups."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from vantage_cli.gql_client import (
+    GraphQLClientConfig,
+    GraphQLDataLoader,
+    GraphQLError,
+    VantageGraphQLClient,
+)
+
+
+@pytest.mark.asyncio
+async def test_loads_in_the_same_tick_share_one_batch():
+    batches = []
+
+    async def batch_load(keys):
+        batches.append(list(keys))
+        return [key.upper() for key in keys]
+
+    loader = GraphQLDataLoader(batch_load)
+    results = await asyncio.gather(loader.load("a"), loader.load("b"), loader.load("a"))
+
+    assert results == ["A", "B", "A"]
+    assert batches == [["a", "b"]]
+
+
+@pytest.mark.asyncio
+async def test_batches_are_split_by_max_batch_size():
+    batches = []
+
+    async def batch_load(keys):
+        batches.append(list(keys))
+        return keys
+
+    loader = GraphQLDataLoader(batch_load, max_batch_size=2)
+    assert await loader.load_many([1, 2, 3, 4, 5]) == [1, 2, 3, 4, 5]
+    assert batches == [[1, 2], [3, 4], [5]]
+
+
+@pytest.mark.asyncio
+async def test_batch_errors_propagate_to_every_caller():
+    loader = GraphQLDataLoader(AsyncMock(side_effect=GraphQLError("boom")))
+
+    results = await asyncio.gather(loader.load(1), loader.load(2), return_exceptions=True)
+
+    assert all(isinstance(result, GraphQLError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_execute_aliased_builds_one_request():
+    client = VantageGraphQLClient(GraphQLClientConfig(url="https://example.com/graphql"))
+    client.execute_async = AsyncMock(return_value={"r0": {"edges": []}, "r1": {"edges": [1]}})
+
+    results = await client.execute_aliased(
+        "clusters",
+        "{ edges { node { name } } }",
+        {"filters": "JSONScalar"},
+        [{"filters": {"name": {"eq": "a"}}}, {"filters": {"name": {"eq": "b"}}}],
+    )
+
+    assert results == [{"edges": []}, {"edges": [1]}]
+    query, variables = client.execute_async.await_args.args
+    assert "query BatchedQuery($filters0: JSONScalar, $filters1: JSONScalar)" in query
+    assert "r1: clusters(filters: $filters1)" in query
+    assert variables == {
+        "filters0": {"name": {"eq": "a"}},
+        "filters1": {"name": {"eq": "b"}},
+    }
+
+
+def test_dataloader_is_shared_per_client():
+    client = VantageGraphQLClient(GraphQLClientConfig(url="https://example.com/graphql"))
+    batch_load = Mock()
+
+    assert client.dataloader("clusters", batch_load) is client.dataloader("clusters", batch_load)
@@ -0,0 +1,76 @@
+"""Unit tests for the on-disk GraphQL schema cache."""
+
+import json
+import time
+
+import pytest
+from graphql import build_schema, get_introspection_query, graphql_sync
+
+import vantage_cli.gql_schema_cache as schema_cache
+
+URL = "https://apis.example.com/cluster/graphql"
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(schema_cache, "USER_SCHEMA_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(schema_cache, "_parsed_schemas", {})
+    return tmp_path
+
+
+@pytest.fixture
+def introspection():
+    schema = build_schema("type Query { clusters: [String] }")
+    return graphql_sync(schema, get_introspection_query()).data
+
+
+def test_round_trip_builds_schema_once(introspection):
+    schema_cache.save_schema_to_cache(URL, introspection)
+
+    first = schema_cache.load_cached_schema(URL)
+    second = schema_cache.load_cached_schema(URL)
+
+    assert first is not None
+    assert "clusters" in first.query_type.fields
+    assert first is second
+
+
+def test_warm_lookup_does_not_reread_the_file(introspection, monkeypatch: pytest.MonkeyPatch):
+    schema_cache.save_schema_to_cache(URL, introspection)
+    first = schema_cache.load_cached_schema(URL)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("cache file was read again")
+
+    monkeypatch.setattr(schema_cache, "_load_entry", fail)
+    monkeypatch.setattr(schema_cache, "_content_hash", fail)
+    assert schema_cache.load_cached_schema(URL) is first
+
+    later = time.time() + 2 * 24 * 60 * 60
+    monkeypatch.setattr(schema_cache.time, "time", lambda: later)
+    assert schema_cache.load_cached_schema(URL) is None
+
+
+def test_entry_from_other_cli_version_is_ignored(introspection):
+    path = schema_cache.save_schema_to_cache(URL, introspection)
+    entry = json.loads(path.read_text())
+    entry["cli_version"] = "0.0.0-other"
+    path.write_text(json.dumps(entry))
+
+    assert schema_cache.load_cached_schema(URL) is None
+
+
+def test_stale_entry_is_ignored(introspection, monkeypatch: pytest.MonkeyPatch):
+    schema_cache.save_schema_to_cache(URL, introspection)
+    later = time.time() + 2 * 24 * 60 * 60
+    monkeypatch.setattr(schema_cache.time, "time", lambda: later)
+
+    assert schema_cache.load_cached_introspection(URL) is None
+    assert schema_cache.load_cached_introspection(URL, max_age=None) == introspection
+
+
+def test_clear_schema_cache(introspection):
+    schema_cache.save_schema_to_cache(URL, introspection)
+    schema_cache.clear_schema_cache()
+
+    assert schema_cache.load_cached_schema(URL) is None
@@ -0,0 +1,91 @@
+"""Unit tests for the shared async HTTP client pool."""
+
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from httpx import AsyncClient
+
+from vantage_cli.http_client_pool import HttpClientPool
+from vantage_cli.jupyterhub_client import JupyterHubClient
+from vantage_cli.vantage_rest_api_client import VantageRestApiClient
+
+
+@pytest.fixture(autouse=True)
+def real_async_client(monkeypatch: pytest.MonkeyPatch):
+    """Undo the global httpx mock; these clients never open a connection."""
+    monkeypatch.setattr(httpx, "AsyncClient", AsyncClient)
+
+
+@pytest.mark.asyncio
+async def test_pool_reuses_client_per_origin():
+    pool = HttpClientPool(http2=False)
+
+    apis = pool.get("https://apis.example.com")
+    jobbergate = pool.get("https://apis.example.com/jobbergate")
+    hub = pool.get("https://hub.example.com/hub/api")
+
+    assert apis is jobbergate
+    assert hub is not apis
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_pool_applies_connection_limits():
+    pool = HttpClientPool(max_connections=7, max_keepalive_connections=3, http2=False)
+
+    pool.get("https://apis.example.com")
+
+    assert pool.limits.max_connections == 7
+    assert pool.limits.max_keepalive_connections == 3
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_pool_close_closes_clients_and_recreates():
+    pool = HttpClientPool(http2=False)
+    first = pool.get("https://apis.example.com")
+
+    await pool.close()
+
+    assert first.is_closed
+    second = pool.get("https://apis.example.com")
+    assert second is not first
+    assert not second.is_closed
+    await pool.close()
+
+
+def test_pool_replaces_client_bound_to_finished_loop():
+    pool = HttpClientPool(http2=False)
+
+    async def get_client() -> httpx.AsyncClient:
+        return pool.get("https://apis.example.com")
+
+    first = asyncio.run(get_client())
+    second = asyncio.run(get_client())
+
+    assert second is not first
+
+
+@pytest.mark.asyncio
+async def test_rest_and_jupyterhub_clients_share_pool(monkeypatch: pytest.MonkeyPatch):
+    pool = HttpClientPool(http2=False)
+    monkeypatch.setattr("vantage_cli.vantage_rest_api_client.http_client_pool", pool)
+    monkeypatch.setattr("vantage_cli.jupyterhub_client.http_client_pool", pool)
+
+    settings = SimpleNamespace(get_apis_url=lambda: "https://apis.example.com")
+    ctx = SimpleNamespace(obj=SimpleNamespace(settings=settings, persona=None, profile="default"))
+    licenses = VantageRestApiClient(ctx, base_path="/lm")  # type: ignore[arg-type]
+    jobs = VantageRestApiClient(ctx, base_path="/jobbergate")  # type: ignore[arg-type]
+    hub_a = JupyterHubClient("https://hub.example.com", "token")
+    hub_b = JupyterHubClient("https://hub.example.com/", "other-token")
+
+    assert licenses.client is jobs.client
+    assert hub_a.client is hub_b.client
+
+    await licenses.close()
+    await hub_a.close()
+    assert not jobs.client.is_closed
+    assert not hub_b.client.is_closed
+    await pool.close()
@@ -0,0 +1,92 @@
+"""Unit tests for the dashboard debug-log tail engine."""
+
+import asyncio
+import logging
+from pathlib import Path
+
+import pytest
+
+from vantage_cli.dashboard import log_tail
+from vantage_cli.dashboard.log_tail import DebugLogTail, tail_lines, watch_log_file
+
+
+def _record(level: str, message: str) -> str:
+    return f"2025-01-01 12:00:00 | {level:<8} | vantage_cli.test:fn:1 - {message}\n"
+
+
+def _message(line: str) -> str:
+    return line.split(" - ")[-1]
+
+
+def test_tail_lines_reads_backwards_in_blocks(tmp_path: Path):
+    log = tmp_path / "debug.log"
+    log.write_text("".join(f"line {i}\n" for i in range(1000)) + "partial")
+
+    with open(log, "rb") as handle:
+        lines, offset = tail_lines(handle, log.stat().st_size, 3, block_size=16)
+
+    assert lines == ["line 997", "line 998", "line 999"]
+    assert offset == log.stat().st_size - len("partial")
+
+
+def test_poll_follows_appends_rotation_and_truncation(tmp_path: Path):
+    log = tmp_path / "debug.log"
+    log.write_text("".join(_record("INFO", f"old {i}") for i in range(10)))
+    tail = DebugLogTail(log, max_lines=4)
+
+    assert [_message(line) for line in tail.open()] == ["old 6", "old 7", "old 8", "old 9"]
+    assert tail.poll() == []
+
+    with open(log, "a") as f:
+        f.write(_record("INFO", "new 1") + "half a li")
+    assert [_message(line) for line in tail.poll()] == ["new 1"]
+
+    # RotatingFileHandler: finish the line, rename away, start a fresh file
+    with open(log, "a") as f:
+        f.write("ne\n")
+    log.rename(tmp_path / "debug.log.1")
+    log.write_text(_record("INFO", "rotated"))
+    assert [_message(line) for line in tail.poll()] == ["half a line", "rotated"]
+
+    # Truncated in place (same inode, smaller than what was read)
+    log.write_text(_record("INFO", "t"))
+    assert [_message(line) for line in tail.poll()] == ["t"]
+    assert len(tail.lines()) == 4
+
+
+def test_level_filter_applies_before_rendering_and_to_continuations(tmp_path: Path):
+    log = tmp_path / "debug.log"
+    log.write_text(
+        _record("DEBUG", "noise")
+        + _record("ERROR", "boom")
+        + "Traceback (most recent call last):\n"
+        + _record("INFO", "hello")
+    )
+    tail = DebugLogTail(log, level=logging.WARNING)
+
+    assert [_message(line) for line in tail.open()] == [
+        "boom",
+        "Traceback (most recent call last):",
+    ]
+    assert len(tail.set_level(logging.DEBUG)) == 4
+
+
+@pytest.mark.asyncio
+async def test_watch_log_file_coalesces_writes(tmp_path: Path):
+    if log_tail._load_inotify() is None:
+        pytest.skip("inotify is not available")
+    log = tmp_path / "debug.log"
+    calls = []
+
+    stop = watch_log_file(log, lambda: calls.append(1), delay=0.05)
+    assert stop is not None
+    try:
+        for i in range(5):
+            with open(log, "a") as f:
+                f.write(_record("INFO", str(i)))
+        (tmp_path / "unrelated.json").write_text("{}")
+        await asyncio.sleep(0.3)
+    finally:
+        stop()
+
+    assert calls == [1]
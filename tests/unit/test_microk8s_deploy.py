@@ -0,0 +1,105 @@
+"""Unit tests for the MicroK8s deployment dependency graph."""
+
+import asyncio
+import subprocess
+from io import StringIO
+
+import pytest
+import yaml
+from rich.console import Console
+
+from vantage_cli.clouds.localhost.apps.slurm_microk8s import utils as microk8s_utils
+from vantage_cli.dependency_tracker import DependencyTracker, Worker, WorkerState
+
+
+@pytest.fixture
+def commands(monkeypatch: pytest.MonkeyPatch):
+    """Record commands instead of running them; the CRD chart optionally fails."""
+    log: list = []
+    state = {"fail_crds": False}
+
+    async def fake_run(cmd, input=None, **kwargs):
+        name = cmd[4] if cmd[2] == "upgrade" else " ".join(cmd[1:4])
+        log.append(("start", name, input))
+        await asyncio.sleep(0.01)
+        if state["fail_crds"] and "crds" in name:
+            raise subprocess.CalledProcessError(1, cmd)
+        log.append(("end", name, None))
+        return subprocess.CompletedProcess(cmd, 0, b"", b"")
+
+    async def all_met(*args, **kwargs):
+        return True, []
+
+    monkeypatch.setattr(microk8s_utils, "run_command", fake_run)
+    monkeypatch.setattr(microk8s_utils, "check_prerequisites", all_met)
+    return log, state
+
+
+def _events(log):
+    return [(event, name) for event, name, _ in log]
+
+
+async def _deploy():
+    await microk8s_utils.deploy_microk8s_stack(
+        console=Console(file=StringIO()),
+        verbose=False,
+        set_values={"clusterName": "demo"},
+        chart_values={"clusterName": "demo"},
+    )
+
+
+@pytest.mark.asyncio
+async def test_independent_charts_install_concurrently(commands):
+    log, _ = commands
+    await _deploy()
+    events = _events(log)
+
+    namespace_applies = [
+        data for event, name, data in log if name == "kubectl apply -f" and event == "start"
+    ]
+    assert len(namespace_applies) == 1
+    assert len(list(yaml.safe_load_all(namespace_applies[0]))) == 4
+
+    # Prometheus and the operator CRDs overlap
+    assert events.index(("start", "slurm-operator-crds")) < events.index(("end", "prometheus"))
+    assert events.index(("start", "prometheus")) < events.index(("end", "slurm-operator-crds"))
+    assert events.index(("end", "slurm-operator")) < events.index(("start", "slurm"))
+
+
+@pytest.mark.asyncio
+async def test_failed_step_skips_dependents(commands):
+    log, state = commands
+    state["fail_crds"] = True
+
+    with pytest.raises(
+        RuntimeError, match="slurm-operator-crds: Failed to install SLURM operator CRDs"
+    ) as exc_info:
+        await _deploy()
+
+    assert "skipped: slurm-operator, slurm-cluster" in str(exc_info.value)
+    assert ("end", "prometheus") in _events(log)
+    assert ("start", "slurm") not in _events(log)
+
+
+@pytest.mark.asyncio
+async def test_tracker_execute_records_results_and_timings():
+    async def slow(worker_id):
+        await asyncio.sleep(0.01)
+        return worker_id.upper()
+
+    tracker = DependencyTracker(
+        [
+            Worker("a", slow),
+            Worker("b", lambda worker_id: "sync"),
+            Worker("c", slow, depends_on=["a", "b"]),
+        ]
+    )
+    await tracker.execute()
+
+    assert tracker.is_complete()
+    assert tracker.workers["c"].result == "C"
+    assert tracker.workers["b"].result == "sync"
+    assert tracker.workers["c"].started_at >= tracker.workers["a"].finished_at
+    assert all(
+        w.state == WorkerState.COMPLETE and w.duration >= 0 for w in tracker.workers.values()
+    )
@@ -293,3 +293,63 @@ async def test_notebook_sdk_create_notebook_rejects_invalid_memory(
         )
 
     assert "Invalid memory specification" in str(excinfo.value)
+
+
+@pytest.mark.asyncio
+async def test_notebook_sdk_list_notebooks_follows_pages(monkeypatch: pytest.MonkeyPatch):
+    """Listing should follow pageInfo cursors instead of truncating at the first page."""
+    ctx = Mock(spec=typer.Context)
+    ctx.obj = SimpleNamespace(profile="default", settings=Mock())
+
+    def page(names, cursor, has_next):
+        return {
+            "notebookServers": {
+                "edges": [
+                    {"node": {"id": name, "name": name, "clusterName": "cluster-a"}}
+                    for name in names
+                ],
+                "pageInfo": {"hasNextPage": has_next, "endCursor": cursor},
+            }
+        }
+
+    mock_client = Mock()
+    mock_client.execute_async = AsyncMock(
+        side_effect=[page(["nb1", "nb2"], "c1", True), page(["nb3"], "c2", False)]
+    )
+    monkeypatch.setattr(
+        "vantage_cli.sdk.notebook.crud.create_async_graphql_client",
+        Mock(return_value=mock_client),
+    )
+
+    notebooks = await NotebookSDK().list_notebooks(ctx, page_size=2)
+
+    assert [notebook.name for notebook in notebooks] == ["nb1", "nb2", "nb3"]
+    _, second_variables = mock_client.execute_async.await_args_list[1].args
+    assert second_variables == {"first": 2, "after": "c1"}
+
+
+@pytest.mark.asyncio
+async def test_notebook_sdk_list_notebooks_pushes_cluster_filter(monkeypatch: pytest.MonkeyPatch):
+    """The cluster filter should be sent to the API instead of applied client-side."""
+    ctx = Mock(spec=typer.Context)
+    ctx.obj = SimpleNamespace(profile="default", settings=Mock())
+
+    mock_client = Mock()
+    mock_client.execute_async = AsyncMock(
+        return_value={
+            "notebookServers": {
+                "edges": [{"node": {"id": "1", "name": "nb1", "clusterName": "cluster-a"}}],
+                "pageInfo": {"hasNextPage": False, "endCursor": None},
+            }
+        }
+    )
+    monkeypatch.setattr(
+        "vantage_cli.sdk.notebook.crud.create_async_graphql_client",
+        Mock(return_value=mock_client),
+    )
+
+    notebooks = await NotebookSDK().list_notebooks(ctx, cluster="cluster-a", limit=5)
+
+    assert [notebook.name for notebook in notebooks] == ["nb1"]
+    _, variables = mock_client.execute_async.await_args.args
+    assert variables == {"first": 5, "filters": {"clusterName": {"eq": "cluster-a"}}}
@@ -0,0 +1,95 @@
+"""Unit tests for concurrent, cached prerequisite checks."""
+
+import asyncio
+import os
+import subprocess
+import time
+from io import StringIO
+from pathlib import Path
+
+import pytest
+import yaml
+from rich.console import Console
+
+from vantage_cli.clouds import utils as cloud_utils
+from vantage_cli.clouds.localhost.apps.slurm_microk8s.utils import (
+    create_microk8s_addon_prerequisite_checks,
+)
+from vantage_cli.clouds.utils import PrerequisiteCheck, PrerequisiteStatus, check_prerequisites
+
+MICROK8S_STATUS = yaml.safe_dump(
+    {
+        "microk8s": {"running": True},
+        "addons": [
+            {"name": "dns", "status": "enabled"},
+            {"name": "hostpath-storage", "status": "enabled"},
+            {"name": "metallb", "status": "disabled"},
+        ],
+    }
+)
+
+
+@pytest.fixture
+def probes(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    """Fake every command and point binaries and the cache file at tmp_path."""
+    binary = tmp_path / "tool"
+    binary.write_text("")
+    calls: list = []
+
+    async def fake_run(command, timeout=None, **kwargs):
+        calls.append(command)
+        await asyncio.sleep(0.1)
+        stdout = MICROK8S_STATUS if command[1] == "status" else "tool 1.0\n"
+        return subprocess.CompletedProcess(command, 0, stdout, "")
+
+    monkeypatch.setattr(cloud_utils, "run_command", fake_run)
+    monkeypatch.setattr(cloud_utils.shutil, "which", lambda name: str(binary))
+    monkeypatch.setattr(cloud_utils, "USER_PREREQUISITE_CACHE_FILE", tmp_path / "cache.json")
+    return calls, binary
+
+
+async def _check(checks):
+    return await check_prerequisites(checks, Console(file=StringIO()), show_table=False)
+
+
+@pytest.mark.asyncio
+async def test_checks_run_concurrently_and_share_microk8s_status(probes):
+    calls, _ = probes
+    checks = [
+        PrerequisiteCheck(name=f"tool-{i}", command=[f"tool-{i}", "--version"]) for i in range(4)
+    ] + create_microk8s_addon_prerequisite_checks()
+
+    started = time.monotonic()
+    all_met, results = await _check(checks)
+
+    assert time.monotonic() - started < 0.35
+    assert calls.count(["microk8s", "status", "--format", "yaml"]) == 1
+    assert not all_met
+    statuses = {result.name: result.status for result in results}
+    assert statuses["microk8s dns addon"] == PrerequisiteStatus.AVAILABLE
+    assert statuses["microk8s metallb addon"] == PrerequisiteStatus.MISSING
+    assert [result.name for result in results] == [check.name for check in checks]
+
+
+@pytest.mark.asyncio
+async def test_successful_results_are_cached_until_the_binary_changes(probes):
+    calls, binary = probes
+    checks = [
+        PrerequisiteCheck(
+            name="docker", command=["docker", "--version"], version_command=["docker", "version"]
+        ),
+        *create_microk8s_addon_prerequisite_checks(),
+    ]
+
+    await _check(checks)
+    first_run = len(calls)
+    _, results = await _check(checks)
+
+    # Only the failing metallb check is probed again
+    assert len(calls) == first_run + 1
+    assert results[0].version == "tool 1.0"
+
+    stat = binary.stat()
+    os.utime(binary, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    await _check(checks)
+    assert len(calls) > first_run + 1 + 1
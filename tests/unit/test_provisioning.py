@@ -0,0 +1,158 @@
+"""Unit tests for the cloud provisioning step graph."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from vantage_cli.clouds.cudo_compute.apps.slurm_metal import utils as slurm_metal_utils
+from vantage_cli.clouds.provisioning import (
+    ProvisioningStep,
+    poll_with_backoff,
+    run_provisioning_steps,
+)
+
+
+def _step(name: str, log: list, depends_on=(), delay: float = 0.01):
+    async def run(results):
+        log.append(("start", name))
+        await asyncio.sleep(delay)
+        log.append(("end", name))
+        return name.upper()
+
+    return ProvisioningStep(name, run, list(depends_on))
+
+
+@pytest.mark.asyncio
+async def test_independent_steps_overlap_and_dependents_wait():
+    log: list = []
+    report = await run_provisioning_steps(
+        [
+            _step("a", log),
+            _step("b", log, ["a"]),
+            _step("c", log, ["a"]),
+            _step("d", log, ["b", "c"]),
+        ]
+    )
+
+    assert report.results == {"a": "A", "b": "B", "c": "C", "d": "D"}
+    assert log.index(("end", "a")) < log.index(("start", "b"))
+    # b and c run at the same time
+    assert log.index(("start", "c")) < log.index(("end", "b"))
+    assert log.index(("end", "b")) < log.index(("start", "d"))
+    assert log.index(("end", "c")) < log.index(("start", "d"))
+    assert [line.split(":")[0] for line in report.timing_lines()][0] == "a"
+
+
+@pytest.mark.asyncio
+async def test_step_failure_is_raised_and_cancels_others():
+    log: list = []
+
+    async def fail(results):
+        raise RuntimeError("quota exceeded")
+
+    with pytest.raises(RuntimeError, match="quota exceeded"):
+        await run_provisioning_steps(
+            [
+                ProvisioningStep("fail", fail),
+                _step("slow", log, delay=5),
+                _step("after", log, ["fail"]),
+            ]
+        )
+
+    assert ("end", "slow") not in log
+    assert ("start", "after") not in log
+
+
+@pytest.mark.asyncio
+async def test_invalid_graphs_are_rejected():
+    log: list = []
+    with pytest.raises(ValueError, match="unknown step"):
+        await run_provisioning_steps([_step("a", log, ["missing"])])
+    with pytest.raises(ValueError, match="Circular"):
+        await run_provisioning_steps([_step("a", log, ["b"]), _step("b", log, ["a"])])
+
+
+@pytest.mark.asyncio
+async def test_poll_with_backoff_doubles_delay_until_ready(monkeypatch: pytest.MonkeyPatch):
+    sleeps: list = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    answers = iter([None, None, None, "ACTIVE"])
+
+    async def check():
+        return next(answers)
+
+    assert await poll_with_backoff(check, timeout=60, initial_delay=1, max_delay=3) == "ACTIVE"
+    assert sleeps == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_poll_with_backoff_times_out():
+    async def never():
+        return None
+
+    with pytest.raises(TimeoutError):
+        await poll_with_backoff(never, timeout=0.01, initial_delay=0.001)
+
+
+@pytest.mark.asyncio
+async def test_head_node_graph_overlaps_network_wait(monkeypatch: pytest.MonkeyPatch, tmp_path):
+    monkeypatch.setattr(
+        "vantage_cli.clouds.cudo_compute.catalog_cache.USER_CUDO_CATALOG_CACHE_DIR", tmp_path
+    )
+    calls: list = []
+    network_polls = 0
+
+    async def record(name, value=None):
+        calls.append(name)
+        await asyncio.sleep(0)
+        return value
+
+    async def get_network(project_id, network_id):
+        nonlocal network_polls
+        network_polls += 1
+        calls.append("get_network")
+        return SimpleNamespace(id=network_id, state="ACTIVE" if network_polls > 2 else "PENDING")
+
+    machine_type = SimpleNamespace(
+        machine_type="epyc",
+        data_center_id="dc",
+        min_vcpu=1,
+        min_memory_gib=1,
+        max_vcpu_free=64,
+        max_memory_gib_free=256,
+        max_gpu_free=0,
+    )
+    sdk = SimpleNamespace(
+        list_billing_accounts=lambda: record("billing", [SimpleNamespace(id="ba")]),
+        create_project=lambda project_data: record("project", SimpleNamespace(id="proj")),
+        create_network=lambda **kwargs: record("network"),
+        get_network=get_network,
+        create_security_group=lambda **kwargs: record("sg", SimpleNamespace(id="sg")),
+        list_vm_machine_types=lambda **kwargs: record("machine_types", [machine_type]),
+        create_vm=lambda **kwargs: record("vm", SimpleNamespace(id="vm-1", kwargs=kwargs)),
+    )
+    ctx = SimpleNamespace(obj=SimpleNamespace(cudo_sdk=sdk, console=MagicMock(), verbose=False))
+
+    original_poll = slurm_metal_utils.poll_with_backoff
+
+    def fast_poll(check, timeout, **kwargs):
+        return original_poll(check, timeout, initial_delay=0.001, description="network")
+
+    monkeypatch.setattr(slurm_metal_utils, "poll_with_backoff", fast_poll)
+
+    vm_id = await slurm_metal_utils.init_project_and_head_node(
+        ctx, project_name="demo", init_script="#!/bin/sh", data_center_id="dc"
+    )
+
+    assert vm_id == "vm-1"
+    # The security group and machine types are done before the network turns active
+    last_network_poll = len(calls) - 1 - calls[::-1].index("get_network")
+    assert calls.index("sg") < last_network_poll
+    assert calls.index("machine_types") < last_network_poll
+    assert calls[-1] == "vm"
@@ -0,0 +1,81 @@
+"""Unit tests for cursor-based GraphQL pagination."""
+
+import asyncio
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from vantage_cli.sdk.base import paginate_connection
+
+
+def _page(nodes: List[int], end_cursor: Optional[str], has_next: bool) -> Dict[str, Any]:
+    return {
+        "clusters": {
+            "edges": [{"node": {"id": node}} for node in nodes],
+            "pageInfo": {"hasNextPage": has_next, "endCursor": end_cursor},
+        }
+    }
+
+
+class FakeServer:
+    """Serves 0..total-1 in pages keyed by the numeric cursor."""
+
+    def __init__(self, total: int):
+        self.total = total
+        self.requests: List[Dict[str, Any]] = []
+
+    async def execute(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        self.requests.append(dict(variables))
+        await asyncio.sleep(0)
+        start = int(variables.get("after", 0))
+        end = min(start + variables["first"], self.total)
+        return _page(list(range(start, end)), str(end), end < self.total)
+
+
+async def _collect(**kwargs: Any) -> List[int]:
+    return [
+        node["id"]
+        async for node in paginate_connection(query="q", connection="clusters", **kwargs)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_follows_end_cursor_across_pages():
+    server = FakeServer(total=250)
+
+    ids = await _collect(execute=server.execute, page_size=100, variables={"filters": {"a": 1}})
+
+    assert ids == list(range(250))
+    assert [r.get("after") for r in server.requests] == [None, "100", "200"]
+    assert all(r["filters"] == {"a": 1} for r in server.requests)
+
+
+@pytest.mark.asyncio
+async def test_max_items_limits_results_and_requests():
+    server = FakeServer(total=1000)
+
+    ids = await _collect(execute=server.execute, page_size=100, max_items=150)
+
+    assert ids == list(range(150))
+    assert [r["first"] for r in server.requests] == [100, 50]
+
+
+@pytest.mark.asyncio
+async def test_next_page_is_prefetched_while_consuming():
+    server = FakeServer(total=200)
+    iterator = paginate_connection(server.execute, "q", "clusters", page_size=100)
+
+    await iterator.__anext__()
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    assert len(server.requests) == 2
+    await iterator.aclose()
+
+
+@pytest.mark.asyncio
+async def test_missing_page_info_stops_after_first_page():
+    async def execute(query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        return {"clusters": {"edges": [{"node": {"id": 1}}]}}
+
+    assert await _collect(execute=execute) == [1]
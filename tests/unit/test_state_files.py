@@ -0,0 +1,87 @@
+"""Unit tests for locked, atomic state file writes."""
+
+import fcntl
+import json
+import os
+import threading
+from pathlib import Path
+
+import pytest
+
+from vantage_cli.exceptions import Abort
+from vantage_cli.state_files import atomic_write_text, state_file_lock
+
+
+def test_atomic_write_replaces_content_and_keeps_mode(tmp_path: Path):
+    path = tmp_path / "config.json"
+    atomic_write_text(path, "old")
+    path.chmod(0o640)
+
+    atomic_write_text(path, "new")
+
+    assert path.read_text() == "new"
+    assert path.stat().st_mode & 0o777 == 0o640
+    assert [p.name for p in tmp_path.iterdir()] == ["config.json"]
+
+
+def test_atomic_write_failure_leaves_original(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    path = tmp_path / "credentials.yaml"
+    atomic_write_text(path, "credentials: {}\n", mode=0o600)
+
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", fail_replace)
+    with pytest.raises(OSError):
+        atomic_write_text(path, "credentials: {truncated")
+
+    assert path.read_text() == "credentials: {}\n"
+    assert path.stat().st_mode & 0o777 == 0o600
+    assert [p.name for p in tmp_path.iterdir()] == ["credentials.yaml"]
+
+
+def test_lock_is_reentrant(tmp_path: Path):
+    path = tmp_path / "config.json"
+
+    with state_file_lock(path):
+        with state_file_lock(path):
+            atomic_write_text(path, "{}")
+
+    # Released: another open file description can take the lock
+    fd = os.open(tmp_path / "config.json.lock", os.O_RDWR)
+    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    os.close(fd)
+
+
+def test_lock_held_by_other_process_times_out(tmp_path: Path):
+    path = tmp_path / "config.json"
+    lock_file = tmp_path / "config.json.lock"
+    lock_file.touch()
+    fd = os.open(lock_file, os.O_RDWR)
+    fcntl.flock(fd, fcntl.LOCK_EX)
+
+    try:
+        with pytest.raises(Abort):
+            with state_file_lock(path, timeout=0.1):
+                pass
+    finally:
+        os.close(fd)
+
+
+def test_concurrent_read_modify_write_loses_no_updates(tmp_path: Path):
+    path = tmp_path / "config.json"
+    atomic_write_text(path, "{}")
+
+    def add_profile(name: str) -> None:
+        with state_file_lock(path):
+            data = json.loads(path.read_text())
+            data[name] = {}
+            atomic_write_text(path, json.dumps(data), durable=False)
+
+    threads = [threading.Thread(target=add_profile, args=(f"p{i}",)) for i in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(json.loads(path.read_text())) == sorted(f"p{i}" for i in range(20))
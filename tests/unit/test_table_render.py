@@ -0,0 +1,122 @@
+"""Unit tests for streaming list tables in UniversalOutputFormatter."""
+
+import json
+from contextlib import contextmanager
+from io import StringIO
+
+import pytest
+from rich.console import Console
+
+from vantage_cli import render
+from vantage_cli.render import UniversalOutputFormatter
+
+
+class TerminalIO(StringIO):
+    """StringIO that claims to be an interactive terminal."""
+
+    def isatty(self) -> bool:
+        return True
+
+
+def _rows(count: int) -> list:
+    names = ["machine", "名前テスト機械", "🚀 rocket", "x" * 40]
+    descriptions = ["short", "a long description that wraps " * 3, "line1\nline2", ""]
+    return [
+        {
+            "id": f"{i:08d}-aaaa-bbbb-cccc-dddddddddddd",
+            "name": f"{names[i % 4]}-{i}",
+            "status": ["active", None][i % 2],
+            "description": descriptions[i % 4],
+            "enabled": bool(i % 3),
+            "tags": [[], [1, 2], {"a": 1}][i % 3],
+            "price_hr": "[bold]1.23[/bold]",
+            "created_at": "2025-01-01T00:00:00Z",
+        }
+        for i in range(count)
+    ]
+
+
+def _formatter(width: int = 120, file=None) -> UniversalOutputFormatter:
+    console = Console(
+        file=file or StringIO(), width=width, force_terminal=True, color_system="truecolor"
+    )
+    formatter = UniversalOutputFormatter(console)
+    formatter._get_terminal_width = lambda: width  # type: ignore[method-assign]
+    return formatter
+
+
+def _single_table(rows: list, width: int) -> str:
+    """Render all rows as one Rich table, the way the list renderer used to."""
+    formatter = _formatter(width)
+    keys = formatter._sort_table_keys(rows)
+    widths = formatter._calculate_proportional_widths(rows, keys, width)
+    columns = [(key, widths.get(key, 20)) for key in keys]
+    table = formatter._new_list_table(columns, "Machines", width)
+    for row in rows:
+        table.add_row(*formatter._format_table_row(row, columns))
+    formatter.console.print(table)
+    return formatter.console.file.getvalue()
+
+
+@pytest.mark.parametrize("width", [40, 90, 160])
+def test_streamed_table_matches_a_single_rich_table(monkeypatch: pytest.MonkeyPatch, width: int):
+    monkeypatch.setattr(render, "TABLE_CHUNK_ROWS", 3)
+    rows = _rows(11)
+    formatter = _formatter(width)
+
+    formatter.output(rows, title="Machines")
+
+    assert formatter.console.file.getvalue() == _single_table(rows, width)
+
+
+def test_rows_are_printed_in_chunks_as_they_are_read(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(render, "TABLE_SAMPLE_ROWS", 2)
+    monkeypatch.setattr(render, "TABLE_CHUNK_ROWS", 2)
+    formatter = _formatter()
+    printed_before = []
+
+    def rows():
+        for index, row in enumerate(_rows(8)):
+            printed_before.append((index, formatter.console.file.getvalue().count("\n")))
+            yield row
+
+    formatter._render_with_textual_datatable(rows(), "Machines")
+
+    # Header and first row go out after the sample; later rows follow chunk by chunk
+    lines = dict(printed_before)
+    assert lines[1] == 0
+    assert 0 < lines[2] < lines[4] < lines[6]
+
+
+def test_limit_truncates_tables_and_json():
+    formatter = UniversalOutputFormatter(Console(file=StringIO(), width=120))
+    formatter.output(_rows(5), title="Machines", limit=2)
+
+    output = formatter.console.file.getvalue()
+    assert "00000001-" in output and "00000002-" not in output
+    assert "Showing 2 of 5" in output
+
+    formatter = _formatter()
+    formatter.json_output = True
+    formatter.limit = 3
+    formatter.output({"items": _rows(5), "total": 5})
+
+    assert len(json.loads(formatter.console.file.getvalue())["items"]) == 3
+
+
+def test_pager_is_only_used_for_interactive_terminals(monkeypatch: pytest.MonkeyPatch):
+    paged = []
+
+    for file in (StringIO(), TerminalIO()):
+        formatter = _formatter(file=file)
+        formatter.pager = True
+
+        @contextmanager
+        def pager(**kwargs):
+            paged.append(kwargs)
+            yield
+
+        monkeypatch.setattr(formatter.console, "pager", pager)
+        formatter.output(_rows(2), title="Machines")
+
+    assert paged == [{"styles": True}]
@@ -0,0 +1,58 @@
+"""Unit tests for cached JWT claim decoding."""
+
+import time
+
+import pytest
+from jose import jwt
+
+import vantage_cli.token_claims as token_claims
+from vantage_cli.token_claims import (
+    TokenDecodeError,
+    decode_token_claims,
+    is_token_claims_expired,
+    token_expires_at,
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    token_claims.clear_token_claims_cache()
+    yield
+    token_claims.clear_token_claims_cache()
+
+
+def test_claims_match_jose_unverified_decode():
+    token = jwt.encode({"sub": "user", "exp": 2_000_000_000}, "secret", algorithm="HS256")
+
+    assert decode_token_claims(token) == jwt.get_unverified_claims(token)
+    assert token_expires_at(token) == 2_000_000_000
+
+
+def test_token_is_decoded_once(monkeypatch: pytest.MonkeyPatch):
+    token = jwt.encode({"exp": int(time.time()) + 3600}, "secret", algorithm="HS256")
+    decode_token_claims(token)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("token decoded twice")
+
+    monkeypatch.setattr(token_claims.base64, "urlsafe_b64decode", fail)
+
+    assert not is_token_claims_expired(token)
+    assert not is_token_claims_expired(token, buffer_seconds=60)
+
+
+def test_cache_is_bounded():
+    for index in range(token_claims.TOKEN_CLAIMS_CACHE_SIZE + 5):
+        decode_token_claims(jwt.encode({"n": index}, "secret", algorithm="HS256"))
+
+    assert len(token_claims._claims_cache) == token_claims.TOKEN_CLAIMS_CACHE_SIZE
+
+
+def test_expiry_and_invalid_tokens():
+    expired = jwt.encode({"exp": int(time.time()) - 5}, "secret", algorithm="HS256")
+    no_exp = jwt.encode({"sub": "user"}, "secret", algorithm="HS256")
+
+    assert is_token_claims_expired(expired)
+    assert is_token_claims_expired(no_exp)
+    with pytest.raises(TokenDecodeError):
+        decode_token_claims("not-a-jwt")
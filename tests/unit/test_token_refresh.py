@@ -0,0 +1,83 @@
+"""Unit tests for single-flight access token refresh."""
+
+import asyncio
+import time
+
+import pytest
+from jose import jwt
+
+import vantage_cli.auth as auth
+from vantage_cli.auth import TokenRefresher
+from vantage_cli.config import Settings
+from vantage_cli.schemas import TokenSet
+
+
+def _token(expires_in: int) -> str:
+    return jwt.encode({"exp": int(time.time()) + expires_in}, "secret", algorithm="HS256")
+
+
+@pytest.fixture
+def refresh_calls(monkeypatch: pytest.MonkeyPatch):
+    calls = []
+
+    async def fake_refresh(token_set, settings):
+        calls.append(token_set.access_token)
+        await asyncio.sleep(0.01)
+        token_set.access_token = _token(3600)
+        token_set.refresh_token = f"refresh-{len(calls)}"
+        return True
+
+    monkeypatch.setattr(auth, "refresh_access_token_async", fake_refresh)
+    monkeypatch.setattr(auth, "save_tokens_to_cache", lambda profile, token_set: None)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_concurrent_refreshes_share_one_request(refresh_calls):
+    refresher = TokenRefresher("default")
+    expired = _token(-10)
+    token_sets = [TokenSet(access_token=expired, refresh_token="refresh-0") for _ in range(5)]
+
+    results = await asyncio.gather(
+        *(refresher.refresh(token_set, Settings()) for token_set in token_sets)
+    )
+
+    assert results == [True] * 5
+    assert len(refresh_calls) == 1
+    assert len({token_set.access_token for token_set in token_sets}) == 1
+    assert all(token_set.refresh_token == "refresh-1" for token_set in token_sets)
+
+
+@pytest.mark.asyncio
+async def test_ensure_fresh_only_refreshes_near_expiry(refresh_calls):
+    refresher = TokenRefresher("default")
+    valid = TokenSet(access_token=_token(3600), refresh_token="r")
+    expiring = TokenSet(access_token=_token(30), refresh_token="r")
+
+    assert await refresher.ensure_fresh(valid, Settings())
+    assert refresh_calls == []
+
+    assert await refresher.ensure_fresh(expiring, Settings(), buffer_seconds=60)
+    assert len(refresh_calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_saving_refreshed_tokens_does_not_block_the_event_loop(
+    refresh_calls, monkeypatch: pytest.MonkeyPatch
+):
+    # Stands in for waiting on the token cache lock held by another process
+    monkeypatch.setattr(auth, "save_tokens_to_cache", lambda profile, token_set: time.sleep(0.3))
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    ticking = asyncio.create_task(ticker())
+    token_set = TokenSet(access_token=_token(-10), refresh_token="r")
+    assert await TokenRefresher("default").refresh(token_set, Settings())
+    ticking.cancel()
+
+    assert ticks >= 10
@@ -12,16 +12,19 @@
 """Vantage CLI package for managing cloud computing resources."""
 
 import asyncio
+import importlib
 import importlib.metadata
 import inspect
 import logging
 import sys
 import time
 from functools import wraps
-from typing import Any, Callable, List, Optional  # noqa: F401
+from typing import Any, Awaitable, Callable, Coroutine, Dict, List, Optional  # noqa: F401
 
+import click
 import typer
 from pydantic import BaseModel, ConfigDict
+from typer.core import TyperGroup
 from typing_extensions import Annotated
 
 from vantage_cli.constants import VANTAGE_CLI_DEBUG_LOG_PATH
@@ -32,6 +35,10 @@ __version__ = importlib.metadata.version("vantage-cli")
 _file_handler: Optional[logging.Handler] = None
 _logging_initialized: bool = False
 
+# Async cleanup callbacks (connection pools, shared SDK clients) that must run
+# inside the event loop of a command before it is torn down
+_async_shutdown_hooks: List[Callable[[], Awaitable[None]]] = []
+
 # Add a null handler at import time to prevent logs from being lost
 # This handler will be replaced by setup_logging()
 logging.getLogger().addHandler(logging.NullHandler())
@@ -121,6 +128,37 @@ def setup_logging(verbose: bool = False) -> None:
     )
 
 
+def register_async_shutdown_hook(hook: Callable[[], Awaitable[None]]) -> None:
+    """Register an async callback to run when the command's event loop finishes.
+
+    Process-wide resources bound to an event loop (e.g. pooled HTTP sessions)
+    register their close method here so they are released before ``asyncio.run``
+    tears the loop down. Registering the same hook twice is a no-op.
+
+    Args:
+        hook: Zero-argument coroutine function performing the cleanup
+    """
+    if hook not in _async_shutdown_hooks:
+        _async_shutdown_hooks.append(hook)
+
+
+async def run_async_shutdown_hooks() -> None:
+    """Run all registered shutdown hooks, logging (not raising) their failures."""
+    for hook in list(_async_shutdown_hooks):
+        try:
+            await hook()
+        except Exception as e:
+            logging.getLogger(__name__).debug(f"Async shutdown hook {hook!r} failed: {e}")
+
+
+async def _run_with_shutdown(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Await a command coroutine and then release loop-bound shared resources."""
+    try:
+        return await coro
+    finally:
+        await run_async_shutdown_hooks()
+
+
 def maybe_run_async(func: Callable) -> Callable:
     """Wrap async functions for use in Typer commands.
 
@@ -148,7 +186,7 @@ def maybe_run_async(func: Callable) -> Callable:
             return func(*args, **kwargs)
         except RuntimeError:
             # No event loop running, safe to use asyncio.run()
-            return asyncio.run(func(*args, **kwargs))
+            return asyncio.run(_run_with_shutdown(func(*args, **kwargs)))
 
     return wrapper
 
@@ -172,6 +210,14 @@ inherited_command_parameters = [
         default=False,
         annotation=Annotated[bool, typer.Option("--json", "-j", help="Output in JSON format")],
     ),
+    TyperCommandParameter(
+        name="pager",
+        type=inspect.Parameter.KEYWORD_ONLY,
+        default=False,
+        annotation=Annotated[
+            bool, typer.Option("--pager", help="Page table output when writing to a terminal")
+        ],
+    ),
     TyperCommandParameter(
         name="verbose",
         type=inspect.Parameter.KEYWORD_ONLY,
@@ -189,6 +235,82 @@ inherited_command_parameters = [
 ]
 
 
+class LazySubcommand(BaseModel):
+    """A subcommand that is only imported when it is invoked.
+
+    ``import_path`` has the form ``"package.module:attribute"`` and points at either
+    a Typer app (registered as a command group) or a command function. ``help`` and
+    ``hidden`` are used to list the subcommand without importing it. ``help`` is the
+    only copy of a lazy group's help text: it is applied to the group once it is
+    imported, so sub-apps registered this way do not set their own ``help``. For a
+    command function it is the short help, and the docstring stays the full help.
+    """
+
+    import_path: str
+    help: str = ""
+    hidden: bool = False
+
+
+class LazyTyperGroup(TyperGroup):
+    """Typer group that defers importing its subcommands until they are invoked.
+
+    Subclasses declare ``lazy_subcommands`` and are passed as ``cls`` to the Typer app.
+    Listing the group in ``--help`` output uses the registered help text, so only the
+    subcommand that actually runs pays for its imports.
+    """
+
+    lazy_subcommands: Dict[str, LazySubcommand] = {}
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._formatting_help = False
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        """List eagerly registered commands followed by the lazy ones."""
+        commands = super().list_commands(ctx)
+        return commands + [name for name in self.lazy_subcommands if name not in commands]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        """Return a command, importing a lazy subcommand the first time it is needed."""
+        command = super().get_command(ctx, cmd_name)
+        lazy = self.lazy_subcommands.get(cmd_name)
+        if command is not None or lazy is None:
+            return command
+
+        if self._formatting_help:
+            # Help listings only need the name and summary
+            return click.Command(cmd_name, help=lazy.help, hidden=lazy.hidden)
+
+        command = self._load_lazy_subcommand(cmd_name, lazy)
+        self.add_command(command, cmd_name)
+        return command
+
+    def format_help(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        """Format help without importing lazy subcommands."""
+        self._formatting_help = True
+        try:
+            super().format_help(ctx, formatter)
+        finally:
+            self._formatting_help = False
+
+    @staticmethod
+    def _load_lazy_subcommand(cmd_name: str, lazy: LazySubcommand) -> click.Command:
+        """Import a lazy subcommand and convert it into a click command."""
+        module_name, attribute = lazy.import_path.split(":")
+        target = getattr(importlib.import_module(module_name), attribute)
+
+        if isinstance(target, typer.Typer):
+            command: click.Command = typer.main.get_group(target)
+            command.help = lazy.help or command.help
+        else:
+            wrapper = AsyncTyper(add_completion=False)
+            wrapper.command(cmd_name, hidden=lazy.hidden, short_help=lazy.help or None)(target)
+            command = typer.main.get_command(wrapper)
+
+        command.name = cmd_name
+        return command
+
+
 class AsyncTyper(typer.Typer):
     """A Typer subclass that automatically wraps async functions with asyncio.run()."""
 
@@ -258,7 +380,7 @@ class AsyncTyper(typer.Typer):
                 return func(*args, **kwargs)
             except RuntimeError:
                 # No event loop running, safe to use asyncio.run()
-                return asyncio.run(func(*args, **kwargs))
+                return asyncio.run(_run_with_shutdown(func(*args, **kwargs)))
         else:
             # Check if the function call returns a coroutine
             result = func(*args, **kwargs)
@@ -270,7 +392,7 @@ class AsyncTyper(typer.Typer):
                     return result
                 except RuntimeError:
                     # No event loop running, safe to use asyncio.run()
-                    return asyncio.run(result)
+                    return asyncio.run(_run_with_shutdown(result))
             return result
 
     def command(
@@ -327,9 +449,13 @@ class AsyncTyper(typer.Typer):
                     json_flag = kwargs.pop("json", False)
                     ctx.obj.json_output = json_flag or getattr(ctx.obj, "json_output", False)
 
-                    # Update the formatter's json_output flag if formatter exists
+                    # Handle pager parameter
+                    pager_flag = kwargs.pop("pager", False)
+
+                    # Update the formatter's output flags if formatter exists
                     if hasattr(ctx.obj, "formatter") and ctx.obj.formatter is not None:
                         ctx.obj.formatter.json_output = ctx.obj.json_output
+                        ctx.obj.formatter.pager = pager_flag or ctx.obj.formatter.pager
 
                     # Handle verbose parameter
                     verbose_flag = kwargs.pop("verbose", False)
@@ -467,7 +593,6 @@ class AsyncTyper(typer.Typer):
 
             # Build kwargs for parent method, filtering out None values
             kwargs = {
-                "cls": cls,
                 "invoke_without_command": invoke_without_command,
                 "no_args_is_help": no_args_is_help,
                 "subcommand_metavar": subcommand_metavar,
@@ -482,6 +607,8 @@ class AsyncTyper(typer.Typer):
                 "deprecated": deprecated,
                 "rich_help_panel": rich_help_panel,
             }
+            if cls is not None:
+                kwargs["cls"] = cls
             if options_metavar is not None:
                 kwargs["options_metavar"] = options_metavar
 
@@ -16,14 +16,14 @@ import datetime
 import inspect
 import json
 import logging
+import time
 from functools import wraps
 from textwrap import dedent
-from typing import Any, Callable, Union
+from typing import Any, Callable, Dict, Optional, Union
 
 import httpx
 import snick
 import typer
-from jose import jwt
 from jose.exceptions import ExpiredSignatureError
 from pydantic import ValidationError
 from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
@@ -35,6 +35,7 @@ from vantage_cli.constants import OIDC_DEVICE_PATH, OIDC_TOKEN_PATH, USER_CONFIG
 from vantage_cli.exceptions import Abort
 from vantage_cli.render import terminal_message
 from vantage_cli.schemas import CliContext, DeviceCodeData, IdentityData, Persona, TokenSet
+from vantage_cli.token_claims import decode_token_claims, token_expires_at
 
 logger = logging.getLogger(__name__)
 
@@ -91,15 +92,11 @@ def validate_token_and_extract_identity(token_set: TokenSet) -> IdentityData:
             "log_message": "Unknown error while validating access access token",
         },
     ):
-        token_data = jwt.decode(
-            token_set.access_token,
-            "",  # Empty key is acceptable when verify_signature is False
-            options={
-                "verify_signature": False,
-                "verify_aud": False,
-                "verify_exp": True,
-            },
-        )
+        # Claims are decoded once per token and cached for the process
+        token_data = decode_token_claims(token_set.access_token)
+        exp_timestamp = token_expires_at(token_set.access_token)
+        if exp_timestamp is not None and exp_timestamp < time.time():
+            raise ExpiredSignatureError("Signature has expired.")
 
     logger.debug("Extracting identity data from the access token")
     with Abort.handle_errors(
@@ -157,22 +154,13 @@ def is_token_expired(token: str, buffer_seconds: int = 60) -> bool:
         True if token is expired or will expire soon, False otherwise
     """
     try:
-        # Decode token without verification to get expiration
-        token_data = jwt.decode(
-            token,
-            "",  # Empty key is acceptable when verify_signature is False
-            options={
-                "verify_signature": False,
-                "verify_aud": False,
-                "verify_exp": False,  # Don't verify expiration here, we want to check manually
-            },
-        )
+        # Read the (cached) expiration claim without verifying the token
+        exp_timestamp = token_expires_at(token)
 
-        if "exp" not in token_data:
+        if exp_timestamp is None:
             logger.debug("Token does not contain expiration claim")
             return True  # Consider token expired if no expiration claim
 
-        exp_timestamp = token_data["exp"]
         exp_datetime = datetime.datetime.fromtimestamp(exp_timestamp)
         now_with_buffer = datetime.datetime.now() + datetime.timedelta(seconds=buffer_seconds)
 
@@ -384,6 +372,151 @@ def refresh_access_token_standalone(token_set: TokenSet, settings: "Settings") -
         return False
 
 
+async def refresh_access_token_async(token_set: TokenSet, settings: "Settings") -> bool:
+    """Non-blocking variant of ``refresh_access_token_standalone``.
+
+    Returns True if refresh was successful, False otherwise.
+    Sets the access token in-place.
+    """
+    if not token_set.refresh_token:
+        return False
+
+    url = f"{settings.get_auth_url()}{OIDC_TOKEN_PATH}"
+    logger.debug(f"Requesting refreshed access token from {url}")
+
+    try:
+        async with httpx.AsyncClient() as client:
+            response = await client.post(
+                url,
+                data={
+                    "client_id": settings.oidc_client_id,
+                    "grant_type": "refresh_token",
+                    "refresh_token": token_set.refresh_token,
+                },
+                headers={"Content-Type": "application/x-www-form-urlencoded"},
+                timeout=30.0,
+            )
+            response.raise_for_status()
+
+            token_data = response.json()
+            token_set.access_token = token_data["access_token"]
+
+            # Update refresh token if provided
+            if "refresh_token" in token_data:
+                token_set.refresh_token = token_data["refresh_token"]
+
+            logger.debug("Successfully refreshed access token")
+            return True
+
+    except httpx.HTTPStatusError as e:
+        logger.error(
+            f"Token refresh failed with status {e.response.status_code}: {e.response.text}"
+        )
+        return False
+    except httpx.TimeoutException as e:
+        logger.error(f"Token refresh timed out: {e}")
+        return False
+    except httpx.RequestError as e:
+        logger.error(f"Token refresh request error: {e}")
+        return False
+    except KeyError as e:
+        logger.error(f"Token refresh response missing required field: {e}")
+        return False
+    except Exception as e:
+        logger.error(f"Unexpected error during token refresh: {type(e).__name__}: {e}")
+        return False
+
+
+class TokenRefresher:
+    """Single-flight access token refresh for one profile.
+
+    Concurrent callers that hit an expired token (or a 401/403) serialize on
+    one lock; the first performs the refresh and the rest adopt its result
+    instead of refreshing again. Token sets held by different clients of the
+    same profile are brought up to date from the latest refreshed tokens.
+    """
+
+    def __init__(self, profile: str):
+        """Initialize the refresher.
+
+        Args:
+            profile: Profile whose token cache is updated after a refresh
+        """
+        self.profile = profile
+        self._latest: Optional[TokenSet] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_lock(self) -> asyncio.Lock:
+        """Return the refresh lock, recreating it for a new event loop."""
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+    async def refresh(
+        self, token_set: TokenSet, settings: "Settings", failed_token: Optional[str] = None
+    ) -> bool:
+        """Refresh ``token_set`` in-place unless another caller already did.
+
+        Args:
+            token_set: Token set to update
+            settings: Settings providing the auth URL and client id
+            failed_token: Access token that was rejected (defaults to the current one)
+
+        Returns:
+            True if ``token_set`` now holds a fresh access token
+        """
+        failed_token = failed_token or token_set.access_token
+
+        async with self._get_lock():
+            latest = self._latest
+            if (
+                latest is not None
+                and latest.access_token != failed_token
+                and not is_token_expired(latest.access_token)
+            ):
+                logger.debug("Access token was already refreshed by a concurrent request")
+                token_set.access_token = latest.access_token
+                token_set.refresh_token = latest.refresh_token or token_set.refresh_token
+                return True
+
+            if not await refresh_access_token_async(token_set, settings):
+                return False
+
+            self._latest = token_set.model_copy()
+            # The cache write waits on a cross-process file lock; keep it off the loop
+            await asyncio.to_thread(save_tokens_to_cache, self.profile, token_set)
+            return True
+
+    async def ensure_fresh(
+        self, token_set: TokenSet, settings: "Settings", buffer_seconds: int = 60
+    ) -> bool:
+        """Proactively refresh a token that expires within ``buffer_seconds``.
+
+        Returns:
+            True if the token is (now) valid beyond the buffer
+        """
+        if token_set.access_token and not is_token_expired(
+            token_set.access_token, buffer_seconds=buffer_seconds
+        ):
+            return True
+        return await self.refresh(token_set, settings)
+
+
+_token_refreshers: Dict[str, TokenRefresher] = {}
+
+
+def get_token_refresher(profile: str) -> TokenRefresher:
+    """Return the process-wide token refresher for a profile."""
+    refresher = _token_refreshers.get(profile)
+    if refresher is None:
+        refresher = TokenRefresher(profile)
+        _token_refreshers[profile] = refresher
+    return refresher
+
+
 async def refresh_access_token(ctx: CliContext, token_set: TokenSet):
     """Attempt to fetch a new access token given a refresh token in a token_set.
 
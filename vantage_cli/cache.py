@@ -21,6 +21,7 @@ from pathlib import Path
 from vantage_cli.constants import USER_TOKEN_CACHE_DIR
 from vantage_cli.exceptions import Abort
 from vantage_cli.schemas import TokenSet
+from vantage_cli.state_files import atomic_write_text, state_file_lock
 
 logger = logging.getLogger(__name__)
 
@@ -128,17 +129,16 @@ def load_tokens_from_cache(profile: str) -> TokenSet:
 def save_tokens_to_cache(profile: str, token_set: TokenSet):
     """Save tokens from a token_set to the cache."""
     (access_token_path, refresh_token_path) = _get_token_paths(profile)
-    # make sure the parent directory exists
-    access_token_path.parent.mkdir(parents=True, exist_ok=True)
 
-    logger.debug(f"Caching access token at {access_token_path}")
-    access_token_path.write_text(token_set.access_token)
-    access_token_path.chmod(0o600)
+    # Both tokens are written under one lock so a concurrent refresh cannot pair
+    # one process's access token with another's refresh token
+    with state_file_lock(access_token_path):
+        logger.debug(f"Caching access token at {access_token_path}")
+        atomic_write_text(access_token_path, token_set.access_token, mode=0o600)
 
-    if token_set.refresh_token is not None:
-        logger.debug(f"Caching refresh token at {refresh_token_path}")
-        refresh_token_path.write_text(token_set.refresh_token)
-        refresh_token_path.chmod(0o600)
+        if token_set.refresh_token is not None:
+            logger.debug(f"Caching refresh token at {refresh_token_path}")
+            atomic_write_text(refresh_token_path, token_set.refresh_token, mode=0o600)
 
 
 def clear_token_cache(profile: str):
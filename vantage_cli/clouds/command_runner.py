@@ -0,0 +1,149 @@
+# Copyright (C) 2025 Vantage Compute Corporation
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/>.
+"""Run external commands (juju, multipass, microk8s, helm, ...) from async code.
+
+``subprocess.run`` blocks the event loop for as long as the command runs,
+which freezes Rich live displays and every other coroutine. ``run_command``
+runs the command as an asyncio subprocess instead, streams its output line
+by line, enforces timeouts, kills the process when the awaiting task is
+cancelled, and limits how many commands run at the same time.
+"""
+
+import asyncio
+import logging
+import subprocess
+import weakref
+from typing import Callable, Dict, List, Mapping, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on external commands running at once across the whole process
+MAX_CONCURRENT_COMMANDS = 8
+
+LineCallback = Callable[[str], None]
+
+_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _semaphore() -> asyncio.Semaphore:
+    """Return the concurrency limiter for the running event loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_COMMANDS)
+        _semaphores[loop] = semaphore
+    return semaphore
+
+
+async def _read_lines(
+    stream: Optional[asyncio.StreamReader], chunks: List[bytes], callback: Optional[LineCallback]
+) -> None:
+    """Collect a stream's output, passing each decoded line to ``callback``."""
+    if stream is None:
+        return
+    while line := await stream.readline():
+        chunks.append(line)
+        if callback is not None:
+            callback(line.decode(errors="replace").rstrip("\r\n"))
+
+
+async def _kill(process: asyncio.subprocess.Process) -> None:
+    """Kill a process that is still running and reap it."""
+    if process.returncode is None:
+        try:
+            process.kill()
+        except ProcessLookupError:
+            pass
+        await process.wait()
+
+
+async def run_command(
+    cmd: List[str],
+    *,
+    input: Optional[Union[str, bytes]] = None,
+    timeout: Optional[float] = None,
+    env: Optional[Mapping[str, str]] = None,
+    check: bool = False,
+    text: bool = True,
+    on_stdout: Optional[LineCallback] = None,
+    on_stderr: Optional[LineCallback] = None,
+) -> subprocess.CompletedProcess:
+    """Run a command without blocking the event loop.
+
+    Args:
+        cmd: Command and arguments
+        input: Data written to the command's stdin, which is closed afterwards
+        timeout: Seconds to wait for the command before killing it
+        env: Environment for the command (defaults to the current environment)
+        check: Raise CalledProcessError if the command exits with a non-zero status
+        text: Return stdout/stderr as str instead of bytes
+        on_stdout: Called with each stdout line (without newline) as it is produced
+        on_stderr: Called with each stderr line (without newline) as it is produced
+
+    Returns:
+        The completed process with captured stdout and stderr
+
+    Raises:
+        FileNotFoundError: If the executable does not exist
+        subprocess.TimeoutExpired: If the command ran longer than ``timeout``
+        subprocess.CalledProcessError: If ``check`` is set and the command failed
+    """
+    if isinstance(input, str):
+        input = input.encode("utf-8")
+
+    async with _semaphore():
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.PIPE if input is not None else asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=dict(env) if env is not None else None,
+        )
+        stdout: List[bytes] = []
+        stderr: List[bytes] = []
+
+        async def communicate() -> None:
+            if input is not None and process.stdin is not None:
+                try:
+                    process.stdin.write(input)
+                    await process.stdin.drain()
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+                process.stdin.close()
+            await asyncio.gather(
+                _read_lines(process.stdout, stdout, on_stdout),
+                _read_lines(process.stderr, stderr, on_stderr),
+            )
+            await process.wait()
+
+        try:
+            await asyncio.wait_for(communicate(), timeout)
+        except asyncio.TimeoutError:
+            await _kill(process)
+            logger.debug(f"{cmd[0]} timed out after {timeout}s")
+            raise subprocess.TimeoutExpired(cmd, timeout or 0, b"".join(stdout), b"".join(stderr))
+        except BaseException:
+            # Cancelled (or failed) while the command was still running
+            await _kill(process)
+            raise
+
+    output: Dict[str, Union[str, bytes]] = {"stdout": b"".join(stdout), "stderr": b"".join(stderr)}
+    if text:
+        output = {name: data.decode(errors="replace") for name, data in output.items()}
+
+    returncode = process.returncode if process.returncode is not None else -1
+    if check and returncode != 0:
+        logger.debug(f"{' '.join(cmd[:4])} exited with {returncode}")
+        raise subprocess.CalledProcessError(returncode, cmd, output["stdout"], output["stderr"])
+    return subprocess.CompletedProcess(cmd, returncode, output["stdout"], output["stderr"])
@@ -18,7 +18,6 @@ import logging
 from typing import Annotated, Optional
 
 import typer
-from cudo_compute_sdk import CudoComputeSDK
 
 from vantage_cli.auth import attach_persona
 from vantage_cli.clouds.common import (
@@ -30,7 +29,9 @@ from vantage_cli.clouds.cudo_compute.apps.slurm_metal.templates import (
     head_node_init_script,
 )
 from vantage_cli.clouds.cudo_compute.apps.slurm_metal.utils import init_project_and_head_node
+from vantage_cli.clouds.cudo_compute.catalog_cache import CudoCatalog
 from vantage_cli.clouds.cudo_compute.cmds import attach_cudo_compute_client
+from vantage_cli.clouds.cudo_compute.sdk_pool import cudo_sdk_pool
 from vantage_cli.clouds.cudo_compute.utils import get_datacenter_id_from_credentials
 from vantage_cli.config import attach_settings
 from vantage_cli.exceptions import handle_abort
@@ -286,17 +287,14 @@ async def _remove_deployment(ctx: typer.Context, deployment: Deployment) -> None
 @attach_persona
 async def list_vm_datacenters_command(ctx: typer.Context) -> Optional[typer.Exit]:
     """List available Cudo Compute datacenters."""
-    cudo_credential = cloud_credential_sdk.get_default(cloud_name=CLOUD)
-    if cudo_credential is None:
+    cudo_sdk = cudo_sdk_pool.get_default()
+    if cudo_sdk is None:
         logger.debug(f"[bold red]Error:[/bold red] No default credential found for '{CLOUD}'")
         logger.debug(f"Run: vantage cloud credential create --cloud {CLOUD}")
         return typer.Exit(code=1)
 
-    # Initialize Cudo Compute SDK
-    cudo_sdk = CudoComputeSDK(api_key=cudo_credential.credentials_data["api_key"])
-
     try:
-        datacenters = await cudo_sdk.list_vm_data_centers()
+        datacenters = await CudoCatalog(cudo_sdk).list_vm_data_centers()
     except Exception as e:
         logger.debug(f"[bold red]Error:[/bold red] Failed to list datacenters: {e}")
         return typer.Exit(code=1)
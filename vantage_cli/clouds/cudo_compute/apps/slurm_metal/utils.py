@@ -11,11 +11,24 @@
 # this program. If not, see <https://www.gnu.org/licenses/>.
 """Utility functions for Cudo Compute SLURM K8S deployments."""
 
-import asyncio
+import logging
 from pathlib import Path
+from typing import Any, Dict, List, Optional
 
 import typer
 
+from vantage_cli.clouds.cudo_compute.catalog_cache import CudoCatalog
+from vantage_cli.clouds.provisioning import (
+    ProvisioningStep,
+    poll_with_backoff,
+    run_provisioning_steps,
+)
+
+logger = logging.getLogger(__name__)
+
+# Give up waiting for the project network to become ACTIVE after this many seconds
+NETWORK_ACTIVE_TIMEOUT_SECONDS = 120
+
 
 def get_local_ssh_public_keys() -> list[str]:
     """Read SSH public keys from the local ~/.ssh directory.
@@ -44,93 +57,8 @@ def get_local_ssh_public_keys() -> list[str]:
     return ssh_keys
 
 
-async def init_project_and_head_node(
-    ctx: typer.Context,
-    project_name: str,
-    init_script: str,
-    data_center_id: str,
-) -> str:
-    """Create a project with the required resources."""
-    # Create project - you'll need to get billing_account_id from settings or pass it
-    billing_accounts = await ctx.obj.cudo_sdk.list_billing_accounts()
-    if not billing_accounts:
-        raise typer.Exit(code=1)
-    billing_account_id = billing_accounts[0].id
-
-    project_data = {
-        "id": project_name,
-        "billingAccountId": billing_account_id,
-    }
-    project = await ctx.obj.cudo_sdk.create_project(project_data=project_data)
-    project_id = project.id
-
-    # Create network
-    network_id = "vantage-slurm-on-metal-nat-network"
-    network = await ctx.obj.cudo_sdk.create_network(
-        project_id=project_id,
-        network_id=network_id,
-        data_center_id=data_center_id,
-        ip_range="10.0.0.0/16",
-    )
-
-    # Wait for network to be active before proceeding
-    ctx.obj.console.print("⏳ Waiting for network to be active...")
-    max_wait = 120  # 2 minutes
-    wait_interval = 5  # seconds
-    elapsed = 0
-
-    while elapsed < max_wait:
-        network = await ctx.obj.cudo_sdk.get_network(
-            project_id=project_id,
-            network_id=network_id,
-        )
-        if network.state == "ACTIVE":
-            ctx.obj.console.print("✅ Network is active")
-            break
-        await asyncio.sleep(wait_interval)
-        elapsed += wait_interval
-    else:
-        raise Exception(f"Network did not become active after {max_wait} seconds")
-
-    # Create security group with allow-all ingress and egress rules
-    security_group_id = "vantage-sg-allow-all"
-    allow_all_rules = [
-        {
-            "protocol": "PROTOCOL_ALL",
-            "ruleType": "RULE_TYPE_INBOUND",
-            "ipRangeCidr": "0.0.0.0/0",
-        },
-        {
-            "protocol": "PROTOCOL_ALL",
-            "ruleType": "RULE_TYPE_OUTBOUND",
-            "ipRangeCidr": "0.0.0.0/0",
-        },
-    ]
-
-    security_group = await ctx.obj.cudo_sdk.create_security_group(
-        project_id=project_id,
-        security_group_id=security_group_id,
-        data_center_id=data_center_id,
-        description="Allow all ingress and egress traffic",
-        rules=allow_all_rules,
-    )
-
-    image_id = "ubuntu-2404"
-
-    # Get local SSH public keys
-    # local_ssh_keys = get_local_ssh_public_keys()
-    # if local_ssh_keys:
-    #    ctx.obj.console.print(f"📝 Found {len(local_ssh_keys)} local SSH key(s) to add to VM")
-    # else:
-    #    ctx.obj.console.print(f"⚠️  [yellow]Warning:[/yellow] No local SSH keys found in ~/.ssh/")
-
-    # Get available machine types for the data center
-    dc_machine_types = await ctx.obj.cudo_sdk.list_vm_machine_types(
-        project_id=project_id, data_center_id=data_center_id
-    )
-
-    # Create VM with the specified specs
-
+def _select_machine_type(dc_machine_types: List[Any]) -> str:
+    """Pick a CPU-only machine type that fits the head node's requested size."""
     requested_vcpus = 8
     requested_memory = 32
     requested_gpus = 0
@@ -156,29 +84,154 @@ async def init_project_and_head_node(
             machine_type = mt.machine_type
             break
 
-    vm = await ctx.obj.cudo_sdk.create_vm(
-        project_id=project_id,
-        vm_id=project_name + "-head-node",
-        data_center_id=data_center_id,
-        machine_type=machine_type,
-        boot_disk_image_id=image_id,
-        vcpus=4,
-        memory_gib=16,
-        gpus=0,
-        boot_disk_size_gib=20,
-        ssh_key_source="SSH_KEY_SOURCE_USER",
-        start_script=init_script,  # Use minimal bootstrap instead of full script
-        # custom_ssh_keys=local_ssh_keys,  # Disabled: causes 403 when combined with large start_script
-        nics=[
+    return machine_type
+
+
+async def init_project_and_head_node(
+    ctx: typer.Context,
+    project_name: str,
+    init_script: str,
+    data_center_id: str,
+) -> str:
+    """Create a project with the required resources and its head node VM.
+
+    The steps run as a dependency graph: the security group and the machine
+    type lookup proceed while the network is coming up, and only the VM
+    creation waits for all of them.
+
+    Returns:
+        ID of the head node VM
+    """
+    cudo_sdk = ctx.obj.cudo_sdk
+    network_id = "vantage-slurm-on-metal-nat-network"
+    security_group_id = "vantage-sg-allow-all"
+    image_id = "ubuntu-2404"
+
+    async def billing_account(results: Dict[str, Any]) -> str:
+        billing_accounts = await cudo_sdk.list_billing_accounts()
+        if not billing_accounts:
+            raise typer.Exit(code=1)
+        return billing_accounts[0].id
+
+    async def project(results: Dict[str, Any]) -> str:
+        project_data = {
+            "id": project_name,
+            "billingAccountId": results["billing_account"],
+        }
+        return (await cudo_sdk.create_project(project_data=project_data)).id
+
+    async def network(results: Dict[str, Any]) -> Any:
+        return await cudo_sdk.create_network(
+            project_id=results["project"],
+            network_id=network_id,
+            data_center_id=data_center_id,
+            ip_range="10.0.0.0/16",
+        )
+
+    async def network_active(results: Dict[str, Any]) -> Any:
+        ctx.obj.console.print("⏳ Waiting for network to be active...")
+
+        async def active_network() -> Optional[Any]:
+            current = await cudo_sdk.get_network(
+                project_id=results["project"], network_id=network_id
+            )
+            return current if current.state == "ACTIVE" else None
+
+        active = await poll_with_backoff(
+            active_network,
+            timeout=NETWORK_ACTIVE_TIMEOUT_SECONDS,
+            description=f"network {network_id} to become active",
+        )
+        ctx.obj.console.print("✅ Network is active")
+        return active
+
+    async def security_group(results: Dict[str, Any]) -> Any:
+        # Allow-all ingress and egress rules
+        allow_all_rules = [
             {
-                "assignPublicIp": True,
-                "networkId": network.id,
-                "securityGroupIds": [security_group.id],
-            }
-        ],
+                "protocol": "PROTOCOL_ALL",
+                "ruleType": "RULE_TYPE_INBOUND",
+                "ipRangeCidr": "0.0.0.0/0",
+            },
+            {
+                "protocol": "PROTOCOL_ALL",
+                "ruleType": "RULE_TYPE_OUTBOUND",
+                "ipRangeCidr": "0.0.0.0/0",
+            },
+        ]
+        return await cudo_sdk.create_security_group(
+            project_id=results["project"],
+            security_group_id=security_group_id,
+            data_center_id=data_center_id,
+            description="Allow all ingress and egress traffic",
+            rules=allow_all_rules,
+        )
+
+    async def machine_type(results: Dict[str, Any]) -> str:
+        # Project pricing does not affect the choice, so the shared cached catalog is used
+        dc_machine_types = await CudoCatalog(cudo_sdk).list_vm_machine_types(
+            data_center_id=data_center_id
+        )
+        return _select_machine_type(dc_machine_types)
+
+    async def head_node(results: Dict[str, Any]) -> str:
+        active_network = results["network_active"]
+        allow_all_group = results["security_group"]
+
+        # Get local SSH public keys
+        # local_ssh_keys = get_local_ssh_public_keys()
+        # if local_ssh_keys:
+        #    ctx.obj.console.print(f"📝 Found {len(local_ssh_keys)} local SSH key(s) to add to VM")
+        # else:
+        #    ctx.obj.console.print(f"⚠️  [yellow]Warning:[/yellow] No local SSH keys found in ~/.ssh/")
+
+        vm = await cudo_sdk.create_vm(
+            project_id=results["project"],
+            vm_id=project_name + "-head-node",
+            data_center_id=data_center_id,
+            machine_type=results["machine_type"],
+            boot_disk_image_id=image_id,
+            vcpus=4,
+            memory_gib=16,
+            gpus=0,
+            boot_disk_size_gib=20,
+            ssh_key_source="SSH_KEY_SOURCE_USER",
+            start_script=init_script,  # Use minimal bootstrap instead of full script
+            # custom_ssh_keys=local_ssh_keys,  # Disabled: causes 403 when combined with large start_script
+            nics=[
+                {
+                    "assignPublicIp": True,
+                    "networkId": active_network.id,
+                    "securityGroupIds": [allow_all_group.id],
+                }
+            ],
+        )
+
+        return vm.id
+
+    report = await run_provisioning_steps(
+        [
+            ProvisioningStep("billing_account", billing_account),
+            ProvisioningStep("project", project, ["billing_account"]),
+            ProvisioningStep("network", network, ["project"]),
+            ProvisioningStep("network_active", network_active, ["network"]),
+            ProvisioningStep("security_group", security_group, ["project"]),
+            ProvisioningStep("machine_type", machine_type),
+            ProvisioningStep(
+                "head_node", head_node, ["network_active", "security_group", "machine_type"]
+            ),
+        ]
     )
 
-    return vm.id
+    logger.debug(f"Provisioned head node in {report.total_seconds:.1f}s")
+    for line in report.timing_lines():
+        logger.debug(f"  {line}")
+    if ctx.obj.verbose:
+        ctx.obj.console.print(f"⏱  Head node provisioning took {report.total_seconds:.1f}s")
+        for line in report.timing_lines():
+            ctx.obj.console.print(f"   • {line}")
+
+    return report.results["head_node"]
 
 
 async def delete_project_and_all_resources(ctx, project_id: str) -> None:
@@ -0,0 +1,357 @@
+# Copyright (C) 2025 Vantage Compute Corporation
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/>.
+"""On-disk TTL cache of Cudo Compute catalog lookups.
+
+Data centers, machine types and public images change rarely, so the results
+of these ``CudoComputeSDK`` calls are stored as JSON under
+``~/.vantage-cli/cudo_catalog_cache/``. Each entry records the CLI version,
+the time it was fetched, the model class of its items and an index of item
+positions by data center, so per-data-center lookups are answered from one
+cached listing instead of filtering a fresh API response.
+
+Entries are keyed by catalog, call arguments (such as the project used for
+custom pricing) and a hash of the API key. Machine types carry free capacity
+and pricing, so they expire after ``CUDO_MACHINE_TYPE_CACHE_TTL_SECONDS``;
+everything else after ``CUDO_CATALOG_CACHE_TTL_SECONDS``.
+"""
+
+import hashlib
+import importlib
+import json
+import logging
+import time
+from dataclasses import asdict, dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import typer
+
+from vantage_cli import __version__
+from vantage_cli.constants import (
+    CUDO_CATALOG_CACHE_TTL_SECONDS,
+    CUDO_MACHINE_TYPE_CACHE_TTL_SECONDS,
+    USER_CUDO_CATALOG_CACHE_DIR,
+)
+from vantage_cli.state_files import atomic_write_text
+
+logger = logging.getLogger(__name__)
+
+# Shared command options for catalog commands
+NO_CACHE_OPTION = typer.Option(
+    False, "--no-cache", help="Query the Cudo Compute API without using the catalog cache"
+)
+REFRESH_OPTION = typer.Option(
+    False, "--refresh", help="Ignore cached catalog data and refresh it from the API"
+)
+
+
+class CacheMode(str, Enum):
+    """How a catalog lookup uses the cache."""
+
+    USE = "use"
+    REFRESH = "refresh"
+    BYPASS = "bypass"
+
+
+def cache_mode(no_cache: bool = False, refresh: bool = False) -> CacheMode:
+    """Return the cache mode selected by the ``--no-cache`` and ``--refresh`` flags."""
+    if no_cache:
+        return CacheMode.BYPASS
+    if refresh:
+        return CacheMode.REFRESH
+    return CacheMode.USE
+
+
+@dataclass
+class CatalogCacheStats:
+    """Per-process counters of catalog cache lookups."""
+
+    hits: int = 0
+    misses: int = 0
+    expired: int = 0
+    refreshed: int = 0
+    bypassed: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of cache-eligible lookups answered from the cache."""
+        lookups = self.hits + self.misses + self.expired + self.refreshed
+        return self.hits / lookups if lookups else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the counters and hit ratio as a dictionary."""
+        return {**asdict(self), "hit_ratio": round(self.hit_ratio, 3)}
+
+
+# Counters for every CudoCatalog in this process
+catalog_cache_stats = CatalogCacheStats()
+
+# Loaded entries keyed by cache file path: fetched_at, items and data center index
+_loaded: Dict[Path, Tuple[float, List[Any], Dict[str, List[int]]]] = {}
+
+
+def _model_path(item: Any) -> str:
+    """Return the ``module:qualname`` of an item's class."""
+    cls = type(item)
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def _import_model(path: str) -> Any:
+    """Import a class from a ``module:qualname`` path."""
+    module_name, _, qualname = path.partition(":")
+    target: Any = importlib.import_module(module_name)
+    for attribute in qualname.split("."):
+        target = getattr(target, attribute)
+    return target
+
+
+def _dump(item: Any) -> Any:
+    """Serialize an SDK model (or plain value) to JSON-compatible data."""
+    if hasattr(item, "model_dump"):
+        return item.model_dump(mode="json", by_alias=True)
+    return item
+
+
+class CudoCatalog:
+    """Cached view of the Cudo Compute catalog calls.
+
+    Example:
+        >>> catalog = CudoCatalog(ctx.obj.cudo_sdk, mode=cache_mode(no_cache, refresh))
+        >>> await catalog.list_vm_machine_types(data_center_id="gb-bournemouth-1")
+    """
+
+    def __init__(
+        self,
+        sdk: Any,
+        mode: CacheMode = CacheMode.USE,
+        cache_dir: Optional[Path] = None,
+        stats: Optional[CatalogCacheStats] = None,
+    ) -> None:
+        """Initialize the catalog.
+
+        Args:
+            sdk: CudoComputeSDK used for cache misses
+            mode: Whether to use, refresh or bypass the cache
+            cache_dir: Cache directory; defaults to ``USER_CUDO_CATALOG_CACHE_DIR``
+            stats: Counters to update; defaults to the process-wide counters
+        """
+        self.sdk = sdk
+        self.mode = mode
+        self.cache_dir = cache_dir or USER_CUDO_CATALOG_CACHE_DIR
+        self.stats = stats or catalog_cache_stats
+        api_key = str(getattr(sdk, "api_key", "") or "")
+        self._account = hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:12]
+
+    def _path(self, catalog: str, args: Dict[str, Any]) -> Path:
+        """Return the cache file for a catalog call."""
+        key = json.dumps({"account": self._account, "args": args}, sort_keys=True)
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+        return self.cache_dir / f"{catalog}-{digest}.json"
+
+    def _read(
+        self, path: Path, max_age: float
+    ) -> Optional[Tuple[List[Any], Dict[str, List[int]]]]:
+        """Return the items and index of a fresh cache entry, or None."""
+        try:
+            entry = json.loads(path.read_text())
+        except FileNotFoundError:
+            self.stats.misses += 1
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable catalog cache {path}: {e}")
+            self.stats.misses += 1
+            return None
+
+        fetched_at = entry.get("fetched_at", 0)
+        if entry.get("cli_version") != __version__ or time.time() - fetched_at > max_age:
+            self.stats.expired += 1
+            return None
+
+        memoized = _loaded.get(path)
+        if memoized is not None and memoized[0] == fetched_at:
+            self.stats.hits += 1
+            return memoized[1], memoized[2]
+
+        try:
+            model = _import_model(entry["model"]) if entry.get("model") else None
+            validate = getattr(model, "model_validate", None)
+            items = [
+                validate(data) if validate is not None else data for data in entry.get("items", [])
+            ]
+        except Exception as e:
+            logger.debug(f"Ignoring catalog cache {path} that no longer matches the SDK: {e}")
+            self.stats.misses += 1
+            return None
+
+        index = entry.get("by_data_center", {})
+        _loaded[path] = (fetched_at, items, index)
+        self.stats.hits += 1
+        logger.debug(f"Catalog cache hit for {path.name} ({time.time() - fetched_at:.0f}s old)")
+        return items, index
+
+    def _write(self, path: Path, catalog: str, items: List[Any]) -> Dict[str, List[int]]:
+        """Store a fresh listing and return its data center index."""
+        index: Dict[str, List[int]] = {}
+        for position, item in enumerate(items):
+            data_center_id = getattr(item, "data_center_id", None)
+            if data_center_id:
+                index.setdefault(str(data_center_id), []).append(position)
+
+        fetched_at = time.time()
+        entry = {
+            "catalog": catalog,
+            "cli_version": __version__,
+            "fetched_at": fetched_at,
+            "model": _model_path(items[0]),
+            "items": [_dump(item) for item in items],
+            "by_data_center": index,
+        }
+        try:
+            atomic_write_text(path, json.dumps(entry), durable=False)
+            _loaded[path] = (fetched_at, list(items), index)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Could not write catalog cache {path}: {e}")
+        return index
+
+    async def _lookup(
+        self,
+        catalog: str,
+        args: Dict[str, Any],
+        max_age: float,
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> Tuple[List[Any], Dict[str, List[int]]]:
+        """Return a catalog listing from the cache or the API, with its data center index."""
+        if self.mode is CacheMode.BYPASS:
+            self.stats.bypassed += 1
+            return list(await fetch() or []), {}
+
+        path = self._path(catalog, args)
+        logger.debug(
+            f"Catalog cache lookup for {catalog} ({self.mode.value}): {self.stats.as_dict()}"
+        )
+        if self.mode is CacheMode.USE:
+            cached = self._read(path, max_age)
+            if cached is not None:
+                return cached
+        else:
+            self.stats.refreshed += 1
+
+        items = list(await fetch() or [])
+        # Empty answers are usually transient (or a "not found"), so they are not stored
+        return items, self._write(path, catalog, items) if items else {}
+
+    @staticmethod
+    def _in_data_center(
+        items: List[Any], index: Dict[str, List[int]], data_center_id: Optional[str]
+    ) -> List[Any]:
+        """Return the items of one data center using the index when available."""
+        if data_center_id is None:
+            return list(items)
+        if index:
+            return [items[position] for position in index.get(data_center_id, [])]
+        return [item for item in items if getattr(item, "data_center_id", None) == data_center_id]
+
+    async def list_vm_data_centers(self) -> List[Any]:
+        """List VM data centers."""
+        items, _ = await self._lookup(
+            "vm_data_centers", {}, CUDO_CATALOG_CACHE_TTL_SECONDS, self.sdk.list_vm_data_centers
+        )
+        return list(items)
+
+    async def get_data_center(self, data_center_id: str) -> Optional[Any]:
+        """Get a data center by ID."""
+        items, _ = await self._lookup(
+            "data_center",
+            {"data_center_id": data_center_id},
+            CUDO_CATALOG_CACHE_TTL_SECONDS,
+            lambda: self._fetch_one(self.sdk.get_data_center, data_center_id=data_center_id),
+        )
+        return items[0] if items else None
+
+    async def list_vm_machine_types(
+        self, project_id: Optional[str] = None, data_center_id: Optional[str] = None
+    ) -> List[Any]:
+        """List VM machine types, optionally for a single data center."""
+        items, index = await self._lookup(
+            "vm_machine_types",
+            {"project_id": project_id},
+            CUDO_MACHINE_TYPE_CACHE_TTL_SECONDS,
+            lambda: self.sdk.list_vm_machine_types(project_id=project_id),
+        )
+        return self._in_data_center(items, index, data_center_id)
+
+    async def list_machine_types(
+        self, project_id: Optional[str] = None, data_center_id: Optional[str] = None
+    ) -> List[Any]:
+        """List bare-metal machine types, optionally for a single data center."""
+        items, index = await self._lookup(
+            "machine_types",
+            {"project_id": project_id},
+            CUDO_MACHINE_TYPE_CACHE_TTL_SECONDS,
+            lambda: self.sdk.list_machine_types(project_id=project_id),
+        )
+        return self._in_data_center(items, index, data_center_id)
+
+    async def get_vm_machine_type(
+        self, data_center_id: str, machine_type_id: str, project_id: Optional[str] = None
+    ) -> Optional[Any]:
+        """Get a VM machine type in a data center."""
+        args = {
+            "data_center_id": data_center_id,
+            "machine_type_id": machine_type_id,
+            "project_id": project_id,
+        }
+        items, _ = await self._lookup(
+            "vm_machine_type",
+            args,
+            CUDO_MACHINE_TYPE_CACHE_TTL_SECONDS,
+            lambda: self._fetch_one(self.sdk.get_vm_machine_type, **args),
+        )
+        return items[0] if items else None
+
+    async def get_machine_type(
+        self, data_center_id: str, machine_type_id: str, project_id: Optional[str] = None
+    ) -> Optional[Any]:
+        """Get a bare-metal machine type in a data center."""
+        args = {
+            "data_center_id": data_center_id,
+            "machine_type_id": machine_type_id,
+            "project_id": project_id,
+        }
+        items, _ = await self._lookup(
+            "machine_type",
+            args,
+            CUDO_MACHINE_TYPE_CACHE_TTL_SECONDS,
+            lambda: self._fetch_one(self.sdk.get_machine_type, **args),
+        )
+        return items[0] if items else None
+
+    async def list_public_vm_images(self) -> List[Any]:
+        """List public VM images."""
+        items, _ = await self._lookup(
+            "public_vm_images", {}, CUDO_CATALOG_CACHE_TTL_SECONDS, self.sdk.list_public_vm_images
+        )
+        return list(items)
+
+    @staticmethod
+    async def _fetch_one(get: Callable[..., Awaitable[Any]], **kwargs: Any) -> List[Any]:
+        """Call a ``get_*`` method and wrap its result as a one-item listing."""
+        item = await get(**kwargs)
+        return [item] if item is not None else []
+
+
+def clear_catalog_cache(cache_dir: Optional[Path] = None) -> None:
+    """Remove every cached catalog entry."""
+    for path in (cache_dir or USER_CUDO_CATALOG_CACHE_DIR).glob("*.json"):
+        _loaded.pop(path, None)
+        path.unlink(missing_ok=True)
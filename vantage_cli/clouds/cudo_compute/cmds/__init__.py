@@ -17,13 +17,22 @@ from functools import wraps
 from typing import Any, Callable
 
 import typer
-from cudo_compute_sdk import CudoComputeSDK
 
-from vantage_cli.sdk.cloud_credential.crud import cloud_credential_sdk
+from vantage_cli.clouds.cudo_compute.sdk_pool import CLOUD, cudo_sdk_pool
 
 logger = logging.getLogger(__name__)
 
-CLOUD = "cudo-compute"
+
+def _attach_cudo_sdk(ctx: typer.Context) -> None:
+    """Attach the shared SDK client for the default credential to the context."""
+    cudo_sdk = cudo_sdk_pool.get_default()
+    if cudo_sdk is None:
+        logger.debug(f"[bold red]Error:[/bold red] No default credential found for '{CLOUD}'")
+        logger.debug(f"Run: vantage cloud credential create --cloud {CLOUD}")
+        raise typer.Exit(code=1)
+
+    ctx.obj.cudo_sdk = cudo_sdk
+    logger.debug("CudoComputeSDK attached to context")
 
 
 def attach_cudo_compute_client(func: Callable[..., Any]) -> Callable[..., Any]:
@@ -31,7 +40,7 @@ def attach_cudo_compute_client(func: Callable[..., Any]) -> Callable[..., Any]:
 
     This decorator:
     1. Retrieves the default Cudo Compute credential
-    2. Initializes the CudoComputeSDK with the API key
+    2. Gets the shared CudoComputeSDK for it from ``cudo_sdk_pool``
     3. Injects the SDK as 'cudo_sdk' into the context object
 
     The decorated function can then access the SDK via ctx.obj.cudo_sdk.
@@ -40,19 +49,7 @@ def attach_cudo_compute_client(func: Callable[..., Any]) -> Callable[..., Any]:
 
         @wraps(func)
         async def async_wrapper(ctx: typer.Context, *args, **kwargs):
-            # Get default credential for Cudo Compute
-            cudo_credential = cloud_credential_sdk.get_default(cloud_name=CLOUD)
-            if cudo_credential is None:
-                logger.debug(
-                    f"[bold red]Error:[/bold red] No default credential found for '{CLOUD}'"
-                )
-                logger.debug(f"Run: vantage cloud credential create --cloud {CLOUD}")
-                raise typer.Exit(code=1)
-
-            # Initialize SDK and attach to context
-            ctx.obj.cudo_sdk = CudoComputeSDK(api_key=cudo_credential.credentials_data["api_key"])
-
-            logger.debug("CudoComputeSDK initialized and attached to context")
+            _attach_cudo_sdk(ctx)
             return await func(ctx, *args, **kwargs)
 
         return async_wrapper
@@ -60,19 +57,7 @@ def attach_cudo_compute_client(func: Callable[..., Any]) -> Callable[..., Any]:
 
         @wraps(func)
         def wrapper(ctx: typer.Context, *args, **kwargs):
-            # Get default credential for Cudo Compute
-            cudo_credential = cloud_credential_sdk.get_default(cloud_name=CLOUD)
-            if cudo_credential is None:
-                logger.debug(
-                    f"[bold red]Error:[/bold red] No default credential found for '{CLOUD}'"
-                )
-                logger.debug(f"Run: vantage cloud credential create --cloud {CLOUD}")
-                raise typer.Exit(code=1)
-
-            # Initialize SDK and attach to context
-            ctx.obj.cudo_sdk = CudoComputeSDK(api_key=cudo_credential.credentials_data["api_key"])
-
-            logger.debug("CudoComputeSDK initialized and attached to context")
+            _attach_cudo_sdk(ctx)
             return func(ctx, *args, **kwargs)
 
         return wrapper
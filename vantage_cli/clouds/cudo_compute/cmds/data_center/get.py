@@ -18,6 +18,7 @@ import typer
 from vantage_cli.auth import attach_persona
 from vantage_cli.config import attach_settings
 
+from ...catalog_cache import NO_CACHE_OPTION, REFRESH_OPTION, CudoCatalog, cache_mode
 from .. import attach_cudo_compute_client
 
 logger = logging.getLogger(__name__)
@@ -29,10 +30,13 @@ logger = logging.getLogger(__name__)
 async def get_data_center(
     ctx: typer.Context,
     data_center_id: str = typer.Argument(..., help="Data center ID"),
+    no_cache: bool = NO_CACHE_OPTION,
+    refresh: bool = REFRESH_OPTION,
 ) -> None:
     """Get details of a specific Cudo Compute data center."""
     try:
-        data_center = await ctx.obj.cudo_sdk.get_data_center(data_center_id=data_center_id)
+        catalog = CudoCatalog(ctx.obj.cudo_sdk, cache_mode(no_cache, refresh))
+        data_center = await catalog.get_data_center(data_center_id=data_center_id)
     except Exception as e:
         logger.debug(f"[bold red]Error:[/bold red] Failed to get data center: {e}")
         raise typer.Exit(code=1)
@@ -18,6 +18,7 @@ import typer
 from vantage_cli.auth import attach_persona
 from vantage_cli.config import attach_settings
 
+from ...catalog_cache import NO_CACHE_OPTION, REFRESH_OPTION, CudoCatalog, cache_mode
 from .. import attach_cudo_compute_client
 
 logger = logging.getLogger(__name__)
@@ -28,10 +29,13 @@ logger = logging.getLogger(__name__)
 @attach_cudo_compute_client
 async def list_data_centers(
     ctx: typer.Context,
+    no_cache: bool = NO_CACHE_OPTION,
+    refresh: bool = REFRESH_OPTION,
 ) -> None:
     """List all available Cudo Compute data centers."""
     try:
-        data_centers = await ctx.obj.cudo_sdk.list_vm_data_centers()
+        catalog = CudoCatalog(ctx.obj.cudo_sdk, cache_mode(no_cache, refresh))
+        data_centers = await catalog.list_vm_data_centers()
     except Exception as e:
         logger.debug(f"[bold red]Error:[/bold red] Failed to list data centers: {e}")
         raise typer.Exit(code=1)
@@ -18,6 +18,7 @@ import typer
 from vantage_cli.auth import attach_persona
 from vantage_cli.config import attach_settings
 
+from ...catalog_cache import NO_CACHE_OPTION, REFRESH_OPTION, CudoCatalog, cache_mode
 from .. import attach_cudo_compute_client
 
 logger = logging.getLogger(__name__)
@@ -30,6 +31,8 @@ async def list_images(
     ctx: typer.Context,
     project_id: str = typer.Option(None, "--project-id", help="Project ID (for private images)"),
     image_type: str = typer.Option("public", "--type", help="Image type: public or private"),
+    no_cache: bool = NO_CACHE_OPTION,
+    refresh: bool = REFRESH_OPTION,
 ) -> None:
     """List Cudo Compute VM images (public or private)."""
     try:
@@ -41,7 +44,8 @@ async def list_images(
                 raise typer.Exit(code=1)
             images = await ctx.obj.cudo_sdk.list_private_vm_images(project_id=project_id)
         else:
-            images = await ctx.obj.cudo_sdk.list_public_vm_images()
+            catalog = CudoCatalog(ctx.obj.cudo_sdk, cache_mode(no_cache, refresh))
+            images = await catalog.list_public_vm_images()
     except Exception as e:
         logger.debug(f"[bold red]Error:[/bold red] Failed to list images: {e}")
         raise typer.Exit(code=1)
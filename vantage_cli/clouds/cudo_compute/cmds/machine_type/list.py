@@ -19,6 +19,7 @@ import typer
 from vantage_cli.auth import attach_persona
 from vantage_cli.config import attach_settings
 
+from ...catalog_cache import NO_CACHE_OPTION, REFRESH_OPTION, CudoCatalog, cache_mode
 from .. import attach_cudo_compute_client
 
 logger = logging.getLogger(__name__)
@@ -39,17 +40,21 @@ async def list_machine_types(
         "--project-id",
         help="Project ID for custom pricing (optional)",
     ),
+    no_cache: bool = NO_CACHE_OPTION,
+    refresh: bool = REFRESH_OPTION,
 ) -> None:
     """List all bare-metal machine types available.
 
     If --datacenter-id is not provided, returns machine types for all data centers.
     """
     try:
-        all_machine_types = await ctx.obj.cudo_sdk.list_machine_types(project_id=project_id)
+        catalog = CudoCatalog(ctx.obj.cudo_sdk, cache_mode(no_cache, refresh))
 
         if datacenter_id:
-            # Filter for specific data center
-            machine_types = [mt for mt in all_machine_types if mt.data_center_id == datacenter_id]
+            # Answered from the catalog's per-data-center index
+            machine_types = await catalog.list_machine_types(
+                project_id=project_id, data_center_id=datacenter_id
+            )
 
             if not machine_types:
                 typer.echo(
@@ -67,6 +72,7 @@ async def list_machine_types(
             )
         else:
             # Show all machine types
+            all_machine_types = await catalog.list_machine_types(project_id=project_id)
             if not all_machine_types:
                 typer.echo("No bare-metal machine types found", err=True)
                 raise typer.Exit(1)
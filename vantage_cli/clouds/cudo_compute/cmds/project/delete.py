@@ -13,6 +13,8 @@
 
 import asyncio
 import logging
+import time
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 import typer
 
@@ -23,132 +25,197 @@ from .. import attach_cudo_compute_client
 
 logger = logging.getLogger(__name__)
 
+# Default number of delete calls issued at the same time
+DEFAULT_TEARDOWN_PARALLELISM = 8
 
-async def _delete_vms(ctx: typer.Context, project_id: str) -> None:
-    """Delete all VMs in a project and wait for cleanup."""
-    typer.echo("  Checking for VMs...")
-    vms = await ctx.obj.cudo_sdk.list_vms(project_id=project_id)
-    if not vms:
-        return
+# Polling of deleted resources starts at the initial delay and doubles up to the maximum
+TEARDOWN_POLL_INITIAL_DELAY = 1.0
+TEARDOWN_POLL_MAX_DELAY = 10.0
 
-    typer.echo(f"  Found {len(vms)} VM(s) to terminate")
-    for vm in vms:
-        vm_id = vm.id
-        typer.echo(f"    Terminating VM: {vm_id}")
-        try:
-            await ctx.obj.cudo_sdk.terminate_vm(project_id=project_id, vm_id=vm_id)
-            typer.echo(f"      ✓ Terminated VM: {vm_id}")
-        except Exception as e:
-            typer.echo(f"      ⚠ Failed to terminate VM {vm_id}: {e}", err=True)
-
-    # Wait for VMs to be fully terminated and cleaned up
-    typer.echo("  Waiting for VM termination and cleanup to complete...")
-    max_wait = 60  # Maximum 60 seconds
-    wait_interval = 5
-    elapsed = 0
-
-    while elapsed < max_wait:
-        await asyncio.sleep(wait_interval)
-        elapsed += wait_interval
-
-        # Check if VMs are gone
-        remaining_vms = await ctx.obj.cudo_sdk.list_vms(project_id=project_id)
-        if not remaining_vms:
-            typer.echo(f"    ✓ All VMs cleaned up after {elapsed}s")
-            break
-        typer.echo(
-            f"    Still waiting... ({elapsed}s elapsed, {len(remaining_vms)} VM(s) remaining)"
-        )
+# Give up waiting for deleted resources of one kind to disappear after this many seconds
+TEARDOWN_WAIT_TIMEOUT = 60.0
 
-    # Extra wait to ensure NICs are detached
-    await asyncio.sleep(3)
 
+class _ResourceKind(NamedTuple):
+    """A kind of project resource and how to list and delete it."""
 
-async def _delete_disks(ctx: typer.Context, project_id: str) -> None:
-    """Delete all disks in a project."""
-    typer.echo("  Checking for disks...")
-    disks = await ctx.obj.cudo_sdk.list_disks(project_id=project_id)
-    if not disks:
-        return
+    label: str
+    list_method: str
+    delete_method: str
+    id_argument: str
+    after: Tuple[str, ...] = ()
 
-    typer.echo(f"  Found {len(disks)} disk(s) to delete")
-    for disk in disks:
-        disk_id = disk.id
-        typer.echo(f"    Deleting disk: {disk_id}")
-        try:
-            await ctx.obj.cudo_sdk.delete_disk(project_id=project_id, disk_id=disk_id)
-            typer.echo(f"      ✓ Deleted disk: {disk_id}")
-        except Exception as e:
-            typer.echo(f"      ⚠ Failed to delete disk {disk_id}: {e}", err=True)
 
+# Teardown plan: each kind is deleted once every kind in ``after`` is gone.
+# VMs hold the NICs and disks, and networks still reference security groups.
+_TEARDOWN_PLAN: Tuple[_ResourceKind, ...] = (
+    _ResourceKind("VM", "list_vms", "terminate_vm", "vm_id"),
+    _ResourceKind("disk", "list_disks", "delete_disk", "disk_id", after=("VM",)),
+    _ResourceKind("volume", "list_volumes", "delete_volume", "volume_id", after=("VM",)),
+    _ResourceKind(
+        "security group",
+        "list_security_groups",
+        "delete_security_group",
+        "security_group_id",
+        after=("VM",),
+    ),
+    _ResourceKind(
+        "network", "list_networks", "delete_network", "network_id", after=("VM", "security group")
+    ),
+)
 
-async def _delete_volumes(ctx: typer.Context, project_id: str) -> None:
-    """Delete all volumes in a project."""
-    typer.echo("  Checking for volumes...")
-    volumes = await ctx.obj.cudo_sdk.list_volumes(project_id=project_id)
-    if not volumes:
-        return
 
-    typer.echo(f"  Found {len(volumes)} volume(s) to delete")
-    for volume in volumes:
-        volume_id = volume.id
-        typer.echo(f"    Deleting volume: {volume_id}")
-        try:
-            await ctx.obj.cudo_sdk.delete_volume(project_id=project_id, volume_id=volume_id)
-            typer.echo(f"      ✓ Deleted volume: {volume_id}")
-        except Exception as e:
-            typer.echo(f"      ⚠ Failed to delete volume {volume_id}: {e}", err=True)
+class _TeardownResult(NamedTuple):
+    """Outcome of deleting one resource."""
 
+    kind: str
+    resource_id: str
+    status: str
+    delete_seconds: float
+    gone_seconds: Optional[float]
+    error: Optional[str] = None
 
-async def _delete_security_groups(ctx: typer.Context, project_id: str) -> None:
-    """Delete all security groups in a project."""
-    typer.echo("  Checking for security groups...")
-    security_groups = await ctx.obj.cudo_sdk.list_security_groups(project_id=project_id)
-    if not security_groups:
-        return
 
-    typer.echo(f"  Found {len(security_groups)} security group(s) to delete")
-    for sg in security_groups:
-        sg_id = sg.id
-        typer.echo(f"    Deleting security group: {sg_id}")
-        try:
-            await ctx.obj.cudo_sdk.delete_security_group(
-                project_id=project_id, security_group_id=sg_id
+async def _wait_until_gone(
+    ctx: typer.Context,
+    project_id: str,
+    kind: _ResourceKind,
+    resource_ids: List[str],
+    started: float,
+) -> Dict[str, float]:
+    """Poll a resource listing with exponential backoff until the given IDs are gone.
+
+    Returns:
+        Seconds from ``started`` until each resource disappeared, for the ones that did
+    """
+    list_resources = getattr(ctx.obj.cudo_sdk, kind.list_method)
+    pending = set(resource_ids)
+    gone_after: Dict[str, float] = {}
+    delay = TEARDOWN_POLL_INITIAL_DELAY
+    deadline = time.monotonic() + TEARDOWN_WAIT_TIMEOUT
+
+    while pending:
+        remaining = {r.id for r in await list_resources(project_id=project_id)}
+        now = time.monotonic()
+        for resource_id in pending - remaining:
+            gone_after[resource_id] = now - started
+        pending &= remaining
+        if not pending:
+            break
+        if now >= deadline:
+            typer.echo(
+                f"    ⚠ {len(pending)} {kind.label}(s) still present after "
+                f"{TEARDOWN_WAIT_TIMEOUT:.0f}s, continuing",
+                err=True,
             )
-            typer.echo(f"      ✓ Deleted security group: {sg_id}")
-        except Exception as e:
-            typer.echo(f"      ⚠ Failed to delete security group {sg_id}: {e}", err=True)
+            break
 
+        logger.debug(f"Waiting {delay:.1f}s for {len(pending)} {kind.label}(s) to disappear")
+        await asyncio.sleep(min(delay, max(deadline - now, 0)))
+        delay = min(delay * 2, TEARDOWN_POLL_MAX_DELAY)
 
-async def _delete_networks(ctx: typer.Context, project_id: str) -> None:
-    """Delete all networks in a project."""
-    typer.echo("  Checking for networks...")
-    networks = await ctx.obj.cudo_sdk.list_networks(project_id=project_id)
-    if not networks:
-        return
+    return gone_after
+
+
+async def _teardown_kind(
+    ctx: typer.Context,
+    project_id: str,
+    kind: _ResourceKind,
+    semaphore: asyncio.Semaphore,
+) -> List[_TeardownResult]:
+    """Delete every resource of one kind concurrently and wait for them to disappear."""
+    resources = await getattr(ctx.obj.cudo_sdk, kind.list_method)(project_id=project_id)
+    if not resources:
+        return []
+
+    typer.echo(f"  Deleting {len(resources)} {kind.label}(s)")
+    delete_resource = getattr(ctx.obj.cudo_sdk, kind.delete_method)
+    started = time.monotonic()
+
+    async def delete(resource_id: str) -> Tuple[str, float, Optional[str]]:
+        async with semaphore:
+            begin = time.monotonic()
+            try:
+                await delete_resource(project_id=project_id, **{kind.id_argument: resource_id})
+            except Exception as e:
+                typer.echo(f"    ⚠ Failed to delete {kind.label} {resource_id}: {e}", err=True)
+                return resource_id, time.monotonic() - begin, str(e)
+            return resource_id, time.monotonic() - begin, None
+
+    outcomes = await asyncio.gather(*(delete(resource.id) for resource in resources))
+    deleted = [resource_id for resource_id, _, error in outcomes if error is None]
+    gone_after = await _wait_until_gone(ctx, project_id, kind, deleted, started)
+
+    results = []
+    for resource_id, delete_seconds, error in outcomes:
+        if error is not None:
+            status = "failed"
+        elif resource_id in gone_after:
+            status = "deleted"
+        else:
+            status = "still present"
+        results.append(
+            _TeardownResult(
+                kind.label,
+                resource_id,
+                status,
+                delete_seconds,
+                gone_after.get(resource_id),
+                error,
+            )
+        )
+    return results
 
-    typer.echo(f"  Found {len(networks)} network(s) to delete")
-    for network in networks:
-        network_id = network.id
-        typer.echo(f"    Deleting network: {network_id}")
-        try:
-            await ctx.obj.cudo_sdk.delete_network(project_id=project_id, network_id=network_id)
-            typer.echo(f"      ✓ Deleted network: {network_id}")
-        except Exception as e:
-            typer.echo(f"      ⚠ Failed to delete network {network_id}: {e}", err=True)
 
+async def _delete_all_project_resources(
+    ctx: typer.Context, project_id: str, parallel: int = DEFAULT_TEARDOWN_PARALLELISM
+) -> List[_TeardownResult]:
+    """Delete all resources in a project following the teardown plan.
 
-async def _delete_all_project_resources(ctx: typer.Context, project_id: str) -> None:
-    """Delete all resources in a project in the correct order."""
-    await _delete_vms(ctx, project_id)
-    await _delete_disks(ctx, project_id)
-    await _delete_volumes(ctx, project_id)
-    await _delete_security_groups(ctx, project_id)
-    await _delete_networks(ctx, project_id)
+    Kinds whose dependencies are gone are torn down at the same time, and at
+    most ``parallel`` delete calls are in flight across all of them.
 
-    # Wait for async deletions to complete
-    typer.echo("  Waiting for resource deletions to complete...")
-    await asyncio.sleep(5)
+    Returns:
+        Per-resource results in plan order
+    """
+    semaphore = asyncio.Semaphore(parallel)
+    done: Dict[str, asyncio.Event] = {kind.label: asyncio.Event() for kind in _TEARDOWN_PLAN}
+    results: Dict[str, List[_TeardownResult]] = {}
+
+    async def run(kind: _ResourceKind) -> None:
+        try:
+            for dependency in kind.after:
+                await done[dependency].wait()
+            results[kind.label] = await _teardown_kind(ctx, project_id, kind, semaphore)
+        except Exception as e:
+            # Raising here would make the task group cancel every other kind
+            typer.echo(f"    ⚠ Failed to tear down {kind.label}s: {e}", err=True)
+            results[kind.label] = [_TeardownResult(kind.label, "*", "failed", 0.0, None, str(e))]
+        finally:
+            # Dependents proceed even if this kind failed; the project delete retries
+            done[kind.label].set()
+
+    async with asyncio.TaskGroup() as task_group:
+        for kind in _TEARDOWN_PLAN:
+            task_group.create_task(run(kind))
+
+    ordered = [result for kind in _TEARDOWN_PLAN for result in results.get(kind.label, [])]
+    _display_teardown_results(ordered)
+    return ordered
+
+
+def _display_teardown_results(results: List[_TeardownResult]) -> None:
+    """Print how long each resource took to delete and to disappear."""
+    for result in results:
+        symbol = "✓" if result.status == "deleted" else "⚠"
+        gone = (
+            f", gone after {result.gone_seconds:.1f}s" if result.gone_seconds is not None else ""
+        )
+        typer.echo(
+            f"    {symbol} {result.kind} {result.resource_id}: {result.status} "
+            f"(delete call {result.delete_seconds:.1f}s{gone})",
+            err=result.status != "deleted",
+        )
 
 
 async def _delete_project_with_retry(ctx: typer.Context, project_id: str) -> None:
@@ -185,6 +252,12 @@ async def delete_project(
     ctx: typer.Context,
     project_id: str = typer.Argument(..., help="Project ID"),
     force: bool = typer.Option(False, "--force", help="Skip confirmation prompt"),
+    parallel: int = typer.Option(
+        DEFAULT_TEARDOWN_PARALLELISM,
+        "--parallel",
+        min=1,
+        help="Number of resources deleted at once",
+    ),
 ) -> None:
     """Delete a Cudo Compute project. All resources in the project will be deleted first."""
     if not force:
@@ -207,7 +280,7 @@ async def delete_project(
         resource_count = project.resource_count or 0
         if resource_count > 0:
             typer.echo(f"Project contains {resource_count} resource(s). Deleting all resources...")
-            await _delete_all_project_resources(ctx, project_id)
+            await _delete_all_project_resources(ctx, project_id, parallel)
 
         # Delete the project with retry logic
         await _delete_project_with_retry(ctx, project_id)
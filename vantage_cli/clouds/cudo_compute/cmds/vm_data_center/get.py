@@ -12,6 +12,7 @@ from typer import Context
 from vantage_cli.auth import attach_persona
 from vantage_cli.config import attach_settings
 
+from ...catalog_cache import NO_CACHE_OPTION, REFRESH_OPTION, CudoCatalog, cache_mode
 from .. import attach_cudo_compute_client
 
 logger = logging.getLogger(__name__)
@@ -26,11 +27,14 @@ async def get_vm_data_center(
         ...,
         help="Data center ID",
     ),
+    no_cache: bool = NO_CACHE_OPTION,
+    refresh: bool = REFRESH_OPTION,
 ) -> None:
     """Get details of a specific VM data center."""
     try:
         # List all data centers and filter by ID
-        data_centers = await ctx.obj.cudo_sdk.list_vm_data_centers()
+        catalog = CudoCatalog(ctx.obj.cudo_sdk, cache_mode(no_cache, refresh))
+        data_centers = await catalog.list_vm_data_centers()
 
         # Find the requested data center
         data_center = next((dc for dc in data_centers if dc.id == data_center_id), None)
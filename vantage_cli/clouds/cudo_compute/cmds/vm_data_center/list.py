@@ -12,6 +12,7 @@ from typer import Context
 from vantage_cli.auth import attach_persona
 from vantage_cli.config import attach_settings
 
+from ...catalog_cache import NO_CACHE_OPTION, REFRESH_OPTION, CudoCatalog, cache_mode
 from .. import attach_cudo_compute_client
 
 logger = logging.getLogger(__name__)
@@ -22,10 +23,13 @@ logger = logging.getLogger(__name__)
 @attach_cudo_compute_client
 async def list_vm_data_centers(
     ctx: Context,
+    no_cache: bool = NO_CACHE_OPTION,
+    refresh: bool = REFRESH_OPTION,
 ) -> None:
     """List all data centers available for virtual machines."""
     try:
-        data_centers = await ctx.obj.cudo_sdk.list_vm_data_centers()
+        catalog = CudoCatalog(ctx.obj.cudo_sdk, cache_mode(no_cache, refresh))
+        data_centers = await catalog.list_vm_data_centers()
 
         # Convert Pydantic models to dicts for the formatter
         data_centers_data = [dc.model_dump() for dc in data_centers]
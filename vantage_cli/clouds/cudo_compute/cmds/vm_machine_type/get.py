@@ -19,6 +19,7 @@ import typer
 from vantage_cli.auth import attach_persona
 from vantage_cli.config import attach_settings
 
+from ...catalog_cache import NO_CACHE_OPTION, REFRESH_OPTION, CudoCatalog, cache_mode
 from .. import attach_cudo_compute_client
 
 logger = logging.getLogger(__name__)
@@ -42,6 +43,8 @@ async def get_vm_machine_type(
         "--project-id",
         help="Project ID for custom pricing (optional)",
     ),
+    no_cache: bool = NO_CACHE_OPTION,
+    refresh: bool = REFRESH_OPTION,
 ) -> None:
     """Get details of a specific VM machine type.
 
@@ -49,7 +52,8 @@ async def get_vm_machine_type(
     CPU/GPU models, and resource limits for a specific data center.
     """
     try:
-        machine_type_details = await ctx.obj.cudo_sdk.get_vm_machine_type(
+        catalog = CudoCatalog(ctx.obj.cudo_sdk, cache_mode(no_cache, refresh))
+        machine_type_details = await catalog.get_vm_machine_type(
             data_center_id=datacenter_id,
             machine_type_id=machine_type,
             project_id=project_id,
@@ -19,6 +19,7 @@ import typer
 from vantage_cli.auth import attach_persona
 from vantage_cli.config import attach_settings
 
+from ...catalog_cache import NO_CACHE_OPTION, REFRESH_OPTION, CudoCatalog, cache_mode
 from .. import attach_cudo_compute_client
 
 logger = logging.getLogger(__name__)
@@ -39,17 +40,24 @@ async def list_vm_machine_types(
         "--project-id",
         help="Project ID for custom pricing (optional)",
     ),
+    limit: Optional[int] = typer.Option(
+        None, "--limit", "-l", help="Maximum number of machine types to show"
+    ),
+    no_cache: bool = NO_CACHE_OPTION,
+    refresh: bool = REFRESH_OPTION,
 ) -> None:
     """List all VM machine types available.
 
     If --datacenter-id is not provided, returns machine types for all data centers.
     """
     try:
-        all_machine_types = await ctx.obj.cudo_sdk.list_vm_machine_types(project_id=project_id)
+        catalog = CudoCatalog(ctx.obj.cudo_sdk, cache_mode(no_cache, refresh))
 
         if datacenter_id:
-            # Filter for specific data center
-            machine_types = [mt for mt in all_machine_types if mt.data_center_id == datacenter_id]
+            # Answered from the catalog's per-data-center index
+            machine_types = await catalog.list_vm_machine_types(
+                project_id=project_id, data_center_id=datacenter_id
+            )
 
             if not machine_types:
                 typer.echo(
@@ -64,9 +72,11 @@ async def list_vm_machine_types(
             ctx.obj.formatter.render_list(
                 data=machine_types_data,
                 resource_name=f"VM Machine Types for {datacenter_id}",
+                limit=limit,
             )
         else:
             # Show all machine types
+            all_machine_types = await catalog.list_vm_machine_types(project_id=project_id)
             if not all_machine_types:
                 typer.echo("No VM machine types found", err=True)
                 raise typer.Exit(1)
@@ -77,6 +87,7 @@ async def list_vm_machine_types(
             ctx.obj.formatter.render_list(
                 data=all_machine_types_data,
                 resource_name="VM Machine Types",
+                limit=limit,
             )
     except typer.Exit:
         raise
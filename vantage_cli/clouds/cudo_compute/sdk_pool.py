@@ -0,0 +1,131 @@
+# Copyright (C) 2025 Vantage Compute Corporation
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/>.
+"""Process-wide registry of CudoComputeSDK clients."""
+
+import asyncio
+import hashlib
+import inspect
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from cudo_compute_sdk import CudoComputeSDK
+
+from vantage_cli import register_async_shutdown_hook
+from vantage_cli.sdk.cloud_credential.crud import cloud_credential_sdk
+from vantage_cli.sdk.cloud_credential.schema import CloudCredential
+
+logger = logging.getLogger(__name__)
+
+CLOUD = "cudo-compute"
+
+
+def _key_fingerprint(api_key: str) -> str:
+    """Return a short hash identifying an API key without keeping it as a dict key."""
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+
+
+class CudoSDKPool:
+    """Process-wide registry of ``CudoComputeSDK`` clients.
+
+    Clients are keyed by credential ID, so every command, the dashboard and
+    the app ``create``/``remove`` paths share one client (and its HTTP
+    connection pool) per credential for the lifetime of a CLI invocation or
+    dashboard session. A client is replaced when its credential's API key
+    changes or when it was created on an event loop that has since finished.
+    The default credential is looked up once and reused until :meth:`close`.
+    The pool registers :meth:`close` as an async shutdown hook.
+
+    Example:
+        >>> cudo_sdk = cudo_sdk_pool.get_default()
+        >>> await cudo_sdk.list_projects()
+        >>> await cudo_sdk_pool.close()
+    """
+
+    def __init__(self) -> None:
+        self._clients: Dict[
+            str, Tuple[str, CudoComputeSDK, Optional[asyncio.AbstractEventLoop]]
+        ] = {}
+        self._retired: List[CudoComputeSDK] = []
+        self._default_credential: Optional[CloudCredential] = None
+
+    def get(self, credential: CloudCredential) -> CudoComputeSDK:
+        """Return the shared client for a credential, creating it if needed.
+
+        Args:
+            credential: Cudo Compute credential with an ``api_key``
+
+        Returns:
+            Shared CudoComputeSDK instance
+        """
+        api_key = credential.credentials_data["api_key"]
+        fingerprint = _key_fingerprint(api_key)
+        try:
+            loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        entry = self._clients.get(credential.id)
+        if entry is not None:
+            client_fingerprint, client, client_loop = entry
+            same_loop = client_loop is None or client_loop is loop
+            if client_fingerprint == fingerprint and same_loop:
+                if client_loop is None and loop is not None:
+                    self._clients[credential.id] = (fingerprint, client, loop)
+                return client
+            if client_loop is None or not client_loop.is_closed():
+                # Still usable by its own loop; closed together with the pool
+                self._retired.append(client)
+
+        logger.debug(f"Creating CudoComputeSDK for credential '{credential.name}'")
+        client = CudoComputeSDK(api_key=api_key)
+        self._clients[credential.id] = (fingerprint, client, loop)
+        register_async_shutdown_hook(self.close)
+        return client
+
+    def get_default(self) -> Optional[CudoComputeSDK]:
+        """Return the shared client for the default Cudo Compute credential.
+
+        The credential is read from the credential store on first use and cached
+        until :meth:`close`; a missing default is not cached, so one created later
+        is picked up.
+
+        Returns:
+            Shared CudoComputeSDK instance, or None if no default credential is configured
+        """
+        if self._default_credential is None:
+            self._default_credential = cloud_credential_sdk.get_default(cloud_name=CLOUD)
+            if self._default_credential is None:
+                logger.debug(f"No default credential found for '{CLOUD}'")
+                return None
+        return self.get(self._default_credential)
+
+    async def close(self) -> None:
+        """Close every pooled client; later calls to :meth:`get` create new ones."""
+        clients = [client for _, client, _ in self._clients.values()] + self._retired
+        self._clients.clear()
+        self._retired.clear()
+        self._default_credential = None
+
+        for client in clients:
+            close = getattr(client, "aclose", None) or getattr(client, "close", None)
+            if close is None:
+                continue
+            try:
+                result = close()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.debug(f"Error closing CudoComputeSDK client: {e}")
+
+
+# Shared registry used by the cudo-compute commands, app deployments and the dashboard
+cudo_sdk_pool = CudoSDKPool()
@@ -34,11 +34,13 @@ from rich.text import Text
 from typing_extensions import Annotated
 
 from vantage_cli.auth import attach_persona
+from vantage_cli.clouds.command_runner import run_command
 from vantage_cli.clouds.common import (
     create_deployment_with_init_status,
     generate_dev_cluster_data,
 )
 from vantage_cli.config import attach_settings
+from vantage_cli.dependency_tracker import DependencyTracker, Worker
 from vantage_cli.exceptions import handle_abort
 from vantage_cli.sdk.cloud.crud import cloud_sdk
 from vantage_cli.sdk.cluster.schema import Cluster, VantageClusterContext
@@ -189,10 +191,8 @@ async def _wait_for_idle_with_status(model: Model, console: Console) -> None:
         while True:
             # Get juju status output with color
             try:
-                result = subprocess.run(
+                result = await run_command(
                     ["juju", "status", "--color", "-m", model.name],
-                    capture_output=True,
-                    text=True,
                     timeout=5,
                     env={**os.environ, "TERM": "xterm-256color"},
                 )
@@ -245,31 +245,63 @@ async def _deploy_juju_localhost(
             vantage_cluster_ctx.client_id, cloud_name=CLOUD_LOCALHOST
         )
 
-        vantage_jupyterhub_config_secret_id = await model.add_secret(
-            JUPYTERHUB_SECRET_NAME, _build_vantage_jupyterhub_secret_args(vantage_cluster_ctx)
+        async def deploy_bundle(worker_id: str) -> None:
+            bundle_yaml = _prepare_bundle(
+                vantage_cluster_ctx,
+                model_name=vantage_cluster_ctx.client_id,
+                vantage_jupyterhub_config_secret_id=tracker.results["jupyterhub-secret"],
+                vantage_sssd_config_secret_id=tracker.results["sssd-secret"],
+            )
+            await _write_and_deploy_model_bundle(model, bundle_yaml)
+
+        # Independent model operations overlap; each step starts once its inputs exist
+        tracker = DependencyTracker(
+            [
+                Worker(
+                    "jupyterhub-secret",
+                    lambda _: model.add_secret(
+                        JUPYTERHUB_SECRET_NAME,
+                        _build_vantage_jupyterhub_secret_args(vantage_cluster_ctx),
+                    ),
+                ),
+                Worker(
+                    "sssd-secret",
+                    lambda _: model.add_secret(
+                        SSSD_SECRET_NAME, _build_vantage_sssd_secret_args(vantage_cluster_ctx)
+                    ),
+                ),
+                Worker("bundle", deploy_bundle, depends_on=["jupyterhub-secret", "sssd-secret"]),
+                Worker(
+                    "grant-jupyterhub-secret",
+                    lambda _: model.grant_secret(
+                        JUPYTERHUB_SECRET_NAME, JUPYTERHUB_APPLICATION_NAME
+                    ),
+                    depends_on=["bundle"],
+                ),
+                Worker(
+                    "grant-sssd-secret",
+                    lambda _: model.grant_secret(SSSD_SECRET_NAME, SSSD_APPLICATION_NAME),
+                    depends_on=["bundle"],
+                ),
+                Worker(
+                    "wait-for-idle",
+                    lambda _: _wait_for_idle_with_status(model, console),
+                    depends_on=["grant-jupyterhub-secret", "grant-sssd-secret"],
+                ),
+                Worker(
+                    "slurmd-node-configured",
+                    lambda _: _run_slurmd_node_configured(model),
+                    depends_on=["wait-for-idle"],
+                ),
+                Worker(
+                    "jobbergate-influxdb",
+                    lambda _: _configure_jobbergate_influxdb(model),
+                    depends_on=["wait-for-idle"],
+                ),
+            ]
         )
-
-        vantage_sssd_config_secret_id = await model.add_secret(
-            SSSD_SECRET_NAME, _build_vantage_sssd_secret_args(vantage_cluster_ctx)
-        )
-
-        bundle_yaml = _prepare_bundle(
-            vantage_cluster_ctx,
-            model_name=vantage_cluster_ctx.client_id,
-            vantage_jupyterhub_config_secret_id=vantage_jupyterhub_config_secret_id,
-            vantage_sssd_config_secret_id=vantage_sssd_config_secret_id,
-        )
-
-        await _write_and_deploy_model_bundle(model, bundle_yaml)
-
-        await model.grant_secret(JUPYTERHUB_SECRET_NAME, JUPYTERHUB_APPLICATION_NAME)
-        await model.grant_secret(SSSD_SECRET_NAME, SSSD_APPLICATION_NAME)
-
-        await _wait_for_idle_with_status(model, console)
-
-        await _run_slurmd_node_configured(model)
-
-        await _configure_jobbergate_influxdb(model)
+        await tracker.execute(fail_fast=True)
+        tracker.raise_first_failure()
 
         await model.disconnect()
         await controller.disconnect()
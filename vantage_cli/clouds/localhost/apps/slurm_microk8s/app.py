@@ -11,6 +11,7 @@
 # this program. If not, see <https://www.gnu.org/licenses/>.
 """MicroK8s application support for deploying the Slurm Operator & Slurm cluster."""
 
+import asyncio
 import subprocess
 from copy import deepcopy
 from typing import Any, Dict, Optional
@@ -19,6 +20,7 @@ import typer
 from rich.console import Console
 from typing_extensions import Annotated
 
+from vantage_cli.clouds.command_runner import run_command
 from vantage_cli.clouds.common import (
     create_deployment_with_init_status,
     generate_dev_cluster_data,
@@ -147,7 +149,7 @@ async def create(ctx: typer.Context, cluster: Cluster) -> typer.Exit:
     }
 
     try:
-        deploy_microk8s_stack(
+        await deploy_microk8s_stack(
             console=console,
             verbose=verbose,
             set_values=set_values,
@@ -236,14 +238,15 @@ async def status_command(
             DEFAULT_NAMESPACE_CERT_MANAGER,
         ]
 
-        for namespace in namespaces:
-            console.print(f"[cyan]Checking namespace: {namespace}[/cyan]")
-            result = subprocess.run(
-                ["microk8s", "kubectl", "get", "pods", "-n", namespace],
-                capture_output=True,
-                text=True,
-                check=True,
+        # Query all namespaces at once, then print the results in order
+        results = await asyncio.gather(
+            *(
+                run_command(["microk8s", "kubectl", "get", "pods", "-n", namespace], check=True)
+                for namespace in namespaces
             )
+        )
+        for namespace, result in zip(namespaces, results):
+            console.print(f"[cyan]Checking namespace: {namespace}[/cyan]")
             console.print(result.stdout)
             console.print()
     except subprocess.CalledProcessError as e:
@@ -285,7 +288,7 @@ async def remove_command(
 
         for namespace in namespaces:
             try:
-                subprocess.run(
+                await run_command(
                     [
                         "microk8s",
                         "kubectl",
@@ -294,7 +297,6 @@ async def remove_command(
                         namespace,
                         "--ignore-not-found=true",
                     ],
-                    capture_output=True,
                     check=True,
                 )
                 console.print(f"[green]✓[/green] Successfully removed namespace '{namespace}'")
@@ -11,23 +11,29 @@
 # this program. If not, see <https://www.gnu.org/licenses/>.
 """Utility functions for SLURM on MicroK8s localhost deployments."""
 
+import asyncio
 import json
 import shutil
 import subprocess
+import time
+from functools import lru_cache
 from pathlib import Path
 from shutil import which
 from textwrap import dedent
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
 
 import snick
 import yaml
 from rich.console import Console
+from rich.table import Table
 
+from vantage_cli.clouds.command_runner import run_command
 from vantage_cli.clouds.utils import (
     PrerequisiteCheck,
     PrerequisiteStatus,
     check_prerequisites,
 )
+from vantage_cli.dependency_tracker import DependencyTracker, Worker
 from vantage_cli.exceptions import Abort
 
 from .constants import (
@@ -412,43 +418,73 @@ def check_microk8s_addon_enabled(addon_name: str) -> bool:
         return False
 
 
+@lru_cache(maxsize=4)
+def _enabled_microk8s_addons(status_yaml: str) -> Optional[frozenset[str]]:
+    """Parse ``microk8s status --format yaml`` output into the set of enabled addons.
+
+    Returns None if MicroK8s is not running or the output cannot be parsed.
+    The parse is memoized, so every addon check shares it.
+    """
+    try:
+        status_data = yaml.safe_load(status_yaml) or {}
+    except yaml.YAMLError:
+        return None
+    if not status_data.get("microk8s", {}).get("running", False):
+        return None
+    return frozenset(
+        addon["name"]
+        for addon in status_data.get("addons", [])
+        if addon.get("status") == "enabled" and addon.get("name")
+    )
+
+
+def _addon_enabled_validator(addon_name: str) -> Callable[[str], Optional[str]]:
+    """Build a PrerequisiteCheck validator requiring ``addon_name`` to be enabled."""
+
+    def validate(status_yaml: str) -> Optional[str]:
+        enabled = _enabled_microk8s_addons(status_yaml)
+        if enabled is None:
+            return "MicroK8s is not running"
+        if addon_name not in enabled:
+            return f"Addon '{addon_name}' is not enabled"
+        return None
+
+    return validate
+
+
 def create_microk8s_addon_prerequisite_checks() -> List[PrerequisiteCheck]:
-    """Create prerequisite checks for required MicroK8s addons."""
+    """Create prerequisite checks for required MicroK8s addons.
+
+    All addon checks run the same ``microk8s status --format yaml`` command,
+    which ``check_prerequisites`` runs only once.
+    """
+    status_command = ["microk8s", "status", "--format", "yaml"]
     return [
         PrerequisiteCheck(
             name="microk8s dns addon",
-            command=[
-                "sh",
-                "-c",
-                "microk8s status | awk '/enabled:/{flag=1; next} /disabled:/{flag=0} flag && /dns/' | grep -q dns && echo 'enabled' || exit 1",
-            ],
+            command=status_command,
             installation_hint="Enable DNS addon: microk8s enable dns",
             required=True,
+            validate=_addon_enabled_validator("dns"),
         ),
         PrerequisiteCheck(
             name="microk8s metallb addon",
-            command=[
-                "sh",
-                "-c",
-                "microk8s status | awk '/enabled:/{flag=1; next} /disabled:/{flag=0} flag && /metallb/' | grep -q metallb && echo 'enabled' || exit 1",
-            ],
+            command=status_command,
             installation_hint="Enable MetalLB addon: microk8s enable metallb:10.64.140.43-10.64.140.49 (adjust IP range as needed)",
             required=True,
+            validate=_addon_enabled_validator("metallb"),
         ),
         PrerequisiteCheck(
             name="microk8s hostpath-storage addon",
-            command=[
-                "sh",
-                "-c",
-                "microk8s status | awk '/enabled:/{flag=1; next} /disabled:/{flag=0} flag && /hostpath-storage/' | grep -q hostpath-storage && echo 'enabled' || exit 1",
-            ],
+            command=status_command,
             installation_hint="Enable hostpath-storage addon: microk8s enable hostpath-storage",
             required=True,
+            validate=_addon_enabled_validator("hostpath-storage"),
         ),
     ]
 
 
-def deploy_microk8s_stack(
+async def deploy_microk8s_stack(
     *,
     console: Console,
     verbose: bool,
@@ -457,6 +493,12 @@ def deploy_microk8s_stack(
 ) -> None:
     """Execute the MicroK8s deployment workflow using CLI utilities only.
 
+    After the prerequisite checks, the deployment steps run as a dependency
+    graph of workers: Helm repository setup and namespace creation start
+    together, Prometheus and the SLURM operator CRDs install concurrently,
+    and each step starts as soon as the steps it needs have finished. A
+    per-step timing report is printed when the graph is done.
+
     Args:
         console: Rich console for output rendering
         verbose: Whether to display verbose output during checks
@@ -466,10 +508,10 @@ def deploy_microk8s_stack(
     Raises:
         RuntimeError: If any deployment step fails
     """
-    # Step 1: Verify prerequisites
+    # Verify prerequisites
     console.print("🔍 Checking prerequisites...", style="bold blue")
     checks = create_complete_prerequisite_checks()
-    all_met, results = check_prerequisites(
+    all_met, results = await check_prerequisites(
         checks,
         console,
         verbose=verbose,
@@ -486,68 +528,148 @@ def deploy_microk8s_stack(
 
     console.print("[green]✓[/green] Prerequisites check passed")
 
-    # Step 2: Configure Helm repositories
-    console.print("📦 Setting up Helm repositories...", style="bold blue")
     repos = [
         ("jetstack", REPO_JETSTACK_URL),
         ("prometheus-community", REPO_PROMETHEUS_URL),
         ("jamesbeedy-slinky-slurm", REPO_SLURM_URL),
     ]
-    try:
-        add_helm_repositories(repos)
-    except subprocess.CalledProcessError as exc:
-        raise RuntimeError(f"Helm repository configuration failed: {exc}") from exc
-
-    console.print("[green]✓[/green] Helm repositories configured")
-
-    # Step 3: Ensure required namespaces exist
-    console.print("🔧 Creating Kubernetes namespaces...", style="bold blue")
     namespaces = [
         DEFAULT_NAMESPACE_CERT_MANAGER,
         DEFAULT_NAMESPACE_PROMETHEUS,
         DEFAULT_NAMESPACE_SLINKY,
         DEFAULT_NAMESPACE_SLURM,
     ]
-    for namespace in namespaces:
-        if not create_k8s_namespace(namespace):
-            raise RuntimeError(f"Failed to create namespace '{namespace}'")
-    console.print("[green]✓[/green] Namespaces ready")
-
-    # Step 4: Install Prometheus stack
-    console.print("📊 Installing Prometheus...", style="bold blue")
-    install_prometheus(
-        DEFAULT_NAMESPACE_PROMETHEUS,
-        DEFAULT_RELEASE_PROMETHEUS,
-        CHART_PROMETHEUS,
-    )
-    console.print("[green]✓[/green] Prometheus installed")
 
-    # Step 5: Install SLURM operator components
-    console.print("⚙️ Installing SLURM operator CRDs...", style="bold blue")
-    install_slurm_operator_crds(
-        DEFAULT_RELEASE_SLURM_OPERATOR_CRDS,
-        CHART_SLURM_OPERATOR_CRDS,
-    )
-    console.print("[green]✓[/green] SLURM operator CRDs installed")
+    def step(
+        start_message: str, done_message: str, action: Callable[[], Awaitable[None]]
+    ) -> Callable[[str], Awaitable[None]]:
+        async def run(worker_id: str) -> None:
+            console.print(start_message, style="bold blue")
+            try:
+                await action()
+            except subprocess.CalledProcessError as exc:
+                detail = exc.stderr
+                if isinstance(detail, bytes):
+                    detail = detail.decode(errors="replace")
+                raise RuntimeError((detail or "").strip() or str(exc)) from exc
+            console.print(f"[green]✓[/green] {done_message}")
+
+        return run
+
+    workers = [
+        Worker(
+            "helm-repositories",
+            step(
+                "📦 Setting up Helm repositories...",
+                "Helm repositories configured",
+                lambda: add_helm_repositories(repos),
+            ),
+        ),
+        Worker(
+            "namespaces",
+            step(
+                "🔧 Creating Kubernetes namespaces...",
+                "Namespaces ready",
+                lambda: create_k8s_namespaces(namespaces),
+            ),
+        ),
+        Worker(
+            "prometheus",
+            step(
+                "📊 Installing Prometheus...",
+                "Prometheus installed",
+                lambda: install_prometheus(
+                    DEFAULT_NAMESPACE_PROMETHEUS,
+                    DEFAULT_RELEASE_PROMETHEUS,
+                    CHART_PROMETHEUS,
+                ),
+            ),
+            depends_on=["helm-repositories", "namespaces"],
+        ),
+        Worker(
+            "slurm-operator-crds",
+            step(
+                "⚙️ Installing SLURM operator CRDs...",
+                "SLURM operator CRDs installed",
+                lambda: install_slurm_operator_crds(
+                    DEFAULT_RELEASE_SLURM_OPERATOR_CRDS,
+                    CHART_SLURM_OPERATOR_CRDS,
+                ),
+            ),
+            depends_on=["helm-repositories"],
+        ),
+        Worker(
+            "slurm-operator",
+            step(
+                "🎛️ Installing SLURM operator...",
+                "SLURM operator installed",
+                lambda: install_slurm_operator(
+                    DEFAULT_NAMESPACE_SLINKY,
+                    DEFAULT_RELEASE_SLURM_OPERATOR,
+                    CHART_SLURM_OPERATOR,
+                ),
+            ),
+            depends_on=["slurm-operator-crds", "namespaces"],
+        ),
+        Worker(
+            "slurm-cluster",
+            step(
+                "🖥️ Installing SLURM cluster...",
+                "SLURM cluster installed",
+                lambda: install_slurm_cluster(
+                    DEFAULT_NAMESPACE_SLURM,
+                    DEFAULT_RELEASE_SLURM_CLUSTER,
+                    CHART_SLURM_CLUSTER,
+                    chart_values,
+                    set_values,
+                ),
+            ),
+            depends_on=["slurm-operator"],
+        ),
+    ]
 
-    console.print("🎛️ Installing SLURM operator...", style="bold blue")
-    install_slurm_operator(
-        DEFAULT_NAMESPACE_SLINKY,
-        DEFAULT_RELEASE_SLURM_OPERATOR,
-        CHART_SLURM_OPERATOR,
-    )
-    console.print("[green]✓[/green] SLURM operator installed")
+    tracker = DependencyTracker(workers)
+    started = time.monotonic()
+    await tracker.execute()
+    print_deployment_timings(console, tracker.workers.values(), started)
 
-    # Step 6: Install SLURM cluster
-    console.print("🖥️ Installing SLURM cluster...", style="bold blue")
-    install_slurm_cluster(
-        DEFAULT_NAMESPACE_SLURM,
-        DEFAULT_RELEASE_SLURM_CLUSTER,
-        CHART_SLURM_CLUSTER,
-        chart_values,
-        set_values,
+    if tracker.has_failures():
+        errors = [f"{worker.id}: {worker.error}" for worker in tracker.get_failed_workers()]
+        skipped = [worker.id for worker in tracker.get_blocked_workers()]
+        message = "; ".join(errors)
+        if skipped:
+            message += f" (skipped: {', '.join(skipped)})"
+        raise RuntimeError(message)
+
+
+def print_deployment_timings(console: Console, workers: Iterable[Any], started: float) -> None:
+    """Print how long each deployment step took and when it started.
+
+    Args:
+        console: Rich console for output rendering
+        workers: Workers of a finished dependency graph
+        started: ``time.monotonic()`` value taken when the graph started
+    """
+    table = Table(title="Deployment Step Timings")
+    table.add_column("Step", style="cyan")
+    table.add_column("Started", justify="right")
+    table.add_column("Duration", justify="right")
+    table.add_column("Status")
+
+    ran = sorted(
+        (worker for worker in workers if worker.started_at is not None),
+        key=lambda worker: worker.started_at,
     )
-    console.print("[green]✓[/green] SLURM cluster installed")
+    for worker in ran:
+        duration = worker.duration
+        table.add_row(
+            worker.id,
+            f"+{worker.started_at - started:.1f}s",
+            f"{duration:.1f}s" if duration is not None else "-",
+            worker.state.value,
+        )
+    table.caption = f"Total: {time.monotonic() - started:.1f}s"
+    console.print(table)
 
 
 def create_complete_prerequisite_checks() -> List[PrerequisiteCheck]:
@@ -557,29 +679,22 @@ def create_complete_prerequisite_checks() -> List[PrerequisiteCheck]:
     return basic_checks + addon_checks
 
 
-def create_k8s_namespace(namespace: str) -> bool:
-    """Create a Kubernetes namespace.
+async def create_k8s_namespaces(namespaces: List[str]) -> None:
+    """Create Kubernetes namespaces with a single ``kubectl apply``.
+
+    Namespaces that already exist are left unchanged.
 
     Args:
-        namespace: Name of the namespace to create
+        namespaces: Names of the namespaces to create
 
-    Returns:
-        bool: True if namespace was created or already exists, False if creation failed
+    Raises:
+        subprocess.CalledProcessError: If kubectl fails
     """
-    try:
-        subprocess.run(
-            ["microk8s", "kubectl", "create", "namespace", namespace],
-            capture_output=True,
-            check=True,
-        )
-        return True
-    except subprocess.CalledProcessError as e:
-        # Namespace might already exist, which is fine
-        stderr_output = e.stderr.decode().strip() if e.stderr else ""
-        if "already exists" in stderr_output:
-            return True
-        else:
-            return False
+    manifest = yaml.safe_dump_all(
+        {"apiVersion": "v1", "kind": "Namespace", "metadata": {"name": namespace}}
+        for namespace in namespaces
+    )
+    await run_command(["microk8s", "kubectl", "apply", "-f", "-"], input=manifest, check=True)
 
 
 def get_ssh_keys() -> Optional[str]:
@@ -600,7 +715,7 @@ def get_ssh_keys() -> Optional[str]:
     return None
 
 
-def helm_repo_add(repo_name: str, repo_url: str, update: bool = True) -> bool:
+async def helm_repo_add(repo_name: str, repo_url: str, update: bool = True) -> bool:
     """Add a Helm repository and optionally update.
 
     Args:
@@ -613,43 +728,31 @@ def helm_repo_add(repo_name: str, repo_url: str, update: bool = True) -> bool:
     """
     try:
         # Add the repository
-        subprocess.run(
-            ["microk8s", "helm", "repo", "add", repo_name, repo_url],
-            capture_output=True,
-            check=True,
-        )
+        await run_command(["microk8s", "helm", "repo", "add", repo_name, repo_url], check=True)
 
         # Update repositories if requested
         if update:
-            subprocess.run(
-                ["microk8s", "helm", "repo", "update"],
-                capture_output=True,
-                check=True,
-            )
+            await run_command(["microk8s", "helm", "repo", "update"], check=True)
 
         return True
     except subprocess.CalledProcessError:
         return False
 
 
-def helm_repo_update() -> bool:
+async def helm_repo_update() -> bool:
     """Update all Helm repositories.
 
     Returns:
         bool: True if successful, False if failed
     """
     try:
-        subprocess.run(
-            ["microk8s", "helm", "repo", "update"],
-            capture_output=True,
-            check=True,
-        )
+        await run_command(["microk8s", "helm", "repo", "update"], check=True)
         return True
     except subprocess.CalledProcessError:
         return False
 
 
-def microk8s_deploy_chart(
+async def microk8s_deploy_chart(
     namespace: str,
     release_name: str,
     chart_repo: str,
@@ -703,40 +806,39 @@ def microk8s_deploy_chart(
             cmd.extend(["--values", "-"])
             input_data = yaml.dump(chart_values).encode("utf-8")
 
-        subprocess.run(
-            cmd,
-            input=input_data,
-            capture_output=True,
-            check=True,
-        )
+        await run_command(cmd, input=input_data, check=True)
         return True
     except subprocess.CalledProcessError:
         return False
 
 
-def add_helm_repositories(repos: List[tuple[str, str]]) -> None:
+async def add_helm_repositories(repos: List[tuple[str, str]]) -> None:
     """Add required Helm repositories.
 
+    The repositories are added concurrently; Helm serialises its own writes to
+    ``repositories.yaml``.
+
     Args:
         repos: List of (name, url) tuples for Helm repositories to add
 
     Raises:
         subprocess.CalledProcessError: If adding or updating repositories fails
     """
-    for name, url in repos:
-        if not helm_repo_add(name, url, update=False):
+    added = await asyncio.gather(*(helm_repo_add(name, url, update=False) for name, url in repos))
+    for (name, _), ok in zip(repos, added):
+        if not ok:
             raise subprocess.CalledProcessError(
                 1, ["helm", "repo", "add"], stderr=f"Failed to add repository {name}"
             )
 
     # Update all repositories at once
-    if not helm_repo_update():
+    if not await helm_repo_update():
         raise subprocess.CalledProcessError(
             1, ["helm", "repo", "update"], stderr="Failed to update Helm repositories"
         )
 
 
-def install_cert_manager(
+async def install_cert_manager(
     namespace: str,
     release_name: str,
     chart_repo: str,
@@ -753,7 +855,7 @@ def install_cert_manager(
     """
     set_values = {"crds.enabled": "true"}
 
-    success = microk8s_deploy_chart(
+    success = await microk8s_deploy_chart(
         namespace=namespace,
         release_name=release_name,
         chart_repo=chart_repo,
@@ -768,7 +870,7 @@ def install_cert_manager(
         )
 
 
-def install_prometheus(
+async def install_prometheus(
     namespace: str,
     release_name: str,
     chart_repo: str,
@@ -783,7 +885,7 @@ def install_prometheus(
     Raises:
         subprocess.CalledProcessError: If installation fails
     """
-    success = microk8s_deploy_chart(
+    success = await microk8s_deploy_chart(
         namespace=namespace,
         release_name=release_name,
         chart_repo=chart_repo,
@@ -797,7 +899,7 @@ def install_prometheus(
         )
 
 
-def install_slurm_operator_crds(
+async def install_slurm_operator_crds(
     release_name: str,
     chart_repo: str,
 ) -> None:
@@ -811,7 +913,7 @@ def install_slurm_operator_crds(
         subprocess.CalledProcessError: If installation fails
     """
     # For CRDs, we need to use global namespace (pass empty string instead of None)
-    success = microk8s_deploy_chart(
+    success = await microk8s_deploy_chart(
         namespace="",  # CRDs are cluster-scoped, empty string for global
         release_name=release_name,
         chart_repo=chart_repo,
@@ -825,7 +927,7 @@ def install_slurm_operator_crds(
         )
 
 
-def install_slurm_operator(
+async def install_slurm_operator(
     namespace: str,
     release_name: str,
     chart_repo: str,
@@ -840,7 +942,7 @@ def install_slurm_operator(
     Raises:
         subprocess.CalledProcessError: If installation fails
     """
-    success = microk8s_deploy_chart(
+    success = await microk8s_deploy_chart(
         namespace=namespace,
         release_name=release_name,
         chart_repo=chart_repo,
@@ -854,7 +956,7 @@ def install_slurm_operator(
         )
 
 
-def install_slurm_cluster(
+async def install_slurm_cluster(
     namespace: str,
     release_name: str,
     chart_repo: str,
@@ -873,7 +975,7 @@ def install_slurm_cluster(
     Raises:
         subprocess.CalledProcessError: If installation fails
     """
-    success = microk8s_deploy_chart(
+    success = await microk8s_deploy_chart(
         namespace=namespace,
         release_name=release_name,
         chart_repo=chart_repo,
@@ -13,7 +13,6 @@
 
 import logging
 import os
-import subprocess
 from pathlib import Path
 from shutil import which
 from typing import Optional
@@ -22,6 +21,7 @@ import typer
 from rich.console import Console
 from typing_extensions import Annotated
 
+from vantage_cli.clouds.command_runner import run_command
 from vantage_cli.clouds.common import (
     create_deployment_with_init_status,
     generate_dev_cluster_data,
@@ -88,55 +88,51 @@ def _generate_cloud_init_configuration(
     return cloud_init_config, image_origin
 
 
-def _launch_vm_instance(
+async def _launch_vm_instance(
     instance_name: str,
     shared_dir: Path,
     cloud_init_config: str,
     image_origin: str,
 ) -> None:
     """Launch the Multipass VM instance."""
+    # Get the number of CPUs available
+    cpu_count = str(os.cpu_count() or 2)  # Default to 2 if unable to determine
+
+    multipass_cmd = [
+        "multipass",
+        "launch",
+        f"-c{cpu_count}",
+        "-m4GB",
+        "-d10GB",
+        "--mount",
+        f"{shared_dir}:/shared",
+        "-n",
+        instance_name,
+        "--cloud-init",
+        "-",  # Use stdin for cloud-init
+        image_origin,
+    ]
+
     try:
-        # Get the number of CPUs available
-        cpu_count = str(os.cpu_count() or 2)  # Default to 2 if unable to determine
-
-        multipass_cmd = [
-            "multipass",
-            "launch",
-            f"-c{cpu_count}",
-            "-m4GB",
-            "-d10GB",
-            "--mount",
-            f"{shared_dir}:/shared",
-            "-n",
-            instance_name,
-            "--cloud-init",
-            "-",  # Use stdin for cloud-init
-            image_origin,
-        ]
-
-        p = subprocess.Popen(
+        result = await run_command(
             multipass_cmd,
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
+            input=cloud_init_config,
+            on_stdout=lambda line: logger.debug(f"multipass: {line}"),
         )
+    except FileNotFoundError as e:
+        raise RuntimeError(f"Error launching multipass instance: {e}")
 
-        stdout, stderr = p.communicate(input=cloud_init_config.encode("utf-8"))
-
-        if p.returncode != 0:
-            error_details = stderr.decode().strip() if stderr else "No error details available"
-            stdout_details = stdout.decode().strip() if stdout else ""
-
-            error_msg = f"Error launching multipass instance (return code {p.returncode})"
-            if error_details:
-                error_msg += f"\nMultipass error: {error_details}"
-            if stdout_details:
-                error_msg += f"\nMultipass stdout: {stdout_details}"
+    if result.returncode != 0:
+        error_details = result.stderr.strip() or "No error details available"
+        stdout_details = result.stdout.strip()
 
-            raise RuntimeError(error_msg)
+        error_msg = f"Error launching multipass instance (return code {result.returncode})"
+        if error_details:
+            error_msg += f"\nMultipass error: {error_details}"
+        if stdout_details:
+            error_msg += f"\nMultipass stdout: {stdout_details}"
 
-    except subprocess.CalledProcessError as e:
-        raise RuntimeError(f"Error launching multipass instance: {e}")
+        raise RuntimeError(error_msg)
 
 
 async def create(ctx: typer.Context, cluster: Cluster) -> typer.Exit:
@@ -204,7 +200,7 @@ async def create(ctx: typer.Context, cluster: Cluster) -> typer.Exit:
     cloud_init_config, image_origin = _generate_cloud_init_configuration(vantage_cluster_ctx)
 
     try:
-        _launch_vm_instance(deployment.name, shared_dir, cloud_init_config, image_origin)
+        await _launch_vm_instance(deployment.name, shared_dir, cloud_init_config, image_origin)
     except Exception as e:
         deployment.status = "error"
         deployment.write()
@@ -297,12 +293,7 @@ async def _remove_deployment(deployment: Deployment) -> None:
         raise RuntimeError("Multipass not found in PATH")
     try:
         # Delete the instance with purge flag (-p) to completely remove it
-        result = subprocess.run(
-            ["multipass", "delete", instance_name, "-p"],
-            capture_output=True,
-            text=True,
-            timeout=60,
-        )
+        result = await run_command(["multipass", "delete", instance_name, "-p"], timeout=60)
 
         if result.returncode != 0:
             deployment.status = "error"
@@ -0,0 +1,146 @@
+# Copyright (C) 2025 Vantage Compute Corporation
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/>.
+"""Run cloud provisioning steps as a small dependency graph.
+
+Each step is a coroutine function that receives the results of the steps it
+depends on. Steps start as soon as their dependencies have finished, so
+independent API calls (e.g. creating a security group while a network comes
+up) overlap instead of running one after another. Scheduling is done by
+:class:`~vantage_cli.dependency_tracker.DependencyTracker`.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar
+
+from vantage_cli.dependency_tracker import DependencyTracker, Worker, WorkerState
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class ProvisioningStep:
+    """A named provisioning step and the steps it depends on."""
+
+    name: str
+    run: Callable[[Dict[str, Any]], Awaitable[Any]]
+    depends_on: List[str] = field(default_factory=list)
+
+
+@dataclass
+class ProvisioningReport:
+    """Results and wall-clock timings of a provisioning run."""
+
+    results: Dict[str, Any] = field(default_factory=dict)
+    started_at: Dict[str, float] = field(default_factory=dict)
+    durations: Dict[str, float] = field(default_factory=dict)
+    total_seconds: float = 0.0
+
+    def timing_lines(self) -> List[str]:
+        """Return one ``name: Xs (started at +Ys)`` line per step, in start order."""
+        return [
+            f"{name}: {self.durations[name]:.1f}s (started at +{self.started_at[name]:.1f}s)"
+            for name in sorted(self.durations, key=lambda n: self.started_at[n])
+        ]
+
+
+async def run_provisioning_steps(steps: List[ProvisioningStep]) -> ProvisioningReport:
+    """Run steps concurrently, each as soon as its dependencies have finished.
+
+    Args:
+        steps: Steps to run; dependencies must name other steps in the list
+
+    Returns:
+        Results and timings of every step
+
+    Raises:
+        ValueError: If a dependency is unknown or the steps form a cycle
+        Exception: The first exception raised by a step; steps still running are cancelled
+    """
+    by_name = {step.name: step for step in steps}
+    for step in steps:
+        for dependency in step.depends_on:
+            if dependency not in by_name:
+                raise ValueError(f"Step '{step.name}' depends on unknown step '{dependency}'")
+
+    report = ProvisioningReport()
+
+    def worker(step: ProvisioningStep) -> Worker:
+        async def run(worker_id: str) -> Any:
+            logger.debug(f"Starting provisioning step '{step.name}'")
+            return await step.run(report.results)
+
+        return Worker(step.name, run, depends_on=list(step.depends_on))
+
+    def record(finished: Worker) -> None:
+        # Dependents read their inputs from report.results
+        if finished.state == WorkerState.COMPLETE:
+            report.results[finished.id] = finished.result
+            logger.debug(f"Finished provisioning step '{finished.id}' in {finished.duration:.1f}s")
+
+    tracker = DependencyTracker([worker(step) for step in steps], on_update=record)
+    origin = time.monotonic()
+    try:
+        await tracker.execute(fail_fast=True)
+    finally:
+        report.total_seconds = time.monotonic() - origin
+        for name, finished in tracker.workers.items():
+            if finished.state == WorkerState.COMPLETE and finished.started_at is not None:
+                report.started_at[name] = finished.started_at - origin
+                report.durations[name] = finished.duration or 0.0
+
+    # Surface the step's own error
+    tracker.raise_first_failure()
+    return report
+
+
+async def poll_with_backoff(
+    check: Callable[[], Awaitable[Optional[T]]],
+    timeout: float,
+    initial_delay: float = 1.0,
+    max_delay: float = 10.0,
+    description: str = "resource",
+) -> T:
+    """Call ``check`` until it returns something other than None.
+
+    The delay between calls starts at ``initial_delay`` and doubles up to
+    ``max_delay``, so fast transitions are noticed quickly without hammering
+    the API during slow ones.
+
+    Args:
+        check: Coroutine function returning a value once the wait is over, else None
+        timeout: Seconds to wait in total
+        initial_delay: Delay before the second call
+        max_delay: Upper bound for the delay between calls
+        description: What is being waited for, used in the timeout message
+
+    Returns:
+        The first value returned by ``check`` that is not None
+
+    Raises:
+        TimeoutError: If ``check`` kept returning None for ``timeout`` seconds
+    """
+    deadline = time.monotonic() + timeout
+    delay = initial_delay
+    while True:
+        value = await check()
+        if value is not None:
+            return value
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError(f"Timed out after {timeout:.0f}s waiting for {description}")
+        await asyncio.sleep(min(delay, remaining))
+        delay = min(delay * 2, max_delay)
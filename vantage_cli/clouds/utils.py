@@ -11,23 +11,35 @@
 # this program. If not, see <https://www.gnu.org/licenses/>.
 """Utility functions for MicroK8s deployment."""
 
+import asyncio
 import importlib
 import importlib.util
+import json
 import logging
 import os
+import shutil
 import subprocess
 import sys
+import time
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 import typer
 from rich.console import Console
 from rich.table import Table
 
-from vantage_cli.constants import VANTAGE_CLI_DEV_APPS_DIR
+from vantage_cli.clouds.command_runner import run_command
+from vantage_cli.constants import (
+    PREREQUISITE_CACHE_TTL_SECONDS,
+    USER_PREREQUISITE_CACHE_FILE,
+    VANTAGE_CLI_DEV_APPS_DIR,
+)
 from vantage_cli.sdk.cluster.schema import Cluster
+from vantage_cli.state_files import atomic_write_text
+
+logger = logging.getLogger(__name__)
 
 
 class PrerequisiteStatus(Enum):
@@ -51,16 +63,25 @@ class PrerequisiteResult:
 
 @dataclass
 class PrerequisiteCheck:
-    """Definition of a prerequisite check."""
+    """Definition of a prerequisite check.
+
+    ``validate``, if given, receives the command's stdout and returns an
+    error message when the output shows the prerequisite is not met (e.g. an
+    addon listed as disabled), or None when it is.
+    """
 
     name: str
     command: List[str]
     version_command: Optional[List[str]] = None
     installation_hint: Optional[str] = None
     required: bool = True
+    validate: Optional[Callable[[str], Optional[str]]] = None
+
 
+Probe = Callable[[List[str], float], Awaitable[subprocess.CompletedProcess]]
 
-def check_prerequisites(
+
+async def check_prerequisites(
     checks: List[PrerequisiteCheck],
     console: Console,
     verbose: bool = False,
@@ -77,18 +98,35 @@ def check_prerequisites(
     Returns:
         Tuple of (all_requirements_met, list_of_results)
     """
-    results = []
-    all_required_met = True
-
     if verbose:
         console.print("[blue]ℹ[/blue] Checking prerequisites...")
 
-    for check in checks:
-        result = _check_single_prerequisite(check, verbose, console)
-        results.append(result)
+    # Checks run concurrently. Identical commands (e.g. one `microk8s status`
+    # shared by every addon check) are only run once per call.
+    probes: Dict[Tuple[str, ...], "asyncio.Task[subprocess.CompletedProcess]"] = {}
+
+    async def probe(command: List[str], timeout: float) -> subprocess.CompletedProcess:
+        key = tuple(command)
+        if key not in probes:
+            probes[key] = asyncio.ensure_future(run_command(command, timeout=timeout))
+        return await asyncio.shield(probes[key])
+
+    cache = _load_prerequisite_cache()
+    results = list(
+        await asyncio.gather(
+            *(
+                _check_single_prerequisite(check, verbose, console, probe, cache)
+                for check in checks
+            )
+        )
+    )
+    _save_prerequisite_cache(cache)
 
-        if check.required and result.status != PrerequisiteStatus.AVAILABLE:
-            all_required_met = False
+    all_required_met = all(
+        result.status == PrerequisiteStatus.AVAILABLE
+        for check, result in zip(checks, results)
+        if check.required
+    )
 
     if show_table:
         _display_prerequisite_table(results, console)
@@ -149,41 +187,125 @@ def _clean_error_message(error_message: str) -> str:
     return cleaned
 
 
-def _check_single_prerequisite(
-    check: PrerequisiteCheck, verbose: bool, console: Console
+def _load_prerequisite_cache() -> Dict[str, Dict[str, Any]]:
+    """Load unexpired cached prerequisite results."""
+    try:
+        entries = json.loads(USER_PREREQUISITE_CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(entries, dict):
+        return {}
+    now = time.time()
+    return {
+        key: entry
+        for key, entry in entries.items()
+        if isinstance(entry, dict)
+        and now - entry.get("checked_at", 0) < PREREQUISITE_CACHE_TTL_SECONDS
+    }
+
+
+def _save_prerequisite_cache(cache: Dict[str, Dict[str, Any]]) -> None:
+    """Persist cached prerequisite results, ignoring write errors."""
+    try:
+        USER_PREREQUISITE_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(USER_PREREQUISITE_CACHE_FILE, json.dumps(cache), durable=False)
+    except OSError as e:
+        logger.debug(f"Could not write prerequisite cache: {e}")
+
+
+def _prerequisite_cache_key(check: PrerequisiteCheck) -> Optional[str]:
+    """Key a check by its commands and its binary's path and mtime.
+
+    Returns None (don't cache) if the binary cannot be found.
+    """
+    binary = shutil.which(check.command[0])
+    if binary is None:
+        return None
+    try:
+        mtime_ns = os.stat(binary).st_mtime_ns
+    except OSError:
+        return None
+    version_command = " ".join(check.version_command or [])
+    return f"{check.name}|{' '.join(check.command)}|{version_command}|{binary}|{mtime_ns}"
+
+
+def _cached_prerequisite(
+    check: PrerequisiteCheck, cache_key: Optional[str], cache: Dict[str, Dict[str, Any]]
+) -> Optional[PrerequisiteResult]:
+    """Return the cached successful result for a check, if there is one."""
+    if cache_key is None or cache_key not in cache:
+        return None
+    return PrerequisiteResult(
+        name=check.name,
+        status=PrerequisiteStatus.AVAILABLE,
+        version=cache[cache_key].get("version"),
+        installation_hint=check.installation_hint,
+    )
+
+
+def _probe_failure(check: PrerequisiteCheck, result: subprocess.CompletedProcess) -> Optional[str]:
+    """Return why a check's command output means the prerequisite is not met, if it does."""
+    if result.returncode != 0:
+        return _clean_error_message(result.stderr)
+    if check.validate is not None:
+        return check.validate(result.stdout)
+    return None
+
+
+async def _probe_version(check: PrerequisiteCheck, probe: Probe) -> Optional[str]:
+    """Get the first line of the version command's output, if one is configured."""
+    if not check.version_command:
+        return None
+    try:
+        version_result = await probe(check.version_command, 5)
+    except Exception:
+        return None  # Version check is optional
+    if version_result.returncode != 0:
+        return None
+    return version_result.stdout.strip().split("\n")[0]
+
+
+async def _check_single_prerequisite(
+    check: PrerequisiteCheck,
+    verbose: bool,
+    console: Console,
+    probe: Probe,
+    cache: Dict[str, Dict[str, Any]],
 ) -> PrerequisiteResult:
-    """Check a single prerequisite."""
+    """Check a single prerequisite.
+
+    Only successful results are cached, so a missing tool or disabled addon
+    is probed again on the next attempt.
+    """
+    cache_key = _prerequisite_cache_key(check)
+    if (cached := _cached_prerequisite(check, cache_key, cache)) is not None:
+        if verbose:
+            version_str = f" (version: {cached.version})" if cached.version else ""
+            console.print(f"[green]✓[/green] {check.name}: Available{version_str} (cached)")
+        return cached
+
     try:
         # Check if tool is available
-        result = subprocess.run(check.command, capture_output=True, text=True, timeout=10)
+        result = await probe(check.command, 10)
 
-        if result.returncode != 0:
-            cleaned_error = _clean_error_message(result.stderr)
+        if (failure := _probe_failure(check, result)) is not None:
             if verbose:
-                console.print(f"[yellow]⚠[/yellow] {check.name}: Command failed - {cleaned_error}")
+                console.print(f"[yellow]⚠[/yellow] {check.name}: Command failed - {failure}")
             return PrerequisiteResult(
                 name=check.name,
                 status=PrerequisiteStatus.MISSING,
-                error_message=cleaned_error,
+                error_message=failure,
                 installation_hint=check.installation_hint,
             )
 
-        # Get version if version command is provided
-        version = None
-        if check.version_command:
-            try:
-                version_result = subprocess.run(
-                    check.version_command, capture_output=True, text=True, timeout=5
-                )
-                if version_result.returncode == 0:
-                    version = version_result.stdout.strip().split("\n")[0]  # Take first line
-            except Exception:
-                pass  # Version check is optional
-
+        version = await _probe_version(check, probe)
         if verbose:
             version_str = f" (version: {version})" if version else ""
             console.print(f"[green]✓[/green] {check.name}: Available{version_str}")
 
+        if cache_key is not None:
+            cache[cache_key] = {"version": version, "checked_at": time.time()}
+
         return PrerequisiteResult(
             name=check.name,
             status=PrerequisiteStatus.AVAILABLE,
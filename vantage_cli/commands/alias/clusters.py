@@ -11,15 +11,27 @@
 # this program. If not, see <https://www.gnu.org/licenses/>.
 """Alias command for clusters -> cluster list."""
 
+from typing import Optional
+
 import typer
+from typing_extensions import Annotated
 
 from vantage_cli.commands.cluster.list import list_clusters
+from vantage_cli.constants import GRAPHQL_DEFAULT_PAGE_SIZE
 from vantage_cli.exceptions import handle_abort
 
 
 @handle_abort
 async def clusters_command(
     ctx: typer.Context,
+    page_size: Annotated[
+        int,
+        typer.Option("--page-size", min=1, help="Number of clusters fetched per API request"),
+    ] = GRAPHQL_DEFAULT_PAGE_SIZE,
+    max_items: Annotated[
+        Optional[int],
+        typer.Option("--max-items", min=1, help="Maximum number of clusters to return"),
+    ] = None,
 ):
     """List all clusters (alias for 'vantage cluster list')."""
-    await list_clusters(ctx)
+    await list_clusters(ctx, page_size=page_size, max_items=max_items)
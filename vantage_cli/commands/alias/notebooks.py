@@ -17,6 +17,7 @@ import typer
 from typing_extensions import Annotated
 
 from vantage_cli.commands.notebook.list import list_notebooks
+from vantage_cli.constants import GRAPHQL_DEFAULT_PAGE_SIZE
 from vantage_cli.exceptions import handle_abort
 
 
@@ -32,9 +33,21 @@ async def notebooks_command(
     kernel: Annotated[
         Optional[str], typer.Option("--kernel", "-k", help="Filter by kernel type")
     ] = None,
-    limit: Annotated[
-        Optional[int], typer.Option("--limit", "-l", help="Maximum number of notebooks to return")
+    max_items: Annotated[
+        Optional[int],
+        typer.Option("--max-items", "--limit", "-l", help="Maximum number of notebooks to return"),
     ] = None,
+    page_size: Annotated[
+        int,
+        typer.Option("--page-size", min=1, help="Number of notebooks fetched per API request"),
+    ] = GRAPHQL_DEFAULT_PAGE_SIZE,
 ):
     """List all notebooks (alias for 'vantage notebook list')."""
-    await list_notebooks(ctx, cluster=cluster, status=status, kernel=kernel, limit=limit)
+    await list_notebooks(
+        ctx,
+        cluster=cluster,
+        status=status,
+        kernel=kernel,
+        max_items=max_items,
+        page_size=page_size,
+    )
@@ -19,7 +19,6 @@ from .list import list_apps
 
 app_app = AsyncTyper(
     name="apps",
-    help="Manage applications",
     no_args_is_help=True,
 )
 
@@ -11,7 +11,13 @@
 # this program. If not, see <https://www.gnu.org/licenses/>.
 """Clean up orphaned deployments whose clusters no longer exist."""
 
+import asyncio
+import time
+from typing import Optional
+
 import typer
+from rich.live import Live
+from rich.table import Table
 from typing_extensions import Annotated
 
 from vantage_cli.config import attach_settings
@@ -20,29 +26,32 @@ from vantage_cli.sdk.cluster.crud import cluster_sdk
 from vantage_cli.sdk.deployment.crud import deployment_sdk
 from vantage_cli.sdk.deployment.schema import Deployment
 
+# Default number of deployments torn down at the same time
+DEFAULT_CLEANUP_PARALLELISM = 4
+
+# Default per-deployment cleanup timeout in seconds
+DEFAULT_CLEANUP_TIMEOUT = 30 * 60
+
+_STATUS_STYLES = {"pending": "dim", "running": "yellow", "failed": "red", "timed out": "red"}
+
 
 async def _find_orphaned_deployments(
     ctx: typer.Context, all_deployments: list[Deployment]
 ) -> list[Deployment]:
     """Find deployments whose clusters no longer exist."""
-    orphaned = []
-    cluster_cache = {}
-
     json_output = getattr(ctx.obj, "json_output", False)
     if not json_output:
         ctx.obj.console.print(f"[blue]Checking {len(all_deployments)} deployment(s)...[/blue]")
 
-    for deployment in all_deployments:
-        cluster_name = deployment.cluster.name
-
-        if cluster_name not in cluster_cache:
-            cluster = await cluster_sdk.get_cluster_by_name(ctx, cluster_name)
-            cluster_cache[cluster_name] = cluster
-
-        if cluster_cache[cluster_name] is None:
-            orphaned.append(deployment)
+    # Look up each distinct cluster concurrently; the SDK batches these
+    # lookups into a single GraphQL request
+    cluster_names = list(dict.fromkeys(d.cluster.name for d in all_deployments))
+    clusters = await asyncio.gather(
+        *(cluster_sdk.get_cluster(ctx, cluster_name) for cluster_name in cluster_names)
+    )
+    cluster_cache = dict(zip(cluster_names, clusters))
 
-    return orphaned
+    return [d for d in all_deployments if cluster_cache[d.cluster.name] is None]
 
 
 def _prepare_orphaned_data(orphaned: list[Deployment]) -> list[dict]:
@@ -84,48 +93,130 @@ def _confirm_cleanup(ctx: typer.Context, orphaned_data: list[dict]) -> bool:
 
 
 async def _cleanup_single_deployment(
-    ctx: typer.Context, deployment: Deployment, available_apps: dict
-) -> dict[str, str | bool]:
-    """Clean up a single orphaned deployment."""
-    result: dict[str, str | bool] = {
+    ctx: typer.Context,
+    deployment: Deployment,
+    available_apps: dict,
+    timeout: Optional[float] = None,
+) -> dict[str, str | bool | float]:
+    """Clean up a single orphaned deployment, giving up after ``timeout`` seconds."""
+    result: dict[str, str | bool | float] = {
         "deployment_id": deployment.id,
         "deployment_name": deployment.name,
         "cluster_name": deployment.cluster.name,
         "app_name": deployment.app_name,
     }
+    start_time = time.monotonic()
 
     try:
-        app_name = deployment.app_name
-
-        if app_name in available_apps:
-            app = available_apps[app_name]
-
-            if app.module and hasattr(app.module, "remove"):
-                remove_function = getattr(app.module, "remove")
-                await remove_function(ctx, deployment)
-                result["status"] = "cleaned"
+        async with asyncio.timeout(timeout):
+            app_name = deployment.app_name
+
+            if app_name in available_apps:
+                app = available_apps[app_name]
+
+                if app.module and hasattr(app.module, "remove"):
+                    remove_function = getattr(app.module, "remove")
+                    await remove_function(ctx, deployment)
+                    result["status"] = "cleaned"
+                else:
+                    await deployment_sdk.delete(deployment.id)
+                    result["status"] = "deleted (no cleanup function)"
             else:
                 await deployment_sdk.delete(deployment.id)
-                result["status"] = "deleted (no cleanup function)"
-        else:
-            await deployment_sdk.delete(deployment.id)
-            result["status"] = "deleted (app not found)"
+                result["status"] = "deleted (app not found)"
 
         result["success"] = True
 
+    except TimeoutError:
+        result["success"] = False
+        result["status"] = "timed out"
+        result["error"] = f"Cleanup did not finish within {timeout:g}s"
+
     except Exception as e:
         result["success"] = False
         result["status"] = "failed"
         result["error"] = str(e)
 
+    result["duration_seconds"] = round(time.monotonic() - start_time, 1)
     return result
 
 
+def _build_progress_table(orphaned: list[Deployment], statuses: dict[str, str]) -> Table:
+    """Build the live progress table shown while deployments are cleaned up."""
+    table = Table(title="Cleaning Up Orphaned Deployments")
+    table.add_column("Deployment")
+    table.add_column("App")
+    table.add_column("Cluster")
+    table.add_column("Status")
+
+    for deployment in orphaned:
+        status = statuses[deployment.id]
+        style = _STATUS_STYLES.get(status, "green")
+        table.add_row(
+            deployment.name,
+            deployment.app_name,
+            deployment.cluster.name,
+            f"[{style}]{status}[/{style}]",
+        )
+    return table
+
+
+async def _cleanup_deployments(
+    ctx: typer.Context,
+    orphaned: list[Deployment],
+    available_apps: dict,
+    parallel: int,
+    timeout: Optional[float],
+) -> list[dict]:
+    """Clean up deployments with at most ``parallel`` teardowns running at once.
+
+    Results are returned in the order of ``orphaned``. A live progress table
+    is shown unless JSON output was requested.
+    """
+    json_output = getattr(ctx.obj, "json_output", False)
+    semaphore = asyncio.Semaphore(parallel)
+    statuses = {deployment.id: "pending" for deployment in orphaned}
+    results: list[dict] = [{} for _ in orphaned]
+    live: Optional[Live] = None
+
+    def set_status(deployment: Deployment, status: str) -> None:
+        statuses[deployment.id] = status
+        if live is not None:
+            live.update(_build_progress_table(orphaned, statuses))
+
+    async def run(index: int, deployment: Deployment) -> None:
+        async with semaphore:
+            set_status(deployment, "running")
+            result = await _cleanup_single_deployment(ctx, deployment, available_apps, timeout)
+            results[index] = result
+            set_status(deployment, str(result["status"]))
+
+    if not json_output:
+        live = Live(
+            _build_progress_table(orphaned, statuses),
+            console=ctx.obj.console,
+            refresh_per_second=4,
+        )
+        live.start()
+
+    try:
+        async with asyncio.TaskGroup() as task_group:
+            for index, deployment in enumerate(orphaned):
+                task_group.create_task(run(index, deployment))
+    finally:
+        if live is not None:
+            live.stop()
+
+    return results
+
+
 def _display_cleanup_results(ctx: typer.Context, cleanup_results: list[dict]) -> None:
     """Display cleanup results to the user."""
     json_output = getattr(ctx.obj, "json_output", False)
     success_count = sum(1 for r in cleanup_results if r["success"])
-    failed_count = len(cleanup_results) - success_count
+    timed_out_count = sum(1 for r in cleanup_results if r["status"] == "timed out")
+    failed_count = len(cleanup_results) - success_count - timed_out_count
+    slowest = max(cleanup_results, key=lambda r: r.get("duration_seconds", 0), default=None)
 
     if json_output:
         ctx.obj.formatter.render_list(
@@ -137,6 +228,14 @@ def _display_cleanup_results(ctx: typer.Context, cleanup_results: list[dict]) ->
         ctx.obj.console.print(f"  [green]• Cleaned: {success_count}[/green]")
         if failed_count > 0:
             ctx.obj.console.print(f"  [red]• Failed: {failed_count}[/red]")
+        if timed_out_count > 0:
+            ctx.obj.console.print(f"  [red]• Timed out: {timed_out_count}[/red]")
+        if slowest is not None:
+            ctx.obj.console.print(
+                f"  [dim]• Slowest: {slowest['deployment_name']} "
+                f"({slowest.get('duration_seconds', 0)}s)[/dim]"
+            )
+        if failed_count + timed_out_count > 0:
             ctx.obj.console.print("\n[yellow]Failed deployments:[/yellow]")
             for result in cleanup_results:
                 if not result["success"]:
@@ -154,6 +253,16 @@ async def cleanup_orphans(
         typer.Option("--dry-run", help="Show what would be cleaned up without actually cleaning"),
     ] = False,
     force: Annotated[bool, typer.Option("--force", "-f", help="Skip confirmation prompt")] = False,
+    parallel: Annotated[
+        int,
+        typer.Option("--parallel", min=1, help="Number of deployments cleaned up at once"),
+    ] = DEFAULT_CLEANUP_PARALLELISM,
+    timeout: Annotated[
+        float,
+        typer.Option(
+            "--timeout", min=0, help="Per-deployment cleanup timeout in seconds (0 disables)"
+        ),
+    ] = DEFAULT_CLEANUP_TIMEOUT,
 ) -> None:
     """Find and clean up deployments whose clusters no longer exist."""
     json_output = getattr(ctx.obj, "json_output", False)
@@ -201,11 +310,9 @@ async def cleanup_orphans(
         from vantage_cli.sdk.deployment_app import deployment_app_sdk
 
         available_apps = {app.name: app for app in deployment_app_sdk.list()}
-        cleanup_results = []
-
-        for deployment in orphaned:
-            result = await _cleanup_single_deployment(ctx, deployment, available_apps)
-            cleanup_results.append(result)
+        cleanup_results = await _cleanup_deployments(
+            ctx, orphaned, available_apps, parallel=parallel, timeout=timeout or None
+        )
 
         _display_cleanup_results(ctx, cleanup_results)
 
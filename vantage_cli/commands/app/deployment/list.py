@@ -36,7 +36,7 @@ async def list_deployments(
         typer.Option("--status", help="Filter deployments by status (e.g., active, inactive)"),
     ] = None,
 ) -> None:
-    """List all active deployments from ~/.vantage-cli/deployments.yaml."""
+    """List all active deployments from the local deployment store."""
     try:
         # Use the SDK to get deployments
         deployments = [
@@ -22,7 +22,6 @@ from .list import list_command
 
 cloud_app = AsyncTyper(
     name="cloud",
-    help="Manage cloud provider configurations.",
     no_args_is_help=True,
 )
 
@@ -22,7 +22,6 @@ from .list import list_clusters
 # Create the cluster command group
 cluster_app = AsyncTyper(
     name="cluster",
-    help="Manage Vantage compute clusters for high-performance computing workloads.",
     invoke_without_command=True,
     no_args_is_help=True,
 )
@@ -165,7 +165,6 @@ async def deploy_app_to_cluster(ctx: typer.Context, cluster: Cluster, app_name:
     """Deploy an application to the newly created cluster."""
     try:
         # Import SDK here to avoid module-level initialization
-        from vantage_cli.sdk.cloud_credential.crud import cloud_credential_sdk
         from vantage_cli.sdk.deployment_app import deployment_app_sdk
 
         available_apps_list = deployment_app_sdk.list()
@@ -187,11 +186,11 @@ async def deploy_app_to_cluster(ctx: typer.Context, cluster: Cluster, app_name:
         if app.module and hasattr(app.module, "create"):
             # Initialize cloud-specific SDK if needed
             if app.cloud == "cudo-compute":
-                from cudo_compute_sdk import CudoComputeSDK
+                from vantage_cli.clouds.cudo_compute.sdk_pool import cudo_sdk_pool
 
-                # Get default credential for Cudo Compute
-                cudo_credential = cloud_credential_sdk.get_default(cloud_name="cudo-compute")
-                if cudo_credential is None:
+                # Attach the shared SDK client for the default credential
+                cudo_sdk = cudo_sdk_pool.get_default()
+                if cudo_sdk is None:
                     logger.error(
                         "[bold red]✗ No default credential found for 'cudo-compute'[/bold red]"
                     )
@@ -199,11 +198,7 @@ async def deploy_app_to_cluster(ctx: typer.Context, cluster: Cluster, app_name:
                         "[dim]Run: vantage cloud credential create --cloud cudo-compute[/dim]"
                     )
                     return
-
-                # Initialize SDK and attach to context
-                ctx.obj.cudo_sdk = CudoComputeSDK(
-                    api_key=cudo_credential.credentials_data["api_key"]
-                )
+                ctx.obj.cudo_sdk = cudo_sdk
 
             # Function-based app
             create_function = getattr(app.module, "create")
@@ -11,9 +11,13 @@
 # this program. If not, see <https://www.gnu.org/licenses/>.
 """List clusters command."""
 
+from typing import Optional
+
 import typer
+from typing_extensions import Annotated
 
 from vantage_cli.config import attach_settings
+from vantage_cli.constants import GRAPHQL_DEFAULT_PAGE_SIZE
 from vantage_cli.exceptions import Abort, handle_abort
 from vantage_cli.sdk.cluster.crud import cluster_sdk
 
@@ -22,23 +26,25 @@ from vantage_cli.sdk.cluster.crud import cluster_sdk
 @attach_settings
 async def list_clusters(
     ctx: typer.Context,
+    page_size: Annotated[
+        int,
+        typer.Option("--page-size", min=1, help="Number of clusters fetched per API request"),
+    ] = GRAPHQL_DEFAULT_PAGE_SIZE,
+    max_items: Annotated[
+        Optional[int],
+        typer.Option("--max-items", min=1, help="Maximum number of clusters to return"),
+    ] = None,
 ):
     """List all Vantage clusters."""
     # Use UniversalOutputFormatter for consistent output
 
     try:
-        # Use the SDK to get clusters
-        clusters = await cluster_sdk.list_clusters(ctx)
-
-        if not clusters:
-            ctx.obj.formatter.render_list(
-                data=[], resource_name="Clusters", empty_message="No clusters found."
-            )
-            return
-
-        # Convert Cluster objects to dict format for the formatter
+        # Convert Cluster objects to dict format for the formatter as each page
+        # arrives; the SDK prefetches the next page meanwhile
         clusters_data = []
-        for cluster in clusters:
+        async for cluster in cluster_sdk.iter_clusters(
+            ctx, page_size=page_size, max_items=max_items
+        ):
             # Access Cluster attributes directly
             description = cluster.description
             # Truncate description for list view
@@ -14,14 +14,15 @@
 from vantage_cli import AsyncTyper
 
 from .clear import clear_config
+from .schema import schema_app
 
 # Create the config app
 config_app = AsyncTyper(
     name="config",
-    help="Manage Vantage CLI configuration and settings.",
     invoke_without_command=True,
     no_args_is_help=True,
 )
 
 # Register subcommands
 config_app.command("clear")(clear_config)
+config_app.add_typer(schema_app)
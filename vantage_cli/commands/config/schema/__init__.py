@@ -0,0 +1,25 @@
+# Copyright (C) 2025 Vantage Compute Corporation
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/>.
+"""GraphQL schema cache commands for Vantage CLI."""
+
+from vantage_cli import AsyncTyper
+
+from .refresh import refresh_schema
+
+schema_app = AsyncTyper(
+    name="schema",
+    help="Manage the locally cached Vantage GraphQL schemas.",
+    no_args_is_help=True,
+)
+
+# Register schema commands
+schema_app.command("refresh")(refresh_schema)
@@ -0,0 +1,56 @@
+# Copyright (C) 2025 Vantage Compute Corporation
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/>.
+"""Refresh the cached GraphQL schemas."""
+
+import typer
+
+from vantage_cli.config import attach_settings
+from vantage_cli.exceptions import handle_abort
+
+# GraphQL endpoints whose introspection results are cached
+GRAPHQL_ENDPOINTS = ["/cluster/graphql", "/sos/graphql"]
+
+
+@handle_abort
+@attach_settings
+async def refresh_schema(ctx: typer.Context) -> None:
+    """Re-introspect the Vantage GraphQL APIs and update the local schema cache.
+
+    Cached schemas are refreshed automatically once they are older than a day
+    or were written by a different CLI version; use this command to pick up
+    server-side schema changes immediately.
+
+    Examples:
+        $ vantage config schema refresh
+    """
+    from vantage_cli.gql_client import VantageGQLClient
+    from vantage_cli.gql_schema_cache import schema_cache_path
+
+    profile = getattr(ctx.obj, "profile", "default")
+
+    results = []
+    for base_path in GRAPHQL_ENDPOINTS:
+        client = VantageGQLClient(ctx.obj.settings, profile, base_path=base_path).create()
+        schema = await client.refresh_schema()
+        results.append(
+            {
+                "endpoint": client.config.url,
+                "types": len(schema.type_map),
+                "cache_file": str(schema_cache_path(client.config.url)),
+            }
+        )
+
+    ctx.obj.formatter.render_list(
+        data=results,
+        resource_name="GraphQL Schemas",
+        empty_message="No GraphQL schemas were refreshed.",
+    )
@@ -23,7 +23,6 @@ from .template.list import list_job_templates
 # Create the job command group
 job_app = AsyncTyper(
     name="job",
-    help="Manage computational jobs, scripts, submissions, and job templates for HPC workloads.",
     invoke_without_command=True,
     no_args_is_help=True,
 )
@@ -29,7 +29,6 @@ from .server.list import list_license_servers
 # Create the license command group
 license_app = AsyncTyper(
     name="license",
-    help="Manage software licenses, license servers, and licensing configurations.",
     invoke_without_command=True,
     no_args_is_help=True,
 )
@@ -24,7 +24,6 @@ from .update import update_network
 # Create the network command group
 network_app = AsyncTyper(
     name="network",
-    help="Manage virtual networks, subnets, and network configurations for cloud infrastructure.",
     invoke_without_command=True,
     no_args_is_help=True,
 )
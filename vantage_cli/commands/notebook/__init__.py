@@ -22,7 +22,6 @@ from .update import update_notebook
 # Create the notebook command group
 notebook_app = AsyncTyper(
     name="notebook",
-    help="Manage Jupyter notebooks and computational notebooks for data science and research.",
     invoke_without_command=True,
     no_args_is_help=True,
 )
@@ -18,6 +18,7 @@ import typer
 from typing_extensions import Annotated
 
 from vantage_cli.config import attach_settings
+from vantage_cli.constants import GRAPHQL_DEFAULT_PAGE_SIZE
 from vantage_cli.exceptions import Abort, handle_abort
 from vantage_cli.sdk.notebook.crud import notebook_sdk
 
@@ -37,9 +38,14 @@ async def list_notebooks(
     kernel: Annotated[
         Optional[str], typer.Option("--kernel", "-k", help="Filter by kernel type")
     ] = None,
-    limit: Annotated[
-        Optional[int], typer.Option("--limit", "-l", help="Maximum number of notebooks to return")
+    max_items: Annotated[
+        Optional[int],
+        typer.Option("--max-items", "--limit", "-l", help="Maximum number of notebooks to return"),
     ] = None,
+    page_size: Annotated[
+        int,
+        typer.Option("--page-size", min=1, help="Number of notebooks fetched per API request"),
+    ] = GRAPHQL_DEFAULT_PAGE_SIZE,
 ):
     """List notebook servers."""
     # Use UniversalOutputFormatter for consistent output
@@ -47,7 +53,9 @@ async def list_notebooks(
     try:
         # Use the SDK to get notebooks
         logger.debug("Using SDK to list notebooks")
-        notebooks = await notebook_sdk.list_notebooks(ctx, cluster=cluster, limit=limit)
+        notebooks = await notebook_sdk.list_notebooks(
+            ctx, cluster=cluster, limit=max_items, page_size=page_size
+        )
 
         if not notebooks:
             ctx.obj.formatter.render_list(
@@ -18,7 +18,6 @@ from .crud import create_profile, delete_profile, get_profile, list_profiles, us
 # Create the profile app
 profile_app = AsyncTyper(
     name="profile",
-    help="Manage Vantage CLI profiles to work with different environments and configurations.",
     invoke_without_command=True,
     no_args_is_help=True,
 )
@@ -24,7 +24,6 @@ from .update import update_storage
 # Create the storage command group
 storage_app = AsyncTyper(
     name="storage",
-    help="Manage storage volumes, disks, and storage configurations for cloud infrastructure.",
     invoke_without_command=True,
     no_args_is_help=True,
 )
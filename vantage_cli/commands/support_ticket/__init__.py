@@ -19,7 +19,7 @@ from .get import get_support_ticket
 from .list import list_support_tickets
 from .update import update_support_ticket
 
-support_ticket_app = AsyncTyper(name="support-ticket", help="Manage support tickets")
+support_ticket_app = AsyncTyper(name="support-ticket")
 
 support_ticket_app.command("create", help="Create a new support ticket")(create_support_ticket)
 support_ticket_app.command("delete", help="Delete a support ticket")(delete_support_ticket)
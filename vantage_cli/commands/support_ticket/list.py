@@ -18,6 +18,7 @@ import typer
 from typing_extensions import Annotated
 
 from vantage_cli.config import attach_graphql_client, attach_settings
+from vantage_cli.constants import GRAPHQL_DEFAULT_PAGE_SIZE
 from vantage_cli.exceptions import Abort, handle_abort
 from vantage_cli.sdk.support_ticket.crud import support_ticket_sdk
 from vantage_cli.sdk.support_ticket.schema import SeverityLevel, TicketStatus
@@ -38,9 +39,14 @@ async def list_support_tickets(
         Optional[str],
         typer.Option("--priority", help="Filter by priority (LOW, MEDIUM, HIGH, CRITICAL)"),
     ] = None,
-    limit: Annotated[
-        Optional[int], typer.Option("--limit", "-l", help="Maximum number of tickets to return")
+    max_items: Annotated[
+        Optional[int],
+        typer.Option("--max-items", "--limit", "-l", help="Maximum number of tickets to return"),
     ] = None,
+    page_size: Annotated[
+        int,
+        typer.Option("--page-size", min=1, help="Number of tickets fetched per API request"),
+    ] = GRAPHQL_DEFAULT_PAGE_SIZE,
 ):
     """List all support tickets."""
     # Use UniversalOutputFormatter for consistent output
@@ -66,7 +72,7 @@ async def list_support_tickets(
         # Use the SDK to get support tickets
         logger.debug("Using SDK to list support tickets")
         tickets = await support_ticket_sdk.list_tickets(
-            ctx, status=status, priority=priority, limit=limit
+            ctx, status=status, priority=priority, limit=max_items, page_size=page_size
         )
 
         if not tickets:
@@ -27,6 +27,7 @@ from .constants import (
     VANTAGE_CLI_ACTIVE_PROFILE,
     VANTAGE_CLI_LOCAL_USER_BASE_DIR,
 )
+from .state_files import atomic_write_text, state_file_lock
 
 # Type variables for generic decorators
 P = ParamSpec("P")
@@ -172,7 +173,7 @@ def attach_graphql_client(
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
         # Import here to avoid circular dependency
-        from .gql_client import VantageGQLClient
+        from .gql_client import graphql_client_pool
 
         if inspect.iscoroutinefunction(func):
 
@@ -188,11 +189,11 @@ def attach_graphql_client(
                 # Get profile from context or use default
                 profile = getattr(ctx.obj, "profile", "default")
 
-                # Create and attach GraphQL client
-                logger.debug(f"Creating GraphQL client for {base_path}")
-                ctx.obj.graphql_client = VantageGQLClient(
+                # Attach the shared (pooled) GraphQL client
+                logger.debug(f"Attaching GraphQL client for {base_path}")
+                ctx.obj.graphql_client = graphql_client_pool.get(
                     ctx.obj.settings, profile, base_path=base_path
-                ).create()
+                )
 
                 return await func(ctx, *args, **kwargs)
 
@@ -211,11 +212,11 @@ def attach_graphql_client(
                 # Get profile from context or use default
                 profile = getattr(ctx.obj, "profile", "default")
 
-                # Create and attach GraphQL client
-                logger.debug(f"Creating GraphQL client for {base_path}")
-                ctx.obj.graphql_client = VantageGQLClient(
+                # Attach the shared (pooled) GraphQL client
+                logger.debug(f"Attaching GraphQL client for {base_path}")
+                ctx.obj.graphql_client = graphql_client_pool.get(
                     ctx.obj.settings, profile, base_path=base_path
-                ).create()
+                )
 
                 return func(ctx, *args, **kwargs)
 
@@ -227,13 +228,15 @@ def attach_graphql_client(
 def dump_settings(profile: str, settings: Settings) -> None:
     """Save settings to the user configuration file."""
     logger.debug(f"Saving settings to {USER_CONFIG_FILE}")
-    if USER_CONFIG_FILE.exists():
-        settings_all_profiles = json.loads(USER_CONFIG_FILE.read_text())
-    else:
-        settings_all_profiles = {}
+    # Hold the lock across the read so concurrent profile updates are not lost
+    with state_file_lock(USER_CONFIG_FILE):
+        if USER_CONFIG_FILE.exists():
+            settings_all_profiles = json.loads(USER_CONFIG_FILE.read_text())
+        else:
+            settings_all_profiles = {}
 
-    settings_all_profiles[f"{profile}"] = settings.model_dump()
-    USER_CONFIG_FILE.write_text(json.dumps(settings_all_profiles))
+        settings_all_profiles[f"{profile}"] = settings.model_dump()
+        atomic_write_text(USER_CONFIG_FILE, json.dumps(settings_all_profiles))
 
 
 def clear_settings() -> None:
@@ -271,5 +274,4 @@ def get_active_profile() -> str:
 
 def set_active_profile(profile_name: str) -> None:
     """Set the active profile."""
-    VANTAGE_CLI_ACTIVE_PROFILE.parent.mkdir(parents=True, exist_ok=True)
-    VANTAGE_CLI_ACTIVE_PROFILE.write_text(profile_name)
+    atomic_write_text(VANTAGE_CLI_ACTIVE_PROFILE, profile_name)
@@ -36,11 +36,40 @@ VANTAGE_CLI_CREDENTIALS_FILE: Path = VANTAGE_CLI_LOCAL_USER_BASE_DIR / "credenti
 VANTAGE_CLI_DEBUG_LOG_PATH: Path = VANTAGE_CLI_LOCAL_USER_BASE_DIR / "debug.log"
 VANTAGE_CLI_DEPLOYMENTS_YAML_PATH: Path = VANTAGE_CLI_LOCAL_USER_BASE_DIR / "deployments.yaml"
 VANTAGE_CLI_DEPLOYMENTS_CACHE_PATH: Path = VANTAGE_CLI_LOCAL_USER_BASE_DIR / "deployments"
+VANTAGE_CLI_DEPLOYMENTS_DB_PATH: Path = VANTAGE_CLI_LOCAL_USER_BASE_DIR / "deployments.db"
 VANTAGE_CLI_ACTIVE_PROFILE: Path = VANTAGE_CLI_LOCAL_USER_BASE_DIR / "active_profile"
 
 USER_CONFIG_FILE: Path = VANTAGE_CLI_LOCAL_USER_BASE_DIR / "config.json"
 
 USER_TOKEN_CACHE_DIR: Path = VANTAGE_CLI_LOCAL_USER_BASE_DIR / "token_cache"
+USER_SCHEMA_CACHE_DIR: Path = VANTAGE_CLI_LOCAL_USER_BASE_DIR / "schema_cache"
+USER_CUDO_CATALOG_CACHE_DIR: Path = VANTAGE_CLI_LOCAL_USER_BASE_DIR / "cudo_catalog_cache"
+USER_PREREQUISITE_CACHE_FILE: Path = VANTAGE_CLI_LOCAL_USER_BASE_DIR / "prerequisite_cache.json"
+
+# GraphQL schema cache entries older than this are re-introspected
+GRAPHQL_SCHEMA_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+# Cudo Compute catalog entries older than this are fetched again. Machine types
+# carry free capacity and pricing, so they expire much sooner than data centers
+# and public images.
+CUDO_CATALOG_CACHE_TTL_SECONDS = 24 * 60 * 60
+CUDO_MACHINE_TYPE_CACHE_TTL_SECONDS = 15 * 60
+
+# Successful prerequisite checks are trusted for this long, as long as the
+# tool's binary has not changed
+PREREQUISITE_CACHE_TTL_SECONDS = 5 * 60
+
+# Number of edges requested per page when following GraphQL connection cursors
+GRAPHQL_DEFAULT_PAGE_SIZE = 100
+
+# Connection limits for the shared REST/JupyterHub HTTP clients
+HTTP_POOL_MAX_CONNECTIONS = 100
+HTTP_POOL_MAX_KEEPALIVE_CONNECTIONS = 20
+HTTP_POOL_KEEPALIVE_EXPIRY_SECONDS = 30.0
+HTTP_DEFAULT_TIMEOUT_SECONDS = 30.0
+
+# Seconds to wait for another vantage process holding a state file lock
+STATE_FILE_LOCK_TIMEOUT_SECONDS = 30.0
 
 # Common deployment constants
 DEFAULT_CLUSTER_NAME = "vantage-cluster"
@@ -65,23 +65,28 @@ run_dashboard(config=config, services=services, ctx=ctx)
 """
 
 import asyncio
+import functools
+import inspect
+import logging
 import signal
 import sys
 import time
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import typer
-from textual import work
+from textual import events, work
 from textual.app import App, ComposeResult
 from textual.containers import Horizontal, Vertical
+from textual.timer import Timer
 from textual.widgets import (
     Button,
     DataTable,
     Header,
     ProgressBar,
     RichLog,
+    Select,
     Static,
     TabbedContent,
     TabPane,
@@ -90,6 +95,7 @@ from textual.widgets import (
 from vantage_cli.auth import extract_persona, is_token_expired
 from vantage_cli.cache import clear_token_cache, load_tokens_from_cache
 from vantage_cli.config import Settings
+from vantage_cli.constants import VANTAGE_CLI_DEBUG_LOG_PATH
 from vantage_cli.schemas import CliContext
 from vantage_cli.sdk.cluster.schema import Cluster
 from vantage_cli.sdk.deployment.schema import Deployment
@@ -108,16 +114,24 @@ from .credential_management_tab_pane import (
 )
 from .dependency_tracker import DependencyTracker, Worker, WorkerState
 from .deployment_management_tab_pane import DeploymentManagementTabPane
+from .log_tail import DebugLogTail, watch_log_file
 from .login_modal import LoginModal
 from .profile_management_tab_pane import (
     CreateProfileModal,
     ProfileManagementTabPane,
     RemoveProfileModal,
 )
+from .refresh import AdaptiveRefresh
 from .support_ticket_tab_pane import (
     SupportTicketManagementTabPane,
 )
 
+# Seconds between debug log checks when inotify is not available
+DEBUG_LOG_POLL_SECONDS = 2.0
+
+# Levels offered by the full logs tab's filter
+DEBUG_LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+
 
 @dataclass
 class DashboardConfig:
@@ -134,6 +148,8 @@ class DashboardConfig:
         enable_controls: Enable Create/Status/Remove control buttons
         enable_clusters: Enable cluster management tab (uses cluster SDK)
         refresh_interval: How often to refresh stats (in seconds)
+        debug_log_lines: Number of debug log lines kept in the full logs tab
+        debug_log_level: Minimum level of debug log lines shown in the full logs tab
 
     Example:
         ```python
@@ -153,6 +169,8 @@ class DashboardConfig:
     enable_controls: bool = True
     enable_clusters: bool = True
     refresh_interval: float = 0.5
+    debug_log_lines: int = 500
+    debug_log_level: str = "DEBUG"
 
 
 @dataclass
@@ -588,10 +606,22 @@ class DashboardApp(App):
 
         # Create workers from services
         self.worker_list = self._create_workers_from_services()
-        self.tracker = DependencyTracker(self.worker_list)
+        self._worker_log_state: Dict[str, Tuple[WorkerState, Optional[str]]] = {}
+        self.tracker = DependencyTracker(self.worker_list, on_update=self._on_worker_update)
 
         # Runtime state
         self.start_time = time.time()
+        self.refresh_policy = AdaptiveRefresh()
+        self._auto_refresh_timer: Optional[Timer] = None
+        # Set while a refresh is awaited; a request meanwhile asks it to run again
+        self._auto_refresh_running = False
+        self._auto_refresh_again = False
+        self.debug_log_tail = DebugLogTail(
+            VANTAGE_CLI_DEBUG_LOG_PATH,
+            max_lines=self.config.debug_log_lines,
+            level=logging.getLevelName(self.config.debug_log_level),
+        )
+        self._stop_debug_log_watch: Optional[Callable[[], None]] = None
         self.execution_complete = False
         self.execution_running = False
 
@@ -686,6 +716,9 @@ class DashboardApp(App):
         for service in self.services:
             # Use custom handler if provided, otherwise use dummy handler
             handler = self.custom_handlers.get(service.name, lambda x: {"duration": 1.0})
+            if not inspect.iscoroutinefunction(handler):
+                # Plain handlers may block; keep them off the UI event loop
+                handler = functools.partial(asyncio.to_thread, handler)
             worker = Worker(service.name, handler, WorkerState.INIT, service.dependencies)
             workers.append(worker)
         return workers
@@ -775,8 +808,19 @@ class DashboardApp(App):
                 if self.config.enable_logs:
                     with TabPane("📜 Full Logs", id="logs-tab"):
                         yield Static("📜 Complete Activity History", classes="section-header")
-                        yield RichLog(id="full-logs", auto_scroll=True, markup=True)
+                        yield RichLog(
+                            id="full-logs",
+                            auto_scroll=True,
+                            markup=True,
+                            max_lines=self.config.debug_log_lines,
+                        )
                         with Horizontal():
+                            yield Select(
+                                [(level.title(), level) for level in DEBUG_LOG_LEVELS],
+                                value=self.config.debug_log_level,
+                                allow_blank=False,
+                                id="debug-log-level-select",
+                            )
                             yield Button("📤 Export Logs", id="export-btn")
                             yield Button("🧹 Clear All", id="clear-all-btn", variant="error")
 
@@ -857,13 +901,18 @@ class DashboardApp(App):
         if self.config.enable_stats:
             self.set_interval(self.config.refresh_interval, self.refresh_stats)
 
-        # Load and refresh the debug log file
+        # Load the debug log file, then follow it (inotify, or polling as a fallback)
         if self.config.enable_logs:
             self.call_later(self.load_debug_log)
-            self.set_interval(2.0, self.refresh_debug_log)  # Refresh every 2 seconds
+            self._stop_debug_log_watch = watch_log_file(
+                VANTAGE_CLI_DEBUG_LOG_PATH, self.refresh_debug_log
+            )
+            if self._stop_debug_log_watch is None:
+                self.set_interval(DEBUG_LOG_POLL_SECONDS, self.refresh_debug_log)
 
-        # Auto-refresh clusters and deployments every 10 seconds
-        self.set_interval(10.0, self.auto_refresh_data)
+        # Auto-refresh clusters and deployments, backing off while nothing changes
+        # or the dashboard is idle/unfocused
+        self._schedule_auto_refresh()
 
     def on_mount(self) -> None:
         """Initialize the app when mounted."""
@@ -1189,74 +1238,43 @@ class DashboardApp(App):
             pass
 
     def load_debug_log(self):
-        """Load the debug log file into the full logs widget."""
-        from pathlib import Path
-
+        """Load the tail of the debug log file into the full logs widget."""
         try:
-            log_file = Path.home() / ".vantage-cli" / "debug.log"
-            if not log_file.exists():
-                return
-
             full_log = self.query_one("#full-logs", RichLog)
             full_log.clear()
-
-            # Read last 500 lines to avoid overwhelming the widget
-            with open(log_file, "r") as f:
-                lines = f.readlines()
-                # Get last 500 lines
-                recent_lines = lines[-500:] if len(lines) > 500 else lines
-
-                for line in recent_lines:
-                    # Remove trailing newline and write to log
-                    full_log.write(line.rstrip())
-
-            # Track the file position for incremental updates
-            self._log_file_position = log_file.stat().st_size
-
+            for line in self.debug_log_tail.open():
+                full_log.write(line)
         except Exception as e:
             # Silently handle errors - don't want to crash dashboard
-            import logging
-
-            logger = logging.getLogger(__name__)
-            logger.debug(f"Error loading debug log: {e}")
+            logging.getLogger(__name__).debug(f"Error loading debug log: {e}")
 
     def refresh_debug_log(self):
-        """Refresh the debug log with new entries."""
-        from pathlib import Path
-
+        """Append debug log entries written since the last refresh."""
         try:
-            log_file = Path.home() / ".vantage-cli" / "debug.log"
-            if not log_file.exists():
-                return
-
-            # Initialize position tracker if not exists
-            if not hasattr(self, "_log_file_position"):
-                self._log_file_position = 0
-
-            current_size = log_file.stat().st_size
-
-            # Only read if file has grown
-            if current_size > self._log_file_position:
+            lines = self.debug_log_tail.poll()
+            if lines:
                 full_log = self.query_one("#full-logs", RichLog)
-
-                with open(log_file, "r") as f:
-                    # Seek to last known position
-                    f.seek(self._log_file_position)
-                    # Read new lines
-                    new_lines = f.readlines()
-
-                    for line in new_lines:
-                        full_log.write(line.rstrip())
-
-                # Update position tracker
-                self._log_file_position = current_size
-
+                for line in lines:
+                    full_log.write(line)
         except Exception as e:
             # Silently handle errors
-            import logging
+            logging.getLogger(__name__).debug(f"Error refreshing debug log: {e}")
 
-            logger = logging.getLogger(__name__)
-            logger.debug(f"Error refreshing debug log: {e}")
+    def on_select_changed(self, event: Select.Changed) -> None:
+        """Re-render the debug log from its buffer when the level filter changes."""
+        if event.select.id != "debug-log-level-select" or not isinstance(event.value, str):
+            return
+        full_log = self.query_one("#full-logs", RichLog)
+        full_log.clear()
+        for line in self.debug_log_tail.set_level(logging.getLevelName(event.value)):
+            full_log.write(line)
+
+    def on_unmount(self) -> None:
+        """Stop following the debug log."""
+        if self._stop_debug_log_watch is not None:
+            self._stop_debug_log_watch()
+            self._stop_debug_log_watch = None
+        self.debug_log_tail.close()
 
     def refresh_stats(self):
         """Update system statistics."""
@@ -1291,33 +1309,98 @@ class DashboardApp(App):
         except Exception:
             pass
 
-    def auto_refresh_data(self) -> None:
-        """Auto-refresh clusters and deployments data every 10 seconds."""
+    def _schedule_auto_refresh(self) -> None:
+        """Schedule the next background refresh using the adaptive interval."""
+        if self._auto_refresh_timer is not None:
+            self._auto_refresh_timer.stop()
+        interval = self.refresh_policy.next_interval()
+        self._auto_refresh_timer = self.set_timer(interval, self.auto_refresh_data)
+
+    async def auto_refresh_data(self) -> None:
+        """Refresh clusters and deployments in place, then schedule the next refresh.
+
+        Focus and key events are handled while a refresh is awaited; a refresh
+        requested meanwhile runs right after the current one instead of starting
+        a second timer chain.
+        """
+        if self._auto_refresh_running:
+            self._auto_refresh_again = True
+            return
+
+        self._auto_refresh_running = True
+        try:
+            while True:
+                self._auto_refresh_again = False
+                changed = await self._sync_refreshable_tables()
+                self.refresh_policy.record_result(changed)
+                if not self._auto_refresh_again:
+                    break
+        finally:
+            self._auto_refresh_running = False
+            self._schedule_auto_refresh()
+
+    async def _sync_refreshable_tables(self) -> bool:
+        """Sync the cluster and deployment tables; return True if either changed."""
         import logging
 
         logger = logging.getLogger(__name__)
 
+        changed = False
         try:
             # Refresh clusters if the cluster tab pane exists
             try:
                 cluster_tab = self.query_one(ClusterManagementTabPane)
-                if cluster_tab:
+                if cluster_tab and not cluster_tab.is_loading:
                     logger.debug("Auto-refreshing clusters...")
-                    cluster_tab.refresh_clusters()
+                    changed |= await cluster_tab.sync_clusters()
             except Exception as e:
                 logger.debug(f"No cluster tab pane to refresh: {e}")
 
             # Refresh deployments if the deployment tab pane exists
             try:
                 deployment_tab = self.query_one(DeploymentManagementTabPane)
-                if deployment_tab:
+                if deployment_tab and not deployment_tab.is_loading:
                     logger.debug("Auto-refreshing deployments...")
-                    deployment_tab.refresh_deployments()
+                    changed |= await deployment_tab.sync_deployments()
             except Exception as e:
                 logger.debug(f"No deployment tab pane to refresh: {e}")
 
         except Exception as e:
             logger.error(f"Error during auto-refresh: {e}")
+        return changed
+
+    def _resume_auto_refresh(self) -> None:
+        """Refresh right away if the refresh interval had backed off."""
+        if self.refresh_policy.unchanged_streak == 0:
+            return
+        self.refresh_policy.unchanged_streak = 0
+        if self._auto_refresh_running:
+            # The running refresh repeats and then schedules the next one
+            self._auto_refresh_again = True
+            return
+        if self._auto_refresh_timer is not None:
+            self._auto_refresh_timer.stop()
+        self.call_later(self.auto_refresh_data)
+
+    def on_app_focus(self, event: events.AppFocus) -> None:
+        """Refresh promptly when the terminal regains focus."""
+        self.refresh_policy.set_focused(True)
+        self._resume_auto_refresh()
+
+    def on_app_blur(self, event: events.AppBlur) -> None:
+        """Slow down background refreshes while the terminal is unfocused."""
+        self.refresh_policy.set_focused(False)
+
+    def on_key(self, event: events.Key) -> None:
+        """Track user activity for the idle back-off."""
+        was_idle = self.refresh_policy.is_idle()
+        self.refresh_policy.record_activity()
+        if was_idle:
+            self._resume_auto_refresh()
+
+    def on_click(self, event: events.Click) -> None:
+        """Track user activity for the idle back-off."""
+        self.refresh_policy.record_activity()
 
     # Button event handlers
     def on_button_pressed(self, event: Button.Pressed) -> None:
@@ -1530,7 +1613,6 @@ class DashboardApp(App):
             app_name: Name of the deployment application
         """
         from vantage_cli.auth import extract_persona
-        from vantage_cli.sdk.cloud_credential.crud import cloud_credential_sdk
         from vantage_cli.sdk.deployment_app import deployment_app_sdk
 
         try:
@@ -1560,20 +1642,16 @@ class DashboardApp(App):
 
             # Initialize cloud-specific SDK if needed
             if app.cloud == "cudo-compute":
-                from cudo_compute_sdk import CudoComputeSDK
+                from vantage_cli.clouds.cudo_compute.sdk_pool import cudo_sdk_pool
 
-                # Get default credential for Cudo Compute
-                cudo_credential = cloud_credential_sdk.get_default(cloud_name="cudo-compute")
-                if cudo_credential is None:
+                # Reuse the shared SDK client for the default credential
+                cudo_sdk = cudo_sdk_pool.get_default()
+                if cudo_sdk is None:
                     raise Exception(
                         "No default credential found for 'cudo-compute'. "
                         "Run: vantage cloud credential create --cloud cudo-compute"
                     )
-
-                # Initialize SDK and attach to context
-                self.ctx.obj.cudo_sdk = CudoComputeSDK(
-                    api_key=cudo_credential.credentials_data["api_key"]
-                )
+                self.ctx.obj.cudo_sdk = cudo_sdk
 
                 self.add_log("🔑 Initialized Cudo Compute SDK", "INFO")
 
@@ -2240,7 +2318,7 @@ class DashboardApp(App):
                     modal.add_message("⏳ Saving credentials...")
                     from vantage_cli.cache import save_tokens_to_cache
 
-                    save_tokens_to_cache(self.ctx.obj.profile, token_set)
+                    await asyncio.to_thread(save_tokens_to_cache, self.ctx.obj.profile, token_set)
                     persona = extract_persona(self.ctx.obj.profile, token_set)
 
                     # Update modal to success
@@ -2479,8 +2557,11 @@ class DashboardApp(App):
         self.add_log(f"🌓 Switched to {mode} mode", "INFO")
 
     def action_start_execution(self):
-        """Start worker execution."""
+        """Start worker execution, re-running only unfinished workers after a failure."""
         if not self.execution_running:
+            retried = self.tracker.retry_failed()
+            if retried:
+                self.add_log(f"🔁 Retrying {len(retried)} unfinished workers...", "INFO")
             self.add_log("🚀 Starting worker execution...", "SUCCESS")
             self.execution_running = True
             self.run_worker(self.execute_workers, exclusive=True)
@@ -2489,14 +2570,16 @@ class DashboardApp(App):
         """Stop worker execution."""
         if self.execution_running:
             self.add_log("⏹️ Stopping execution...", "WARNING")
-            self.execution_running = False
+            self.tracker.cancel()
 
     def action_restart(self):
         """Restart execution."""
         self.add_log("🔄 Restarting execution...", "INFO")
+        self.tracker.cancel()
         for worker in self.worker_list:
-            worker.state = WorkerState.INIT
-        self.tracker = DependencyTracker(self.worker_list)
+            worker.reset()
+        self._worker_log_state.clear()
+        self.tracker = DependencyTracker(self.worker_list, on_update=self._on_worker_update)
 
         for service in self.services:
             try:
@@ -2534,40 +2617,53 @@ class DashboardApp(App):
         except Exception:
             pass
 
-    async def execute_workers(self):
-        """Execute workers with progress tracking."""
-        self.add_log("📋 Starting execution", "INFO")
-
-        for worker in self.worker_list:
-            if not self.execution_running:
-                break
-
-            self.add_log(f"▶️ Processing {worker.id}...", "INFO")
+    def _on_worker_update(self, worker: Worker) -> None:
+        """Log a worker's state changes and update its progress bar."""
+        logged = (worker.state, worker.message)
+        if self._worker_log_state.get(worker.id) != logged:
+            self._worker_log_state[worker.id] = logged
+            self._log_worker_state(worker)
 
-            # Update worker state
-            if hasattr(self, "tracker") and worker.id in self.tracker.workers:
-                self.tracker.workers[worker.id].state = WorkerState.IN_PROGRESS
-
-            # Update progress
-            try:
-                progress_bar = self.query_one(f"#progress-{worker.id}", ProgressBar)
-                for progress in range(0, 101, 20):
-                    if not self.execution_running:
-                        break
-                    progress_bar.update(progress=progress)
-                    await asyncio.sleep(0.3)
-            except Exception:
-                pass
-
-            # Complete worker
-            if hasattr(self, "tracker") and worker.id in self.tracker.workers:
-                self.tracker.workers[worker.id].state = WorkerState.COMPLETE
+        try:
+            progress_bar = self.query_one(f"#progress-{worker.id}", ProgressBar)
+            progress_bar.update(progress=worker.progress * 100)
+        except Exception:
+            pass
 
+    def _log_worker_state(self, worker: Worker) -> None:
+        """Write a worker's new state or progress message to the activity log."""
+        if worker.state == WorkerState.IN_PROGRESS:
+            if worker.message:
+                self.add_log(f"⏳ {worker.id}: {worker.message}", "INFO")
+            else:
+                self.add_log(f"▶️ Processing {worker.id}...", "INFO")
+        elif worker.state == WorkerState.COMPLETE:
             self.add_log(f"✅ {worker.id} completed", "SUCCESS")
+        elif worker.state == WorkerState.FAILED:
+            self.add_log(f"❌ {worker.id} failed: {worker.error}", "ERROR")
+        elif worker.state == WorkerState.SKIPPED:
+            self.add_log(f"⏭️ {worker.id} skipped: {worker.error}", "WARNING")
 
-        self.add_log("🎉 All workers completed!", "SUCCESS")
-        self.execution_running = False
-        self.execution_complete = True
+    async def execute_workers(self):
+        """Run the worker graph, starting each worker as soon as its dependencies complete."""
+        self.add_log("📋 Starting execution", "INFO")
+        try:
+            succeeded = await self.tracker.execute()
+        finally:
+            self.execution_running = False
+
+        summary = self.tracker.get_status_summary()
+        if succeeded:
+            self.add_log("🎉 All workers completed!", "SUCCESS")
+            self.execution_complete = True
+        elif summary[WorkerState.CANCELLED.value]:
+            self.add_log(f"⏹️ Execution stopped ({summary['cancelled']} cancelled)", "WARNING")
+        else:
+            self.add_log(
+                f"⚠️ Execution finished with {summary['failed']} failed and "
+                f"{summary['skipped']} skipped workers; press start to retry them",
+                "ERROR",
+            )
 
 
 def run_dashboard(
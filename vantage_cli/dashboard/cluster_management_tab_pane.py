@@ -27,6 +27,7 @@ from textual.reactive import reactive
 from textual.screen import ModalScreen
 from textual.widgets import Button, DataTable, Input, Label, Select, Static, TabPane
 
+from vantage_cli.dashboard.refresh import TableModel
 from vantage_cli.exceptions import Abort
 from vantage_cli.sdk.cluster.crud import cluster_sdk
 from vantage_cli.sdk.cluster.schema import Cluster
@@ -319,6 +320,19 @@ class RemoveClusterModal(ModalScreen[Optional[str]]):
             self.dismiss(None)
 
 
+def _cluster_row(cluster: Cluster) -> tuple:
+    """Render a cluster as a clusters table row."""
+    provider = cluster.provider if cluster.provider else "Unknown"
+    owner = cluster.owner_email if cluster.owner_email else "Unknown"
+    description = cluster.description if cluster.description else "No description"
+
+    # Truncate long descriptions
+    if len(description) > 50:
+        description = description[:47] + "..."
+
+    return (cluster.name, cluster.status, provider, owner, description)
+
+
 class ClusterManagementTabPane(TabPane):
     """A TabPane widget for cluster management functionality."""
 
@@ -413,6 +427,9 @@ class ClusterManagementTabPane(TabPane):
         """
         super().__init__("🖥️ Clusters", id="clusters-tab", **kwargs)
         self.ctx = ctx
+        self.table_model: TableModel[Cluster] = TableModel(
+            key=lambda cluster: cluster.name, render=_cluster_row
+        )
 
     def compose(self) -> ComposeResult:
         """Create the cluster management layout with 2-panel horizontal layout."""
@@ -483,8 +500,23 @@ class ClusterManagementTabPane(TabPane):
         )
 
     @work(exclusive=True)
-    async def refresh_clusters(self) -> None:
-        """Refresh the clusters list from the API."""
+    async def refresh_clusters(self, announce: bool = True) -> None:
+        """Refresh the clusters list from the API.
+
+        Args:
+            announce: Show a notification with the number of clusters loaded
+        """
+        await self.sync_clusters(announce=announce)
+
+    async def sync_clusters(self, announce: bool = False) -> bool:
+        """Fetch clusters and patch the table with whatever changed.
+
+        Args:
+            announce: Show a notification with the number of clusters loaded
+
+        Returns:
+            True if the table changed
+        """
         self.is_loading = True
 
         try:
@@ -497,10 +529,12 @@ class ClusterManagementTabPane(TabPane):
             self.last_refresh = datetime.now()
 
             # Update the UI
-            self.update_clusters_table()
+            changed = self.update_clusters_table()
 
             logger.debug("Cluster refresh completed successfully")
-            self.notify(f"Loaded {len(clusters_data)} clusters", severity="information")
+            if announce:
+                self.notify(f"Loaded {len(clusters_data)} clusters", severity="information")
+            return changed
 
         except Abort as e:
             error_msg = f"Failed to fetch clusters: {e.message}"
@@ -516,33 +550,21 @@ class ClusterManagementTabPane(TabPane):
         finally:
             self.is_loading = False
 
-    def update_clusters_table(self) -> None:
-        """Update the clusters table with current data."""
-        table = self.query_one("#clusters-table", DataTable)
-        table.clear()
-
-        logger.debug(f"Updating clusters table with {len(self.clusters)} clusters")
-
-        if not self.clusters:
-            logger.debug("No clusters to display")
-            return
-
-        for cluster in self.clusters:
-            logger.debug(f"Processing cluster: {cluster}")
-
-            # Extract key information for the table
-            name = cluster.name
-            status = cluster.status
-            provider = cluster.provider if cluster.provider else "Unknown"
-            owner = cluster.owner_email if cluster.owner_email else "Unknown"
-            description = cluster.description if cluster.description else "No description"
+        return False
 
-            # Truncate long descriptions
-            if len(description) > 50:
-                description = description[:47] + "..."
+    def update_clusters_table(self) -> bool:
+        """Patch the clusters table to match the current data.
 
-            logger.debug(f"Adding row: {name}, {status}, {provider}, {owner}, {description}")
-            table.add_row(name, status, provider, owner, description, key=name)
+        Returns:
+            True if any row was added, changed or removed
+        """
+        table = self.query_one("#clusters-table", DataTable)
+        patch = self.table_model.sync(table, self.clusters)
+        logger.debug(
+            f"Clusters table: {patch.added} added, {patch.updated} updated, "
+            f"{patch.removed} removed"
+        )
+        return patch.changed
 
     def update_cluster_details(self, cluster: Cluster) -> None:
         """Update the cluster details view with selected cluster info."""
@@ -581,10 +603,7 @@ class ClusterManagementTabPane(TabPane):
             cluster_name = event.row_key
             logger.debug(f"Cluster selected: {cluster_name}")
 
-            # Find the selected cluster
-            selected = next(
-                (cluster for cluster in self.clusters if cluster.name == cluster_name), None
-            )
+            selected = self.table_model.get(cluster_name)
 
             if selected:
                 logger.debug(f"Found cluster data for {cluster_name}: {selected}")
@@ -27,6 +27,7 @@ from textual.reactive import reactive
 from textual.screen import ModalScreen
 from textual.widgets import Button, DataTable, Input, Label, Select, Static, TabPane
 
+from vantage_cli.dashboard.refresh import TableModel
 from vantage_cli.sdk.cloud_credential.schema import CloudCredential
 
 logger = logging.getLogger(__name__)
@@ -297,6 +298,25 @@ class RemoveCredentialModal(ModalScreen[Optional[str]]):
             self.dismiss(None)
 
 
+def _credential_row(credential: CloudCredential) -> tuple:
+    """Render a credential as a credentials table row."""
+    cred_type = str(
+        credential.credential_type.value
+        if hasattr(credential.credential_type, "value")
+        else credential.credential_type
+    )
+    cloud_id = (
+        credential.cloud_id[:12] + "..." if len(credential.cloud_id) > 12 else credential.cloud_id
+    )
+    is_default = "✓" if credential.default else ""
+    created = (
+        credential.created_at.strftime("%Y-%m-%d")
+        if isinstance(credential.created_at, datetime)
+        else str(credential.created_at)
+    )
+    return (credential.name, cred_type, cloud_id, is_default, created)
+
+
 class CredentialManagementTabPane(TabPane):
     """A TabPane widget for credential management functionality."""
 
@@ -381,6 +401,9 @@ class CredentialManagementTabPane(TabPane):
         """
         super().__init__(title, **kwargs)
         self.ctx = ctx
+        self.table_model: TableModel[CloudCredential] = TableModel(
+            key=lambda credential: credential.id, render=_credential_row
+        )
         self.credentials = credentials or []
         self.selected_credential = None
 
@@ -436,30 +459,9 @@ class CredentialManagementTabPane(TabPane):
         table.add_columns("Name", "Type", "Cloud ID", "Default", "Created")
 
     def update_credentials_table(self) -> None:
-        """Update the credentials table with current data."""
+        """Patch the credentials table to match the current data."""
         table = self.query_one("#credentials-table", DataTable)
-        table.clear()
-
-        for credential in self.credentials:
-            name = credential.name
-            cred_type = str(
-                credential.credential_type.value
-                if hasattr(credential.credential_type, "value")
-                else credential.credential_type
-            )
-            cloud_id = (
-                credential.cloud_id[:12] + "..."
-                if len(credential.cloud_id) > 12
-                else credential.cloud_id
-            )
-            is_default = "✓" if credential.default else ""
-            created = (
-                credential.created_at.strftime("%Y-%m-%d")
-                if isinstance(credential.created_at, datetime)
-                else str(credential.created_at)
-            )
-
-            table.add_row(name, cred_type, cloud_id, is_default, created, key=credential.id)
+        self.table_model.sync(table, self.credentials)
 
     def update_credential_details(self, credential: CloudCredential) -> None:
         """Update the details viewer with credential information.
@@ -545,8 +547,7 @@ class CredentialManagementTabPane(TabPane):
             credential_id = event.row_key
             logger.debug(f"Credential selected: {credential_id}")
 
-            # Find the selected credential
-            selected = next((cred for cred in self.credentials if cred.id == credential_id), None)
+            selected = self.table_model.get(credential_id)
 
             if selected:
                 logger.debug(f"Found credential data for {credential_id}: {selected}")
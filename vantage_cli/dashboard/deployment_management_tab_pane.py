@@ -27,12 +27,16 @@ from textual.message import Message
 from textual.reactive import reactive
 from textual.widgets import Button, DataTable, Select, Static, TabPane
 
+from vantage_cli.dashboard.refresh import TableModel
 from vantage_cli.exceptions import Abort
 from vantage_cli.sdk.deployment import deployment_sdk
 from vantage_cli.sdk.deployment.schema import Deployment
 
 logger = logging.getLogger(__name__)
 
+# How often the local deployment store's change counter is checked
+STORE_CHECK_INTERVAL_SECONDS = 2.0
+
 
 class DeploymentObjectReceived(Message):
     """Message sent when a deployment object is received from the SDK."""
@@ -42,6 +46,22 @@ class DeploymentObjectReceived(Message):
         super().__init__()
 
 
+def _deployment_row(deployment: Deployment) -> tuple:
+    """Render a deployment as a deployments table row."""
+    cloud_name = (
+        deployment.cloud.name if hasattr(deployment.cloud, "name") else str(deployment.cloud)
+    )
+    return (
+        deployment.name,
+        deployment.app_name,
+        deployment.cluster_name,
+        cloud_name.upper() if cloud_name else "Unknown",
+        deployment.status,
+        deployment.formatted_created_at,  # Using computed field
+        "✅" if deployment.is_active else "❌",  # Using computed field
+    )
+
+
 class DeploymentManagementTabPane(TabPane):
     """A TabPane widget for deployment management functionality."""
 
@@ -127,6 +147,11 @@ class DeploymentManagementTabPane(TabPane):
         """
         super().__init__("🚀 Deployments", id="deployments-tab", **kwargs)
         self.ctx = ctx
+        self.table_model: TableModel[Deployment] = TableModel(
+            key=lambda deployment: deployment.id, render=_deployment_row
+        )
+        # Deployment store generation the table was last loaded from
+        self._loaded_generation: Optional[int] = None
 
     def compose(self) -> ComposeResult:
         """Create the deployment management layout with 2-panel horizontal layout."""
@@ -191,8 +216,9 @@ class DeploymentManagementTabPane(TabPane):
         # Debug the context structure
         logger.debug(f"DeploymentManagementTabPane context: {self.ctx}")
 
-        # Auto-refresh deployments on mount
+        # Auto-refresh deployments on mount, then whenever the local store changes
         self.refresh_deployments()
+        self.set_interval(STORE_CHECK_INTERVAL_SECONDS, self.check_store_changed)
 
     def setup_deployments_table(self) -> None:
         """Set up the deployments table with columns."""
@@ -203,8 +229,31 @@ class DeploymentManagementTabPane(TabPane):
         logger.debug("Deployments table setup complete.")
 
     @work(exclusive=True)
-    async def refresh_deployments(self) -> None:
-        """Refresh the deployments list from the local storage."""
+    async def refresh_deployments(self, announce: bool = True) -> None:
+        """Refresh the deployments list from the local storage.
+
+        Args:
+            announce: Show a notification with the number of deployments loaded
+        """
+        await self.sync_deployments(force=True, announce=announce)
+
+    async def sync_deployments(self, force: bool = False, announce: bool = False) -> bool:
+        """Reload deployments if the store changed and patch the table.
+
+        The deployment store's generation counter is compared with the one
+        seen at the last load, so an unchanged store costs a single-row read.
+
+        Args:
+            force: Reload even if the store has not changed (e.g. filters changed)
+            announce: Show a notification with the number of deployments loaded
+
+        Returns:
+            True if the table changed
+        """
+        generation = deployment_sdk.generation()
+        if not force and generation == self._loaded_generation:
+            return False
+
         self.is_loading = True
 
         try:
@@ -224,12 +273,15 @@ class DeploymentManagementTabPane(TabPane):
 
             self.deployments = deployments_data
             self.last_refresh = datetime.now()
+            self._loaded_generation = generation
 
             # Update the UI
-            self.update_deployments_table()
+            changed = self.update_deployments_table()
 
             logger.debug("Deployment refresh completed successfully")
-            self.notify(f"Loaded {len(deployments_data)} deployments", severity="information")
+            if announce:
+                self.notify(f"Loaded {len(deployments_data)} deployments", severity="information")
+            return changed
 
         except Abort as e:
             error_msg = f"Failed to fetch deployments: {e.message}"
@@ -245,47 +297,26 @@ class DeploymentManagementTabPane(TabPane):
         finally:
             self.is_loading = False
 
-    def update_deployments_table(self) -> None:
-        """Update the deployments table with current data."""
-        table = self.query_one("#deployments-table", DataTable)
-        table.clear()
-
-        logger.debug(f"Updating deployments table with {len(self.deployments)} deployments")
+        return False
 
-        if not self.deployments:
-            logger.debug("No deployments to display")
-            return
+    async def check_store_changed(self) -> None:
+        """Reload as soon as another command writes to the deployment store."""
+        if not self.is_loading:
+            await self.sync_deployments()
 
-        for i, deployment in enumerate(self.deployments):
-            logger.debug(f"Processing deployment {i}: {deployment.id}")
+    def update_deployments_table(self) -> bool:
+        """Patch the deployments table to match the current data.
 
-            # Use the Deployment schema object properties
-            name = deployment.name
-            app_name = deployment.app_name
-            cluster_name = deployment.cluster_name
-            cloud_name = (
-                deployment.cloud.name
-                if hasattr(deployment.cloud, "name")
-                else str(deployment.cloud)
-            )
-            cloud = cloud_name.upper() if cloud_name else "Unknown"
-            status = deployment.status
-            created = deployment.formatted_created_at  # Using computed field
-            is_active = "✅" if deployment.is_active else "❌"  # Using computed field
-
-            logger.debug(
-                f"Adding row: {name}, {app_name}, {cluster_name}, {cloud}, {status}, {created}, {is_active}"
-            )
-            table.add_row(
-                name,
-                app_name,
-                cluster_name,
-                cloud,
-                status,
-                created,
-                is_active,
-                key=deployment.id,
-            )
+        Returns:
+            True if any row was added, changed or removed
+        """
+        table = self.query_one("#deployments-table", DataTable)
+        patch = self.table_model.sync(table, self.deployments)
+        logger.debug(
+            f"Deployments table: {patch.added} added, {patch.updated} updated, "
+            f"{patch.removed} removed"
+        )
+        return patch.changed
 
     def update_deployment_details(self, deployment: Deployment) -> None:
         """Update the deployment details viewer with selected deployment info."""
@@ -376,11 +407,7 @@ class DeploymentManagementTabPane(TabPane):
             deployment_id = event.row_key
             logger.debug(f"Deployment selected: {deployment_id}")
 
-            # Find the selected deployment
-            selected = next(
-                (deployment for deployment in self.deployments if deployment.id == deployment_id),
-                None,
-            )
+            selected = self.table_model.get(deployment_id)
 
             if selected:
                 logger.debug(f"Found deployment data for {deployment_id}: {selected}")
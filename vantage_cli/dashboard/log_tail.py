@@ -0,0 +1,295 @@
+# Copyright (C) 2025 Vantage Compute Corporation
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/>.
+"""Follow the CLI debug log for the dashboard's Full Logs tab.
+
+``DebugLogTail`` loads the last lines of the log by reading backwards from
+the end of the file in blocks, then reads only what was appended since. It
+keeps the file open and tracks its inode, so when ``RotatingFileHandler``
+renames the log away the rest of the old file is still read before the new
+one is opened from the start. Lines are kept in a fixed-size ring buffer
+tagged with their log level, so changing the level filter re-renders from
+memory.
+
+``watch_log_file`` wakes the dashboard through inotify on Linux; callers
+fall back to polling when it returns None.
+"""
+
+import asyncio
+import ctypes
+import logging
+import os
+import re
+import struct
+import sys
+from collections import deque
+from pathlib import Path
+from typing import BinaryIO, Callable, Deque, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Bytes read per step when seeking backwards from the end of the log
+BLOCK_SIZE = 64 * 1024
+
+# When more than this much was appended between reads, skip ahead to the tail
+CATCH_UP_BYTES = 1024 * 1024
+
+# Level column written by the file handler set up in vantage_cli.setup_logging
+_LEVEL_PATTERN = re.compile(r"\| (DEBUG|INFO|WARNING|ERROR|CRITICAL)\s+\|")
+
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = 0o2000000
+_IN_MODIFY = 0x00000002
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def tail_lines(
+    handle: BinaryIO, end: int, count: int, block_size: int = BLOCK_SIZE
+) -> Tuple[List[str], int]:
+    """Return the last ``count`` complete lines before ``end`` without reading the whole file.
+
+    Args:
+        handle: File opened in binary mode
+        end: Offset to read back from (usually the file size)
+        count: Number of lines wanted
+        block_size: Bytes read per backward step
+
+    Returns:
+        The lines (without newlines) and the offset just past the last complete line
+    """
+    position = end
+    chunks: List[bytes] = []
+    newlines = 0
+    while position > 0 and newlines <= count:
+        size = min(block_size, position)
+        position -= size
+        handle.seek(position)
+        chunk = handle.read(size)
+        chunks.append(chunk)
+        newlines += chunk.count(b"\n")
+
+    data = b"".join(reversed(chunks))
+    complete, separator, partial = data.rpartition(b"\n")
+    if not separator:
+        # Not even one complete line yet
+        return [], position
+    lines = complete.split(b"\n")
+    if position > 0:
+        # The first line started before the oldest block that was read
+        lines = lines[1:]
+    return [line.decode(errors="replace") for line in lines[-count:]], end - len(partial)
+
+
+class DebugLogTail:
+    """Incrementally follow a log file into a bounded, level-tagged buffer.
+
+    Args:
+        path: Log file to follow
+        max_lines: Number of lines kept in the ring buffer
+        level: Minimum level of lines returned for rendering
+    """
+
+    def __init__(self, path: Path, max_lines: int = 500, level: int = logging.DEBUG):
+        self.path = path
+        self.level = level
+        self._records: Deque[Tuple[int, str]] = deque(maxlen=max_lines)
+        self._handle: Optional[BinaryIO] = None
+        self._inode: Optional[Tuple[int, int]] = None
+        self._partial = b""
+        # Traceback and other continuation lines inherit the last record's level
+        self._last_level = logging.INFO
+
+    @property
+    def max_lines(self) -> int:
+        """Size of the ring buffer."""
+        return self._records.maxlen or 0
+
+    def lines(self) -> List[str]:
+        """Return the buffered lines at or above the current level."""
+        return [line for level, line in self._records if level >= self.level]
+
+    def set_level(self, level: int) -> List[str]:
+        """Change the level filter and return the buffered lines that now pass it."""
+        self.level = level
+        return self.lines()
+
+    def open(self) -> List[str]:
+        """Load the tail of the log into the buffer and return the visible lines."""
+        self.close()
+        self._records.clear()
+        try:
+            handle = open(self.path, "rb")
+        except FileNotFoundError:
+            return []
+        stat = os.fstat(handle.fileno())
+        lines, offset = tail_lines(handle, stat.st_size, self.max_lines)
+        handle.seek(offset)
+        self._handle = handle
+        self._inode = (stat.st_dev, stat.st_ino)
+        self._ingest(lines)
+        return self.lines()
+
+    def poll(self) -> List[str]:
+        """Read what was appended since the last call and return the new visible lines.
+
+        Handles the log being rotated (renamed away and recreated) and being
+        truncated in place.
+        """
+        if self._handle is None:
+            return self.open()
+
+        # Whatever is left in the file we have open, even if it was renamed away
+        lines = self._read_available()
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            # Rotated, and the new file has not been created yet
+            return self._ingest(lines)
+
+        if (stat.st_dev, stat.st_ino) != self._inode:
+            try:
+                handle = open(self.path, "rb")
+            except FileNotFoundError:
+                return self._ingest(lines)
+            self._handle.close()
+            self._handle = handle
+            stat = os.fstat(handle.fileno())
+            self._inode = (stat.st_dev, stat.st_ino)
+            self._partial = b""
+            lines += self._read_available()
+        elif stat.st_size < self._handle.tell():
+            self._handle.seek(0)
+            self._partial = b""
+            lines += self._read_available()
+
+        return self._ingest(lines)
+
+    def close(self) -> None:
+        """Close the log file."""
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+        self._inode = None
+        self._partial = b""
+
+    def _read_available(self) -> List[str]:
+        """Read complete lines appended to the open file, keeping any partial line."""
+        if self._handle is None:
+            return []
+        size = os.fstat(self._handle.fileno()).st_size
+        if size - self._handle.tell() > CATCH_UP_BYTES:
+            lines, offset = tail_lines(self._handle, size, self.max_lines)
+            self._handle.seek(offset)
+            self._partial = b""
+            return lines
+
+        data = self._partial + self._handle.read()
+        complete, separator, self._partial = data.rpartition(b"\n")
+        if not separator:
+            return []
+        return [line.decode(errors="replace") for line in complete.split(b"\n")]
+
+    def _ingest(self, lines: List[str]) -> List[str]:
+        """Tag lines with their level, buffer them and return the visible ones."""
+        visible = []
+        for line in lines[-self.max_lines :]:
+            match = _LEVEL_PATTERN.search(line, 0, 48)
+            if match:
+                self._last_level = logging.getLevelName(match.group(1))
+            self._records.append((self._last_level, line))
+            if self._last_level >= self.level:
+                visible.append(line)
+        return visible
+
+
+def _load_inotify() -> Optional[ctypes.CDLL]:
+    """Return libc if it provides inotify, else None."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        # The already-loaded C library; find_library would spawn ldconfig
+        libc = ctypes.CDLL(None, use_errno=True)
+        libc.inotify_init1  # noqa: B018 - raises AttributeError if missing
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+def watch_log_file(
+    path: Path, callback: Callable[[], None], delay: float = 0.1
+) -> Optional[Callable[[], None]]:
+    """Call ``callback`` shortly after the log file is written, created or rotated.
+
+    The log's directory is watched with inotify so that rotation (the file
+    being renamed away and recreated) is noticed too. Bursts of writes are
+    coalesced into one call ``delay`` seconds after the first.
+
+    Must be called from a running event loop.
+
+    Args:
+        path: Log file to watch
+        callback: Called on the event loop after changes
+        delay: Seconds to wait for further writes before calling back
+
+    Returns:
+        A function that stops watching, or None if inotify is unavailable
+    """
+    libc = _load_inotify()
+    if libc is None:
+        return None
+
+    fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+    if fd < 0:
+        return None
+    mask = _IN_MODIFY | _IN_CREATE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_DELETE
+    if libc.inotify_add_watch(fd, os.fsencode(path.parent), mask) < 0:
+        logger.debug(f"inotify watch on {path.parent} failed: errno {ctypes.get_errno()}")
+        os.close(fd)
+        return None
+
+    loop = asyncio.get_running_loop()
+    name = os.fsencode(path.name)
+    pending: List[asyncio.TimerHandle] = []
+
+    def fire() -> None:
+        pending.clear()
+        callback()
+
+    def on_readable() -> None:
+        relevant = False
+        while True:
+            try:
+                data = os.read(fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                _, _, _, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                event_name = data[offset : offset + length].rstrip(b"\0")
+                offset += length
+                relevant = relevant or event_name.startswith(name)
+        if relevant and not pending:
+            pending.append(loop.call_later(delay, fire))
+
+    loop.add_reader(fd, on_readable)
+
+    def stop() -> None:
+        for handle in pending:
+            handle.cancel()
+        loop.remove_reader(fd)
+        os.close(fd)
+
+    return stop
@@ -27,6 +27,7 @@ from textual.reactive import reactive
 from textual.screen import ModalScreen
 from textual.widgets import Button, DataTable, Input, Label, Select, Static, TabPane
 
+from vantage_cli.dashboard.refresh import TableModel
 from vantage_cli.exceptions import Abort
 from vantage_cli.sdk.profile import profile_sdk
 from vantage_cli.sdk.profile.schema import Profile
@@ -269,6 +270,16 @@ class RemoveProfileModal(ModalScreen[Optional[str]]):
             self.dismiss(None)
 
 
+def _profile_row(profile: Profile) -> tuple:
+    """Render a profile as a profiles table row."""
+    return (
+        profile.name,
+        profile.api_base_url,  # Using computed field
+        "✅ Active" if profile.is_active else "⚪ Inactive",
+        "🔑 Connected" if profile.settings else "❌ Not configured",
+    )
+
+
 class ProfileManagementTabPane(TabPane):
     """A TabPane widget for profile management functionality."""
 
@@ -348,6 +359,9 @@ class ProfileManagementTabPane(TabPane):
         """
         super().__init__("👤 Profiles", id="profiles-tab", **kwargs)
         self.ctx = ctx
+        self.table_model: TableModel[Profile] = TableModel(
+            key=lambda profile: profile.name, render=_profile_row
+        )
 
     def compose(self) -> ComposeResult:
         """Create the profile management layout with 2-panel horizontal layout."""
@@ -460,27 +474,13 @@ class ProfileManagementTabPane(TabPane):
             logger.info(f"is_loading set to False, profiles count: {len(self.profiles)}")
 
     def update_profiles_table(self) -> None:
-        """Update the profiles table with current data."""
+        """Patch the profiles table to match the current data."""
         table = self.query_one("#profiles-table", DataTable)
-        table.clear()
-
-        logger.debug(f"Updating profiles table with {len(self.profiles)} profiles")
-
-        if not self.profiles:
-            logger.debug("No profiles to display")
-            return
-
-        for i, profile in enumerate(self.profiles):
-            logger.debug(f"Processing profile {i}: {profile.name}")
-
-            # Use the Profile schema object properties
-            name = profile.name
-            url = profile.api_base_url  # Using computed field
-            is_active = "✅ Active" if profile.is_active else "⚪ Inactive"
-            api_key_status = "🔑 Connected" if profile.settings else "❌ Not configured"
-
-            logger.debug(f"Adding row: {name}, {url}, {is_active}, {api_key_status}")
-            table.add_row(name, url, is_active, api_key_status, key=profile.name)
+        patch = self.table_model.sync(table, self.profiles)
+        logger.debug(
+            f"Profiles table: {patch.added} added, {patch.updated} updated, "
+            f"{patch.removed} removed"
+        )
 
     def update_profile_details(self, profile: Profile) -> None:
         """Update the profile details viewer with selected profile info."""
@@ -555,10 +555,7 @@ class ProfileManagementTabPane(TabPane):
             profile_name = event.row_key
             logger.debug(f"Profile selected: {profile_name}")
 
-            # Find the selected profile
-            selected = next(
-                (profile for profile in self.profiles if profile.name == profile_name), None
-            )
+            selected = self.table_model.get(profile_name)
 
             if selected:
                 logger.debug(f"Found profile data for {profile_name}: {selected}")
@@ -0,0 +1,248 @@
+# Copyright (C) 2025 Vantage Compute Corporation
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/>.
+"""Incremental refresh helpers for the dashboard.
+
+``AdaptiveRefresh`` decides how long to wait before the next background
+refresh: the base interval while the user is interacting and data is
+changing, backing off while nothing changes, the terminal is unfocused or
+the user is idle. ``patch_table_rows`` applies a refreshed row set to a
+``DataTable`` cell by cell instead of clearing and rebuilding it, and
+``TableModel`` is the keyed view-model the tab panes put in front of their
+tables: it renders items to rows, patches the table, keeps the cursor on
+the same row and looks items up by row key in constant time.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import (
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from textual.widgets import DataTable
+from textual.widgets.data_table import CellDoesNotExist, RowKey
+
+T = TypeVar("T")
+
+
+@dataclass
+class AdaptiveRefresh:
+    """Polling interval policy for background data refreshes.
+
+    Attributes:
+        base_interval: Seconds between refreshes while active and data changes
+        max_interval: Upper bound for the backed-off interval
+        idle_after: Seconds without user input after which the user counts as idle
+        inactive_factor: Interval multiplier while unfocused or idle
+    """
+
+    base_interval: float = 10.0
+    max_interval: float = 120.0
+    idle_after: float = 60.0
+    inactive_factor: float = 4.0
+    focused: bool = True
+    unchanged_streak: int = 0
+    last_activity: float = field(default_factory=time.monotonic)
+
+    def record_activity(self) -> None:
+        """Note user input (key press, click); resets the idle timer."""
+        self.last_activity = time.monotonic()
+
+    def set_focused(self, focused: bool) -> None:
+        """Note that the terminal gained or lost focus."""
+        self.focused = focused
+        if focused:
+            self.record_activity()
+
+    def record_result(self, changed: bool) -> None:
+        """Note whether the last refresh found any changes."""
+        self.unchanged_streak = 0 if changed else self.unchanged_streak + 1
+
+    def is_idle(self, now: Optional[float] = None) -> bool:
+        """Return True if there has been no user input for ``idle_after`` seconds."""
+        now = time.monotonic() if now is None else now
+        return now - self.last_activity >= self.idle_after
+
+    def next_interval(self, now: Optional[float] = None) -> float:
+        """Return the number of seconds to wait before the next refresh."""
+        interval = self.base_interval * 2 ** min(self.unchanged_streak, 4)
+        if not self.focused or self.is_idle(now):
+            interval *= self.inactive_factor
+        return min(interval, self.max_interval)
+
+
+class RowPatch(NamedTuple):
+    """Number of rows added, updated, removed and reordered by ``patch_table_rows``."""
+
+    added: int
+    updated: int
+    removed: int
+    reordered: bool = False
+
+    @property
+    def changed(self) -> bool:
+        """True if the table was modified."""
+        return bool(self.added or self.updated or self.removed or self.reordered)
+
+
+def patch_table_rows(table: DataTable, rows: Mapping[str, Sequence[object]]) -> RowPatch:
+    """Make a DataTable show ``rows`` by patching only what differs.
+
+    Rows whose key is gone are removed, new keys are appended and, for rows
+    that already exist, only cells whose value changed are updated. The
+    cursor and scroll position are left alone, so a background refresh does
+    not disturb the user. Only if the rows end up in a different order than
+    ``rows`` is the table rebuilt.
+
+    Args:
+        table: Table whose columns match the length of every row
+        rows: Cell values keyed by row key, in display order
+
+    Returns:
+        Counts of added, updated and removed rows
+    """
+    column_keys = list(table.columns)
+    existing: Dict[str, Sequence[object]] = {
+        row_key.value: table.get_row(row_key)
+        for row_key in table.rows
+        if row_key.value is not None
+    }
+
+    removed = [key for key in existing if key not in rows]
+    for key in removed:
+        table.remove_row(key)
+
+    added = updated = 0
+    for key, cells in rows.items():
+        current = existing.get(key)
+        if current is None:
+            table.add_row(*cells, key=key)
+            added += 1
+            continue
+        changed_cells = [
+            (column_key, value)
+            for column_key, old, value in zip(column_keys, current, cells)
+            if old != value
+        ]
+        for column_key, value in changed_cells:
+            table.update_cell(key, column_key, value)
+        updated += bool(changed_cells)
+
+    reordered = [row_key.value for row_key in _ordered_keys(table)] != list(rows)
+    if reordered:
+        table.clear()
+        for key, cells in rows.items():
+            table.add_row(*cells, key=key)
+
+    return RowPatch(added, updated, len(removed), reordered)
+
+
+def _ordered_keys(table: DataTable) -> List[RowKey]:
+    """Return the table's row keys in display order."""
+    return [row.key for row in table.ordered_rows]
+
+
+def _cursor_key(table: DataTable) -> Optional[str]:
+    """Return the key of the row under the cursor, if any."""
+    if not table.row_count:
+        return None
+    try:
+        return table.coordinate_to_cell_key(table.cursor_coordinate).row_key.value
+    except CellDoesNotExist:
+        return None
+
+
+class TableModel(Generic[T]):
+    """Keyed view-model between a list of items and the DataTable showing them.
+
+    Each item is rendered to a row under a stable key. ``sync`` patches the
+    table with only the rows that changed and keeps the cursor on the row it
+    was on (by key, not by index) without scrolling, and ``get`` resolves a
+    selected row key back to its item through a dict index.
+
+    Args:
+        key: Returns the row key for an item
+        render: Returns the cell values for an item, one per table column
+    """
+
+    def __init__(self, key: Callable[[T], str], render: Callable[[T], Sequence[object]]):
+        self._key = key
+        self._render = render
+        self._index: Dict[str, T] = {}
+
+    def __len__(self) -> int:
+        """Return the number of items in the model."""
+        return len(self._index)
+
+    def __contains__(self, row_key: Union[RowKey, str]) -> bool:
+        """Return True if an item has the given row key."""
+        return self.get(row_key) is not None
+
+    @property
+    def items(self) -> List[T]:
+        """Items in display order."""
+        return list(self._index.values())
+
+    def get(self, row_key: Union[RowKey, str, None]) -> Optional[T]:
+        """Return the item shown under ``row_key``, or None (e.g. a placeholder row)."""
+        if isinstance(row_key, RowKey):
+            row_key = row_key.value
+        return self._index.get(row_key) if row_key is not None else None
+
+    def sync(
+        self,
+        table: DataTable,
+        items: Iterable[T],
+        placeholder: Optional[Tuple[str, Sequence[object]]] = None,
+    ) -> RowPatch:
+        """Show ``items`` in ``table``, touching only rows that changed.
+
+        Args:
+            table: Table whose columns match the rendered rows
+            items: Items in display order; later duplicates of a key are ignored
+            placeholder: Row key and cells shown while there are no items
+
+        Returns:
+            What was added, updated, removed or reordered
+        """
+        index: Dict[str, T] = {}
+        rows: Dict[str, Sequence[object]] = {}
+        for item in items:
+            key = self._key(item)
+            if key not in index:
+                index[key] = item
+                rows[key] = self._render(item)
+        self._index = index
+        if not rows and placeholder is not None:
+            rows[placeholder[0]] = placeholder[1]
+
+        cursor_key = _cursor_key(table)
+        scroll_x, scroll_y = table.scroll_offset
+        patch = patch_table_rows(table, rows)
+
+        if cursor_key in rows:
+            row_index = table.get_row_index(cursor_key)
+            if row_index != table.cursor_row:
+                table.move_cursor(row=row_index, scroll=False)
+        if patch.reordered:
+            table.call_after_refresh(table.scroll_to, scroll_x, scroll_y, animate=False)
+        return patch
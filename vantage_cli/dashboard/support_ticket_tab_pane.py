@@ -16,6 +16,7 @@ A reusable TabPane widget for managing Vantage support tickets in the dashboard.
 """
 
 import logging
+from datetime import datetime
 from typing import List, Optional
 
 import typer
@@ -26,6 +27,7 @@ from textual.reactive import reactive
 from textual.screen import ModalScreen
 from textual.widgets import Button, DataTable, Input, Label, Select, Static, TabPane, TextArea
 
+from vantage_cli.dashboard.refresh import TableModel
 from vantage_cli.sdk.support_ticket.crud import SupportTicketSDK
 from vantage_cli.sdk.support_ticket.schema import (
     Comment,
@@ -456,6 +458,39 @@ class UpdateCommentModal(ModalScreen[Optional[dict]]):
             self.dismiss(None)
 
 
+def _ticket_row(ticket: SupportTicket) -> tuple:
+    """Render a ticket as a tickets table row."""
+    # Just show the date
+    created_at = ticket.created_at or "N/A"
+    if created_at != "N/A" and len(created_at) > 10:
+        created_at = created_at[:10]
+
+    # Get the enum values properly
+    status_display = ticket.status.value if ticket.status else "open"
+    priority_display = ticket.priority.value if ticket.priority else "medium"
+
+    return (
+        ticket.id[:8] if len(ticket.id) > 8 else ticket.id,
+        ticket.title,
+        status_display,
+        priority_display,
+        created_at,
+    )
+
+
+def _comment_row(comment: Comment) -> tuple:
+    """Render a comment as a comments table row."""
+    created_time = comment.created_at or "Unknown"
+    if created_time != "Unknown":
+        try:
+            dt = datetime.fromisoformat(created_time.replace("Z", "+00:00"))
+            created_time = dt.strftime("%Y-%m-%d %H:%M")
+        except ValueError:
+            pass
+
+    return (comment.user_email or "Unknown", created_time)
+
+
 class SupportTicketManagementTabPane(TabPane):
     """TabPane for managing support tickets with 3-panel horizontal layout."""
 
@@ -554,6 +589,12 @@ class SupportTicketManagementTabPane(TabPane):
         self.ctx = ctx
         self.support_ticket_sdk = SupportTicketSDK()
         self.tickets: List[SupportTicket] = []
+        self.tickets_model: TableModel[SupportTicket] = TableModel(
+            key=lambda ticket: ticket.id, render=_ticket_row
+        )
+        self.comments_model: TableModel[Comment] = TableModel(
+            key=lambda comment: comment.id, render=_comment_row
+        )
 
     def compose(self) -> ComposeResult:
         """Create the support ticket management layout with 3 horizontal panels."""
@@ -700,10 +741,7 @@ class SupportTicketManagementTabPane(TabPane):
             return
 
         try:
-            # Get the comments table
             comments_table = self.query_one("#support-ticket-comments-table", DataTable)
-            logger.debug("Found comments table, clearing it")
-            comments_table.clear()
 
             # Fetch comments from API
             logger.debug(f"Fetching comments for ticket {ticket_id}")
@@ -713,38 +751,24 @@ class SupportTicketManagementTabPane(TabPane):
             # Store comments for later use
             self.current_comments = comments if comments else []
 
+            # Rows are keyed by comment ID, so reloading the same ticket only
+            # patches what changed and keeps the selected comment highlighted
+            patch = self.comments_model.sync(
+                comments_table,
+                self.current_comments,
+                placeholder=("empty", ("No comments", "")),
+            )
+
             if not comments:
-                logger.debug("No comments found, adding placeholder")
-                comments_table.add_row("No comments", "")
+                logger.debug("No comments found, showing placeholder")
                 # Clear the detail view
                 comment_detail = self.query_one("#support-ticket-comment-detail", Static)
                 comment_detail.update("No comments for this ticket yet.")
                 return
 
-            # Add comments to the table
-            for idx, comment in enumerate(comments):
-                # Format timestamp
-                created_time = comment.created_at or "Unknown"
-                if created_time != "Unknown":
-                    try:
-                        from datetime import datetime
-
-                        dt = datetime.fromisoformat(created_time.replace("Z", "+00:00"))
-                        created_time = dt.strftime("%Y-%m-%d %H:%M")
-                    except Exception:
-                        pass
-
-                user_email = comment.user_email or "Unknown"
-
-                logger.debug(f"Adding comment {idx + 1}: user={user_email}, time={created_time}")
-                comments_table.add_row(
-                    user_email,
-                    created_time,
-                    key=str(idx),  # Use index as key to identify comment later
-                )
-
             logger.debug(
-                f"Successfully loaded {len(comments)} comments for ticket {ticket_id} into table"
+                f"Loaded {len(comments)} comments for ticket {ticket_id}: {patch.added} added, "
+                f"{patch.updated} updated, {patch.removed} removed"
             )
 
         except Exception as e:
@@ -794,41 +818,23 @@ class SupportTicketManagementTabPane(TabPane):
             self.notify(f"Failed to refresh tickets: {str(e)}", severity="error")
 
     def update_tickets_table(self, tickets: List[SupportTicket]) -> None:
-        """Update the tickets table with the provided tickets."""
+        """Patch the tickets table to match the provided tickets."""
         try:
             tickets_table = self.query_one("#support-tickets-table", DataTable)
-            tickets_table.clear()
 
             logger.debug(f"Updating tickets table with {len(tickets)} tickets")
 
-            if not tickets:
-                logger.debug("No tickets to display")
-                # Add a placeholder row to show the table is working
-                tickets_table.add_row(
-                    "(No tickets)", "No support tickets found", "-", "-", "-", key="empty"
-                )
-                return
-
-            for ticket in tickets:
-                # Format created_at
-                created_at = ticket.created_at or "N/A"
-                if created_at != "N/A" and len(created_at) > 10:
-                    created_at = created_at[:10]  # Just show date
-
-                # Get the enum values properly
-                status_display = ticket.status.value if ticket.status else "open"
-                priority_display = ticket.priority.value if ticket.priority else "medium"
-
-                tickets_table.add_row(
-                    ticket.id[:8] if len(ticket.id) > 8 else ticket.id,
-                    ticket.title,
-                    status_display,
-                    priority_display,
-                    created_at,
-                    key=ticket.id,
-                )
+            # A placeholder row shows the table is working when there are no tickets
+            patch = self.tickets_model.sync(
+                tickets_table,
+                tickets,
+                placeholder=("empty", ("(No tickets)", "No support tickets found", "-", "-", "-")),
+            )
 
-            logger.debug(f"Tickets table now has {tickets_table.row_count} rows")
+            logger.debug(
+                f"Tickets table: {patch.added} added, {patch.updated} updated, "
+                f"{patch.removed} removed"
+            )
         except Exception as e:
             logger.error(f"Failed to update tickets table: {e}")
 
@@ -839,53 +845,42 @@ class SupportTicketManagementTabPane(TabPane):
         # Check if this is the comments table
         if event.data_table.id == "support-ticket-comments-table":
             try:
-                # Get the actual key value from the RowKey object
-                row_key_value = (
-                    event.row_key.value if hasattr(event.row_key, "value") else str(event.row_key)
-                )
-                row_key_str = str(row_key_value)
+                comment = self.comments_model.get(event.row_key)
 
-                # Skip if no key (placeholder row) or not a valid number
-                if row_key_str == "None" or not row_key_str.isdigit():
-                    logger.debug(f"Skipping placeholder row selection (key: {row_key_str})")
+                # Skip the placeholder row
+                if comment is None:
+                    logger.debug(f"Skipping placeholder row selection (key: {event.row_key})")
                     return
 
-                # Get the comment index from the row key
-                comment_idx = int(row_key_str)
-
-                if 0 <= comment_idx < len(self.current_comments):
-                    comment = self.current_comments[comment_idx]
-                    self.selected_comment = comment
-
-                    # Format the comment for display
-                    user_email = comment.user_email or "Unknown"
-                    created_time = comment.created_at or "Unknown"
-                    if created_time != "Unknown":
-                        try:
-                            from datetime import datetime
-
-                            dt = datetime.fromisoformat(created_time.replace("Z", "+00:00"))
-                            created_time = dt.strftime("%Y-%m-%d %H:%M:%S")
-                        except Exception:
-                            pass
-
-                    raw_text = comment.raw_text or "No comment text"
-
-                    # Update the comment detail view
-                    comment_detail = self.query_one("#support-ticket-comment-detail", Static)
-                    detail_text = f"[bold]User:[/bold] {user_email}\n"
-                    detail_text += f"[bold]Time:[/bold] {created_time}\n\n"
-                    detail_text += f"{raw_text}"
-                    comment_detail.update(detail_text)
+                self.selected_comment = comment
 
-                    # Enable the update comment button
+                # Format the comment for display
+                user_email = comment.user_email or "Unknown"
+                created_time = comment.created_at or "Unknown"
+                if created_time != "Unknown":
                     try:
-                        update_comment_btn = self.query_one("#update-comment-btn", Button)
-                        update_comment_btn.disabled = False
+                        dt = datetime.fromisoformat(created_time.replace("Z", "+00:00"))
+                        created_time = dt.strftime("%Y-%m-%d %H:%M:%S")
                     except Exception:
                         pass
 
-                    logger.debug(f"Updated comment detail view for comment {comment_idx}")
+                raw_text = comment.raw_text or "No comment text"
+
+                # Update the comment detail view
+                comment_detail = self.query_one("#support-ticket-comment-detail", Static)
+                detail_text = f"[bold]User:[/bold] {user_email}\n"
+                detail_text += f"[bold]Time:[/bold] {created_time}\n\n"
+                detail_text += f"{raw_text}"
+                comment_detail.update(detail_text)
+
+                # Enable the update comment button
+                try:
+                    update_comment_btn = self.query_one("#update-comment-btn", Button)
+                    update_comment_btn.disabled = False
+                except Exception:
+                    pass
+
+                logger.debug(f"Updated comment detail view for comment {comment.id}")
             except Exception as e:
                 logger.error(f"Failed to display comment: {e}")
                 import traceback
@@ -898,8 +893,7 @@ class SupportTicketManagementTabPane(TabPane):
             # Get the selected ticket ID from the row key
             ticket_id = str(event.row_key.value)
 
-            # Find the ticket in our list
-            selected_ticket = next((t for t in self.tickets if t.id == ticket_id), None)
+            selected_ticket = self.tickets_model.get(ticket_id)
 
             if selected_ticket:
                 self.selected_ticket = selected_ticket
@@ -0,0 +1,473 @@
+# Copyright (C) 2025 Vantage Compute Corporation
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/>.
+"""Dependency tracking and concurrent execution of workers.
+
+A ``Worker`` is a named unit of work with a list of workers it depends on.
+``DependencyTracker`` validates the graph and ``execute()`` runs it as an
+async DAG scheduler: every worker starts as soon as its dependencies have
+completed, up to ``max_concurrency`` at a time. A failed worker's
+dependents (transitively) are skipped while independent branches carry
+on; workers can be retried automatically, the whole run can be cancelled,
+and ``retry_failed()`` re-runs only what did not complete.
+
+The module has no UI dependencies, so app deployments (MicroK8s Helm
+charts, Juju bundle steps, cloud provisioning) use the same scheduler as
+the dashboard.
+"""
+
+import asyncio
+import inspect
+import logging
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+class WorkerState(Enum):
+    """Enum for worker states."""
+
+    INIT = "init"
+    READY = "ready"
+    IN_PROGRESS = "in-progress"
+    COMPLETE = "complete"
+    FAILED = "failed"
+    SKIPPED = "skipped"
+    CANCELLED = "cancelled"
+
+
+FINISHED_STATES = frozenset(
+    {WorkerState.COMPLETE, WorkerState.FAILED, WorkerState.SKIPPED, WorkerState.CANCELLED}
+)
+
+
+@dataclass
+class Worker:
+    """Worker class with dependency tracking.
+
+    ``worker_func`` is called with the worker ID on the event loop; if it
+    returns an awaitable (e.g. it is a coroutine function) that is awaited.
+    Blocking functions should be wrapped with ``asyncio.to_thread``.
+
+    Attributes:
+        retries: How many times to re-run the worker after it raises
+        retry_delay: Seconds before the first retry; doubles for each further retry
+        progress: Fraction (0-1) reported through ``DependencyTracker.report_progress``
+        message: Latest progress or retry message
+    """
+
+    id: str
+    worker_func: Callable
+    state: WorkerState = WorkerState.INIT
+    depends_on: Optional[List[str]] = field(default_factory=list)
+    result: Optional[Any] = None
+    error: Optional[str] = None
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    retries: int = 0
+    retry_delay: float = 1.0
+    attempts: int = 0
+    progress: float = 0.0
+    message: Optional[str] = None
+    exception: Optional[BaseException] = field(default=None, repr=False)
+
+    def __post_init__(self):
+        """Convert depends_on to empty list if None."""
+        if self.depends_on is None:
+            self.depends_on = []
+
+    def can_start(self, completed_workers: Set[str]) -> bool:
+        """Check if this worker can start based on dependencies."""
+        if self.state != WorkerState.INIT:
+            return False
+
+        # Check if all dependencies are completed
+        if self.depends_on:
+            for dep in self.depends_on:
+                if dep not in completed_workers:
+                    return False
+
+        return True
+
+    @property
+    def duration(self) -> Optional[float]:
+        """Seconds the worker ran for, or None if it has not finished."""
+        if self.started_at is None or self.finished_at is None:
+            return None
+        return self.finished_at - self.started_at
+
+    @property
+    def is_finished(self) -> bool:
+        """True once the worker completed, failed, was skipped or was cancelled."""
+        return self.state in FINISHED_STATES
+
+    def mark_ready(self):
+        """Mark worker as ready to run."""
+        self.state = WorkerState.READY
+
+    def mark_in_progress(self):
+        """Mark worker as in progress."""
+        self.state = WorkerState.IN_PROGRESS
+
+    def mark_complete(self, result: Any = None):
+        """Mark worker as complete."""
+        self.state = WorkerState.COMPLETE
+        self.result = result
+        self.progress = 1.0
+
+    def mark_failed(self, error: str):
+        """Mark worker as failed."""
+        self.state = WorkerState.FAILED
+        self.error = error
+
+    def mark_skipped(self, reason: str):
+        """Mark worker as skipped because a dependency did not complete."""
+        self.state = WorkerState.SKIPPED
+        self.error = reason
+
+    def mark_cancelled(self):
+        """Mark worker as cancelled."""
+        self.state = WorkerState.CANCELLED
+
+    def reset(self):
+        """Return the worker to its initial state so it can run again."""
+        self.state = WorkerState.INIT
+        self.result = None
+        self.error = None
+        self.exception = None
+        self.started_at = None
+        self.finished_at = None
+        self.attempts = 0
+        self.progress = 0.0
+        self.message = None
+
+
+WorkerCallback = Callable[[Worker], None]
+
+
+class DependencyTracker:
+    """Manages workers with dependencies and execution order.
+
+    Args:
+        workers: Workers to run; dependencies on unknown workers are dropped
+        max_concurrency: Upper bound on workers running at once (None for no limit)
+        on_update: Called with a worker whenever its state or progress changes
+    """
+
+    def __init__(
+        self,
+        workers: List[Worker],
+        max_concurrency: Optional[int] = None,
+        on_update: Optional[WorkerCallback] = None,
+    ):
+        self.workers: Dict[str, Worker] = {w.id: w for w in workers}
+        self.completed_workers: Set[str] = set()
+        self.failed_workers: Set[str] = set()
+        self.max_concurrency = max_concurrency
+        self.on_update = on_update
+        self._running: Dict["asyncio.Task[Any]", Worker] = {}
+        self._cancelled = False
+        self.validate_dependencies()
+
+    def validate_dependencies(self):
+        """Validate that all dependencies exist and there are no cycles."""
+        # Check that all dependencies exist and remove invalid ones
+        for worker in self.workers.values():
+            if worker.depends_on:
+                valid_deps = []
+                for dep in worker.depends_on:
+                    if dep not in self.workers:
+                        logger.warning(
+                            f"Worker '{worker.id}' depends on non-existent worker '{dep}'. "
+                            f"This dependency will be ignored. Available workers: {list(self.workers.keys())}"
+                        )
+                    else:
+                        valid_deps.append(dep)
+                # Update worker with only valid dependencies
+                worker.depends_on = valid_deps
+
+        # Check for circular dependencies using DFS
+        def has_cycle(worker_id: str, visited: Set[str], rec_stack: Set[str]) -> bool:
+            if worker_id in rec_stack:
+                return True
+            if worker_id in visited:
+                return False
+
+            visited.add(worker_id)
+            rec_stack.add(worker_id)
+
+            worker_depends = self.workers[worker_id].depends_on
+            if worker_depends:
+                for dep in worker_depends:
+                    if has_cycle(dep, visited, rec_stack):
+                        return True
+
+            rec_stack.remove(worker_id)
+            return False
+
+        visited = set()
+        for worker_id in self.workers:
+            if worker_id not in visited:
+                if has_cycle(worker_id, visited, set()):
+                    raise ValueError(
+                        f"Circular dependency detected involving worker '{worker_id}'"
+                    )
+
+    def get_ready_workers(self) -> List[Worker]:
+        """Get workers that are ready to run (dependencies satisfied)."""
+        ready = []
+        for worker in self.workers.values():
+            if worker.can_start(self.completed_workers):
+                worker.mark_ready()
+                ready.append(worker)
+        return ready
+
+    def mark_worker_complete(self, worker_id: str, result: Any = None):
+        """Mark a worker as complete and update tracking."""
+        if worker_id in self.workers:
+            self.workers[worker_id].mark_complete(result)
+            self.completed_workers.add(worker_id)
+
+    def mark_worker_failed(self, worker_id: str, error: str):
+        """Mark a worker as failed and update tracking."""
+        if worker_id in self.workers:
+            self.workers[worker_id].mark_failed(error)
+            self.failed_workers.add(worker_id)
+
+    @property
+    def results(self) -> Dict[str, Any]:
+        """Results of the completed workers, by worker ID."""
+        return {worker_id: self.workers[worker_id].result for worker_id in self.completed_workers}
+
+    async def execute(self, fail_fast: bool = False) -> bool:
+        """Run all workers, each as soon as its dependencies are complete.
+
+        Independent workers run concurrently, up to ``max_concurrency`` at a
+        time. When a worker fails (after its retries), every worker that
+        depends on it, directly or not, is skipped; unrelated workers keep
+        running unless ``fail_fast`` is set, in which case running workers
+        are cancelled and nothing else starts. Workers that are already
+        complete are not run again, so calling ``execute()`` after
+        :meth:`retry_failed` only re-runs what did not complete.
+
+        Args:
+            fail_fast: Cancel everything as soon as one worker fails
+
+        Returns:
+            True if every worker completed
+        """
+        self._cancelled = False
+        try:
+            while True:
+                if not self._cancelled:
+                    self._start_ready_workers()
+                if not self._running:
+                    break
+
+                done, _ = await asyncio.wait(self._running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    worker = self._running.pop(task)
+                    self._finish(worker, task)
+                    if worker.state == WorkerState.FAILED and fail_fast:
+                        self.cancel()
+        finally:
+            for task in self._running:
+                task.cancel()
+            if self._running:
+                await asyncio.gather(*self._running, return_exceptions=True)
+                for worker in self._running.values():
+                    worker.finished_at = time.monotonic()
+                    self._set_state(worker, worker.mark_cancelled)
+                self._running.clear()
+
+        if self._cancelled:
+            for worker in self.workers.values():
+                if worker.state in (WorkerState.INIT, WorkerState.READY):
+                    self._set_state(worker, worker.mark_cancelled)
+        return self.is_complete()
+
+    def cancel(self) -> None:
+        """Stop the running ``execute()``: cancel running workers and start no more."""
+        self._cancelled = True
+        for task in self._running:
+            task.cancel()
+
+    def retry_failed(self) -> List[str]:
+        """Reset failed, skipped and cancelled workers so the next ``execute()`` runs them.
+
+        Returns:
+            IDs of the workers that were reset
+        """
+        reset = []
+        for worker in self.workers.values():
+            if worker.state not in (WorkerState.INIT, WorkerState.COMPLETE):
+                worker.reset()
+                reset.append(worker.id)
+        self.failed_workers.clear()
+        return reset
+
+    def report_progress(
+        self, worker_id: str, fraction: float, message: Optional[str] = None
+    ) -> None:
+        """Record how far a running worker has got; called from within the worker."""
+        worker = self.workers[worker_id]
+        worker.progress = min(max(fraction, 0.0), 1.0)
+        if message is not None:
+            worker.message = message
+        self._notify(worker)
+
+    def progress(self) -> float:
+        """Return the overall fraction of work done, counting finished workers as whole."""
+        if not self.workers:
+            return 1.0
+        done = sum(1.0 if w.is_finished else w.progress for w in self.workers.values())
+        return done / len(self.workers)
+
+    def raise_first_failure(self) -> None:
+        """Re-raise the exception of the worker that failed first, if any."""
+        for worker in sorted(self.get_failed_workers(), key=lambda w: w.finished_at or 0.0):
+            if worker.exception is not None:
+                raise worker.exception
+
+    def _start_ready_workers(self) -> None:
+        """Start ready workers while below the concurrency limit."""
+        self.get_ready_workers()
+        for worker in self.workers.values():
+            if self.max_concurrency is not None and len(self._running) >= self.max_concurrency:
+                return
+            if worker.state == WorkerState.READY:
+                worker.started_at = time.monotonic()
+                self._set_state(worker, worker.mark_in_progress)
+                self._running[asyncio.create_task(self._run_worker(worker))] = worker
+
+    def _finish(self, worker: Worker, task: "asyncio.Task[Any]") -> None:
+        """Record the outcome of a finished worker task."""
+        worker.finished_at = time.monotonic()
+        if task.cancelled():
+            self._set_state(worker, worker.mark_cancelled)
+            return
+        error = task.exception()
+        if error is None:
+            self.completed_workers.add(worker.id)
+            self._set_state(worker, worker.mark_complete, task.result())
+            return
+
+        worker.exception = error
+        self.failed_workers.add(worker.id)
+        self._set_state(worker, worker.mark_failed, str(error) or type(error).__name__)
+        logger.debug(f"Worker '{worker.id}' failed: {worker.error}")
+        self._skip_dependents(worker.id)
+
+    def _skip_dependents(self, worker_id: str) -> None:
+        """Skip every worker that depends, directly or not, on ``worker_id``."""
+        pending = [worker_id]
+        while pending:
+            failed = pending.pop()
+            for worker in self.workers.values():
+                if failed in (worker.depends_on or []) and worker.state in (
+                    WorkerState.INIT,
+                    WorkerState.READY,
+                ):
+                    self._set_state(
+                        worker, worker.mark_skipped, f"dependency '{failed}' did not complete"
+                    )
+                    pending.append(worker.id)
+
+    def _set_state(self, worker: Worker, mark: Callable[..., None], *args: Any) -> None:
+        """Apply a state transition and notify ``on_update``."""
+        mark(*args)
+        self._notify(worker)
+
+    def _notify(self, worker: Worker) -> None:
+        """Pass a changed worker to ``on_update``."""
+        if self.on_update is not None:
+            self.on_update(worker)
+
+    async def _run_worker(self, worker: Worker) -> Any:
+        """Run the worker function, retrying with exponential backoff if it raises."""
+        while True:
+            worker.attempts += 1
+            try:
+                return await self._call(worker)
+            except Exception as exc:
+                if worker.attempts > worker.retries:
+                    raise
+                delay = worker.retry_delay * 2 ** (worker.attempts - 1)
+                worker.message = f"Attempt {worker.attempts} failed ({exc}); retrying"
+                logger.debug(f"Worker '{worker.id}': {worker.message} in {delay:.1f}s")
+                self._notify(worker)
+                await asyncio.sleep(delay)
+
+    @staticmethod
+    async def _call(worker: Worker) -> Any:
+        """Call the worker function, awaiting its result if it is awaitable."""
+        result = worker.worker_func(worker.id)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    def get_execution_order(self) -> List[List[str]]:
+        """Get the execution order as layers (workers that can run in parallel)."""
+        layers = []
+        remaining = set(self.workers.keys())
+        completed = set()
+
+        while remaining:
+            # Find workers that can run now
+            current_layer = []
+            for worker_id in remaining.copy():
+                worker = self.workers[worker_id]
+                if worker.depends_on is None or all(dep in completed for dep in worker.depends_on):
+                    current_layer.append(worker_id)
+                    remaining.remove(worker_id)
+
+            if not current_layer:
+                # No progress possible - circular dependency or other issue
+                raise ValueError(f"Cannot resolve dependencies for remaining workers: {remaining}")
+
+            layers.append(current_layer)
+            completed.update(current_layer)
+
+        return layers
+
+    def get_status_summary(self) -> Dict[str, int]:
+        """Get a summary of worker states."""
+        summary = {state.value: 0 for state in WorkerState}
+        for worker in self.workers.values():
+            summary[worker.state.value] += 1
+        return summary
+
+    def is_complete(self) -> bool:
+        """Check if all workers are complete."""
+        return len(self.completed_workers) == len(self.workers)
+
+    def has_failures(self) -> bool:
+        """Check if any workers have failed."""
+        return len(self.failed_workers) > 0
+
+    def get_failed_workers(self) -> List[Worker]:
+        """Get list of failed workers."""
+        return [w for w in self.workers.values() if w.state == WorkerState.FAILED]
+
+    def get_blocked_workers(self) -> List[Worker]:
+        """Get workers that were skipped or are blocked by failed dependencies."""
+        blocked = []
+        for worker in self.workers.values():
+            if worker.state == WorkerState.SKIPPED:
+                blocked.append(worker)
+            elif worker.state == WorkerState.INIT and worker.depends_on:
+                # Check if any dependency failed
+                if any(dep in self.failed_workers for dep in worker.depends_on):
+                    blocked.append(worker)
+        return blocked
@@ -15,12 +15,13 @@ This module provides a robust, production-ready GraphQL client with comprehensiv
 features including authentication, retry logic, error handling, and observability.
 """
 
+import asyncio
 import logging
 import time
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple, Union
 
 from gql import Client, GraphQLRequest
 from gql import gql as gql_query
@@ -30,17 +31,18 @@ from gql.transport.exceptions import (
     TransportConnectionFailed,
     TransportServerError,
 )
-from graphql import DocumentNode
+from graphql import DocumentNode, GraphQLSchema
 from graphql.language.ast import OperationDefinitionNode
-from jose import exceptions as jwt_exceptions
-from jose import jwt
 from requests.exceptions import ConnectionError, Timeout
 
-from .auth import extract_persona, refresh_access_token_standalone
-from .cache import load_tokens_from_cache, save_tokens_to_cache
+from . import register_async_shutdown_hook
+from .auth import extract_persona, get_token_refresher, is_token_expired
+from .cache import load_tokens_from_cache
 from .config import Settings
 from .exceptions import VantageCliError
+from .gql_schema_cache import load_cached_schema, save_schema_to_cache
 from .schemas import Persona
+from .token_claims import TokenDecodeError, is_token_claims_expired
 
 logger = logging.getLogger(__name__)
 
@@ -83,6 +85,7 @@ class GraphQLClientConfig:
     url: str
     timeout: int = 30
     verify_ssl: bool = True
+    keep_alive: bool = False  # Hold one connected session open across queries
 
     # Retry settings
     max_retries: int = 3
@@ -104,6 +107,79 @@ class GraphQLClientConfig:
     transport_type: TransportType = TransportType.AIOHTTP
 
 
+class GraphQLDataLoader:
+    """Coalesce individual key lookups into batched requests.
+
+    Every ``load()`` issued during the same event-loop tick is collected and
+    handed to ``batch_load_fn`` in one call once the tick ends, in the style of
+    DataLoader. Duplicate keys within a batch share one result. Results are not
+    cached across batches, so later loads always see fresh data.
+
+    Example:
+        >>> loader = GraphQLDataLoader(fetch_clusters_by_name)
+        >>> a, b = await asyncio.gather(loader.load("a"), loader.load("b"))  # one request
+    """
+
+    def __init__(
+        self,
+        batch_load_fn: Callable[[List[Hashable]], Awaitable[List[Any]]],
+        max_batch_size: int = 50,
+    ):
+        """Initialize the loader.
+
+        Args:
+            batch_load_fn: Coroutine function returning one result per key, in key order
+            max_batch_size: Maximum number of keys handed to a single batch call
+        """
+        self.batch_load_fn = batch_load_fn
+        self.max_batch_size = max_batch_size
+        self._pending: Dict[Hashable, "asyncio.Future[Any]"] = {}
+
+    def load(self, key: Hashable) -> "asyncio.Future[Any]":
+        """Schedule a key for the current batch and return a future for its result."""
+        future = self._pending.get(key)
+        if future is not None:
+            return future
+
+        loop = asyncio.get_running_loop()
+        if not self._pending:
+            loop.call_soon(self._dispatch)
+        future = loop.create_future()
+        self._pending[key] = future
+        return future
+
+    async def load_many(self, keys: List[Hashable]) -> List[Any]:
+        """Load several keys in as few batches as possible."""
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def _dispatch(self) -> None:
+        """Send the keys collected during this tick, split into bounded batches."""
+        pending, self._pending = self._pending, {}
+        items = list(pending.items())
+        for start in range(0, len(items), self.max_batch_size):
+            asyncio.ensure_future(self._run_batch(items[start : start + self.max_batch_size]))
+
+    async def _run_batch(self, items: List[Tuple[Hashable, "asyncio.Future[Any]"]]) -> None:
+        keys = [key for key, _ in items]
+        try:
+            results = await self.batch_load_fn(keys)
+            if len(results) != len(keys):
+                raise GraphQLError(
+                    f"Batch load returned {len(results)} results for {len(keys)} keys"
+                )
+        except BaseException as error:
+            for _, future in items:
+                if not future.done():
+                    future.set_exception(error)
+            if not isinstance(error, Exception):
+                raise
+            return
+
+        for (_, future), result in zip(items, results):
+            if not future.done():
+                future.set_result(result)
+
+
 @dataclass
 class QueryMetrics:
     """Metrics for a GraphQL query execution."""
@@ -142,7 +218,11 @@ class VantageGraphQLClient:
         self._client: Optional[Client] = None
         self._transport = None
         self._schema = None
+        self._session: Optional[Any] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._session_lock: Optional[asyncio.Lock] = None
         self._query_metrics: List[QueryMetrics] = []
+        self._loaders: Dict[str, GraphQLDataLoader] = {}
 
         # Setup logging
         if config.enable_logging:
@@ -206,20 +286,15 @@ class VantageGraphQLClient:
             return True
 
         try:
-            # Decode without verification to check expiration
-            jwt.decode(
-                self.persona.token_set.access_token,
-                key="",  # Empty key since we're not verifying signature
-                options={"verify_signature": False, "verify_exp": True},
-            )
-            return False
-        except jwt_exceptions.ExpiredSignatureError:
-            return True
-        except jwt_exceptions.JWTError:
+            # Uses the process-wide decoded claims cache
+            return is_token_claims_expired(self.persona.token_set.access_token)
+        except TokenDecodeError:
             logger.warning("Invalid token format")
             return True
 
-    async def _refresh_token_async(self, settings: Settings) -> bool:
+    async def _refresh_token_async(
+        self, settings: Settings, failed_token: Optional[str] = None
+    ) -> bool:
         """Refresh the access token using the refresh token asynchronously.
 
         Returns True if refresh was successful, False otherwise.
@@ -230,13 +305,12 @@ class VantageGraphQLClient:
             return False
 
         try:
-            # Use the existing sync refresh function in an async wrapper
-            # This is safe since the function doesn't block the event loop for long
-            refresh_success = refresh_access_token_standalone(self.persona.token_set, settings)
+            # Concurrent 401s for this profile share a single refresh request
+            refresh_success = await get_token_refresher(self.profile).refresh(
+                self.persona.token_set, settings, failed_token=failed_token
+            )
 
             if refresh_success:
-                # Save updated tokens to cache
-                save_tokens_to_cache(self.profile, self.persona.token_set)
                 logger.debug("Successfully refreshed access token")
                 return True
             else:
@@ -247,8 +321,23 @@ class VantageGraphQLClient:
             logger.error(f"Failed to refresh token asynchronously: {e}")
             return False
 
+    async def _ensure_fresh_token(self) -> None:
+        """Refresh the access token ahead of its expiry, if it can be refreshed."""
+        if not self.settings or not self.persona or not self.persona.token_set.refresh_token:
+            return
+        try:
+            await get_token_refresher(self.profile).ensure_fresh(
+                self.persona.token_set, self.settings
+            )
+        except Exception as e:
+            logger.debug(f"Proactive token refresh failed: {e}")
+
     def _refresh_transport_headers(self) -> None:
         """Update transport with refreshed token by recreating it."""
+        if self._session is not None:
+            # Persistent sessions send the Authorization header per request
+            # (see _request_extra_args), so the live transport is kept.
+            return
         if self.persona and self.persona.token_set.access_token:
             # Recreate transport with updated token. Some tests monkeypatch
             # _create_transport to return a sentinel transport; honor that
@@ -342,21 +431,105 @@ class VantageGraphQLClient:
         else:
             raise GraphQLError(f"Transport error during {query_name}: {error}")
 
+    def _build_gql_client(self) -> Client:
+        """Create the gql Client, seeding it from the on-disk schema cache.
+
+        A cached schema enables local query validation without an
+        introspection round-trip; on a cache miss the schema is fetched from
+        the transport (if enabled) and persisted by ``_store_fetched_schema``.
+        """
+        if self.config.fetch_schema or self.config.validate_queries:
+            schema = load_cached_schema(self.config.url)
+            if schema is not None:
+                return Client(transport=self._transport, schema=schema)
+
+        return Client(
+            transport=self._transport, fetch_schema_from_transport=self.config.fetch_schema
+        )
+
+    def _store_fetched_schema(self, client: Client) -> None:
+        """Persist a schema that was just introspected from the server."""
+        if client.introspection is None:
+            return
+        try:
+            save_schema_to_cache(self.config.url, dict(client.introspection))
+        except OSError as e:
+            logger.debug(f"Could not write GraphQL schema cache: {e}")
+
+    def _request_extra_args(self) -> Dict[str, Any]:
+        """Per-request aiohttp arguments carrying the current access token."""
+        if self.persona and self.persona.token_set.access_token:
+            return {"headers": {"Authorization": f"Bearer {self.persona.token_set.access_token}"}}
+        return {}
+
+    async def _get_persistent_session(self):
+        """Return the connected keep-alive session, connecting on first use.
+
+        aiohttp sessions are bound to the event loop that created them. Each CLI
+        command runs in its own ``asyncio.run`` loop, so a session left over from
+        a previous (now closed) loop is discarded and a new one is connected.
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is not None and self._session_loop is loop:
+            return self._session
+
+        if self._session_lock is None or self._session_loop is not loop:
+            self._session = None
+            self._client = None
+            self._transport = None
+            self._session_lock = asyncio.Lock()
+            self._session_loop = loop
+
+        async with self._session_lock:
+            if self._session is None:
+                self._create_transport()
+                self._client = self._build_gql_client()
+                self._session = await self._client.connect_async()
+                self._store_fetched_schema(self._client)
+                logger.debug(f"Opened persistent GraphQL session to {self.config.url}")
+
+        return self._session
+
+    async def close(self) -> None:
+        """Close the persistent session, if one is open on the running loop."""
+        session_client = self._client
+        same_loop = False
+        try:
+            same_loop = self._session_loop is asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+
+        if self._session is not None and session_client is not None and same_loop:
+            try:
+                await session_client.close_async()
+                logger.debug(f"Closed persistent GraphQL session to {self.config.url}")
+            except Exception as e:
+                logger.debug(f"Error closing GraphQL session: {e}")
+
+        self._session = None
+        self._client = None
+        self._transport = None
+        self._session_lock = None
+        self._session_loop = None
+
     @asynccontextmanager
     async def _async_session(self):
         """Context manager for asynchronous GraphQL sessions."""
+        if self.config.keep_alive:
+            yield await self._get_persistent_session()
+            return
+
         if not self._transport:
             created = self._create_transport()
             # Support tests that monkeypatch _create_transport to return a transport
             if self._transport is None and created is not None:  # pragma: no cover
                 self._transport = created  # type: ignore[assignment]
 
-        client = Client(
-            transport=self._transport, fetch_schema_from_transport=self.config.fetch_schema
-        )
+        client = self._build_gql_client()
 
         try:
             async with client as session:
+                self._store_fetched_schema(client)
                 yield session
         finally:
             # Transport cleanup is handled by the context manager
@@ -380,6 +553,7 @@ class VantageGraphQLClient:
             AuthenticationError: For authentication issues
         """
         if require_auth:
+            await self._ensure_fresh_token()
             self._validate_auth()
 
         query_name = self._extract_query_name(query)
@@ -390,12 +564,15 @@ class VantageGraphQLClient:
         while retry_count <= max_auth_retries:
             try:
                 parsed_query = gql_query(query)
+                sent_token = self.persona.token_set.access_token if self.persona else None
 
                 async with self._async_session() as session:
                     # Use the new GraphQLRequest API to avoid deprecation warning
                     if GraphQLRequest is not None:
                         request = GraphQLRequest(parsed_query, variable_values=variables or {})
-                        result = await session.execute(request)
+                        result = await session.execute(
+                            request, extra_args=self._request_extra_args()
+                        )
                     else:
                         # Fallback for older versions
                         result = await session.execute(
@@ -432,7 +609,9 @@ class VantageGraphQLClient:
                     )
 
                     # Try to refresh the token
-                    refresh_success = await self._refresh_token_async(self.settings)
+                    refresh_success = await self._refresh_token_async(
+                        self.settings, failed_token=sent_token
+                    )
 
                     if refresh_success:
                         # Update transport with new token
@@ -465,17 +644,116 @@ class VantageGraphQLClient:
         # This should never be reached due to the retry loop and error handling
         raise GraphQLError(f"Unexpected end of execution for {query_name}")
 
+    async def execute_aliased(
+        self,
+        field_name: str,
+        selection: str,
+        variable_types: Dict[str, str],
+        arguments: List[Dict[str, Any]],
+        operation_name: str = "BatchedQuery",
+    ) -> List[Any]:
+        """Query the same field once per argument set in a single aliased request.
+
+        Args:
+            field_name: Top-level query field (e.g. "clusters")
+            selection: Selection set for the field, including braces
+            variable_types: GraphQL type per argument (e.g. {"filters": "JSONScalar"})
+            arguments: Argument values for each alias
+            operation_name: Name of the generated operation
+
+        Returns:
+            The field result for each argument set, in order
+        """
+        if not arguments:
+            return []
+
+        definitions: List[str] = []
+        fields: List[str] = []
+        variables: Dict[str, Any] = {}
+        for index, values in enumerate(arguments):
+            field_args = []
+            for name, graphql_type in variable_types.items():
+                variable = f"{name}{index}"
+                definitions.append(f"${variable}: {graphql_type}")
+                field_args.append(f"{name}: ${variable}")
+                variables[variable] = values.get(name)
+            fields.append(f"r{index}: {field_name}({', '.join(field_args)}) {selection}")
+
+        query = (
+            f"query {operation_name}({', '.join(definitions)}) {{\n  "
+            + "\n  ".join(fields)
+            + "\n}"
+        )
+        data = await self.execute_async(query, variables)
+        return [data.get(f"r{index}") for index in range(len(arguments))]
+
+    def dataloader(
+        self,
+        name: str,
+        batch_load_fn: Callable[[List[Hashable]], Awaitable[List[Any]]],
+        max_batch_size: int = 50,
+    ) -> GraphQLDataLoader:
+        """Return the named batching loader for this client, creating it on first use.
+
+        Args:
+            name: Loader identifier, unique per kind of lookup
+            batch_load_fn: Coroutine function returning one result per key
+            max_batch_size: Maximum number of keys per batch request
+
+        Returns:
+            GraphQLDataLoader shared by all callers of this client
+        """
+        loader = self._loaders.get(name)
+        if loader is None:
+            loader = GraphQLDataLoader(batch_load_fn, max_batch_size=max_batch_size)
+            self._loaders[name] = loader
+        return loader
+
     async def get_schema(self) -> Optional[Any]:
-        """Get the GraphQL schema if available."""
+        """Get the GraphQL schema if available.
+
+        The on-disk cache is consulted first; the server is only introspected
+        when no fresh cached copy exists.
+        """
         if self.config.fetch_schema:
+            schema = load_cached_schema(self.config.url)
+            if schema is not None:
+                return schema
             try:
-                async with self._async_session() as session:
-                    # Access the client's schema, not session's
-                    return getattr(session, "schema", None)
+                return await self.refresh_schema()
             except Exception:
                 return None
         return None
 
+    async def refresh_schema(self) -> GraphQLSchema:
+        """Introspect the server and overwrite the cached schema for this endpoint.
+
+        Returns:
+            The freshly built GraphQL schema
+
+        Raises:
+            GraphQLError: If the introspection query fails
+        """
+        transport = AIOHTTPTransport(
+            url=self.config.url,
+            headers=self._build_headers(),
+            timeout=self.config.timeout,
+            ssl=self.config.verify_ssl,
+        )
+        client = Client(transport=transport, fetch_schema_from_transport=True)
+
+        try:
+            async with client:
+                pass
+        except Exception as error:
+            self._handle_transport_error(error, "IntrospectionQuery")
+
+        if client.introspection is None or client.schema is None:
+            raise GraphQLError(f"Introspection returned no schema for {self.config.url}")
+
+        save_schema_to_cache(self.config.url, dict(client.introspection))
+        return client.schema
+
     def get_metrics(self) -> List[QueryMetrics]:
         """Get query execution metrics."""
         return self._query_metrics.copy()
@@ -662,9 +940,13 @@ class VantageGQLClient:
         self.profile = profile
         self.base_path = base_path
 
-    def create(self) -> VantageGraphQLClient:
+    def create(self, keep_alive: bool = False) -> VantageGraphQLClient:
         """Create an async GraphQL client with the configured settings.
 
+        Args:
+            keep_alive: Keep one connected session open across queries. The
+                caller is responsible for awaiting ``client.close()``.
+
         Returns:
             Configured VantageGraphQLClient instance
 
@@ -690,6 +972,7 @@ class VantageGQLClient:
                 verify_ssl=True,
                 enable_logging=True,
                 log_queries=False,  # Security: don't log queries in production
+                keep_alive=keep_alive,
             )
 
             logger.debug(f"Created async GraphQL client for {graphql_url}")
@@ -700,11 +983,92 @@ class VantageGQLClient:
             raise
 
 
+class GraphQLClientPool:
+    """Process-wide registry of keep-alive GraphQL clients.
+
+    Clients are keyed by ``(profile, base_path)`` so every SDK talking to the
+    same endpoint with the same credentials shares one connected session (and
+    its TCP/TLS connection) for the lifetime of a CLI invocation or dashboard
+    session. The pool registers :meth:`close` as an async shutdown hook, so
+    sessions are released before the command's event loop is torn down.
+
+    Example:
+        >>> client = graphql_client_pool.get(settings, "default", "/sos/graphql")
+        >>> await client.execute_async(query, variables)
+        >>> await graphql_client_pool.close()
+    """
+
+    def __init__(self) -> None:
+        self._clients: Dict[Tuple[str, str], VantageGraphQLClient] = {}
+        self._retired: List[VantageGraphQLClient] = []
+
+    def get(
+        self,
+        settings: Settings,
+        profile: str = "default",
+        base_path: str = "/cluster/graphql",
+    ) -> VantageGraphQLClient:
+        """Return the shared client for a profile and endpoint, creating it if needed.
+
+        Args:
+            settings: Settings object containing API configuration
+            profile: Profile name to use for authentication
+            base_path: API endpoint path (e.g., "/cluster/graphql", "/sos/graphql")
+
+        Returns:
+            Shared VantageGraphQLClient instance
+        """
+        key = (profile, base_path)
+        graphql_url = f"{settings.get_apis_url()}{base_path}"
+        client = self._clients.get(key)
+
+        if client is not None and client.config.url != graphql_url:
+            # Profile settings changed (e.g. edited in the dashboard); the old
+            # session is closed together with the rest of the pool.
+            self._retired.append(self._clients.pop(key))
+            client = None
+
+        if client is None:
+            client = VantageGQLClient(settings, profile, base_path=base_path).create(
+                keep_alive=True
+            )
+            self._clients[key] = client
+            register_async_shutdown_hook(self.close)
+            return client
+
+        client.settings = settings
+        token_set = client.persona.token_set if client.persona else None
+        if token_set is None or is_token_expired(token_set.access_token):
+            # Long-lived sessions (dashboard) outlive the access token; reload
+            # it from the cache and refresh if needed, as create() would.
+            client.persona = extract_persona(profile, None, settings)
+
+        return client
+
+    async def close(self) -> None:
+        """Close every pooled session and empty the pool."""
+        clients = [*self._clients.values(), *self._retired]
+        self._clients.clear()
+        self._retired.clear()
+        for client in clients:
+            await client.close()
+
+
+# Global singleton instance
+graphql_client_pool = GraphQLClientPool()
+
+
+async def close_graphql_clients() -> None:
+    """Explicitly close all pooled GraphQL sessions."""
+    await graphql_client_pool.close()
+
+
 def create_async_graphql_client(settings: Settings, profile: str = "default"):
-    """Create an async GraphQL client for the cluster endpoint.
+    """Get the shared async GraphQL client for the cluster endpoint.
 
     This is a convenience function that maintains backward compatibility.
-    For new code, prefer using VantageGQLClient directly.
+    The returned client comes from :data:`graphql_client_pool`, so repeated
+    calls within a command reuse the same connection.
 
     Args:
         settings: Settings object containing API configuration
@@ -716,4 +1080,4 @@ def create_async_graphql_client(settings: Settings, profile: str = "default"):
     Raises:
         Exception: If client creation fails
     """
-    return VantageGQLClient(settings, profile, base_path="/cluster/graphql").create()
+    return graphql_client_pool.get(settings, profile, base_path="/cluster/graphql")
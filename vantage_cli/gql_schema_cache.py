@@ -0,0 +1,171 @@
+# Copyright (C) 2025 Vantage Compute Corporation
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/>.
+"""On-disk cache of GraphQL introspection results.
+
+Each endpoint's introspection result is stored as JSON under
+``~/.vantage-cli/schema_cache/`` together with the endpoint URL, the CLI
+version that fetched it, a content hash and a timestamp. An entry is ignored
+when it was written by a different CLI version or is older than
+``GRAPHQL_SCHEMA_CACHE_TTL_SECONDS``. Parsed schemas are memoized per process
+by the cache file's mtime and size, so a warm lookup is a single ``stat``
+and each cache file is read and built at most once.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from gql.utilities import build_client_schema
+from graphql import GraphQLSchema
+
+from vantage_cli import __version__
+from vantage_cli.constants import GRAPHQL_SCHEMA_CACHE_TTL_SECONDS, USER_SCHEMA_CACHE_DIR
+from vantage_cli.state_files import atomic_write_text
+
+logger = logging.getLogger(__name__)
+
+# Parsed schemas keyed by cache file path, with the file (mtime, size) they were
+# built from and the entry's fetch time
+_parsed_schemas: Dict[Path, Tuple[Tuple[int, int], float, GraphQLSchema]] = {}
+
+
+def schema_cache_path(url: str) -> Path:
+    """Return the cache file path for a GraphQL endpoint URL."""
+    digest = hashlib.sha256(url.encode("utf-8")).hexdigest()[:16]
+    return USER_SCHEMA_CACHE_DIR / f"{digest}.json"
+
+
+def _content_hash(introspection: Dict[str, Any]) -> str:
+    """Return a stable hash of an introspection result."""
+    payload = json.dumps(introspection, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def load_cached_introspection(
+    url: str, max_age: Optional[float] = GRAPHQL_SCHEMA_CACHE_TTL_SECONDS
+) -> Optional[Dict[str, Any]]:
+    """Load a cached introspection result for an endpoint if it is still valid.
+
+    Args:
+        url: GraphQL endpoint URL
+        max_age: Maximum entry age in seconds, or None to ignore the TTL
+
+    Returns:
+        The introspection result, or None if missing, stale or unreadable
+    """
+    entry = _load_entry(url, max_age)
+    return entry.get("introspection") if entry is not None else None
+
+
+def _load_entry(url: str, max_age: Optional[float]) -> Optional[Dict[str, Any]]:
+    """Read and validate the cache entry for an endpoint."""
+    path = schema_cache_path(url)
+    try:
+        entry = json.loads(path.read_text())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.debug(f"Ignoring unreadable schema cache {path}: {e}")
+        return None
+
+    if entry.get("url") != url or entry.get("cli_version") != __version__:
+        logger.debug(f"Schema cache for {url} was written by another CLI version")
+        return None
+
+    if _is_stale(entry.get("fetched_at", 0), max_age):
+        logger.debug(f"Schema cache for {url} is stale")
+        return None
+
+    return entry
+
+
+def _is_stale(fetched_at: float, max_age: Optional[float]) -> bool:
+    """Return True if an entry fetched at ``fetched_at`` is older than ``max_age``."""
+    return max_age is not None and time.time() - fetched_at > max_age
+
+
+def load_cached_schema(
+    url: str, max_age: Optional[float] = GRAPHQL_SCHEMA_CACHE_TTL_SECONDS
+) -> Optional[GraphQLSchema]:
+    """Return the cached client schema for an endpoint, building it at most once.
+
+    Args:
+        url: GraphQL endpoint URL
+        max_age: Maximum entry age in seconds, or None to ignore the TTL
+
+    Returns:
+        GraphQLSchema built from the cached introspection, or None
+    """
+    path = schema_cache_path(url)
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    file_key = (stat.st_mtime_ns, stat.st_size)
+
+    memoized = _parsed_schemas.get(path)
+    if memoized is not None and memoized[0] == file_key:
+        # Same file as last time: only the TTL can have changed
+        _, fetched_at, schema = memoized
+        return None if _is_stale(fetched_at, max_age) else schema
+
+    entry = _load_entry(url, max_age)
+    if entry is None or entry.get("introspection") is None:
+        return None
+
+    try:
+        schema = build_client_schema(entry["introspection"])
+    except Exception as e:
+        logger.debug(f"Cached schema for {url} could not be built: {e}")
+        return None
+
+    _parsed_schemas[path] = (file_key, entry.get("fetched_at", 0), schema)
+    return schema
+
+
+def save_schema_to_cache(url: str, introspection: Dict[str, Any]) -> Path:
+    """Persist an introspection result for an endpoint.
+
+    Args:
+        url: GraphQL endpoint URL
+        introspection: Introspection query result (``client.introspection``)
+
+    Returns:
+        Path of the written cache file
+    """
+    path = schema_cache_path(url)
+    entry = {
+        "url": url,
+        "cli_version": __version__,
+        "fetched_at": time.time(),
+        "content_hash": _content_hash(introspection),
+        "introspection": introspection,
+    }
+
+    # The cache can always be rebuilt, so it is written atomically but without fsync
+    atomic_write_text(path, json.dumps(entry), durable=False)
+    _parsed_schemas.pop(path, None)
+    logger.debug(f"Cached GraphQL schema for {url} at {path}")
+    return path
+
+
+def clear_schema_cache(url: Optional[str] = None) -> None:
+    """Remove the cached schema for one endpoint, or all cached schemas."""
+    paths = [schema_cache_path(url)] if url else list(USER_SCHEMA_CACHE_DIR.glob("*.json"))
+    for path in paths:
+        _parsed_schemas.pop(path, None)
+        path.unlink(missing_ok=True)
@@ -0,0 +1,139 @@
+# Copyright (C) 2025 Vantage Compute Corporation
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/>.
+"""Process-wide pool of keep-alive async HTTP clients for the REST SDKs."""
+
+import asyncio
+import importlib.util
+import logging
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+from vantage_cli import register_async_shutdown_hook
+from vantage_cli.constants import (
+    HTTP_DEFAULT_TIMEOUT_SECONDS,
+    HTTP_POOL_KEEPALIVE_EXPIRY_SECONDS,
+    HTTP_POOL_MAX_CONNECTIONS,
+    HTTP_POOL_MAX_KEEPALIVE_CONNECTIONS,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def http2_available() -> bool:
+    """Return True if the optional ``h2`` package needed for HTTP/2 is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+def _origin(url: str) -> str:
+    """Return the ``scheme://host[:port]`` part of a URL."""
+    parsed = httpx.URL(url)
+    port = f":{parsed.port}" if parsed.port else ""
+    return f"{parsed.scheme}://{parsed.host}{port}"
+
+
+class HttpClientPool:
+    """Process-wide registry of keep-alive ``httpx.AsyncClient`` instances.
+
+    Clients are keyed by the origin of the base URL, so every REST SDK and
+    JupyterHub call talking to the same host shares one connection pool (and
+    its TCP/TLS connections) for the lifetime of a CLI invocation or dashboard
+    session. HTTP/2 is negotiated when the ``h2`` package is installed. The
+    pool registers :meth:`close` as an async shutdown hook, so connections are
+    released before the command's event loop is torn down.
+
+    Example:
+        >>> client = http_client_pool.get("https://apis.vantagecompute.ai/jobbergate")
+        >>> response = await client.get(url, headers=headers)
+        >>> await http_client_pool.close()
+    """
+
+    def __init__(
+        self,
+        max_connections: int = HTTP_POOL_MAX_CONNECTIONS,
+        max_keepalive_connections: int = HTTP_POOL_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = HTTP_POOL_KEEPALIVE_EXPIRY_SECONDS,
+        http2: Optional[bool] = None,
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            max_connections: Maximum number of connections per client
+            max_keepalive_connections: Maximum number of idle connections kept open
+            keepalive_expiry: Seconds an idle connection is kept open
+            http2: Enable HTTP/2; defaults to whether ``h2`` is installed
+        """
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2_available() if http2 is None else http2
+        self._clients: Dict[
+            str, Tuple[httpx.AsyncClient, Optional[asyncio.AbstractEventLoop]]
+        ] = {}
+        self._retired: List[httpx.AsyncClient] = []
+
+    def get(self, base_url: str) -> httpx.AsyncClient:
+        """Return the shared client for a base URL, creating it if needed.
+
+        Args:
+            base_url: Any URL on the target host; only its origin is used as the key
+
+        Returns:
+            Shared httpx.AsyncClient instance
+        """
+        key = _origin(base_url)
+        try:
+            loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        entry = self._clients.get(key)
+        if entry is not None:
+            client, client_loop = entry
+            if not client.is_closed and (client_loop is None or client_loop is loop):
+                if client_loop is None and loop is not None:
+                    self._clients[key] = (client, loop)
+                return client
+            if not client.is_closed and client_loop is not None and not client_loop.is_closed():
+                # Connections belong to another running loop; close them with the pool
+                self._retired.append(client)
+
+        logger.debug(f"Creating pooled HTTP client for {key} (http2={self.http2})")
+        client = httpx.AsyncClient(
+            timeout=HTTP_DEFAULT_TIMEOUT_SECONDS, limits=self.limits, http2=self.http2
+        )
+        self._clients[key] = (client, loop)
+        register_async_shutdown_hook(self.close)
+        return client
+
+    async def close(self) -> None:
+        """Close every pooled client; later calls to :meth:`get` create new ones."""
+        clients = [client for client, _ in self._clients.values()] + self._retired
+        self._clients.clear()
+        self._retired.clear()
+
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.debug(f"Error closing pooled HTTP client: {e}")
+
+
+# Shared pool used by VantageRestApiClient and JupyterHubClient
+http_client_pool = HttpClientPool()
+
+
+async def close_http_clients() -> None:
+    """Explicitly close all pooled HTTP clients."""
+    await http_client_pool.close()
@@ -17,6 +17,7 @@ from typing import Any, Dict, Optional
 import httpx
 
 from vantage_cli.exceptions import Abort
+from vantage_cli.http_client_pool import http_client_pool
 
 logger = logging.getLogger(__name__)
 
@@ -34,7 +35,11 @@ class JupyterHubClient:
         self.hub_url = hub_url.rstrip("/")
         self.api_token = api_token
         self.api_base = f"{self.hub_url}/hub/api"
-        self.client = httpx.AsyncClient(timeout=30.0)
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared HTTP client for this JupyterHub host."""
+        return http_client_pool.get(self.hub_url)
 
     def _headers(self) -> Dict[str, str]:
         """Get request headers with authentication."""
@@ -207,5 +212,8 @@ class JupyterHubClient:
             return []
 
     async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """Release the client.
+
+        Connections stay in the shared pool so later calls to the same hub reuse
+        them; the pool closes them when the command's event loop shuts down.
+        """
@@ -19,36 +19,13 @@ import subprocess
 from typing import Optional
 
 import typer
-from jose import jwt
 from rich.console import Console
 from rich.panel import Panel
 
-from vantage_cli import AsyncTyper, __version__, maybe_run_async, setup_logging
+from vantage_cli import AsyncTyper, LazySubcommand, LazyTyperGroup, __version__, setup_logging
 from vantage_cli.auth import extract_persona, fetch_auth_tokens, is_token_expired
 from vantage_cli.cache import clear_token_cache, load_tokens_from_cache, with_cache
 from vantage_cli.client import attach_client
-from vantage_cli.commands.alias import (
-    apps_command,
-    clouds_command,
-    clusters_command,
-    federations_command,
-    networks_command,
-    notebooks_command,
-    profiles_command,
-    teams_command,
-)
-from vantage_cli.commands.app import app_app
-from vantage_cli.commands.cli_dash import cli_dash
-from vantage_cli.commands.cloud import cloud_app
-from vantage_cli.commands.cluster import cluster_app
-from vantage_cli.commands.config import config_app
-from vantage_cli.commands.job import job_app
-from vantage_cli.commands.license import license_app
-from vantage_cli.commands.network import network_app
-from vantage_cli.commands.notebook import notebook_app
-from vantage_cli.commands.profile import profile_app
-from vantage_cli.commands.storage import storage_app
-from vantage_cli.commands.support_ticket import support_ticket_app
 from vantage_cli.config import (
     attach_settings,
     ensure_default_profile_exists,
@@ -57,6 +34,7 @@ from vantage_cli.config import (
 from vantage_cli.exceptions import handle_abort
 from vantage_cli.render import UniversalOutputFormatter
 from vantage_cli.schemas import CliContext, Persona, TokenSet
+from vantage_cli.token_claims import decode_token_claims
 from vantage_cli.utils import get_dev_apps_gh_url
 
 from .constants import VANTAGE_CLI_DEV_APPS_DIR
@@ -69,8 +47,91 @@ logger = logging.getLogger(__name__)
 logging.getLogger("httpx").disabled = True
 logging.getLogger("httpcore").disabled = True
 
+
+class VantageGroup(LazyTyperGroup):
+    """Top-level command group; subcommands are imported only when invoked."""
+
+    lazy_subcommands = {
+        "app": LazySubcommand(
+            import_path="vantage_cli.commands.app:app_app", help="Manage applications"
+        ),
+        "cloud": LazySubcommand(
+            import_path="vantage_cli.commands.cloud:cloud_app",
+            help="Manage cloud provider configurations.",
+        ),
+        "cluster": LazySubcommand(
+            import_path="vantage_cli.commands.cluster:cluster_app",
+            help="Manage Vantage compute clusters for high-performance computing workloads.",
+        ),
+        "config": LazySubcommand(
+            import_path="vantage_cli.commands.config:config_app",
+            help="Manage Vantage CLI configuration and settings.",
+        ),
+        "job": LazySubcommand(
+            import_path="vantage_cli.commands.job:job_app",
+            help="Manage computational jobs, scripts, submissions, and job templates for HPC workloads.",
+        ),
+        "license": LazySubcommand(
+            import_path="vantage_cli.commands.license:license_app",
+            help="Manage software licenses, license servers, and licensing configurations.",
+        ),
+        "network": LazySubcommand(
+            import_path="vantage_cli.commands.network:network_app",
+            help="Manage virtual networks, subnets, and network configurations for cloud infrastructure.",
+        ),
+        "notebook": LazySubcommand(
+            import_path="vantage_cli.commands.notebook:notebook_app",
+            help="Manage Jupyter notebooks and computational notebooks for data science and research.",
+        ),
+        "profile": LazySubcommand(
+            import_path="vantage_cli.commands.profile:profile_app",
+            help="Manage Vantage CLI profiles to work with different environments and configurations.",
+        ),
+        "storage": LazySubcommand(
+            import_path="vantage_cli.commands.storage:storage_app",
+            help="Manage storage volumes, disks, and storage configurations for cloud infrastructure.",
+        ),
+        "support-ticket": LazySubcommand(
+            import_path="vantage_cli.commands.support_ticket:support_ticket_app",
+            help="Manage support tickets",
+        ),
+        # CLI Dashboard command
+        "cli-dash": LazySubcommand(
+            import_path="vantage_cli.commands.cli_dash:cli_dash",
+            help="Vantage CLI Dashboard - Interactive terminal dashboard.",
+        ),
+        # Alias commands
+        "apps": LazySubcommand(
+            import_path="vantage_cli.commands.alias.apps:apps_command", hidden=True
+        ),
+        "clouds": LazySubcommand(
+            import_path="vantage_cli.commands.alias.clouds:clouds_command", hidden=True
+        ),
+        "clusters": LazySubcommand(
+            import_path="vantage_cli.commands.alias.clusters:clusters_command", hidden=True
+        ),
+        "federations": LazySubcommand(
+            import_path="vantage_cli.commands.alias.federations:federations_command",
+            hidden=True,
+        ),
+        "networks": LazySubcommand(
+            import_path="vantage_cli.commands.alias.networks:networks_command", hidden=True
+        ),
+        "notebooks": LazySubcommand(
+            import_path="vantage_cli.commands.alias.notebooks:notebooks_command", hidden=True
+        ),
+        "profiles": LazySubcommand(
+            import_path="vantage_cli.commands.alias.profiles:profiles_command", hidden=True
+        ),
+        "teams": LazySubcommand(
+            import_path="vantage_cli.commands.alias.teams:teams_command", hidden=True
+        ),
+    }
+
+
 app = AsyncTyper(
     name="Vantage CLI",
+    cls=VantageGroup,
     add_completion=False,
     help="Vantage Compute Command Line Interface",
     no_args_is_help=True,
@@ -90,19 +151,6 @@ def version(ctx: typer.Context):
         typer.echo(__version__)
 
 
-app.add_typer(app_app, name="app")
-app.add_typer(cloud_app, name="cloud")
-app.add_typer(cluster_app, name="cluster")
-app.add_typer(config_app, name="config")
-app.add_typer(job_app, name="job")
-app.add_typer(license_app, name="license")
-app.add_typer(network_app, name="network")
-app.add_typer(notebook_app, name="notebook")
-app.add_typer(profile_app, name="profile")
-app.add_typer(storage_app, name="storage")
-app.add_typer(support_ticket_app, name="support-ticket")
-
-
 @app.callback(invoke_without_command=True)
 @handle_abort
 def main(ctx: typer.Context):
@@ -351,15 +399,7 @@ async def whoami(ctx: typer.Context):
 
         token_info = {}
         try:
-            token_data = jwt.decode(
-                persona.token_set.access_token,
-                "",  # Empty key is acceptable when verify_signature is False
-                options={
-                    "verify_signature": False,
-                    "verify_aud": False,
-                    "verify_exp": False,  # Don't verify expiration for display
-                },
-            )
+            token_data = decode_token_claims(persona.token_set.access_token)
 
             # Extract additional fields if available
             if "exp" in token_data:
@@ -429,19 +469,5 @@ async def whoami(ctx: typer.Context):
             console.print()
 
 
-# CLI Dashboard command
-app.command("cli-dash")(maybe_run_async(cli_dash))
-
-# Register alias commands
-app.command("apps", hidden=True)(apps_command)
-app.command("clouds", hidden=True)(clouds_command)
-app.command("clusters", hidden=True)(clusters_command)
-app.command("federations", hidden=True)(federations_command)
-app.command("networks", hidden=True)(networks_command)
-app.command("notebooks", hidden=True)(notebooks_command)
-app.command("profiles", hidden=True)(profiles_command)
-app.command("teams", hidden=True)(teams_command)
-
-
 if __name__ == "__main__":
     app()
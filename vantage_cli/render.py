@@ -14,233 +14,26 @@
 import json
 import shutil
 import time
-from contextlib import contextmanager
+from contextlib import contextmanager, nullcontext
+from itertools import chain, islice
 from types import TracebackType
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, ContextManager, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import snick
 from rich.console import Console
 from rich.live import Live
 from rich.panel import Panel
 from rich.progress import Progress, ProgressColumn, SpinnerColumn, Task, TextColumn
+from rich.segment import Segment, Segments
+from rich.style import Style
 from rich.table import Table
 from rich.text import Text
-from textual.app import App, ComposeResult
-from textual.binding import Binding
-from textual.widgets import DataTable, Footer, Header
 
+# Rows read from the start of a list to choose table columns and their widths
+TABLE_SAMPLE_ROWS = 100
 
-class TableViewerApp(App):
-    """Textual app for displaying data tables with auto-layout."""
-
-    BINDINGS = [
-        Binding("q", "quit", "Quit", priority=True),
-        Binding("escape", "quit", "Quit", priority=True),
-    ]
-
-    def __init__(self, data: List[Dict[str, Any]], title: str = "", **kwargs):
-        super().__init__(**kwargs)
-        self.data = data
-        self.title = title
-
-    def compose(self) -> ComposeResult:
-        """Create the table widget."""
-        if self.title:
-            yield Header(show_clock=False)
-
-        data_table = DataTable(show_cursor=False, zebra_stripes=True)
-        data_table.cursor_type = "none"
-        yield data_table
-
-        if self.title:
-            yield Footer()
-
-    def on_mount(self) -> None:
-        """Set up the table when the app mounts."""
-        if not self.data:
-            return
-
-        table = self.query_one(DataTable)
-
-        # Get all unique keys from all items
-        all_keys = set()
-        for item in self.data:
-            if isinstance(item, dict):
-                all_keys.update(item.keys())
-
-        # Sort keys with common fields first
-        common_fields = [
-            "id",
-            "name",
-            "title",
-            "description",
-            "status",
-            "created_at",
-            "updated_at",
-        ]
-        sorted_keys = []
-
-        for field in common_fields:
-            if field in all_keys:
-                sorted_keys.append(field)
-                all_keys.remove(field)
-
-        sorted_keys.extend(sorted(all_keys))
-
-        # Add columns
-        for key in sorted_keys:
-            header = self._format_column_header(key)
-            table.add_column(header, key=key)
-
-        # Add rows
-        for item in self.data:
-            row_data = []
-            for key in sorted_keys:
-                value = item.get(key, "")
-                formatted_value = self._format_cell_value(key, value)
-                row_data.append(formatted_value)
-            table.add_row(*row_data)
-
-        if self.title:
-            self.title = self.title
-
-    def _format_column_header(self, key: str) -> str:
-        """Format column header nicely."""
-        # Handle special cases first
-        special_cases = {
-            "id": "ID",
-            "url": "URL",
-            "api": "API",
-            "cpu": "CPU",
-            "gpu": "GPU",
-            "ram": "RAM",
-            "ssh": "SSH",
-            "uuid": "UUID",
-            "cidr": "CIDR",
-            "ip": "IP",
-        }
-
-        if key.lower() in special_cases:
-            return special_cases[key.lower()]
-
-        # Split on underscores and capitalize each word
-        words = key.split("_")
-        formatted_words = []
-        for word in words:
-            if word.lower() in special_cases:
-                formatted_words.append(special_cases[word.lower()])
-            else:
-                formatted_words.append(word.capitalize())
-
-        return " ".join(formatted_words)
-
-    def _format_cell_value(self, key: str, value: Any) -> str:
-        """Format a cell value for display."""
-        if value is None:
-            return "N/A"
-        elif value == "":
-            return "N/A"
-        elif isinstance(value, bool):
-            return "✓" if value else "✗"
-        elif isinstance(value, (list, dict)):
-            # For complex nested data, show a summary
-            if isinstance(value, list):
-                return f"[{len(value)} items]" if value else "[]"
-            else:
-                return f"[{len(value)} keys]" if value else "{}"
-        elif isinstance(value, str):
-            # Handle common formatting cases
-            if key.lower().endswith("_at") or "date" in key.lower():
-                # Try to format dates nicely, fallback to original
-                try:
-                    from datetime import datetime
-
-                    if "T" in value and value.endswith("Z"):
-                        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
-                        return dt.strftime("%Y-%m-%d")
-                    return value
-                except Exception:
-                    return value
-            elif key.lower() in ["status", "state"]:
-                return value.upper()
-            else:
-                # Truncate strings based on field-specific limits to prevent wrapping
-                max_length = self._get_field_max_length(key)
-                if len(value) > max_length:
-                    return value[: max_length - 3] + "..."
-                return value
-        else:
-            return str(value)
-
-    def _get_field_max_length(self, key: str) -> int:
-        """Get maximum character length for a field value."""
-        key_lower = key.lower()
-
-        if key_lower == "description":
-            return 50
-        elif key_lower in ["name", "title"]:
-            return 30
-        elif key_lower in ["email", "url"]:
-            return 35
-        elif key_lower == "id":
-            return 15
-        else:
-            return 25
-
-    def _render_static_table(
-        self, items: List[Dict[str, Any]], title: str, console: Console
-    ) -> None:
-        """Render a static table using Rich console (for non-interactive mode)."""
-        from rich.table import Table
-
-        if not items:
-            return
-
-        # Create Rich table for static rendering
-        table = Table(
-            title=title if title else None, show_header=True, header_style="bold magenta"
-        )
-
-        # Get all unique keys from all items
-        all_keys = set()
-        for item in items:
-            if isinstance(item, dict):
-                all_keys.update(item.keys())
-
-        # Sort keys with common fields first
-        common_fields = [
-            "id",
-            "name",
-            "title",
-            "description",
-            "status",
-            "created_at",
-            "updated_at",
-        ]
-        sorted_keys = []
-
-        for field in common_fields:
-            if field in all_keys:
-                sorted_keys.append(field)
-                all_keys.remove(field)
-
-        sorted_keys.extend(sorted(all_keys))
-
-        # Add columns (Textual will auto-size these)
-        for key in sorted_keys:
-            header = self._format_column_header(key)
-            table.add_column(header, no_wrap=True)
-
-        # Add rows
-        for item in items:
-            row_data = []
-            for key in sorted_keys:
-                value = item.get(key, "")
-                formatted_value = self._format_cell_value(key, value)
-                row_data.append(formatted_value)
-            table.add_row(*row_data)
-
-        console.print(table)
+# Rows rendered and printed at a time when streaming a list as a table
+TABLE_CHUNK_ROWS = 200
 
 
 class CommandTimeElapsedColumn(ProgressColumn):
@@ -1296,6 +1089,88 @@ class TerminalOutputManager:
                 self.console.print(message)
 
 
+def _chunked(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Yield lists of up to ``size`` consecutive items."""
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+class _TableRowWriter:
+    """Lay out further rows of a rendered list table without Rich's table layout.
+
+    Each cell is wrapped with ``Text.wrap`` using its column's width and
+    overflow, exactly as ``Table`` does, and the row is framed with the
+    table's borders. This skips the per-cell measuring and padding passes
+    that make large Rich tables slow.
+
+    Args:
+        box: The table's box, after substitution for the console
+        border_style: Style of the table borders
+        columns: Content width (excluding padding), overflow and no-wrap flag per column
+    """
+
+    def __init__(self, box: Any, border_style: Style, columns: List[Tuple[int, str, bool]]):
+        self.columns = columns
+        self.left = Segment(box.mid_left, border_style)
+        self.divider = Segment(box.mid_vertical, border_style)
+        self.right = Segment(box.mid_right, border_style)
+        self.padding = Segment(" ", Style())
+
+    @classmethod
+    def for_table(
+        cls, table: Table, console: Console, bottom_edge: List[Segment]
+    ) -> "_TableRowWriter":
+        """Recover the column widths Rich chose for ``table`` from its rendered bottom edge."""
+        box = table.box.substitute(console.options, safe=console.safe_box)
+        edge = "".join(segment.text for segment in bottom_edge).rstrip("\n")
+        widths = [len(part) - 2 for part in edge[1:-1].split(box.bottom_divider)]
+        columns = [
+            (width, column.overflow, bool(column.no_wrap))
+            for width, column in zip(widths, table.columns)
+        ]
+        return cls(box, console.get_style(table.border_style or ""), columns)
+
+    def render_row(self, console: Console, cells: List[str]) -> List[Segment]:
+        """Return the segments of one row, one line per wrapped cell line."""
+        rendered = []
+        for cell, (width, overflow, no_wrap) in zip(cells, self.columns):
+            if width < 1:
+                # Rich renders nothing into a column squeezed to its padding
+                rendered.append([[Segment(" " * (width + 2), Style())]])
+                continue
+            text = console.render_str(cell, highlight=False)
+            if text.cell_len <= width and "\n" not in text.plain and "\t" not in text.plain:
+                # Fits on one line: wrapping would only pad it
+                text.pad_right(width - text.cell_len)
+                lines = [text]
+            else:
+                lines = text.wrap(
+                    console,
+                    width,
+                    justify="left",
+                    overflow=overflow,  # type: ignore[arg-type]
+                    tab_size=console.tab_size or 8,
+                    no_wrap=no_wrap,
+                )
+            rendered.append(
+                [[self.padding, *line.render(console), self.padding] for line in lines]
+            )
+
+        segments: List[Segment] = []
+        for line_no in range(max(len(cell_lines) for cell_lines in rendered)):
+            segments.append(self.left)
+            for index, (cell_lines, (width, _, _)) in enumerate(zip(rendered, self.columns)):
+                if index:
+                    segments.append(self.divider)
+                if line_no < len(cell_lines):
+                    segments.extend(cell_lines[line_no])
+                else:
+                    segments.append(Segment(" " * (width + 2), Style()))
+            segments += [self.right, Segment.line()]
+        return segments
+
+
 class UniversalOutputFormatter:
     """Universal output formatter for all CLI commands.
 
@@ -1308,15 +1183,25 @@ class UniversalOutputFormatter:
         formatter.output(data, title="Job Scripts")
     """
 
-    def __init__(self, console: Console, json_output: bool = False):
+    def __init__(
+        self,
+        console: Console,
+        json_output: bool = False,
+        limit: Optional[int] = None,
+        pager: bool = False,
+    ):
         """Initialize the output formatter.
 
         Args:
             console: Rich console for output
             json_output: Whether to output JSON instead of formatted tables
+            limit: Maximum number of list items to output (None for all)
+            pager: Whether to page table output when writing to a terminal
         """
         self.console = console
         self.json_output = json_output
+        self.limit = limit
+        self.pager = pager
 
     def _get_terminal_width(self) -> int:
         """Retrieve the current terminal width and update the console accordingly."""
@@ -1334,18 +1219,62 @@ class UniversalOutputFormatter:
 
         return width
 
-    def output(self, data: Any, title: str = "", empty_message: str = "No items found.") -> None:
+    def output(
+        self,
+        data: Any,
+        title: str = "",
+        empty_message: str = "No items found.",
+        limit: Optional[int] = None,
+    ) -> None:
         """Output data either as JSON or formatted table.
 
         Args:
             data: Data to output (dict, list, or simple value)
             title: Title for the table display
             empty_message: Message to show when data is empty
+            limit: Maximum number of list items to output; defaults to ``self.limit``
         """
+        data, total = self._apply_limit(data, self.limit if limit is None else limit)
         if self.json_output:
             self._output_json(data)
         else:
-            self._output_table(data, title, empty_message)
+            with self._paged():
+                self._output_table(data, title, empty_message)
+                if total is not None:
+                    shown = len(data["items"] if isinstance(data, dict) else data)
+                    self.console.print(
+                        f"\nShowing {shown} of {total} (use --limit to change)", style="dim"
+                    )
+
+    @staticmethod
+    def _apply_limit(data: Any, limit: Optional[int]) -> Tuple[Any, Optional[int]]:
+        """Truncate a list (or a paginated response's items) to ``limit`` entries.
+
+        Returns:
+            The possibly truncated data and, if anything was dropped, the original count
+        """
+        if limit is None or limit < 0:
+            return data, None
+        if isinstance(data, list) and len(data) > limit:
+            return data[:limit], len(data)
+        if (
+            isinstance(data, dict)
+            and isinstance(data.get("items"), list)
+            and len(data["items"]) > limit
+        ):
+            return {**data, "items": data["items"][:limit]}, len(data["items"])
+        return data, None
+
+    def _paged(self) -> ContextManager[Any]:
+        """Return a context that sends console output through a pager if enabled.
+
+        Paging only applies when stdout is an interactive terminal, so piped
+        output is never held back.
+        """
+        isatty = getattr(self.console.file, "isatty", None)
+        if self.pager and isatty is not None and isatty():
+            return self.console.pager(styles=True)
+        return nullcontext()
 
     def _output_json(self, data: Any) -> None:
         """Output data as formatted JSON without syntax highlighting.
@@ -1403,23 +1332,56 @@ class UniversalOutputFormatter:
             # If Textual fails, show a simple error message
             self.console.print(f"[red]Error rendering table: {e}[/red]")
 
-    def _render_with_textual_datatable(self, items: List[Dict[str, Any]], title: str) -> None:
-        """Render using Rich Table with dynamic width based on terminal size."""
-        from rich import box
-        from rich.table import Table
+    def _render_with_textual_datatable(self, items: Iterable[Dict[str, Any]], title: str) -> None:
+        """Render using Rich Table with dynamic width based on terminal size.
 
-        if not items:
+        Columns and their widths are chosen from the first ``TABLE_SAMPLE_ROWS``
+        items, so keys that only appear further down are not shown. The title,
+        header and first row are rendered as a Rich table; every further row
+        is formatted on its own and printed ``TABLE_CHUNK_ROWS`` at a time, so
+        the first rows appear straight away and memory stays bounded however
+        long the list is.
+        """
+        rows = iter(items)
+        sample = list(islice(rows, TABLE_SAMPLE_ROWS))
+        if not sample:
             return
 
         # Get terminal width for dynamic sizing
         terminal_width = self._get_terminal_width()
 
-        # Get all unique keys from items
+        sorted_keys = self._sort_table_keys(sample)
+        if not sorted_keys:
+            return
+
+        # Calculate dynamic column widths based on terminal size
+        column_widths = self._calculate_proportional_widths(sample, sorted_keys, terminal_width)
+        columns = [(key, column_widths.get(key, 20)) for key in sorted_keys]
+
+        table = self._new_list_table(columns, title, terminal_width)
+        table.add_row(*self._format_table_row(sample[0], columns))
+        lines = self.console.render_lines(
+            table, self.console.options.update(width=terminal_width), new_lines=True
+        )
+        # Hold back the bottom edge until every row has been printed
+        self.console.print(Segments(chain.from_iterable(lines[:-1])), end="")
+        bottom_edge = lines[-1]
+
+        writer = _TableRowWriter.for_table(table, self.console, bottom_edge)
+        for chunk in _chunked(chain(sample[1:], rows), TABLE_CHUNK_ROWS):
+            segments: List[Segment] = []
+            for item in chunk:
+                segments += writer.render_row(self.console, self._format_table_row(item, columns))
+            self.console.print(Segments(segments), end="")
+
+        self.console.print(Segments(bottom_edge), end="")
+
+    def _sort_table_keys(self, items: List[Dict[str, Any]]) -> List[str]:
+        """Return the keys used by ``items``, with priority fields first."""
         all_keys = set()
         for item in items:
             all_keys.update(item.keys())
 
-        # Sort keys with priority fields first
         common_fields = [
             "id",
             "name",
@@ -1437,9 +1399,13 @@ class UniversalOutputFormatter:
                 all_keys.remove(field)
 
         sorted_keys.extend(sorted(all_keys))
+        return sorted_keys
 
-        # Calculate dynamic column widths based on terminal size
-        column_widths = self._calculate_proportional_widths(items, sorted_keys, terminal_width)
+    def _new_list_table(
+        self, columns: List[Tuple[str, int]], title: str, terminal_width: int
+    ) -> Table:
+        """Create an empty list table with fixed-width columns."""
+        from rich import box
 
         # Create Rich table with proper formatting and dynamic sizing
         table = Table(
@@ -1454,62 +1420,49 @@ class UniversalOutputFormatter:
         )
 
         # Add columns with calculated widths and smart overflow handling
-        # Track which columns use ellipsis for smart truncation
-        column_overflow = {}
-
-        for key in sorted_keys:
-            header = self._format_column_header(key)
-            col_width = column_widths.get(key, 20)
-
-            # Determine overflow strategy based on column type and width
-            if key.lower() in ["description", "summary", "details", "message"]:
-                # Long text fields - use fold for wrapping when very narrow
-                if col_width < 20:
-                    overflow = "ellipsis"
-                    no_wrap = True
-                else:
-                    overflow = "fold"
-                    no_wrap = False
-            elif key.lower() in ["id", "client_id", "clientid", "deployment_id", "product_id"]:
-                # IDs should never wrap, always use ellipsis
-                overflow = "ellipsis"
-                no_wrap = True
-            elif "_at" in key.lower() or "date" in key.lower() or "time" in key.lower():
-                # Dates/times should not wrap
-                overflow = "ellipsis"
-                no_wrap = True
-            else:
-                # Default columns - use ellipsis for narrow columns, fold for wider ones
-                if col_width < 15:
-                    overflow = "ellipsis"
-                    no_wrap = True
-                else:
-                    overflow = "fold"
-                    no_wrap = False
-
-            column_overflow[key] = (overflow, col_width)
-
+        for key, col_width in columns:
+            overflow, no_wrap = self._column_overflow(key, col_width)
             table.add_column(
-                header, overflow=overflow, no_wrap=no_wrap, width=col_width, max_width=col_width
+                self._format_column_header(key),
+                overflow=overflow,
+                no_wrap=no_wrap,
+                width=col_width,
+                max_width=col_width,
             )
-
-        # Add rows with smart truncation for ellipsis columns
-        for item in items:
-            row_data = []
-            for key in sorted_keys:
-                value = item.get(key, "")
-                formatted_value = self._format_cell_value(key, value)
-
-                # Apply smart truncation for columns using ellipsis
-                overflow_type, col_width = column_overflow[key]
-                if overflow_type == "ellipsis" and isinstance(formatted_value, str):
-                    formatted_value = self._smart_truncate(formatted_value, col_width)
-
-                row_data.append(formatted_value)
-            table.add_row(*row_data)
-
-        # Print using our console
-        self.console.print(table)
+        return table
+
+    def _column_overflow(self, key: str, col_width: int) -> Tuple[str, bool]:
+        """Return the overflow strategy and no-wrap flag for a column."""
+        if key.lower() in ["description", "summary", "details", "message"]:
+            # Long text fields - use fold for wrapping when very narrow
+            if col_width < 20:
+                return "ellipsis", True
+            return "fold", False
+        elif key.lower() in ["id", "client_id", "clientid", "deployment_id", "product_id"]:
+            # IDs should never wrap, always use ellipsis
+            return "ellipsis", True
+        elif "_at" in key.lower() or "date" in key.lower() or "time" in key.lower():
+            # Dates/times should not wrap
+            return "ellipsis", True
+        # Default columns - use ellipsis for narrow columns, fold for wider ones
+        if col_width < 15:
+            return "ellipsis", True
+        return "fold", False
+
+    def _format_table_row(self, item: Dict[str, Any], columns: List[Tuple[str, int]]) -> List[str]:
+        """Format one item's cells, truncating those in ellipsis columns."""
+        row_data = []
+        for key, col_width in columns:
+            formatted_value = self._format_cell_value(key, item.get(key, ""))
+
+            # Apply smart truncation for columns using ellipsis
+            if self._column_overflow(key, col_width)[0] == "ellipsis" and isinstance(
+                formatted_value, str
+            ):
+                formatted_value = self._smart_truncate(formatted_value, col_width)
+
+            row_data.append(formatted_value)
+        return row_data
 
     def _calculate_proportional_widths(
         self, items: List[Dict[str, Any]], sorted_keys: List[str], total_width: int
@@ -2106,7 +2059,11 @@ class UniversalOutputFormatter:
     # ============================================================================
 
     def render_list(
-        self, data: Any, resource_name: str, empty_message: Optional[str] = None
+        self,
+        data: Any,
+        resource_name: str,
+        empty_message: Optional[str] = None,
+        limit: Optional[int] = None,
     ) -> None:
         """Render a list of resources (for LIST operations).
 
@@ -2114,11 +2071,12 @@ class UniversalOutputFormatter:
             data: Response data containing list of items
             resource_name: Human-readable name for the resource type (e.g., "Job Scripts")
             empty_message: Custom message when no items found
+            limit: Maximum number of items to render; defaults to ``self.limit``
         """
         if empty_message is None:
             empty_message = f"No {resource_name.lower()} found."
 
-        self.output(data, title=resource_name, empty_message=empty_message)
+        self.output(data, title=resource_name, empty_message=empty_message, limit=limit)
 
     def render_get(self, data: Any, resource_name: str, resource_id: str = "") -> None:
         """Render a single resource (for GET operations).
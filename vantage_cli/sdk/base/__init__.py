@@ -11,11 +11,20 @@
 # this program. If not, see <https://www.gnu.org/licenses/>.
 """Base SDK classes for CRUD operations."""
 
-from .crud import BaseCRUDSDK, BaseGraphQLResourceSDK, BaseLocalResourceSDK, BaseRestApiResourceSDK
+from .crud import (
+    BaseCRUDSDK,
+    BaseGraphQLResourceSDK,
+    BaseLocalResourceSDK,
+    BaseRestApiResourceSDK,
+    eq_filters,
+    paginate_connection,
+)
 
 __all__ = [
     "BaseCRUDSDK",
     "BaseLocalResourceSDK",
     "BaseGraphQLResourceSDK",
     "BaseRestApiResourceSDK",
+    "eq_filters",
+    "paginate_connection",
 ]
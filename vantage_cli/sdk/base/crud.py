@@ -11,12 +11,14 @@
 # this program. If not, see <https://www.gnu.org/licenses/>.
 """Base CRUD SDK classes with common patterns extracted from profile and deployment commands."""
 
+import asyncio
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
 
 import typer
 
+from vantage_cli.constants import GRAPHQL_DEFAULT_PAGE_SIZE
 from vantage_cli.exceptions import Abort
 from vantage_cli.gql_client import create_async_graphql_client
 from vantage_cli.render import RenderStepOutput
@@ -24,6 +26,93 @@ from vantage_cli.render import RenderStepOutput
 logger = logging.getLogger(__name__)
 
 
+def eq_filters(**fields: Any) -> Optional[Dict[str, Any]]:
+    """Build a ``filters: JSONScalar`` argument matching each given field exactly.
+
+    Fields whose value is None are left out, so optional CLI filters can be
+    passed straight through.
+
+    Example:
+        >>> eq_filters(clusterName="prod", status=None)
+        {'clusterName': {'eq': 'prod'}}
+
+    Returns:
+        Filters dictionary, or None when no field was given
+    """
+    filters = {field: {"eq": value} for field, value in fields.items() if value is not None}
+    return filters or None
+
+
+async def paginate_connection(
+    execute: Callable[[str, Dict[str, Any]], Awaitable[Optional[Dict[str, Any]]]],
+    query: str,
+    connection: str,
+    variables: Optional[Dict[str, Any]] = None,
+    page_size: int = GRAPHQL_DEFAULT_PAGE_SIZE,
+    max_items: Optional[int] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """Iterate over every node of a Relay-style GraphQL connection.
+
+    The query must accept ``$first: Int`` and ``$after: String`` and select
+    ``pageInfo { hasNextPage endCursor }`` on the connection. The request for
+    the next page is issued as soon as a page arrives, so it is in flight while
+    the caller converts the nodes of the current one.
+
+    Args:
+        execute: Coroutine function taking ``(query, variables)`` and returning response data
+        query: GraphQL query string
+        connection: Top-level field holding the connection (e.g. "clusters")
+        variables: Extra query variables (filters, etc.); None values are omitted
+        page_size: Number of edges requested per page
+        max_items: Stop after yielding this many nodes (None for all)
+
+    Yields:
+        Connection nodes in server order
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1")
+
+    # Unset optional variables (e.g. no filters) are left out of the request
+    base_variables = {key: value for key, value in (variables or {}).items() if value is not None}
+    yielded = 0
+
+    def fetch(after: Optional[str], remaining: Optional[int]) -> "asyncio.Future[Any]":
+        page_variables = dict(base_variables)
+        page_variables["first"] = page_size if remaining is None else min(page_size, remaining)
+        if after is not None:
+            page_variables["after"] = after
+        return asyncio.ensure_future(execute(query, page_variables))
+
+    pending: Optional["asyncio.Future[Any]"] = fetch(None, max_items)
+    try:
+        while pending is not None:
+            data = await pending
+            pending = None
+
+            page = (data or {}).get(connection) or {}
+            edges = page.get("edges") or []
+            page_info = page.get("pageInfo") or {}
+            end_cursor = page_info.get("endCursor")
+
+            remaining = None if max_items is None else max_items - yielded - len(edges)
+            if (
+                edges
+                and page_info.get("hasNextPage")
+                and end_cursor
+                and (remaining is None or remaining > 0)
+            ):
+                pending = fetch(end_cursor, remaining)
+
+            for edge in edges:
+                if max_items is not None and yielded >= max_items:
+                    return
+                yield edge["node"]
+                yielded += 1
+    finally:
+        if pending is not None and not pending.done():
+            pending.cancel()
+
+
 class BaseCRUDSDK(ABC):
     """Abstract base class for CRUD SDK operations.
 
@@ -162,19 +251,53 @@ class BaseGraphQLResourceSDK(BaseCRUDSDK):
                 log_message=f"GraphQL query error: {str(e)}",
             )
 
-    async def list(self, ctx: typer.Context, **kwargs: Any) -> List[Dict[str, Any]]:
-        """List resources using GraphQL query.
+    def paginate(
+        self,
+        ctx: typer.Context,
+        query: Optional[str] = None,
+        variables: Optional[Dict[str, Any]] = None,
+        page_size: int = GRAPHQL_DEFAULT_PAGE_SIZE,
+        max_items: Optional[int] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over all resources, following the connection cursor page by page.
 
-        This is a default implementation that subclasses can override.
+        Args:
+            ctx: Typer context with settings
+            query: Paginated GraphQL query (defaults to ``_get_list_query()``)
+            variables: Extra query variables (filters, etc.)
+            page_size: Number of resources requested per page
+            max_items: Maximum number of resources to yield (None for all)
+
+        Returns:
+            Async iterator over resource dictionaries
         """
-        variables = {"first": kwargs.get("limit", 100)}
-        query = self._get_list_query()
 
-        data = await self._execute_graphql_query(ctx, query, variables)
+        async def execute(page_query: str, page_variables: Dict[str, Any]) -> Dict[str, Any]:
+            return await self._execute_graphql_query(ctx, page_query, page_variables)
+
+        return paginate_connection(
+            execute,
+            query or self._get_list_query(),
+            f"{self.resource_name}s",
+            variables=variables,
+            page_size=page_size,
+            max_items=max_items,
+        )
+
+    async def list(self, ctx: typer.Context, **kwargs: Any) -> List[Dict[str, Any]]:
+        """List resources using GraphQL query.
 
-        # Extract items from GraphQL connection structure
-        edges = data.get(f"{self.resource_name}s", {}).get("edges", [])
-        return [edge["node"] for edge in edges]
+        This is a default implementation that subclasses can override. All
+        pages are fetched unless ``max_items`` (or the legacy ``limit``) is given.
+        """
+        return [
+            node
+            async for node in self.paginate(
+                ctx,
+                page_size=kwargs.get("page_size") or GRAPHQL_DEFAULT_PAGE_SIZE,
+                max_items=kwargs.get("max_items", kwargs.get("limit")),
+            )
+        ]
 
     async def get(
         self, ctx: typer.Context, resource_id: str, **kwargs: Any
@@ -200,6 +323,9 @@ class BaseGraphQLResourceSDK(BaseCRUDSDK):
     def _get_list_query(self) -> str:
         """Get the GraphQL query for listing resources.
 
+        The query must accept ``$first`` and ``$after`` and select
+        ``pageInfo { hasNextPage endCursor }`` so it can be paginated.
+
         Returns:
             GraphQL query string
         """
@@ -157,12 +157,18 @@ class CloudCredentialSDK:
             del self._credentials[credential_id]
 
             # Remove from file
-            from vantage_cli.sdk.cloud_credential.schema import load_credentials, save_credentials
-
-            credentials_data = load_credentials()
-            if credential_id in credentials_data.get("credentials", {}):
-                del credentials_data["credentials"][credential_id]
-                save_credentials(credentials_data)
+            from vantage_cli.sdk.cloud_credential.schema import (
+                CREDENTIALS_YAML,
+                load_credentials,
+                save_credentials,
+            )
+            from vantage_cli.state_files import state_file_lock
+
+            with state_file_lock(CREDENTIALS_YAML):
+                credentials_data = load_credentials()
+                if credential_id in credentials_data.get("credentials", {}):
+                    del credentials_data["credentials"][credential_id]
+                    save_credentials(credentials_data)
 
             logger.debug(f"Deleted credential {credential_id}")
             return True
@@ -20,6 +20,7 @@ from pydantic import BaseModel, Field
 
 from vantage_cli.constants import VANTAGE_CLI_CREDENTIALS_FILE as CREDENTIALS_YAML
 from vantage_cli.sdk.cloud.schema import CloudType
+from vantage_cli.state_files import atomic_write_text, state_file_lock
 
 
 def load_credentials() -> Dict[str, Any]:
@@ -44,6 +45,9 @@ def load_credentials() -> Dict[str, Any]:
 def save_credentials(credentials_data: Dict[str, Any]) -> None:
     """Save credentials data to ~/.vantage-cli/credentials.yaml.
 
+    Callers that modify data returned by :func:`load_credentials` should hold
+    ``state_file_lock(CREDENTIALS_YAML)`` around the load and the save.
+
     Args:
         credentials_data: Dictionary containing credentials data
     """
@@ -52,11 +56,12 @@ def save_credentials(credentials_data: Dict[str, Any]) -> None:
     logger = logging.getLogger(__name__)
 
     try:
-        # Ensure the directory exists
-        CREDENTIALS_YAML.parent.mkdir(parents=True, exist_ok=True)
-        CREDENTIALS_YAML.write_text(
-            yaml.dump(credentials_data, default_flow_style=False, indent=2)
-        )
+        with state_file_lock(CREDENTIALS_YAML):
+            atomic_write_text(
+                CREDENTIALS_YAML,
+                yaml.dump(credentials_data, default_flow_style=False, indent=2),
+                mode=0o600,
+            )
     except Exception as e:
         logger.error(f"Failed to save credentials to {CREDENTIALS_YAML}: {e}")
 
@@ -119,14 +124,16 @@ class CloudCredential(BaseModel):
         This method loads the current credentials, updates this credential's entry,
         and saves it back to ~/.vantage-cli/credentials.yaml.
         """
-        credentials_data = load_credentials()
         # Use mode='python' to serialize enums as their values
         cred_dict = self.model_dump(mode="python")
         # Ensure credential_type is serialized as a string value
         if isinstance(cred_dict.get("credential_type"), CloudType):
             cred_dict["credential_type"] = cred_dict["credential_type"].value
-        credentials_data["credentials"][str(self.id)] = cred_dict
-        save_credentials(credentials_data)
+
+        with state_file_lock(CREDENTIALS_YAML):
+            credentials_data = load_credentials()
+            credentials_data["credentials"][str(self.id)] = cred_dict
+            save_credentials(credentials_data)
 
 
 __all__ = [
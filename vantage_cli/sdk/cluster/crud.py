@@ -12,13 +12,15 @@
 """Cluster CRUD SDK using the base CRUD classes."""
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
-import httpx
 import typer
 
 from vantage_cli.auth import extract_persona
+from vantage_cli.constants import GRAPHQL_DEFAULT_PAGE_SIZE
 from vantage_cli.exceptions import Abort
+from vantage_cli.gql_client import create_async_graphql_client
+from vantage_cli.http_client_pool import http_client_pool
 from vantage_cli.sdk.admin.management.organizations import get_extra_attributes
 from vantage_cli.sdk.base import BaseGraphQLResourceSDK
 from vantage_cli.sdk.cluster.schema import Cluster
@@ -27,45 +29,55 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# Selection set for a cluster connection, used by the batched by-name lookup
+_CLUSTER_SELECTION = """{
+    edges {
+        node {
+            name
+            status
+            clientId
+            description
+            ownerEmail
+            provider
+            cloudAccountId
+            creationParameters
+        }
+    }
+}"""
+
+
 class ClusterSDK(BaseGraphQLResourceSDK):
     """SDK for cluster CRUD operations using GraphQL API."""
 
     def __init__(self):
         super().__init__(resource_name="cluster")
 
-    def _get_list_query(self) -> str:
-        """Get the GraphQL query for listing clusters."""
-        return """
-        query getClusters($first: Int!) {
-            clusters(first: $first) {
-                edges {
-                    node {
-                        name
-                        status
-                        clientId
-                        description
-                        ownerEmail
-                        provider
-                        cloudAccountId
-                        creationParameters
-                    }
-                }
-            }
-        }
-        """
+    def _cluster_from_node(self, ctx: typer.Context, cluster_data: Dict[str, Any]) -> Cluster:
+        """Convert a GraphQL cluster node into a Cluster object."""
+        client_id = cluster_data.get("clientId", "")
 
-    def _get_single_query(self) -> str:
-        """Get the GraphQL query for fetching a single cluster.
+        # Construct jupyterhub_url from settings and client_id
+        base_domain = ".".join(ctx.obj.settings.vantage_url.split("//")[-1].split(".")[1:])
+        jupyterhub_url = f"https://{client_id}.{base_domain}"
 
-        The GraphQL API supports filtering via the filters parameter. We use
-        the name filter with an 'eq' operator to fetch a specific cluster.
+        return Cluster(
+            name=cluster_data.get("name", ""),
+            status=cluster_data.get("status", "unknown"),
+            client_id=client_id,
+            client_secret=cluster_data.get("clientSecret"),  # None for list/get queries
+            description=cluster_data.get("description", ""),
+            owner_email=cluster_data.get("ownerEmail", ""),
+            provider=cluster_data.get("provider", "unknown"),
+            cloud_account_id=cluster_data.get("cloudAccountId"),
+            creation_parameters=cluster_data.get("creationParameters", {}),
+            jupyterhub_url=jupyterhub_url,
+        )
 
-        Returns:
-            GraphQL query string for fetching a single cluster by name
-        """
+    def _get_list_query(self) -> str:
+        """Get the GraphQL query for listing clusters."""
         return """
-        query getClusters($first: Int!, $filters: JSONScalar) {
-            clusters(first: $first, filters: $filters) {
+        query getClusters($first: Int!, $after: String) {
+            clusters(first: $first, after: $after) {
                 edges {
                     node {
                         name
@@ -78,6 +90,10 @@ class ClusterSDK(BaseGraphQLResourceSDK):
                         creationParameters
                     }
                 }
+                pageInfo {
+                    hasNextPage
+                    endCursor
+                }
             }
         }
         """
@@ -87,8 +103,9 @@ class ClusterSDK(BaseGraphQLResourceSDK):
     ) -> Optional[Cluster]:
         """Get a specific cluster by name using GraphQL query with filtering.
 
-        This method uses the GraphQL filters parameter to query for a specific
-        cluster by name, which is more efficient than fetching all clusters.
+        This method uses the GraphQL filters parameter (``{"name": {"eq": ...}}``)
+        to query for a specific cluster by name, which is more efficient than
+        fetching all clusters.
 
         Args:
             ctx: Typer context with settings and console
@@ -98,48 +115,40 @@ class ClusterSDK(BaseGraphQLResourceSDK):
         Returns:
             Cluster object or None if not found
         """
+        # Lookups issued concurrently (e.g. via asyncio.gather) are coalesced
+        # by the client's loader into one aliased query
+        profile = getattr(ctx.obj, "profile", "default")
+        graphql_client = create_async_graphql_client(ctx.obj.settings, profile)
+
+        async def load_clusters_by_name(names: List[Any]) -> List[Optional[Dict[str, Any]]]:
+            results = await graphql_client.execute_aliased(
+                "clusters",
+                _CLUSTER_SELECTION,
+                {"first": "Int!", "filters": "JSONScalar"},
+                [{"first": 1, "filters": {"name": {"eq": name}}} for name in names],
+                operation_name="getClustersByName",
+            )
+            return [
+                edges[0]["node"] if (edges := (result or {}).get("edges")) else None
+                for result in results
+            ]
+
+        loader = graphql_client.dataloader("clusters_by_name", load_clusters_by_name)
         try:
-            # Use GraphQL filters to query for specific cluster by name
-            # Filter syntax: {"name": {"eq": "cluster-name"}}
-            variables = {
-                "first": 1,  # We only expect one result
-                "filters": {"name": {"eq": resource_id}},
-            }
-            query = self._get_single_query()
-
-            data = await self._execute_graphql_query(ctx, query, variables)
-            logger.debug(f"get: Raw data received for cluster '{resource_id}': {data}")
-
-            # Extract cluster from GraphQL connection structure
-            edges = data.get("clusters", {}).get("edges", [])
-
-            if edges:
-                cluster_data = edges[0]["node"]
-                client_id = cluster_data.get("clientId", "")
-
-                # Construct jupyterhub_url from settings and client_id
-                base_domain = ".".join(ctx.obj.settings.vantage_url.split("//")[-1].split(".")[1:])
-                jupyterhub_url = f"https://{client_id}.{base_domain}"
-
-                # Convert to Cluster object
-                return Cluster(
-                    name=cluster_data.get("name", ""),
-                    status=cluster_data.get("status", "unknown"),
-                    client_id=client_id,
-                    client_secret=cluster_data.get("clientSecret"),  # May be None
-                    description=cluster_data.get("description", ""),
-                    owner_email=cluster_data.get("ownerEmail", ""),
-                    provider=cluster_data.get("provider", "unknown"),
-                    cloud_account_id=cluster_data.get("cloudAccountId"),
-                    creation_parameters=cluster_data.get("creationParameters", {}),
-                    jupyterhub_url=jupyterhub_url,
-                )
+            cluster_data = await loader.load(resource_id)
+        except Exception as e:
+            logger.error(f"Failed to execute GraphQL query for cluster: {str(e)}")
+            raise Abort(
+                f"Failed to query cluster: {str(e)}",
+                subject="Cluster Query Failed",
+                log_message=f"GraphQL query error: {str(e)}",
+            )
 
+        logger.debug(f"get: Raw data received for cluster '{resource_id}': {cluster_data}")
+        if cluster_data is None:
             return None
 
-        except Exception:
-            # Re-raise to let the base class error handling deal with it
-            raise
+        return self._cluster_from_node(ctx, cluster_data)
 
     def _get_create_mutation(self) -> str:
         """Get the GraphQL mutation for creating a cluster."""
@@ -332,51 +341,25 @@ class ClusterSDK(BaseGraphQLResourceSDK):
 
         return True
 
-    async def list_clusters(self, ctx: typer.Context, **kwargs: Any) -> List[Cluster]:
-        """List all clusters as Cluster objects.
+    async def iter_clusters(
+        self,
+        ctx: typer.Context,
+        page_size: int = GRAPHQL_DEFAULT_PAGE_SIZE,
+        max_items: Optional[int] = None,
+    ) -> AsyncIterator[Cluster]:
+        """Iterate over clusters page by page as Cluster objects.
 
         Args:
             ctx: Typer context
-            **kwargs: Additional filtering parameters
+            page_size: Number of clusters requested per page
+            max_items: Maximum number of clusters to yield (None for all)
 
-        Returns:
-            List of Cluster objects
+        Yields:
+            Cluster objects as their pages arrive
         """
-        import logging
-
-        logger = logging.getLogger(__name__)
-
-        # Get raw cluster data from the base list method
-        clusters_raw = await self.list(ctx, **kwargs)
-
-        logger.debug(f"list_clusters: Got {len(clusters_raw)} raw clusters from API")
-        if clusters_raw:
-            logger.debug(f"list_clusters: First cluster sample: {clusters_raw[0]}")
-
-        clusters: List[Cluster] = []
-        for cluster_data in clusters_raw:
+        async for cluster_data in self.paginate(ctx, page_size=page_size, max_items=max_items):
             try:
-                client_id = cluster_data.get("clientId", "")
-
-                # Construct jupyterhub_url from settings and client_id
-                base_domain = ".".join(ctx.obj.settings.vantage_url.split("//")[-1].split(".")[1:])
-                jupyterhub_url = f"https://{client_id}.{base_domain}"
-
-                cluster = Cluster(
-                    name=cluster_data.get("name", ""),
-                    status=cluster_data.get("status", "unknown"),
-                    client_id=client_id,
-                    client_secret=cluster_data.get(
-                        "clientSecret"
-                    ),  # Will be None for list operations
-                    description=cluster_data.get("description", ""),
-                    owner_email=cluster_data.get("ownerEmail", ""),
-                    provider=cluster_data.get("provider", "unknown"),
-                    cloud_account_id=cluster_data.get("cloudAccountId"),
-                    creation_parameters=cluster_data.get("creationParameters", {}),
-                    jupyterhub_url=jupyterhub_url,
-                )
-                clusters.append(cluster)
+                cluster = self._cluster_from_node(ctx, cluster_data)
             except Exception as e:
                 # Skip clusters that fail to parse
                 logger.warning(
@@ -384,6 +367,26 @@ class ClusterSDK(BaseGraphQLResourceSDK):
                 )
                 logger.debug(f"list_clusters: Cluster data that failed: {cluster_data}")
                 continue
+            yield cluster
+
+    async def list_clusters(self, ctx: typer.Context, **kwargs: Any) -> List[Cluster]:
+        """List all clusters as Cluster objects.
+
+        Args:
+            ctx: Typer context
+            **kwargs: Pagination parameters (``page_size``, ``max_items``)
+
+        Returns:
+            List of Cluster objects
+        """
+        clusters = [
+            cluster
+            async for cluster in self.iter_clusters(
+                ctx,
+                page_size=kwargs.get("page_size") or GRAPHQL_DEFAULT_PAGE_SIZE,
+                max_items=kwargs.get("max_items", kwargs.get("limit")),
+            )
+        ]
 
         logger.debug(f"list_clusters: Returning {len(clusters)} Cluster objects")
         return clusters
@@ -482,39 +485,40 @@ class ClusterSDK(BaseGraphQLResourceSDK):
                 "Content-Type": "application/json",
             }
 
-            async with httpx.AsyncClient() as client:
-                # First, search for the client by clientId
-                params = {"client_id": client_id}
-                response = await client.get(api_url, headers=headers, params=params)
+            client = http_client_pool.get(api_url)
+
+            # First, search for the client by clientId
+            params = {"client_id": client_id}
+            response = await client.get(api_url, headers=headers, params=params)
 
-                if response.status_code != 200:
-                    return None
+            if response.status_code != 200:
+                return None
 
-                response_data = response.json()
-                clients = response_data.get("clients", [])
+            response_data = response.json()
+            clients = response_data.get("clients", [])
 
-                if not clients:
-                    return None
+            if not clients:
+                return None
 
-                # Get the first matching client's internal ID
-                vantage_client = clients[0]
-                internal_id = vantage_client.get("id")
+            # Get the first matching client's internal ID
+            vantage_client = clients[0]
+            internal_id = vantage_client.get("id")
 
-                if not internal_id:
-                    return None
+            if not internal_id:
+                return None
 
-                # Get the client secret using the internal ID
-                secret_url = f"{api_url}/{internal_id}"
-                secret_response = await client.get(secret_url, headers=headers)
+            # Get the client secret using the internal ID
+            secret_url = f"{api_url}/{internal_id}"
+            secret_response = await client.get(secret_url, headers=headers)
 
-                if secret_response.status_code != 200:
-                    return None
+            if secret_response.status_code != 200:
+                return None
 
-                secret_data = secret_response.json()
-                # Try both camelCase and snake_case field names
-                client_secret = secret_data.get("client_secret")
+            secret_data = secret_response.json()
+            # Try both camelCase and snake_case field names
+            client_secret = secret_data.get("client_secret")
 
-                return client_secret
+            return client_secret
 
         except Exception:
             return None
@@ -12,109 +12,148 @@
 """Deployment CRUD SDK that uses the deployment command interface."""
 
 import logging
-from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 
 import typer
-import yaml
 
-from vantage_cli.exceptions import Abort
+from vantage_cli.sdk.cloud import cloud_sdk
 from vantage_cli.sdk.cloud.schema import Cloud
 from vantage_cli.sdk.cloud_credential.schema import CloudCredential
-from vantage_cli.sdk.deployment.schema import Deployment
+from vantage_cli.sdk.cluster.schema import Cluster, VantageClusterContext
+from vantage_cli.sdk.deployment.schema import DEPLOYMENT_RECORD_FORMAT, Deployment
+from vantage_cli.sdk.deployment.store import DeploymentStore, deployment_store
 
 logger = logging.getLogger(__name__)
 
 
-if TYPE_CHECKING:
-    from vantage_cli.sdk.cluster.schema import Cluster, VantageClusterContext
-
-
 class DeploymentSDK:
     """SDK for deployment CRUD operations that matches the deployment command interface.
 
-    This SDK reads from ~/.vantage-cli/deployments.yaml and provides the interface
-    expected by the deployment commands.
+    This SDK reads from the indexed deployment store (~/.vantage-cli/deployments.db)
+    and provides the interface expected by the deployment commands.
     """
 
-    def __init__(self):
-        """Initialize the deployment SDK."""
-        pass
+    def __init__(self, store: Optional[DeploymentStore] = None):
+        """Initialize the deployment SDK.
 
-    def _get_deployments_file_path(self) -> Path:
-        """Get the path to the deployments file.
-
-        Returns:
-            Path to ~/.vantage-cli/deployments.yaml
+        Args:
+            store: Deployment store to use; defaults to the shared store
         """
-        vantage_dir = Path.home() / ".vantage-cli"
-        vantage_dir.mkdir(exist_ok=True)
-        return vantage_dir / "deployments.yaml"
+        self._store = store
+        # Hydrated deployments keyed by ID, with the store version they were built from
+        self._hydrated: Dict[str, Tuple[int, Deployment]] = {}
+
+    @property
+    def store(self) -> DeploymentStore:
+        """Deployment store backing this SDK."""
+        return self._store or deployment_store
+
+    def generation(self) -> int:
+        """Return the store's change counter; it differs after any deployment write."""
+        return self.store.generation()
+
+    @staticmethod
+    def _parse_timestamps(deployment_data: Dict[str, Any]) -> Tuple[datetime, datetime]:
+        """Return the created_at and updated_at timestamps of a record."""
+        created_at = deployment_data.get("created_at")
+        if isinstance(created_at, str):
+            created_at = datetime.fromisoformat(created_at)
+        elif not isinstance(created_at, datetime):
+            created_at = datetime.now()
+
+        updated_at = deployment_data.get("updated_at")
+        if isinstance(updated_at, str):
+            updated_at = datetime.fromisoformat(updated_at)
+        elif updated_at is None:
+            updated_at = created_at
+
+        return created_at, updated_at
 
-    def _load_deployments_data(self) -> Dict[str, Any]:
-        """Load deployment data from ~/.vantage-cli/deployments.yaml.
+    def _dict_to_deployment(
+        self,
+        deployment_id: str,
+        deployment_data: Dict[str, Any],
+        version: Optional[int] = None,
+    ) -> Optional[Deployment]:
+        """Convert a stored record to a Deployment object.
+
+        Deployments are hydrated at most once per store version: later calls
+        for an unchanged record return a deep copy of the cached object instead
+        of re-validating it, so callers can edit nested models freely.
+
+        Args:
+            deployment_id: The deployment ID (UUID string)
+            deployment_data: Dictionary containing the stored deployment record
+            version: Store version of the record, enables the hydration cache
 
         Returns:
-            Dictionary containing deployments data with 'deployments' key
+            Deployment object or None if conversion fails
         """
-        deployments_file = self._get_deployments_file_path()
-        if not deployments_file.exists():
-            return {"deployments": {}}
+        if version is not None:
+            cached = self._hydrated.get(deployment_id)
+            if cached is not None and cached[0] == version:
+                return cached[1].model_copy(deep=True)
 
-        try:
-            with open(deployments_file, "r") as f:
-                data: Dict[str, Any] = yaml.safe_load(f) or {}
-                # Ensure the structure exists
-                if "deployments" not in data:
-                    data["deployments"] = {}
-                return data
-        except Exception as e:
-            logger.warning(f"Failed to load deployments file: {e}")
-            return {"deployments": {}}
+        deployment = None
+        if deployment_data.get("record_format") == DEPLOYMENT_RECORD_FORMAT:
+            deployment = self._construct_deployment(deployment_id, deployment_data)
+        if deployment is None:
+            deployment = self._validate_deployment(deployment_id, deployment_data)
 
-    def _save_deployments_data(self, deployments_data: Dict[str, Any]) -> None:
-        """Save deployment data to ~/.vantage-cli/deployments.yaml.
+        if deployment is None or version is None:
+            return deployment
 
-        Args:
-            deployments_data: Dictionary containing deployments data
+        self._hydrated[deployment_id] = (version, deployment)
+        return deployment.model_copy(deep=True)
+
+    def _construct_deployment(
+        self, deployment_id: str, deployment_data: Dict[str, Any]
+    ) -> Optional[Deployment]:
+        """Build a Deployment without validation from a record the CLI wrote itself.
+
+        Records written by :meth:`Deployment.write` were dumped from validated
+        models, so they are rebuilt with ``model_construct``.
+
+        Returns:
+            Deployment object, or None if the record is not in the expected shape
         """
-        deployments_file = self._get_deployments_file_path()
         try:
-            with open(deployments_file, "w") as f:
-                yaml.dump(deployments_data, f, default_flow_style=False, indent=2)
-        except Exception as e:
-            logger.error(f"Failed to save deployments file: {e}")
-            raise Abort(f"Failed to save deployments: {e}")
+            created_at, updated_at = self._parse_timestamps(deployment_data)
+            return Deployment.model_construct(
+                id=deployment_id,
+                app_name=deployment_data["app_name"],
+                cluster=Cluster.model_construct(**deployment_data["cluster"]),
+                vantage_cluster_ctx=VantageClusterContext.model_construct(
+                    **deployment_data["vantage_cluster_ctx"]
+                ),
+                cloud=Cloud.model_construct(**deployment_data["cloud"]),
+                substrate=deployment_data["substrate"],
+                status=deployment_data["status"],
+                created_at=created_at,
+                updated_at=updated_at,
+                deployment_type=deployment_data.get("deployment_type"),
+                k8s_namespaces=deployment_data.get("k8s_namespaces"),
+                additional_metadata=deployment_data.get("additional_metadata"),
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            logger.debug(f"Falling back to validated hydration for {deployment_id}: {e}")
+            return None
 
-    def _dict_to_deployment(
+    def _validate_deployment(
         self, deployment_id: str, deployment_data: Dict[str, Any]
     ) -> Optional[Deployment]:
-        """Convert a dictionary from YAML to a Deployment object.
+        """Convert a legacy or externally written record to a validated Deployment object.
 
         Args:
             deployment_id: The deployment ID (UUID string)
-            deployment_data: Dictionary containing deployment data from YAML
+            deployment_data: Dictionary containing deployment data
 
         Returns:
             Deployment object or None if conversion fails
         """
         try:
-            from datetime import datetime
-
-            from vantage_cli.sdk.cluster.schema import Cluster, VantageClusterContext
-
-            # Parse datetime strings to datetime objects
-            created_at = deployment_data.get("created_at")
-            if isinstance(created_at, str):
-                created_at = datetime.fromisoformat(created_at)
-            elif not isinstance(created_at, datetime):
-                created_at = datetime.now()
-
-            updated_at = deployment_data.get("updated_at")
-            if isinstance(updated_at, str):
-                updated_at = datetime.fromisoformat(updated_at)
-            elif updated_at is None:
-                updated_at = created_at
+            created_at, updated_at = self._parse_timestamps(deployment_data)
 
             # Parse nested Cluster object
             cluster_data = deployment_data.get("cluster")
@@ -147,8 +186,6 @@ class DeploymentSDK:
                 cloud_data = deployment_data.get("cloud_provider", "unknown")
 
             # Convert cloud data to Cloud object
-            from vantage_cli.sdk.cloud import cloud_sdk
-
             if isinstance(cloud_data, str):
                 # If it's a string, get the Cloud object from SDK
                 cloud = cloud_sdk.get(cloud_data)
@@ -159,9 +196,7 @@ class DeploymentSDK:
                     cloud = cloud_sdk.get("localhost")
             elif isinstance(cloud_data, dict):
                 # If it's a dict (from YAML), reconstruct Cloud object
-                from vantage_cli.sdk.cloud.schema import Cloud as CloudModel
-
-                cloud = CloudModel(**cloud_data)
+                cloud = Cloud(**cloud_data)
             else:
                 # Already a Cloud object
                 cloud = cloud_data
@@ -187,7 +222,9 @@ class DeploymentSDK:
                 updated_at=updated_at,
                 deployment_type=deployment_data.get("deployment_type"),
                 k8s_namespaces=deployment_data.get("k8s_namespaces"),
-                additional_metadata=deployment_data.get("metadata"),
+                additional_metadata=deployment_data.get(
+                    "additional_metadata", deployment_data.get("metadata")
+                ),
             )
         except Exception as e:
             logger.warning(
@@ -202,31 +239,29 @@ class DeploymentSDK:
 
         Args:
             ctx: Typer context
-            **kwargs: Filtering options like cloud, status, etc.
+            **kwargs: Filtering options: cloud, status, cluster_name and app_name
 
         Returns:
             List of Deployment objects
         """
-        deployments_data = self._load_deployments_data()
-        all_deployments = deployments_data.get("deployments", {})
+        # Filters are answered from the store's indexes
+        cloud_filter = kwargs.get("cloud")
+        status_filter = kwargs.get("status")
+        records = self.store.list(
+            cluster_name=kwargs.get("cluster_name"),
+            app_name=kwargs.get("app_name"),
+            cloud=cloud_filter if cloud_filter != "all" else None,
+            status=status_filter if status_filter != "all" else None,
+        )
 
         # Convert to Deployment objects
         deployments: List[Deployment] = []
-        for deployment_id, deployment_record in all_deployments.items():
+        for stored in records:
             # Use the helper method to convert dict to Deployment object
-            deployment = self._dict_to_deployment(deployment_id, deployment_record)
+            deployment = self._dict_to_deployment(stored.id, stored.record, stored.version)
             if deployment:
                 deployments.append(deployment)
 
-        # Apply filters
-        cloud_filter = kwargs.get("cloud")
-        if cloud_filter and cloud_filter != "all":
-            deployments = [d for d in deployments if d.cloud.name.lower() == cloud_filter.lower()]
-
-        status_filter = kwargs.get("status")
-        if status_filter and status_filter != "all":
-            deployments = [d for d in deployments if d.status == status_filter]
-
         logger.debug(f"Returning {len(deployments)} deployments after filtering")
         return deployments
 
@@ -258,16 +293,12 @@ class DeploymentSDK:
         Returns:
             Deployment object or None if not found
         """
-        deployments_data = self._load_deployments_data()
-        all_deployments = deployments_data.get("deployments", {})
-
-        if deployment_id not in all_deployments:
+        stored = self.store.get(deployment_id)
+        if stored is None:
             return None
 
-        deployment_record = all_deployments[deployment_id]
-
         # Use the helper method to convert dict to Deployment object
-        return self._dict_to_deployment(deployment_id, deployment_record)
+        return self._dict_to_deployment(stored.id, stored.record, stored.version)
 
     async def get(
         self, ctx: typer.Context, deployment_id: str, **kwargs: Any
@@ -301,16 +332,10 @@ class DeploymentSDK:
         Returns:
             True if successful, False otherwise
         """
-        deployments_data = self._load_deployments_data()
-        all_deployments = deployments_data.get("deployments", {})
-
-        if deployment_id not in all_deployments:
+        if not self.store.update_status(deployment_id, status):
             logger.warning(f"Deployment {deployment_id} not found for status update")
             return False
 
-        all_deployments[deployment_id]["status"] = status
-        self._save_deployments_data(deployments_data)
-
         logger.info(f"Updated deployment '{deployment_id}' status to '{status}'")
         return True
 
@@ -327,7 +352,7 @@ class DeploymentSDK:
         k8s_namespaces: Optional[List[str]] = None,
         verbose: bool = False,
     ) -> Deployment:
-        """Create a new deployment and save it to the deployments file.
+        """Create a new deployment and save it to the deployment store.
 
         Args:
             app_name: Name of the app being deployed (e.g., 'slurm-multipass')
@@ -356,7 +381,7 @@ class DeploymentSDK:
             additional_metadata=additional_metadata or {},
         )
 
-        # Save to file using the deployment's write method
+        # Save to the store using the deployment's write method
         deployment.write()
 
         if verbose:
@@ -376,16 +401,11 @@ class DeploymentSDK:
         Returns:
             True if successful, False otherwise
         """
-        deployments_data = self._load_deployments_data()
-        all_deployments = deployments_data.get("deployments", {})
-
-        if deployment_id not in all_deployments:
+        self._hydrated.pop(deployment_id, None)
+        if not self.store.delete(deployment_id):
             logger.warning(f"Deployment {deployment_id} not found for deletion")
             return False
 
-        del all_deployments[deployment_id]
-        self._save_deployments_data(deployments_data)
-
         logger.info(f"Deleted deployment '{deployment_id}'")
         return True
 
@@ -401,8 +421,7 @@ class DeploymentSDK:
         Returns:
             List of Deployment objects for the cluster
         """
-        all_deployments = await self.list(ctx)
-        return [d for d in all_deployments if d.cluster.name == cluster_name]
+        return await self.list(ctx, cluster_name=cluster_name)
 
 
 # Create the singleton instance
@@ -15,53 +15,15 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 from uuid import uuid4
 
-import yaml
 from pydantic import BaseModel, Field, computed_field
 
-from vantage_cli.constants import VANTAGE_CLI_DEPLOYMENTS_YAML_PATH as DEPLOYMENTS_YAML
 from vantage_cli.sdk.cloud.schema import Cloud
 from vantage_cli.sdk.cloud_credential.schema import CloudCredential
 from vantage_cli.sdk.cluster.schema import Cluster, VantageClusterContext
+from vantage_cli.sdk.deployment.store import deployment_store
 
-
-def load_deployments() -> Dict[str, Any]:
-    """Load deployment tracking data from ~/.vantage-cli/deployments.yaml.
-
-    Returns:
-        Dictionary containing deployments data with 'deployments' key
-    """
-    if not DEPLOYMENTS_YAML.exists():
-        return {"deployments": {}}
-
-    try:
-        data = yaml.safe_load(DEPLOYMENTS_YAML.read_text())
-        if "deployments" not in data:
-            data["deployments"] = {}
-        return data
-    except Exception:
-        # Load deployments and return empty dict with defaults on error
-        return {"deployments": {}}
-
-
-def save_deployments(deployments_data: Dict[str, Any]) -> None:
-    """Save deployment tracking data to ~/.vantage-cli/deployments.yaml.
-
-    Args:
-        deployments_data: Dictionary containing deployments data
-    """
-    import logging
-
-    logger = logging.getLogger(__name__)
-
-    try:
-        # Ensure the directory exists
-        DEPLOYMENTS_YAML.parent.mkdir(parents=True, exist_ok=True)
-        DEPLOYMENTS_YAML.write_text(
-            yaml.dump(deployments_data, default_flow_style=False, indent=2)
-        )
-    except Exception as e:
-        logger.error(f"Failed to save deployments to {DEPLOYMENTS_YAML}: {e}")
-        raise RuntimeError(f"Failed to save deployments: {e}") from e
+# Marks records written by Deployment.write(); bump when the dumped layout changes
+DEPLOYMENT_RECORD_FORMAT = 1
 
 
 class Deployment(BaseModel):
@@ -105,26 +67,13 @@ class Deployment(BaseModel):
             super().__setattr__("updated_at", datetime.now())
 
     def write(self) -> None:
-        """Save this deployment to the deployments file.
-
-        This method loads the current deployments, updates this deployment's entry,
-        and saves it back to ~/.vantage-cli/deployments.yaml.
+        """Save this deployment to the local deployment store.
 
+        Only this deployment's row in ~/.vantage-cli/deployments.db is written.
         """
-        from vantage_cli.sdk.cloud.schema import CloudType
-
-        deployments_data = load_deployments()
-        # Use mode='python' to serialize properly
-        deployment_dict = self.model_dump(mode="python")
-
-        # Ensure CloudType enums are serialized as strings
-        if "credential" in deployment_dict and deployment_dict["credential"]:
-            cred = deployment_dict["credential"]
-            if isinstance(cred.get("credential_type"), CloudType):
-                cred["credential_type"] = cred["credential_type"].value
-
-        deployments_data["deployments"][str(self.id)] = deployment_dict
-        save_deployments(deployments_data)
+        record = self.model_dump(mode="json")
+        record["record_format"] = DEPLOYMENT_RECORD_FORMAT
+        deployment_store.put(str(self.id), record)
 
     @computed_field
     @property
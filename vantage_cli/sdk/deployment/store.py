@@ -0,0 +1,337 @@
+# Copyright (C) 2025 Vantage Compute Corporation
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/>.
+"""Indexed local store for deployment records.
+
+Deployments are kept in a SQLite database (``~/.vantage-cli/deployments.db``)
+with one row per deployment. The full record is stored as JSON next to
+indexed columns for the cluster name, app name, cloud and status, so point
+lookups and updates touch a single row instead of rewriting every deployment.
+Each row carries a ``version`` that is bumped on every write, and triggers
+bump a store-wide ``generation`` on any change so watchers (e.g. the
+dashboard) can tell whether anything changed with a single-row read.
+
+Deployments tracked in the legacy ``deployments.yaml`` file are imported the
+first time the store is opened; the YAML file is then renamed to
+``deployments.yaml.migrated``.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from datetime import date, datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional
+
+import yaml
+
+from vantage_cli.constants import (
+    VANTAGE_CLI_DEPLOYMENTS_DB_PATH,
+    VANTAGE_CLI_DEPLOYMENTS_YAML_PATH,
+)
+
+logger = logging.getLogger(__name__)
+
+# Bumped whenever the table layout changes
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS deployments (
+    id TEXT PRIMARY KEY,
+    cluster_name TEXT,
+    app_name TEXT,
+    cloud TEXT,
+    status TEXT,
+    created_at TEXT,
+    version INTEGER NOT NULL DEFAULT 1,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS deployments_cluster_name ON deployments (cluster_name);
+CREATE INDEX IF NOT EXISTS deployments_app_name ON deployments (app_name);
+CREATE INDEX IF NOT EXISTS deployments_cloud ON deployments (cloud);
+CREATE INDEX IF NOT EXISTS deployments_status ON deployments (status);
+CREATE TABLE IF NOT EXISTS store_meta (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    generation INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO store_meta (id, generation) VALUES (1, 0);
+CREATE TRIGGER IF NOT EXISTS deployments_insert_generation AFTER INSERT ON deployments
+BEGIN UPDATE store_meta SET generation = generation + 1 WHERE id = 1; END;
+CREATE TRIGGER IF NOT EXISTS deployments_update_generation AFTER UPDATE ON deployments
+BEGIN UPDATE store_meta SET generation = generation + 1 WHERE id = 1; END;
+CREATE TRIGGER IF NOT EXISTS deployments_delete_generation AFTER DELETE ON deployments
+BEGIN UPDATE store_meta SET generation = generation + 1 WHERE id = 1; END;
+"""
+
+
+class StoredDeployment(NamedTuple):
+    """A deployment record as read from the store."""
+
+    id: str
+    version: int
+    record: Dict[str, Any]
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize values PyYAML and pydantic hand us that JSON does not support."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (set, tuple)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _cloud_name(record: Dict[str, Any]) -> Optional[str]:
+    """Return the lower-cased cloud name of a record for indexing."""
+    cloud = record.get("cloud")
+    if cloud is None:
+        cloud = record.get("cloud_provider")
+    if isinstance(cloud, dict):
+        cloud = cloud.get("name") or cloud.get("id")
+    return str(cloud).lower() if cloud else None
+
+
+def _cluster_name(record: Dict[str, Any]) -> Optional[str]:
+    """Return the cluster name of a record for indexing."""
+    cluster = record.get("cluster")
+    if isinstance(cluster, dict):
+        return cluster.get("name")
+    return None
+
+
+class DeploymentStore:
+    """SQLite-backed store of deployment records with secondary indexes.
+
+    Example:
+        >>> deployment_store.put(deployment_id, record)
+        >>> deployment_store.get(deployment_id).record["status"]
+        >>> deployment_store.list(cluster_name="my-cluster", status="active")
+    """
+
+    def __init__(
+        self,
+        db_path: Path = VANTAGE_CLI_DEPLOYMENTS_DB_PATH,
+        legacy_yaml_path: Optional[Path] = VANTAGE_CLI_DEPLOYMENTS_YAML_PATH,
+    ) -> None:
+        """Initialize the store; the database is opened on first use.
+
+        Args:
+            db_path: Path of the SQLite database
+            legacy_yaml_path: deployments.yaml to import on first open, if any
+        """
+        self.db_path = db_path
+        self.legacy_yaml_path = legacy_yaml_path
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return the open connection, creating the database on first use."""
+        if self._connection is not None:
+            return self._connection
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(
+            self.db_path, timeout=10.0, isolation_level=None, check_same_thread=False
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.executescript(_SCHEMA)
+
+        if connection.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+            migrated: Optional[int] = None
+            with connection:
+                connection.execute("BEGIN IMMEDIATE")
+                # Another process may have migrated while we waited for the lock
+                if connection.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+                    migrated = self._migrate_legacy_yaml(connection)
+                    connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            # Only retire the YAML once its records are committed
+            if migrated is not None:
+                self._retire_legacy_yaml(migrated)
+
+        self._connection = connection
+        return connection
+
+    def _migrate_legacy_yaml(self, connection: sqlite3.Connection) -> Optional[int]:
+        """Import deployments from the legacy YAML file inside the open transaction.
+
+        Returns:
+            Number of deployments imported, or None if there was no file to import
+        """
+        path = self.legacy_yaml_path
+        if path is None or not path.exists():
+            return None
+
+        try:
+            data = yaml.safe_load(path.read_text()) or {}
+        except Exception as e:
+            logger.warning(f"Could not migrate deployments from {path}: {e}")
+            return None
+
+        deployments = data.get("deployments") or {}
+        for deployment_id, record in deployments.items():
+            if isinstance(record, dict):
+                self._upsert(connection, str(deployment_id), record)
+        return len(deployments)
+
+    def _retire_legacy_yaml(self, count: int) -> None:
+        """Rename the imported legacy YAML file so it is not imported again."""
+        path = self.legacy_yaml_path
+        if path is None:
+            return
+        migrated_path = path.with_name(f"{path.name}.migrated")
+        path.replace(migrated_path)
+        logger.info(
+            f"Migrated {count} deployment(s) from {path} to {self.db_path} "
+            f"(original kept at {migrated_path})"
+        )
+
+    @staticmethod
+    def _upsert(
+        connection: sqlite3.Connection, deployment_id: str, record: Dict[str, Any]
+    ) -> None:
+        """Insert or replace a record, bumping its version."""
+        created_at = record.get("created_at")
+        connection.execute(
+            """
+            INSERT INTO deployments (id, cluster_name, app_name, cloud, status, created_at, record)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (id) DO UPDATE SET
+                cluster_name = excluded.cluster_name,
+                app_name = excluded.app_name,
+                cloud = excluded.cloud,
+                status = excluded.status,
+                created_at = excluded.created_at,
+                record = excluded.record,
+                version = deployments.version + 1
+            """,
+            (
+                deployment_id,
+                _cluster_name(record),
+                record.get("app_name"),
+                _cloud_name(record),
+                record.get("status"),
+                created_at.isoformat() if isinstance(created_at, datetime) else created_at,
+                json.dumps(record, default=_json_default),
+            ),
+        )
+
+    def get(self, deployment_id: str) -> Optional[StoredDeployment]:
+        """Return a single deployment record by ID."""
+        with self._lock:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT id, version, record FROM deployments WHERE id = ?", (deployment_id,)
+                )
+                .fetchone()
+            )
+        return StoredDeployment(row[0], row[1], json.loads(row[2])) if row else None
+
+    def list(
+        self,
+        cluster_name: Optional[str] = None,
+        app_name: Optional[str] = None,
+        cloud: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> List[StoredDeployment]:
+        """Return deployment records matching all given filters, oldest first.
+
+        Args:
+            cluster_name: Only deployments on this cluster
+            app_name: Only deployments of this app
+            cloud: Only deployments on this cloud (case-insensitive)
+            status: Only deployments with this status
+
+        Returns:
+            Matching records
+        """
+        filters = {
+            "cluster_name": cluster_name,
+            "app_name": app_name,
+            "cloud": cloud.lower() if cloud else None,
+            "status": status,
+        }
+        clauses = [f"{column} = ?" for column, value in filters.items() if value is not None]
+        params = [value for value in filters.values() if value is not None]
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        with self._lock:
+            rows = (
+                self._connect()
+                .execute(
+                    f"SELECT id, version, record FROM deployments{where} ORDER BY created_at, id",
+                    params,
+                )
+                .fetchall()
+            )
+        return [StoredDeployment(row[0], row[1], json.loads(row[2])) for row in rows]
+
+    def generation(self) -> int:
+        """Return a counter that changes whenever any deployment is written or deleted.
+
+        Writes from other processes are included, so comparing two values is
+        a cheap way to detect that the deployment list needs reloading.
+        """
+        with self._lock:
+            row = self._connect().execute("SELECT generation FROM store_meta").fetchone()
+        return row[0] if row else 0
+
+    def put(self, deployment_id: str, record: Dict[str, Any]) -> None:
+        """Create or replace a deployment record."""
+        with self._lock:
+            self._upsert(self._connect(), deployment_id, record)
+
+    def update_status(self, deployment_id: str, status: str) -> bool:
+        """Set the status of a deployment.
+
+        Returns:
+            True if the deployment exists, False otherwise
+        """
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute("BEGIN IMMEDIATE")
+                row = connection.execute(
+                    "SELECT record FROM deployments WHERE id = ?", (deployment_id,)
+                ).fetchone()
+                if row is None:
+                    return False
+                record = json.loads(row[0])
+                record["status"] = status
+                self._upsert(connection, deployment_id, record)
+        return True
+
+    def delete(self, deployment_id: str) -> bool:
+        """Delete a deployment record.
+
+        Returns:
+            True if a record was deleted, False if it did not exist
+        """
+        with self._lock:
+            cursor = self._connect().execute(
+                "DELETE FROM deployments WHERE id = ?", (deployment_id,)
+            )
+        return cursor.rowcount > 0
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+# Shared store for the default deployments database
+deployment_store = DeploymentStore()
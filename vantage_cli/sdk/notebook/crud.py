@@ -17,9 +17,11 @@ from typing import Any, Dict, List, Optional
 
 import typer
 
+from vantage_cli.constants import GRAPHQL_DEFAULT_PAGE_SIZE
 from vantage_cli.exceptions import Abort
 from vantage_cli.gql_client import GraphQLError, create_async_graphql_client
 from vantage_cli.jupyterhub_sdk import jupyterhub_sdk
+from vantage_cli.sdk.base import eq_filters, paginate_connection
 from vantage_cli.sdk.notebook.schema import Notebook
 
 logger = logging.getLogger(__name__)
@@ -89,20 +91,22 @@ class NotebookSDK:
         ctx: typer.Context,
         cluster: Optional[str] = None,
         limit: Optional[int] = None,
+        page_size: int = GRAPHQL_DEFAULT_PAGE_SIZE,
     ) -> List[Notebook]:
-        """List all notebook servers.
+        """List all notebook servers, following pagination cursors.
 
         Args:
             ctx: Typer context containing settings and profile
             cluster: Optional cluster name filter
-            limit: Maximum number of notebooks to return
+            limit: Maximum number of notebooks to return (None for all)
+            page_size: Number of notebooks requested per page
 
         Returns:
             List of Notebook objects
         """
         query = """
-        query NotebookServers($first: Int) {
-            notebookServers(first: $first) {
+        query NotebookServers($first: Int, $after: String, $filters: JSONScalar) {
+            notebookServers(first: $first, after: $after, filters: $filters) {
                 edges {
                     node {
                         id
@@ -116,43 +120,47 @@ class NotebookSDK:
                         updatedAt
                     }
                 }
+                pageInfo {
+                    hasNextPage
+                    endCursor
+                }
                 total
             }
         }
         """
 
-        variables: Dict[str, Any] = {}
-        if limit:
-            variables["first"] = limit
-        else:
-            variables["first"] = 100  # Default limit
-
         try:
             # Create async GraphQL client
             profile = getattr(ctx.obj, "profile", "default")
             graphql_client = create_async_graphql_client(ctx.obj.settings, profile)
 
-            # Execute the query
-            logger.debug(f"Executing GraphQL query to list notebooks with variables: {variables}")
-            response_data = await graphql_client.execute_async(query, variables)
-
-            if not response_data:
-                raise Abort(
-                    "No response from server",
-                    subject="Query Failed",
-                    log_message="GraphQL query returned no response",
+            async def execute(page_query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+                logger.debug(
+                    f"Executing GraphQL query to list notebooks with variables: {variables}"
                 )
-
-            notebooks_data = response_data.get("notebookServers", {})
-            notebooks_list = [edge["node"] for edge in notebooks_data.get("edges", [])]
-
-            # Apply client-side cluster filter if provided
-            if cluster:
-                notebooks_list = [n for n in notebooks_list if n.get("clusterName") == cluster]
+                response_data = await graphql_client.execute_async(page_query, variables)
+                if not response_data:
+                    raise Abort(
+                        "No response from server",
+                        subject="Query Failed",
+                        log_message="GraphQL query returned no response",
+                    )
+                return response_data
+
+            # The cluster filter is pushed down to the API so only matching
+            # notebooks are transferred
+            notebook_nodes = paginate_connection(
+                execute,
+                query,
+                "notebookServers",
+                variables={"filters": eq_filters(clusterName=cluster)},
+                page_size=page_size,
+                max_items=limit,
+            )
 
             # Convert to Notebook objects with proper field mapping
             notebooks: List[Notebook] = []
-            for notebook_dict in notebooks_list:
+            async for notebook_dict in notebook_nodes:
                 # Map camelCase to snake_case for the Pydantic model
                 notebook = Notebook(
                     id=notebook_dict.get("id", ""),
@@ -195,10 +203,10 @@ class NotebookSDK:
             Notebook object if found, None otherwise
         """
         # Since the API doesn't support a singular notebookServer query,
-        # we'll use the notebookServers list query and filter by name
+        # we'll use the notebookServers list query filtered by name
         query = """
-        query NotebookServers($first: Int) {
-            notebookServers(first: $first) {
+        query NotebookServers($first: Int, $filters: JSONScalar) {
+            notebookServers(first: $first, filters: $filters) {
                 edges {
                     node {
                         id
@@ -217,7 +225,8 @@ class NotebookSDK:
         }
         """
 
-        variables: Dict[str, Any] = {"first": 100}  # Get a reasonable number of notebooks
+        # Two results are enough to detect an ambiguous name
+        variables: Dict[str, Any] = {"first": 2, "filters": eq_filters(name=name)}
 
         try:
             # Create async GraphQL client
@@ -236,10 +245,7 @@ class NotebookSDK:
                 )
 
             notebooks_data = response_data.get("notebookServers", {})
-            notebooks_list = [edge["node"] for edge in notebooks_data.get("edges", [])]
-
-            # Filter by name
-            matching_notebooks = [n for n in notebooks_list if n.get("name") == name]
+            matching_notebooks = [edge["node"] for edge in notebooks_data.get("edges", [])]
 
             if not matching_notebooks:
                 logger.debug(f"Notebook server '{name}' not found")
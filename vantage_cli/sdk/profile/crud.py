@@ -233,12 +233,18 @@ class ProfileSDK:
             del self._profiles[profile_name]
 
             # Remove from file
-            from vantage_cli.sdk.profile.schema import load_profiles, save_profiles
+            from vantage_cli.sdk.profile.schema import (
+                USER_CONFIG_FILE,
+                load_profiles,
+                save_profiles,
+            )
+            from vantage_cli.state_files import state_file_lock
 
-            profiles_data = load_profiles()
-            if profile_name in profiles_data:
-                del profiles_data[profile_name]
-                save_profiles(profiles_data)
+            with state_file_lock(USER_CONFIG_FILE):
+                profiles_data = load_profiles()
+                if profile_name in profiles_data:
+                    del profiles_data[profile_name]
+                    save_profiles(profiles_data)
 
             # Clear token cache
             self._clear_profile_token_cache(profile_name)
@@ -20,6 +20,7 @@ from pydantic import BaseModel, computed_field
 from vantage_cli.config import Settings
 from vantage_cli.constants import USER_CONFIG_FILE
 from vantage_cli.sdk.cloud_credential.schema import CloudCredential
+from vantage_cli.state_files import atomic_write_text, state_file_lock
 
 logger = logging.getLogger(__name__)
 
@@ -43,13 +44,15 @@ def load_profiles() -> Dict[str, Any]:
 def save_profiles(profiles_data: Dict[str, Any]) -> None:
     """Save profiles data to ~/.vantage-cli/profiles.json.
 
+    Callers that modify data returned by :func:`load_profiles` should hold
+    ``state_file_lock(USER_CONFIG_FILE)`` around the load and the save.
+
     Args:
         profiles_data: Dictionary containing profile settings data
     """
     try:
-        # Ensure the directory exists
-        USER_CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
-        USER_CONFIG_FILE.write_text(json.dumps(profiles_data, indent=2))
+        with state_file_lock(USER_CONFIG_FILE):
+            atomic_write_text(USER_CONFIG_FILE, json.dumps(profiles_data, indent=2))
     except Exception as e:
         logger.error(f"Failed to save profiles to {USER_CONFIG_FILE}: {e}")
 
@@ -16,9 +16,11 @@ from typing import Any, Dict, List, Optional
 
 import typer
 
+from vantage_cli.constants import GRAPHQL_DEFAULT_PAGE_SIZE
 from vantage_cli.exceptions import Abort
-from vantage_cli.gql_client import VantageGQLClient, VantageGraphQLClient
+from vantage_cli.gql_client import VantageGraphQLClient, graphql_client_pool
 from vantage_cli.schemas import CliContext
+from vantage_cli.sdk.base import eq_filters, paginate_connection
 from vantage_cli.sdk.support_ticket.schema import (
     Comment,
     SeverityLevel,
@@ -33,7 +35,7 @@ class SupportTicketSDK:
     """SDK for support ticket operations."""
 
     def _get_graphql_client(self, ctx: typer.Context) -> VantageGraphQLClient:
-        """Get or create a GraphQL client for SOS API.
+        """Get the shared GraphQL client for SOS API.
 
         Args:
             ctx: Typer context or CliContext
@@ -45,24 +47,19 @@ class SupportTicketSDK:
         if hasattr(ctx, "obj") and hasattr(ctx.obj, "graphql_client"):
             return ctx.obj.graphql_client
 
-        # Otherwise, create a new GraphQL client for SOS API
+        # Otherwise, use the shared GraphQL client for SOS API
         # This handles the dashboard case where ctx is a CliContext
         if isinstance(ctx, CliContext):
-            # Create GraphQL client with SOS endpoint
             if ctx.settings is None:
                 raise ValueError("Settings not available in context")
-            factory = VantageGQLClient(
-                settings=ctx.settings, profile=ctx.profile, base_path="/sos/graphql"
-            )
-            return factory.create()
+            return graphql_client_pool.get(ctx.settings, ctx.profile, base_path="/sos/graphql")
         elif hasattr(ctx, "obj") and isinstance(ctx.obj, CliContext):
             # Handle typer.Context wrapping CliContext
             if ctx.obj.settings is None:
                 raise ValueError("Settings not available in context")
-            factory = VantageGQLClient(
-                settings=ctx.obj.settings, profile=ctx.obj.profile, base_path="/sos/graphql"
+            return graphql_client_pool.get(
+                ctx.obj.settings, ctx.obj.profile, base_path="/sos/graphql"
             )
-            return factory.create()
         else:
             raise ValueError("Context must be typer.Context or CliContext")
 
@@ -72,21 +69,25 @@ class SupportTicketSDK:
         status: Optional[str] = None,
         priority: Optional[str] = None,
         limit: Optional[int] = None,
+        page_size: int = GRAPHQL_DEFAULT_PAGE_SIZE,
+        ticket_id: Optional[int] = None,
     ) -> List[SupportTicket]:
-        """List all support tickets.
+        """List all support tickets, following pagination cursors.
 
         Args:
             ctx: Typer context containing settings and profile
             status: Optional status filter
             priority: Optional priority filter
-            limit: Maximum number of tickets to return
+            limit: Maximum number of tickets to return (None for all)
+            page_size: Number of tickets requested per page
+            ticket_id: Optional ticket ID filter
 
         Returns:
             List of SupportTicket objects
         """
         query = """
-        query SupportTickets($first: Int) {
-            tickets(first: $first) {
+        query SupportTickets($first: Int, $after: String, $filters: JSONScalar) {
+            tickets(first: $first, after: $after, filters: $filters) {
                 edges {
                     node {
                         id
@@ -100,44 +101,43 @@ class SupportTicketSDK:
                         updatedAt
                     }
                 }
+                pageInfo {
+                    hasNextPage
+                    endCursor
+                }
                 total
             }
         }
         """
 
-        variables: Dict[str, Any] = {}
-        if limit:
-            variables["first"] = limit
-        else:
-            variables["first"] = 100  # Default limit
-
         try:
             # Get GraphQL client (handles both CLI and dashboard contexts)
             graphql_client = self._get_graphql_client(ctx)
 
-            # Execute the query
-            logger.debug(
-                f"Executing GraphQL query to list support tickets with variables: {variables}"
+            async def execute(page_query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+                logger.debug(
+                    f"Executing GraphQL query to list support tickets with variables: {variables}"
+                )
+                response_data = await graphql_client.execute_async(page_query, variables)
+                if not response_data:
+                    # Treat no response as an empty page (API might not be implemented yet)
+                    logger.warning("No response from GraphQL server for support tickets")
+                    return {}
+                return response_data
+
+            # Filters are pushed down to the API so only matching tickets are transferred
+            ticket_nodes = paginate_connection(
+                execute,
+                query,
+                "tickets",
+                variables={"filters": eq_filters(id=ticket_id, status=status, priority=priority)},
+                page_size=page_size,
+                max_items=limit,
             )
-            response_data = await graphql_client.execute_async(query, variables)
-
-            if not response_data:
-                logger.warning("No response from GraphQL server for support tickets")
-                # Return empty list if no response (API might not be implemented yet)
-                return []
-
-            tickets_data = response_data.get("tickets", {})
-            tickets_list = [edge["node"] for edge in tickets_data.get("edges", [])]
-
-            # Apply client-side filters if provided
-            if status:
-                tickets_list = [t for t in tickets_list if t.get("status") == status]
-            if priority:
-                tickets_list = [t for t in tickets_list if t.get("priority") == priority]
 
             # Convert to SupportTicket objects with proper field mapping
-            tickets = []
-            for ticket_dict in tickets_list:
+            tickets: List[SupportTicket] = []
+            async for ticket_dict in ticket_nodes:
                 ticket = SupportTicket(
                     id=str(ticket_dict.get("id", "")),
                     title=ticket_dict.get("title", ""),
@@ -182,15 +182,17 @@ class SupportTicketSDK:
         Returns:
             SupportTicket object if found, None otherwise
         """
-        # Use the tickets query and filter by ID
-        # The API doesn't have a singular 'ticket' query
-        tickets = await self.list_tickets(ctx, limit=1000)  # Get all tickets
+        # The API doesn't have a singular 'ticket' query, so filter the tickets
+        # query by ID on the server. Ticket IDs are integers.
+        if not str(ticket_id).isdigit():
+            logger.debug(f"Support ticket '{ticket_id}' not found")
+            return None
+
+        tickets = await self.list_tickets(ctx, ticket_id=int(ticket_id), limit=1)
 
-        # Find the ticket with matching ID
-        for ticket in tickets:
-            if ticket.id == str(ticket_id):
-                logger.debug(f"Successfully retrieved support ticket '{ticket_id}'")
-                return ticket
+        if tickets:
+            logger.debug(f"Successfully retrieved support ticket '{ticket_id}'")
+            return tickets[0]
 
         logger.debug(f"Support ticket '{ticket_id}' not found")
         return None
@@ -435,20 +437,22 @@ class SupportTicketSDK:
         ctx: typer.Context,
         ticket_id: Optional[str] = None,
         limit: Optional[int] = None,
+        page_size: int = GRAPHQL_DEFAULT_PAGE_SIZE,
     ) -> List[Comment]:
-        """List comments for a ticket or all comments.
+        """List comments for a ticket or all comments, following pagination cursors.
 
         Args:
             ctx: Typer context containing graphql_client
             ticket_id: Optional ticket ID to filter comments
-            limit: Maximum number of comments to return
+            limit: Maximum number of comments to return (None for all)
+            page_size: Number of comments requested per page
 
         Returns:
             List of Comment objects
         """
         query = """
-        query Comments($first: Int, $filters: JSONScalar) {
-            comments(first: $first, filters: $filters) {
+        query Comments($first: Int, $after: String, $filters: JSONScalar) {
+            comments(first: $first, after: $after, filters: $filters) {
                 edges {
                     node {
                         id
@@ -460,32 +464,34 @@ class SupportTicketSDK:
                         updatedAt
                     }
                 }
+                pageInfo {
+                    hasNextPage
+                    endCursor
+                }
             }
         }
         """
 
-        variables: Dict[str, Any] = {}
-        if limit:
-            variables["first"] = limit
-        else:
-            variables["first"] = 100
-
-        if ticket_id:
-            variables["filters"] = {"ticketId": {"eq": int(ticket_id)}}
+        filters = eq_filters(ticketId=int(ticket_id) if ticket_id else None)
 
         try:
             graphql_client = self._get_graphql_client(ctx)
-            logger.debug("Executing GraphQL query to list comments")
-            response_data = await graphql_client.execute_async(query, variables)
-
-            if not response_data:
-                return []
 
-            comments_data = response_data.get("comments", {})
-            comments_list = [edge["node"] for edge in comments_data.get("edges", [])]
+            async def execute(page_query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+                logger.debug("Executing GraphQL query to list comments")
+                return await graphql_client.execute_async(page_query, variables) or {}
+
+            comment_nodes = paginate_connection(
+                execute,
+                query,
+                "comments",
+                variables={"filters": filters},
+                page_size=page_size,
+                max_items=limit,
+            )
 
             comments = []
-            for comment_dict in comments_list:
+            async for comment_dict in comment_nodes:
                 comment = Comment(
                     id=str(comment_dict.get("id", "")),
                     ticket_id=str(comment_dict.get("ticketId", "")),
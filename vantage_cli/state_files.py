@@ -0,0 +1,195 @@
+# Copyright (C) 2025 Vantage Compute Corporation
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/>.
+"""Locked, atomic access to the state files under ``~/.vantage-cli``.
+
+Several ``vantage`` processes may run at once (e.g. one per cluster in CI), so
+every read-modify-write of a shared state file must happen under
+:func:`state_file_lock`, and every write goes through
+:func:`atomic_write_text`:
+
+* Locks are advisory ``flock`` locks on a ``<file>.lock`` sidecar, so they
+  survive the state file itself being replaced. They are re-entrant within a
+  process, which lets ``save_*`` helpers lock on their own while callers hold
+  the same lock around a whole load/modify/save cycle.
+* Writes go to a temporary file in the same directory which is then renamed
+  over the target, so readers see either the old or the new content and never
+  a truncated file.
+* Durable writes (the default) ``fsync`` the data and the directory entry
+  before returning; caches that can be rebuilt pass ``durable=False``.
+"""
+
+import logging
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+
+from vantage_cli.constants import STATE_FILE_LOCK_TIMEOUT_SECONDS
+from vantage_cli.exceptions import Abort
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+# Poll interval while waiting for another process to release a lock
+_LOCK_POLL_SECONDS = 0.05
+
+# Per-path in-process lock, owning thread, the open lock file and its depth
+_registry_lock = threading.Lock()
+_locks: Dict[Path, threading.RLock] = {}
+_held: Dict[Path, Tuple[int, int]] = {}
+
+
+def _lock_path(path: Path) -> Path:
+    """Return the sidecar lock file for a state file."""
+    return path.with_name(f"{path.name}.lock")
+
+
+def _thread_lock(path: Path) -> threading.RLock:
+    """Return the in-process lock guarding a state file."""
+    with _registry_lock:
+        lock = _locks.get(path)
+        if lock is None:
+            lock = _locks[path] = threading.RLock()
+        return lock
+
+
+def _acquire_file_lock(lock_path: Path, timeout: float) -> int:
+    """Open and ``flock`` a lock file, waiting up to ``timeout`` seconds."""
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+    if fcntl is None:
+        return fd
+
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return fd
+        except BlockingIOError:
+            if time.monotonic() >= deadline:
+                os.close(fd)
+                raise Abort(
+                    f"Timed out after {timeout:.0f}s waiting for {lock_path}. "
+                    "Another vantage process may be stuck; remove the lock file if not.",
+                    subject="State file locked",
+                    log_message=f"Timed out waiting for state file lock {lock_path}",
+                )
+            time.sleep(_LOCK_POLL_SECONDS)
+
+
+@contextmanager
+def state_file_lock(
+    path: Path, timeout: float = STATE_FILE_LOCK_TIMEOUT_SECONDS
+) -> Iterator[None]:
+    """Hold the cross-process lock for a state file.
+
+    Waiting for the lock blocks the calling thread, so coroutines must not
+    take it (or call a ``save_*`` helper that does) on the event loop; run
+    the locked work with ``asyncio.to_thread`` instead.
+
+    Args:
+        path: State file to lock (the lock itself is taken on ``<path>.lock``)
+        timeout: Seconds to wait for another process to release the lock
+
+    Raises:
+        Abort: If the lock could not be acquired within ``timeout``
+    """
+    path = Path(path)
+    thread_lock = _thread_lock(path)
+    if not thread_lock.acquire(timeout=timeout):
+        raise Abort(
+            f"Timed out after {timeout:.0f}s waiting for {path}.",
+            subject="State file locked",
+            log_message=f"Timed out waiting for in-process lock on {path}",
+        )
+
+    try:
+        fd, depth = _held.get(path, (-1, 0))
+        if depth == 0:
+            fd = _acquire_file_lock(_lock_path(path), timeout)
+        _held[path] = (fd, depth + 1)
+        try:
+            yield
+        finally:
+            fd, depth = _held.pop(path)
+            if depth > 1:
+                _held[path] = (fd, depth - 1)
+            else:
+                # Closing the descriptor releases the flock
+                os.close(fd)
+    finally:
+        thread_lock.release()
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Flush a directory entry so a rename survives a crash."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def atomic_write_text(
+    path: Path,
+    text: str,
+    mode: Optional[int] = None,
+    durable: bool = True,
+) -> None:
+    """Replace a file's content atomically.
+
+    Args:
+        path: File to write
+        text: New content
+        mode: Permission bits for the file; defaults to the current file's, or 0o644
+        durable: ``fsync`` the data and directory entry before returning
+
+    Raises:
+        OSError: If the file could not be written
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if mode is None:
+        try:
+            mode = path.stat().st_mode & 0o777
+        except FileNotFoundError:
+            mode = 0o644
+
+    # mkstemp creates the file as 0o600, so secrets are never briefly world-readable
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            fh.write(text)
+            fh.flush()
+            if durable:
+                os.fsync(fh.fileno())
+        os.chmod(tmp_name, mode)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+    if durable:
+        _fsync_directory(path.parent)
+    logger.debug(f"Wrote {path} atomically (durable={durable})")
@@ -0,0 +1,236 @@
+# Copyright (C) 2025 Vantage Compute Corporation
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/>.
+"""Interactive Textual viewer for tabular command output.
+
+Kept separate from ``vantage_cli.render`` so that rendering plain output does
+not import Textual.
+"""
+
+from typing import Any, Dict, List
+
+from rich.console import Console
+from textual.app import App, ComposeResult
+from textual.binding import Binding
+from textual.widgets import DataTable, Footer, Header
+
+
+class TableViewerApp(App):
+    """Textual app for displaying data tables with auto-layout."""
+
+    BINDINGS = [
+        Binding("q", "quit", "Quit", priority=True),
+        Binding("escape", "quit", "Quit", priority=True),
+    ]
+
+    def __init__(self, data: List[Dict[str, Any]], title: str = "", **kwargs):
+        super().__init__(**kwargs)
+        self.data = data
+        self.title = title
+
+    def compose(self) -> ComposeResult:
+        """Create the table widget."""
+        if self.title:
+            yield Header(show_clock=False)
+
+        data_table = DataTable(show_cursor=False, zebra_stripes=True)
+        data_table.cursor_type = "none"
+        yield data_table
+
+        if self.title:
+            yield Footer()
+
+    def on_mount(self) -> None:
+        """Set up the table when the app mounts."""
+        if not self.data:
+            return
+
+        table = self.query_one(DataTable)
+
+        # Get all unique keys from all items
+        all_keys = set()
+        for item in self.data:
+            if isinstance(item, dict):
+                all_keys.update(item.keys())
+
+        # Sort keys with common fields first
+        common_fields = [
+            "id",
+            "name",
+            "title",
+            "description",
+            "status",
+            "created_at",
+            "updated_at",
+        ]
+        sorted_keys = []
+
+        for field in common_fields:
+            if field in all_keys:
+                sorted_keys.append(field)
+                all_keys.remove(field)
+
+        sorted_keys.extend(sorted(all_keys))
+
+        # Add columns
+        for key in sorted_keys:
+            header = self._format_column_header(key)
+            table.add_column(header, key=key)
+
+        # Add rows
+        for item in self.data:
+            row_data = []
+            for key in sorted_keys:
+                value = item.get(key, "")
+                formatted_value = self._format_cell_value(key, value)
+                row_data.append(formatted_value)
+            table.add_row(*row_data)
+
+        if self.title:
+            self.title = self.title
+
+    def _format_column_header(self, key: str) -> str:
+        """Format column header nicely."""
+        # Handle special cases first
+        special_cases = {
+            "id": "ID",
+            "url": "URL",
+            "api": "API",
+            "cpu": "CPU",
+            "gpu": "GPU",
+            "ram": "RAM",
+            "ssh": "SSH",
+            "uuid": "UUID",
+            "cidr": "CIDR",
+            "ip": "IP",
+        }
+
+        if key.lower() in special_cases:
+            return special_cases[key.lower()]
+
+        # Split on underscores and capitalize each word
+        words = key.split("_")
+        formatted_words = []
+        for word in words:
+            if word.lower() in special_cases:
+                formatted_words.append(special_cases[word.lower()])
+            else:
+                formatted_words.append(word.capitalize())
+
+        return " ".join(formatted_words)
+
+    def _format_cell_value(self, key: str, value: Any) -> str:
+        """Format a cell value for display."""
+        if value is None:
+            return "N/A"
+        elif value == "":
+            return "N/A"
+        elif isinstance(value, bool):
+            return "✓" if value else "✗"
+        elif isinstance(value, (list, dict)):
+            # For complex nested data, show a summary
+            if isinstance(value, list):
+                return f"[{len(value)} items]" if value else "[]"
+            else:
+                return f"[{len(value)} keys]" if value else "{}"
+        elif isinstance(value, str):
+            # Handle common formatting cases
+            if key.lower().endswith("_at") or "date" in key.lower():
+                # Try to format dates nicely, fallback to original
+                try:
+                    from datetime import datetime
+
+                    if "T" in value and value.endswith("Z"):
+                        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+                        return dt.strftime("%Y-%m-%d")
+                    return value
+                except Exception:
+                    return value
+            elif key.lower() in ["status", "state"]:
+                return value.upper()
+            else:
+                # Truncate strings based on field-specific limits to prevent wrapping
+                max_length = self._get_field_max_length(key)
+                if len(value) > max_length:
+                    return value[: max_length - 3] + "..."
+                return value
+        else:
+            return str(value)
+
+    def _get_field_max_length(self, key: str) -> int:
+        """Get maximum character length for a field value."""
+        key_lower = key.lower()
+
+        if key_lower == "description":
+            return 50
+        elif key_lower in ["name", "title"]:
+            return 30
+        elif key_lower in ["email", "url"]:
+            return 35
+        elif key_lower == "id":
+            return 15
+        else:
+            return 25
+
+    def _render_static_table(
+        self, items: List[Dict[str, Any]], title: str, console: Console
+    ) -> None:
+        """Render a static table using Rich console (for non-interactive mode)."""
+        from rich.table import Table
+
+        if not items:
+            return
+
+        # Create Rich table for static rendering
+        table = Table(
+            title=title if title else None, show_header=True, header_style="bold magenta"
+        )
+
+        # Get all unique keys from all items
+        all_keys = set()
+        for item in items:
+            if isinstance(item, dict):
+                all_keys.update(item.keys())
+
+        # Sort keys with common fields first
+        common_fields = [
+            "id",
+            "name",
+            "title",
+            "description",
+            "status",
+            "created_at",
+            "updated_at",
+        ]
+        sorted_keys = []
+
+        for field in common_fields:
+            if field in all_keys:
+                sorted_keys.append(field)
+                all_keys.remove(field)
+
+        sorted_keys.extend(sorted(all_keys))
+
+        # Add columns (Textual will auto-size these)
+        for key in sorted_keys:
+            header = self._format_column_header(key)
+            table.add_column(header, no_wrap=True)
+
+        # Add rows
+        for item in items:
+            row_data = []
+            for key in sorted_keys:
+                value = item.get(key, "")
+                formatted_value = self._format_cell_value(key, value)
+                row_data.append(formatted_value)
+            table.add_row(*row_data)
+
+        console.print(table)
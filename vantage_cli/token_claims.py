@@ -0,0 +1,97 @@
+# Copyright (C) 2025 Vantage Compute Corporation
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/>.
+"""Cached, unverified decoding of JWT access token claims.
+
+The CLI only ever inspects its own access tokens without verifying their
+signature (expiry checks, identity extraction, ``whoami``), so the payload is
+base64-decoded directly instead of going through ``jose``. Decoded claims are
+kept in a small LRU keyed by the token's SHA-256 hash so each token is decoded
+once per process no matter how many times it is inspected.
+"""
+
+import base64
+import binascii
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+# Number of distinct tokens whose claims are kept in memory
+TOKEN_CLAIMS_CACHE_SIZE = 32
+
+_claims_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+
+class TokenDecodeError(ValueError):
+    """Raised when a token is not a decodable JWT."""
+
+
+def _token_key(token: str) -> str:
+    """Return the cache key for a token."""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def decode_token_claims(token: str) -> Dict[str, Any]:
+    """Return the claims of a JWT without verifying its signature.
+
+    Args:
+        token: Encoded JWT
+
+    Returns:
+        A copy of the token's claims
+
+    Raises:
+        TokenDecodeError: If the token is not a well-formed JWT
+    """
+    key = _token_key(token)
+    claims = _claims_cache.get(key)
+    if claims is not None:
+        _claims_cache.move_to_end(key)
+        return dict(claims)
+
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+    except (IndexError, ValueError, binascii.Error) as e:
+        raise TokenDecodeError(f"Invalid token: {e}") from e
+
+    if not isinstance(claims, dict):
+        raise TokenDecodeError("Invalid token: claims are not a JSON object")
+
+    _claims_cache[key] = claims
+    if len(_claims_cache) > TOKEN_CLAIMS_CACHE_SIZE:
+        _claims_cache.popitem(last=False)
+    return dict(claims)
+
+
+def token_expires_at(token: str) -> Optional[float]:
+    """Return the token's ``exp`` timestamp, or None if it has no usable expiry."""
+    exp = decode_token_claims(token).get("exp")
+    return float(exp) if isinstance(exp, (int, float)) else None
+
+
+def is_token_claims_expired(token: str, buffer_seconds: float = 0) -> bool:
+    """Check whether a token expires within ``buffer_seconds`` from now.
+
+    Tokens without an expiry claim are considered expired.
+
+    Raises:
+        TokenDecodeError: If the token is not a well-formed JWT
+    """
+    exp = token_expires_at(token)
+    return exp is None or exp <= time.time() + buffer_seconds
+
+
+def clear_token_claims_cache() -> None:
+    """Forget all cached token claims."""
+    _claims_cache.clear()
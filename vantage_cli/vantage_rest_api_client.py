@@ -11,9 +11,9 @@ import typer
 from rich.console import Console
 from rich.json import JSON
 
-from .auth import refresh_access_token_standalone
-from .cache import save_tokens_to_cache
+from .auth import get_token_refresher
 from .config import Settings
+from .http_client_pool import http_client_pool
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +23,8 @@ class VantageRestApiClient:
 
     Provides authenticated HTTP request capabilities for interacting with
     Vantage APIs. Handles authentication, request construction, and error handling.
+    Requests go through the process-wide :data:`http_client_pool`, so clients for
+    the same host share keep-alive connections.
     """
 
     def __init__(
@@ -37,9 +39,13 @@ class VantageRestApiClient:
         self.profile = ctx.obj.profile
         self.settings = ctx.obj.settings or Settings()
         self.timeout = timeout
-        self.client = httpx.AsyncClient(timeout=timeout)
         self.console = Console()
 
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared HTTP client for this API host."""
+        return http_client_pool.get(self.base_url)
+
     def _headers(self) -> Dict[str, str]:
         headers = {
             "Accept": "application/json",
@@ -53,21 +59,32 @@ class VantageRestApiClient:
 
         return headers
 
-    async def _refresh_token_if_needed(self) -> bool:
-        """Refresh access token if needed and possible."""
+    async def _refresh_token_if_needed(
+        self, failed_token: Optional[str] = None, proactive: bool = False
+    ) -> bool:
+        """Refresh access token if needed and possible.
+
+        Refreshes are single-flight per profile, so concurrent requests that
+        hit an expired token share one refresh.
+
+        Args:
+            failed_token: Access token the server rejected, if any
+            proactive: Only refresh if the token is about to expire
+        """
         if not self.persona or not self.persona.token_set.refresh_token:
             return False
 
+        refresher = get_token_refresher(self.profile)
         try:
-            refresh_success = refresh_access_token_standalone(
-                self.persona.token_set, self.settings
+            if proactive:
+                return await refresher.ensure_fresh(self.persona.token_set, self.settings)
+
+            refresh_success = await refresher.refresh(
+                self.persona.token_set, self.settings, failed_token=failed_token
             )
             if refresh_success:
-                # Save updated tokens to cache
-                save_tokens_to_cache(self.profile, self.persona.token_set)
                 logger.debug("Successfully refreshed access token")
-                return True
-            return False
+            return refresh_success
         except Exception as e:
             logger.error(f"Failed to refresh token: {e}")
             return False
@@ -91,9 +108,11 @@ class VantageRestApiClient:
             Exception: On other request failures
         """
         url = f"{self.base_url}{path}"
+        await self._refresh_token_if_needed(proactive=True)
         headers = self._headers()
         if "headers" in kwargs:
             headers.update(kwargs.pop("headers"))
+        kwargs.setdefault("timeout", self.timeout)
 
         max_auth_retries = 1
         retry_count = 0
@@ -114,7 +133,8 @@ class VantageRestApiClient:
                         f"Authentication error {e.response.status_code}, attempting token refresh"
                     )
 
-                    if await self._refresh_token_if_needed():
+                    failed_token = headers.get("Authorization", "").removeprefix("Bearer ")
+                    if await self._refresh_token_if_needed(failed_token=failed_token or None):
                         # Update headers with new token and retry
                         headers = self._headers()
                         retry_count += 1
@@ -191,8 +211,11 @@ class VantageRestApiClient:
         self.console.print(json_obj)
 
     async def close(self):
-        """Close the HTTP client connection."""
-        await self.client.aclose()
+        """Release the client.
+
+        Connections stay in the shared pool for reuse and are closed when the
+        command's event loop shuts down.
+        """
 
 
 def attach_vantage_rest_client(
@@ -252,7 +275,7 @@ def attach_vantage_rest_client(
                 try:
                     return await func(ctx, *args, **kwargs)
                 finally:
-                    # Clean up the client
+                    # Release the client; pooled connections are closed on shutdown
                     await ctx.obj.rest_client.close()
 
             return async_wrapper